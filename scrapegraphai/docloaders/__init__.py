@@ -6,6 +6,7 @@ torchcodec/FFmpeg DLL loading at import time (sentence_transformers -> torchcode
 """
 
 from .browser_base import browser_base_fetch
+from .browser_pool import BrowserPool, close_browser_pools, get_browser_pool
 from .scrape_do import scrape_do_fetch
 
 _LAZY_MODULES = {
@@ -24,7 +25,10 @@ def __getattr__(name):
 
 __all__ = [
     "browser_base_fetch",
+    "BrowserPool",
     "ChromiumLoader",
+    "close_browser_pools",
+    "get_browser_pool",
     "PlasmateLoader",
     "scrape_do_fetch",
 ]
@@ -5,6 +5,8 @@ browserbase integration module
 import asyncio
 from typing import List
 
+from ..utils.fetch_scheduler import get_fetch_scheduler
+
 
 def browser_base_fetch(
     api_key: str,
@@ -27,6 +29,8 @@ def browser_base_fetch(
 
     Returns:
         List[str]: The results of the loading operations.
+
+    Every link is loaded through the shared per-host fetch scheduler.
     """
     try:
         from browserbase import Browserbase
@@ -42,9 +46,13 @@ def browser_base_fetch(
     session = browserbase.sessions.create(project_id=project_id)
 
     result = []
+    scheduler = get_fetch_scheduler()
 
     async def _async_fetch_link(url):
-        return await asyncio.to_thread(session.load, url, text_content=text_content)
+        async with scheduler.aslot(url):
+            return await asyncio.to_thread(
+                session.load, url, text_content=text_content
+            )
 
     if async_mode:
 
@@ -56,6 +64,7 @@ def browser_base_fetch(
         result = asyncio.run(_async_browser_base_fetch())
     else:
         for url in link:
-            result.append(session.load(url, text_content=text_content))
+            with scheduler.slot(url):
+                result.append(session.load(url, text_content=text_content))
 
     return result
@@ -0,0 +1,259 @@
+"""
+browser_pool module
+"""
+
+import asyncio
+import atexit
+import json
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from ..utils.background_loop import arun_in_background, run_sync_in_background
+from ..utils.logging import get_logger
+
+logger = get_logger("browser-pool")
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BROWSERS = 2
+DEFAULT_MAX_PAGES_PER_BROWSER = 8
+
+
+class _PooledBrowser:
+    """A launched browser and the number of contexts currently leased from it."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.active = 0
+
+    def is_connected(self) -> bool:
+        is_connected = getattr(self.browser, "is_connected", None)
+        return bool(is_connected()) if callable(is_connected) else True
+
+
+class BrowserPool:
+    """
+    A pool of long-lived Playwright browsers shared by every fetcher of the process.
+
+    Browsers live on the process-wide background event loop, so they survive the
+    short-lived loops created by ``asyncio.run`` in synchronous code paths. Each
+    lease gets a fresh, isolated browser context that is closed afterwards, so
+    cookies and storage never leak between fetches.
+
+    Attributes:
+        browser_name: The Playwright browser type, 'chromium' or 'firefox'.
+        launch_kwargs: Keyword arguments forwarded to ``browser_type.launch``.
+        max_browsers: Maximum number of browsers kept alive by the pool.
+        max_pages_per_browser: Maximum number of concurrent contexts per browser.
+    """
+
+    def __init__(
+        self,
+        browser_name: str = "chromium",
+        launch_kwargs: Optional[dict] = None,
+        max_browsers: int = DEFAULT_MAX_BROWSERS,
+        max_pages_per_browser: int = DEFAULT_MAX_PAGES_PER_BROWSER,
+    ):
+        if browser_name not in ("chromium", "firefox"):
+            raise ValueError(f"Invalid browser name: {browser_name}")
+        if max_browsers < 1 or max_pages_per_browser < 1:
+            raise ValueError(
+                "max_browsers and max_pages_per_browser must be greater than 0."
+            )
+
+        self.browser_name = browser_name
+        self.launch_kwargs = launch_kwargs or {}
+        self.max_browsers = max_browsers
+        self.max_pages_per_browser = max_pages_per_browser
+
+        self._playwright = None
+        self._browsers: List[_PooledBrowser] = []
+        # Created lazily on the background loop, which owns them.
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of contexts the pool can lease at the same time."""
+        return self.max_browsers * self.max_pages_per_browser
+
+    async def _start(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+
+    async def _launch(self) -> _PooledBrowser:
+        browser_type = getattr(self._playwright, self.browser_name)
+        browser = await browser_type.launch(**self.launch_kwargs)
+        logger.info(
+            f"Launched pooled {self.browser_name} browser "
+            f"({len(self._browsers) + 1}/{self.max_browsers})"
+        )
+        pooled = _PooledBrowser(browser)
+        self._browsers.append(pooled)
+        return pooled
+
+    async def _acquire(self) -> _PooledBrowser:
+        await self._start()
+
+        async with self._condition:
+            while True:
+                for pooled in list(self._browsers):
+                    if not pooled.is_connected() and pooled.active == 0:
+                        logger.warning("Dropping disconnected pooled browser")
+                        self._browsers.remove(pooled)
+
+                available = [
+                    pooled
+                    for pooled in self._browsers
+                    if pooled.is_connected()
+                    and pooled.active < self.max_pages_per_browser
+                ]
+                if available:
+                    pooled = min(available, key=lambda b: b.active)
+                elif len(self._browsers) < self.max_browsers:
+                    pooled = await self._launch()
+                else:
+                    await self._condition.wait()
+                    continue
+
+                pooled.active += 1
+                return pooled
+
+    async def _release(self, pooled: _PooledBrowser):
+        async with self._condition:
+            pooled.active -= 1
+            self._condition.notify()
+
+    @asynccontextmanager
+    async def _lease(self, **context_kwargs):
+        pooled = await self._acquire()
+        context = None
+        try:
+            context = await pooled.browser.new_context(**context_kwargs)
+            yield context
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close pooled browser context: {e}")
+            await self._release(pooled)
+
+    async def _run(self, fn: Callable[[Any], Awaitable[T]], context_kwargs) -> T:
+        async with self._lease(**context_kwargs) as context:
+            return await fn(context)
+
+    async def run(self, fn: Callable[[Any], Awaitable[T]], **context_kwargs) -> T:
+        """
+        Leases a fresh browser context and awaits ``fn(context)`` on the pool loop.
+
+        Args:
+            fn: Coroutine function receiving the leased browser context.
+            context_kwargs: Keyword arguments forwarded to ``browser.new_context``.
+
+        Returns:
+            The value returned by ``fn``.
+        """
+        return await arun_in_background(self._run(fn, context_kwargs))
+
+    def run_sync(
+        self,
+        fn: Callable[[Any], Awaitable[T]],
+        timeout: Optional[float] = None,
+        **context_kwargs,
+    ) -> T:
+        """
+        Synchronous counterpart of ``run`` for callers without an event loop.
+
+        Args:
+            fn: Coroutine function receiving the leased browser context.
+            timeout: Maximum number of seconds to wait; None waits indefinitely.
+            context_kwargs: Keyword arguments forwarded to ``browser.new_context``.
+
+        Returns:
+            The value returned by ``fn``.
+        """
+        return run_sync_in_background(self._run(fn, context_kwargs), timeout=timeout)
+
+    async def _close(self):
+        browsers, self._browsers = self._browsers, []
+        for pooled in browsers:
+            try:
+                await pooled.browser.close()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled browser: {e}")
+        if self._playwright is not None:
+            playwright, self._playwright = self._playwright, None
+            await playwright.stop()
+
+    def close(self, timeout: Optional[float] = 30):
+        """Closes every browser of the pool and stops Playwright."""
+        if self._playwright is None and not self._browsers:
+            return
+        run_sync_in_background(self._close(), timeout=timeout)
+
+
+_pools: Dict[str, BrowserPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(
+    browser_name: str = "chromium",
+    launch_kwargs: Optional[dict] = None,
+    max_browsers: int = DEFAULT_MAX_BROWSERS,
+    max_pages_per_browser: int = DEFAULT_MAX_PAGES_PER_BROWSER,
+) -> BrowserPool:
+    """
+    Returns the process-wide pool for the given browser type and launch options.
+
+    Browsers launched with different options (headless, proxy, extra args) cannot
+    serve each other's fetches, so each distinct combination gets its own pool.
+    The size limits of the first call win for a given combination.
+
+    Args:
+        browser_name: The Playwright browser type, 'chromium' or 'firefox'.
+        launch_kwargs: Keyword arguments forwarded to ``browser_type.launch``.
+        max_browsers: Maximum number of browsers kept alive by the pool.
+        max_pages_per_browser: Maximum number of concurrent contexts per browser.
+
+    Returns:
+        BrowserPool: The shared pool.
+    """
+    launch_kwargs = launch_kwargs or {}
+    key = json.dumps(
+        {"browser_name": browser_name, "launch_kwargs": launch_kwargs},
+        sort_keys=True,
+        default=str,
+    )
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = BrowserPool(
+                browser_name,
+                launch_kwargs,
+                max_browsers=max_browsers,
+                max_pages_per_browser=max_pages_per_browser,
+            )
+            _pools[key] = pool
+    return pool
+
+
+def close_browser_pools():
+    """Closes every process-wide browser pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser pool: {e}")
+
+
+atexit.register(close_browser_pools)
@@ -1,14 +1,54 @@
 import asyncio
+import contextvars
+import functools
+import inspect
+import time
 from typing import Any, AsyncIterator, Iterator, List, Optional, Union
+from urllib.parse import urlparse
 
 import aiohttp
 import async_timeout
 from langchain_core.documents import Document
 
 from ..utils import Proxy, dynamic_import, get_logger, parse_or_search_proxy
+from ..utils.fetch_scheduler import THROTTLE_STATUSES, get_fetch_scheduler
 
 logger = get_logger("web-loader")
 
+# Resource types aborted when ``block_resources=True``; the DOM never needs them.
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+
+# Network counters of the fetch running in the current task. Every fetch gets
+# its own dict, so the same URL fetched twice in a batch is counted twice.
+_fetch_stats: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "scrapegraphai_fetch_stats", default=None
+)
+
+# Counts nodes added to the DOM, so that new content is noticed even when a
+# virtualized list recycles its nodes and the page height stays the same.
+_SCROLL_OBSERVER_JS = """() => {
+    if (window.__scrapegraphScroll) return;
+    const state = (window.__scrapegraphScroll = {mutations: 0});
+    new MutationObserver((records) => {
+        for (const record of records) state.mutations += record.addedNodes.length;
+    }).observe(document.documentElement, {childList: true, subtree: true});
+}"""
+
+_SCROLL_PROBE_JS = """(selector) => ({
+    height: document.body ? document.body.scrollHeight : document.documentElement.scrollHeight,
+    nodes: document.getElementsByTagName("*").length,
+    mutations: window.__scrapegraphScroll ? window.__scrapegraphScroll.mutations : 0,
+    items: selector ? document.querySelectorAll(selector).length : 0,
+})"""
+
+_SCROLL_GROWTH_JS = """(probe) => {
+    const height = document.body ? document.body.scrollHeight : document.documentElement.scrollHeight;
+    const mutations = window.__scrapegraphScroll ? window.__scrapegraphScroll.mutations : 0;
+    return height > probe.height
+        || document.getElementsByTagName("*").length > probe.nodes
+        || mutations > probe.mutations;
+}"""
+
 
 class ChromiumLoader:
     """Scrapes HTML pages from URLs using a (headless) instance of the
@@ -21,6 +61,14 @@ class ChromiumLoader:
         proxy: A dictionary containing proxy settings; None disables protection.
         urls: A list of URLs to scrape content from.
         requires_js_support: Flag to determine if JS rendering is required.
+        browser_pool: Whether to lease browser contexts from the process-wide
+            browser pool instead of launching a browser per URL; a dict is
+            forwarded to the pool as its size limits.
+        max_concurrency: Maximum number of URLs scraped at the same time.
+        preserve_order: Whether documents are yielded in input order.
+        block_resources: Resource types and domains aborted during Playwright fetches.
+        infinite_scroll: Whether Playwright fetches scroll the page to load lazy content; a
+            dict is forwarded to ascrape_playwright_scroll.
     """
 
     def __init__(
@@ -36,6 +84,11 @@ class ChromiumLoader:
         browser_name: str = "chromium",  # default chromium
         retry_limit: int = 1,
         timeout: int = 60,
+        browser_pool: Union[bool, dict] = False,
+        max_concurrency: Optional[int] = None,
+        preserve_order: bool = True,
+        block_resources: Union[bool, dict] = False,
+        infinite_scroll: Union[bool, dict] = False,
         **kwargs: Any,
     ):
         """Initialize the loader with a list of URL paths.
@@ -48,6 +101,21 @@ class ChromiumLoader:
             requires_js_support: Whether to use JS rendering for scraping.
             retry_limit: Maximum number of retry attempts for scraping. Defaults to 3.
             timeout: Maximum time in seconds to wait for scraping. Defaults to 10.
+            browser_pool: Lease contexts from the shared browser pool. Accepts True or
+                a dict with ``max_browsers`` and ``max_pages_per_browser``.
+            max_concurrency: Maximum number of URLs scraped at the same time by
+                lazy_load/alazy_load. None means one at a time for lazy_load and
+                all at once for alazy_load.
+            preserve_order: Whether documents are yielded in the order of ``urls``
+                rather than in completion order.
+            block_resources: Abort requests the DOM does not need. True blocks images,
+                media and fonts; a dict accepts ``resource_types`` (Playwright
+                resource types) and ``domains`` (hosts blocked with their
+                subdomains). Per-fetch network counters are then added to the
+                Document metadata.
+            infinite_scroll: Fetch with ascrape_playwright_scroll when the backend is
+                'playwright'. Accepts True or a dict of its keyword arguments
+                (e.g. ``max_items`` and ``item_selector``).
             kwargs: A dictionary containing additional browser kwargs.
 
         Raises:
@@ -71,6 +139,108 @@ class ChromiumLoader:
         self.browser_name = kwargs.get("browser_name", browser_name)
         self.retry_limit = kwargs.get("retry_limit", retry_limit)
         self.timeout = kwargs.get("timeout", timeout)
+        self.browser_pool = browser_pool
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0.")
+        self.max_concurrency = max_concurrency
+        self.preserve_order = preserve_order
+        self.block_resources = block_resources
+        self.infinite_scroll = infinite_scroll
+
+    def _get_browser_pool(self, browser_name: str):
+        """Returns the shared browser pool matching this loader's launch options."""
+        from .browser_pool import get_browser_pool
+
+        pool_config = self.browser_pool if isinstance(self.browser_pool, dict) else {}
+        launch_kwargs = {
+            "headless": self.headless,
+            "proxy": self.proxy,
+            **self.browser_config,
+        }
+        return get_browser_pool(browser_name, launch_kwargs, **pool_config)
+
+    def _blocked_resources(self):
+        """Returns the blocked resource types and domains as a pair of sets."""
+        if isinstance(self.block_resources, dict):
+            resource_types = self.block_resources.get(
+                "resource_types", DEFAULT_BLOCKED_RESOURCE_TYPES
+            )
+            domains = self.block_resources.get("domains", [])
+        else:
+            resource_types = DEFAULT_BLOCKED_RESOURCE_TYPES
+            domains = []
+        return set(resource_types), {domain.lower().lstrip(".") for domain in domains}
+
+    async def _setup_resource_blocking(self, context):
+        """
+        Routes every request of the context through the resource blocklist and
+        records the network counters of the current fetch.
+
+        Does nothing unless ``block_resources`` is enabled.
+        """
+        if not self.block_resources:
+            return
+
+        resource_types, domains = self._blocked_resources()
+        stats = _fetch_stats.get()
+        if stats is None:
+            stats = {}
+        stats.update(requests_completed=0, requests_blocked=0, bytes_received=0)
+
+        def _is_blocked(request) -> bool:
+            if request.resource_type in resource_types:
+                return True
+            host = (urlparse(request.url).hostname or "").lower()
+            return any(host == d or host.endswith(f".{d}") for d in domains)
+
+        async def _route(route):
+            if _is_blocked(route.request):
+                stats["requests_blocked"] += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        async def _on_request_finished(request):
+            stats["requests_completed"] += 1
+            try:
+                sizes = await request.sizes()
+            except Exception:
+                return
+            stats["bytes_received"] += sizes.get("responseBodySize", 0) + sizes.get(
+                "responseHeadersSize", 0
+            )
+
+        await context.route("**/*", _route)
+        context.on("requestfinished", _on_request_finished)
+
+    def _report_navigation(self, url: str, response):
+        """Feeds the status of a page navigation back into the fetch scheduler."""
+        headers = getattr(response, "headers", None)
+        get_fetch_scheduler().report(
+            url,
+            getattr(response, "status", None),
+            headers if isinstance(headers, dict) else None,
+        )
+
+    async def _navigate(self, page, url: str, wait_until: str):
+        """
+        Opens ``url`` in the page and reports the response to the fetch scheduler.
+
+        A 429/503 answer is navigated again once the scheduler's backoff for the
+        host is over, at most ``max_retries`` times, like on the HTTP tier.
+        """
+        scheduler = get_fetch_scheduler()
+        attempt = 0
+        while True:
+            response = await page.goto(url, wait_until=wait_until)
+            self._report_navigation(url, response)
+            if (
+                getattr(response, "status", None) not in THROTTLE_STATUSES
+                or attempt >= scheduler.max_retries
+            ):
+                return response
+            attempt += 1
+            await asyncio.sleep(scheduler.remaining_pause(url))
 
     async def scrape(self, url: str) -> str:
         if self.backend == "playwright":
@@ -170,27 +340,34 @@ class ChromiumLoader:
         sleep: float = 2,
         scroll_to_bottom: bool = False,
         browser_name: str = "chromium",  # default chrome is added
+        max_items: Optional[int] = None,
+        item_selector: Optional[str] = None,
+        max_stalls: int = 3,
     ) -> str:
         """
-        Asynchronously scrape the content of a given URL using Playwright's sync API and scrolling.
+        Asynchronously scrape the content of a given URL using Playwright's async API and scrolling.
 
         Notes:
         - The user gets to decide between scrolling to the bottom of the page or scrolling by a finite amount of time.
-        - If the user chooses to scroll to the bottom, the scraper will stop when the page height stops changing or when
-        the timeout is reached. In this case, the user should opt for an appropriate timeout value i.e. larger than usual.
-        - Sleep needs to be set to a value greater than 0 to allow lazy-loaded content to load.
-        Additionally, if used with scroll_to_bottom=True, the sleep value should be set to a higher value, to
-        make sure that the scrolling actually happens, thereby allowing the page height to change.
+        - After each scroll the page is given up to `sleep` seconds to add content. New content is detected from
+        the DOM itself (added nodes, node count, scroll height), so waiting ends as soon as the page grows and
+        never blocks the event loop of other pages being scraped concurrently.
+        - A scroll that adds no content is a stall; scrolling stops after `max_stalls` consecutive stalls, when
+        `max_items` elements match `item_selector`, or when the timeout is reached.
         - Probably the best website to test this is https://www.reddit.com/ as it has infinite scrolling.
 
         Args:
         - url (str): The URL to scrape.
         - timeout (Union[int, None]): The maximum time to spend scrolling. This is separate from the global timeout. If set, must be greater than 0.
-        Can also be set to None, in which case the scraper will only stop when the page height stops changing.
+        Can also be set to None, in which case the scraper will only stop when the page stops producing content.
         - scroll (float): The number of pixels to scroll down by. Defaults to 15000. Cannot be less than 5000 pixels.
         Less than this and we don't scroll enough to see any content change.
-        - sleep (int): The number of seconds to sleep after each scroll, to allow the page to load.
+        - sleep (int): The maximum number of seconds to wait for new content after each scroll.
         Defaults to 2. Must be greater than 0.
+        - scroll_to_bottom (bool): Stop at the first scroll that adds no content instead of after `max_stalls`.
+        - max_items (Optional[int]): Stop once this many elements match `item_selector`.
+        - item_selector (Optional[str]): CSS selector of the items counted against `max_items`.
+        - max_stalls (int): Consecutive scrolls without new content after which scrolling stops. Defaults to 3.
 
         Returns:
             str: The scraped HTML content
@@ -199,13 +376,9 @@ class ChromiumLoader:
         - ValueError: If the timeout value is less than or equal to 0.
         - ValueError: If the sleep value is less than or equal to 0.
         - ValueError: If the scroll value is less than 5000.
+        - ValueError: If max_items is set without item_selector, or max_stalls is less than 1.
         """
-        # NB: I have tested using scrollHeight to determine when to stop scrolling
-        # but it doesn't always work as expected. The page height doesn't change on some sites like
-        # https://www.steelwood.amsterdam/. The site deos not scroll to the bottom.
-        # In my browser I can scroll vertically but in Chromium it scrolls horizontally?!?
-
-        if timeout and timeout <= 0:
+        if timeout is not None and timeout <= 0:
             raise ValueError(
                 "If set, timeout value for scrolling scraper must be greater than 0."
             )
@@ -220,20 +393,77 @@ class ChromiumLoader:
                 "Scroll value for scrolling scraper must be greater than or equal to 5000."
             )
 
-        import time
+        if max_items is not None and not item_selector:
+            raise ValueError("max_items requires an item_selector to count items.")
+
+        if max_stalls < 1:
+            raise ValueError("max_stalls must be greater than 0.")
 
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
         from playwright.async_api import async_playwright
         from undetected_playwright import Malenia
 
         logger.info(f"Starting scraping with scrolling support for {url}...")
 
+        stall_limit = 1 if scroll_to_bottom else max_stalls
+
+        async def _scroll_page(context):
+            await self._setup_resource_blocking(context)
+            await Malenia.apply_stealth(context)
+            page = await context.new_page()
+            await self._navigate(page, url, "domcontentloaded")
+            await page.wait_for_load_state(self.load_state)
+            await page.evaluate(_SCROLL_OBSERVER_JS)
+
+            start_time = time.monotonic()
+            stalls = 0
+
+            while True:
+                probe = await page.evaluate(_SCROLL_PROBE_JS, item_selector)
+
+                if max_items is not None and probe["items"] >= max_items:
+                    logger.info(f"Collected {probe['items']} items for url {url}")
+                    break
+
+                await page.mouse.wheel(0, scroll)
+                logger.debug(f"Scrolled {url} at height {probe['height']}px...")
+
+                # Wait until the page adds content, at most `sleep` seconds.
+                try:
+                    await page.wait_for_function(
+                        _SCROLL_GROWTH_JS, arg=probe, timeout=sleep * 1000
+                    )
+                    stalls = 0
+                except PlaywrightTimeoutError:
+                    stalls += 1
+
+                if stalls >= stall_limit:
+                    logger.info(
+                        f"No new content for url {url} after {stalls} scrolls. Stopping."
+                    )
+                    break
+
+                elapsed_time = time.monotonic() - start_time
+                logger.debug(f"Elapsed time: {elapsed_time} seconds")
+                if timeout and elapsed_time >= timeout:
+                    logger.info(f"Reached timeout of {timeout} seconds for url {url}")
+                    break
+
+            return await page.content()
+
         results = ""
         attempt = 0
 
         while attempt < self.retry_limit:
+            browser = None
             try:
+                if self.browser_pool:
+                    results = await self._get_browser_pool(browser_name).run(
+                        _scroll_page
+                    )
+                    break
+
                 async with async_playwright() as p:
-                    browser = None
                     if browser_name == "chromium":
                         browser = await p.chromium.launch(
                             headless=self.headless,
@@ -249,62 +479,7 @@ class ChromiumLoader:
                     else:
                         raise ValueError(f"Invalid browser name: {browser_name}")
                     context = await browser.new_context()
-                    await Malenia.apply_stealth(context)
-                    page = await context.new_page()
-                    await page.goto(url, wait_until="domcontentloaded")
-                    await page.wait_for_load_state(self.load_state)
-
-                    previous_height = None
-                    start_time = time.time()
-
-                    # Store the heights of the page after each scroll
-                    # This is useful in case we scroll with a timer and want to stop shortly after reaching the bottom
-                    # or simly when the page stops changing for some reason.
-                    heights = []
-
-                    while True:
-                        current_height = await page.evaluate(
-                            "document.body ? document.body.scrollHeight : document.documentElement.scrollHeight"
-                        )
-                        heights.append(current_height)
-                        heights = heights[
-                            -5:
-                        ]  # Keep only the last 5 heights, to not run out of memory
-
-                        # Break if we've reached the bottom of the page i.e. if scrolling makes no more progress
-                        # Attention!!! This is not always reliable. Sometimes the page might not change due to lazy loading
-                        # or other reasons. In such cases, the user should set scroll_to_bottom=False and set a timeout.
-                        if scroll_to_bottom and previous_height == current_height:
-                            logger.info(f"Reached bottom of page for url {url}")
-                            break
-
-                        previous_height = current_height
-
-                        await page.mouse.wheel(0, scroll)
-                        logger.debug(
-                            f"Scrolled {url} to current height {current_height}px..."
-                        )
-                        time.sleep(
-                            sleep
-                        )  # Allow some time for any lazy-loaded content to load
-
-                        current_time = time.time()
-                        elapsed_time = current_time - start_time
-                        logger.debug(f"Elapsed time: {elapsed_time} seconds")
-
-                        if timeout:
-                            if elapsed_time >= timeout:
-                                logger.info(
-                                    f"Reached timeout of {timeout} seconds for url {url}"
-                                )
-                                break
-                            elif len(heights) == 5 and len(set(heights)) == 1:
-                                logger.info(
-                                    f"Page height has not changed for url {url} for the last 5 scrolls. Stopping."
-                                )
-                                break
-
-                    results = await page.content()
+                    results = await _scroll_page(context)
                     break
 
             except (aiohttp.ClientError, asyncio.TimeoutError, Exception) as e:
@@ -315,7 +490,8 @@ class ChromiumLoader:
                         f"Error: Network error after {self.retry_limit} attempts - {e}"
                     )
             finally:
-                await browser.close()
+                if browser is not None:
+                    await browser.close()
 
         return results
 
@@ -340,8 +516,26 @@ class ChromiumLoader:
         results = ""
         attempt = 0
 
+        async def _scrape_page(context):
+            await self._setup_resource_blocking(context)
+            await Malenia.apply_stealth(context)
+            page = await context.new_page()
+            await self._navigate(page, url, "domcontentloaded")
+            await page.wait_for_load_state(self.load_state)
+            return await page.content()
+
         while attempt < self.retry_limit:
             try:
+                if self.browser_pool:
+                    async with async_timeout.timeout(self.timeout):
+                        results = await self._get_browser_pool(browser_name).run(
+                            _scrape_page,
+                            storage_state=self.storage_state,
+                            ignore_https_errors=True,
+                        )
+                    logger.info("Content scraped")
+                    return results
+
                 async with async_playwright() as p, async_timeout.timeout(self.timeout):
                     browser = None
                     if browser_name == "chromium":
@@ -362,11 +556,7 @@ class ChromiumLoader:
                         storage_state=self.storage_state,
                         ignore_https_errors=True,
                     )
-                    await Malenia.apply_stealth(context)
-                    page = await context.new_page()
-                    await page.goto(url, wait_until="domcontentloaded")
-                    await page.wait_for_load_state(self.load_state)
-                    results = await page.content()
+                    results = await _scrape_page(context)
                     logger.info("Content scraped")
                     await browser.close()
                     return results
@@ -399,8 +589,23 @@ class ChromiumLoader:
         logger.info(f"Starting scraping with JavaScript support for {url}...")
         attempt = 0
 
+        async def _render_page(context):
+            await self._setup_resource_blocking(context)
+            page = await context.new_page()
+            await self._navigate(page, url, "networkidle")
+            return await page.content()
+
         while attempt < self.retry_limit:
+            browser = None
             try:
+                if self.browser_pool:
+                    async with async_timeout.timeout(self.timeout):
+                        results = await self._get_browser_pool(browser_name).run(
+                            _render_page, storage_state=self.storage_state
+                        )
+                    logger.info("Content scraped after JavaScript rendering")
+                    return results
+
                 async with async_playwright() as p, async_timeout.timeout(self.timeout):
                     browser = None
                     if browser_name == "chromium":
@@ -420,9 +625,7 @@ class ChromiumLoader:
                     context = await browser.new_context(
                         storage_state=self.storage_state
                     )
-                    page = await context.new_page()
-                    await page.goto(url, wait_until="networkidle")
-                    results = await page.content()
+                    results = await _render_page(context)
                     logger.info("Content scraped after JavaScript rendering")
                     return results
             except (aiohttp.ClientError, asyncio.TimeoutError, Exception) as e:
@@ -433,7 +636,8 @@ class ChromiumLoader:
                         f"Failed to scrape after {self.retry_limit} attempts: {str(e)}"
                     )
             finally:
-                await browser.close()
+                if browser is not None:
+                    await browser.close()
 
     def load(self) -> List[Document]:
         """Load all documents synchronously."""
@@ -443,48 +647,116 @@ class ChromiumLoader:
         """Load all documents asynchronously."""
         return [doc async for doc in self.alazy_load()]
 
+    def _get_scraping_fn(self):
+        if self.requires_js_support:
+            return self.ascrape_with_js_support
+        if self.infinite_scroll and self.backend == "playwright":
+            scroll_kwargs = (
+                self.infinite_scroll if isinstance(self.infinite_scroll, dict) else {}
+            )
+            return functools.partial(self.ascrape_playwright_scroll, **scroll_kwargs)
+        return getattr(self, f"ascrape_{self.backend}")
+
+    async def _scrape_document(self, scraping_fn, url: str) -> Document:
+        stats = {}
+        token = _fetch_stats.set(stats)
+        try:
+            # Every scraping backend goes through the per-host politeness scheduler.
+            async with get_fetch_scheduler().aslot(url):
+                pending = scraping_fn(url)
+                if not inspect.isawaitable(pending):
+                    raise ValueError(f"a coroutine was expected, got {pending!r}")
+                html_content = await pending
+        finally:
+            _fetch_stats.reset(token)
+        return Document(page_content=html_content, metadata={"source": url, **stats})
+
+    async def _astream_documents(
+        self, urls: List[str], max_concurrency: Optional[int]
+    ) -> AsyncIterator[Document]:
+        """
+        Scrapes every URL on the current event loop with at most ``max_concurrency``
+        pages in flight, yielding each Document as soon as it is available.
+
+        When ``preserve_order`` is set, finished Documents are buffered until all the
+        URLs before them are done, so the output order matches ``self.urls``.
+        """
+        scraping_fn = self._get_scraping_fn()
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def _fetch(index: int, url: str):
+            if semaphore is None:
+                return index, await self._scrape_document(scraping_fn, url)
+            async with semaphore:
+                return index, await self._scrape_document(scraping_fn, url)
+
+        tasks = [asyncio.ensure_future(_fetch(i, url)) for i, url in enumerate(urls)]
+        finished = {}
+        next_index = 0
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, document = await next_done
+                if not self.preserve_order:
+                    yield document
+                    continue
+
+                finished[index] = document
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+        finally:
+            pending_tasks = [task for task in tasks if not task.done()]
+            for task in pending_tasks:
+                task.cancel()
+            if pending_tasks:
+                await asyncio.gather(*pending_tasks, return_exceptions=True)
+
     def lazy_load(self) -> Iterator[Document]:
         """
         Lazily load text content from the provided URLs.
 
         This method yields Documents one at a time as they're scraped,
-        instead of waiting to scrape all URLs before returning.
+        instead of waiting to scrape all URLs before returning. All URLs share
+        a single event loop; ``max_concurrency`` (default 1) bounds how many are
+        scraped at the same time.
 
         Yields:
             Document: The scraped content encapsulated within a Document object.
         """
-        scraping_fn = (
-            self.ascrape_with_js_support
-            if self.requires_js_support
-            else getattr(self, f"ascrape_{self.backend}")
-        )
+        urls = list(self.urls)
+        if not urls:
+            return
+
+        documents = self._astream_documents(urls, self.max_concurrency or 1)
 
-        for url in self.urls:
-            html_content = asyncio.run(scraping_fn(url))
-            metadata = {"source": url}
-            yield Document(page_content=html_content, metadata=metadata)
+        async def _next_document():
+            return await documents.__anext__()
+
+        with asyncio.Runner() as runner:
+            try:
+                while True:
+                    try:
+                        document = runner.run(_next_document())
+                    except StopAsyncIteration:
+                        break
+                    yield document
+            finally:
+                runner.run(documents.aclose())
 
     async def alazy_load(self) -> AsyncIterator[Document]:
         """
         Asynchronously load text content from the provided URLs.
 
-        This method leverages asyncio to initiate the scraping of all provided URLs
-        simultaneously. It improves performance by utilizing concurrent asynchronous
-        requests. Each Document is yielded as soon as its content is available,
-        encapsulating the scraped content.
+        This method leverages asyncio to scrape the provided URLs concurrently,
+        with at most ``max_concurrency`` pages in flight (unbounded by default).
+        Each Document is yielded as soon as its content is available, restoring
+        the input order unless ``preserve_order`` is False.
 
         Yields:
             Document: A Document object containing the scraped content, along with its
             source URL as metadata.
         """
-        scraping_fn = (
-            self.ascrape_with_js_support
-            if self.requires_js_support
-            else getattr(self, f"ascrape_{self.backend}")
-        )
-
-        tasks = [scraping_fn(url) for url in self.urls]
-        results = await asyncio.gather(*tasks)
-        for url, content in zip(self.urls, results):
-            metadata = {"source": url}
-            yield Document(page_content=content, metadata=metadata)
+        urls = list(self.urls)
+        async for document in self._astream_documents(urls, self.max_concurrency):
+            yield document
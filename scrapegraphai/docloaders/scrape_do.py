@@ -5,10 +5,8 @@ Scrape_do module
 import os
 import urllib.parse
 
-import requests
-import urllib3
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from ..utils.fetch_scheduler import get_fetch_scheduler
+from ..utils.http_client import get_http_client
 
 
 def scrape_do_fetch(
@@ -27,24 +25,28 @@ def scrape_do_fetch(
 
     Returns:
         str: The raw response from the target URL.
+
+    Requests go through the shared HTTP client and are throttled per target
+    host by the shared fetch scheduler.
     """
     encoded_url = urllib.parse.quote(target_url)
+    client = get_http_client()
     if use_proxy:
         proxy_scrape_do_url = os.getenv("PROXY_SCRAPE_DO_URL", "proxy.scrape.do:8080")
         proxy_mode_url = f"http://{token}:@{proxy_scrape_do_url}"
-        proxies = {
-            "http": proxy_mode_url,
-            "https": proxy_mode_url,
-        }
         params = (
             {"geoCode": geoCode, "super": str(super_proxy).lower()} if geoCode else {}
         )
-        response = requests.get(
-            target_url, proxies=proxies, verify=False, params=params
+        response = client.get_sync(
+            target_url, proxy=proxy_mode_url, verify=False, params=params
         )
     else:
         api_scrape_do_url = os.getenv("API_SCRAPE_DO_URL", "api.scrape.do")
         url = f"http://{api_scrape_do_url}?token={token}&url={encoded_url}"
-        response = requests.get(url)
+        # The API host is not the scraped site: throttle on the target host.
+        scheduler = get_fetch_scheduler()
+        with scheduler.slot(target_url):
+            response = client.get_sync(url, schedule=False)
+        scheduler.report(target_url, response.status, response.headers)
 
     return response.text
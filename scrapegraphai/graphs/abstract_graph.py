@@ -3,18 +3,25 @@ AbstractGraph Module
 """
 
 import asyncio
+import os
 import uuid
 import warnings
 from abc import ABC, abstractmethod
 from typing import Optional, Type
 
 from langchain.chat_models import init_chat_model
-from langchain_core.rate_limiters import InMemoryRateLimiter
 from pydantic import BaseModel
 
 from ..helpers import models_tokens
 from ..models import XAI, CLoD, DeepSeek, MiniMax, Nvidia, OneApi
+from ..utils.fetch_scheduler import get_fetch_scheduler
+from ..utils.http_client import configure_http_client
+from ..utils.llm_cache import DEFAULT_FILENAME, get_llm_cache
+from ..utils.llm_clients import UNSHARED_PROVIDERS, get_llm_client
+from ..utils.llm_scheduler import AdmissionLimiter, get_llm_scheduler
 from ..utils.logging import get_logger, set_verbosity_info, set_verbosity_warning
+from ..utils.map_executor import get_map_executor
+from ..utils.tokenizers.encoding_cache import configure_encoding_cache
 
 logger = get_logger(__name__)
 
@@ -72,12 +79,27 @@ class AbstractGraph(ABC):
         self.headless = True if self.config is None else config.get("headless", True)
         self.loader_kwargs = self.config.get("loader_kwargs", {})
         self.cache_path = self.config.get("cache_path", False)
+        self.fetch_cache = self.config.get("fetch_cache", {})
         self.browser_base = self.config.get("browser_base")
         self.scrape_do = self.config.get("scrape_do")
         self.storage_state = self.config.get("storage_state")
         self.timeout = self.config.get("timeout", 480)
+        self.fetch_mode = self.config.get("fetch_mode", "browser")
+        self.markdown_engine = self.config.get("markdown_engine", "html2text")
+
+        # Per-host politeness limits are process-wide, shared by every fetcher.
+        if self.config.get("fetch_scheduler"):
+            get_fetch_scheduler().configure(**self.config["fetch_scheduler"])
+        if self.config.get("http_client"):
+            configure_http_client(**self.config["http_client"])
+        if self.config.get("map_executor"):
+            get_map_executor(self.llm_model).configure(**self.config["map_executor"])
+        if self.config.get("tokenizer_cache_dir"):
+            configure_encoding_cache(self.config["tokenizer_cache_dir"])
 
         self.graph = self._create_graph()
+        if self.config.get("deadline") is not None:
+            self.graph.deadline = self.config["deadline"]
         self.final_state = None
         self.execution_info = None
 
@@ -94,8 +116,14 @@ class AbstractGraph(ABC):
             "loader_kwargs": self.loader_kwargs,
             "llm_model": self.llm_model,
             "cache_path": self.cache_path,
+            "fetch_cache": self.fetch_cache,
             "timeout": self.timeout,
+            "fetch_mode": self.fetch_mode,
+            "markdown_engine": self.markdown_engine,
         }
+        # None (the default) lets each node mark prompts when its provider needs it.
+        if self.config.get("cache_control") is not None:
+            common_params["cache_control"] = self.config["cache_control"]
 
         self.set_common_params(common_params, overwrite=True)
 
@@ -136,24 +164,31 @@ class AbstractGraph(ABC):
         llm_params = {**llm_defaults, **llm_config}
         rate_limit_params = llm_params.pop("rate_limit", {})
 
-        if rate_limit_params:
-            requests_per_second = rate_limit_params.get("requests_per_second")
-            max_retries = rate_limit_params.get("max_retries")
-            if requests_per_second is not None:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    llm_params["rate_limiter"] = InMemoryRateLimiter(
-                        requests_per_second=requests_per_second
-                    )
-            if max_retries is not None:
-                llm_params["max_retries"] = max_retries
+        if rate_limit_params.get("max_retries") is not None:
+            llm_params["max_retries"] = rate_limit_params["max_retries"]
+
+        llm_cache = self._create_llm_cache()
+        if llm_cache is not None:
+            llm_params["cache"] = llm_cache
 
         if "model_instance" in llm_params:
             try:
                 self.model_token = llm_params["model_tokens"]
             except KeyError as exc:
                 raise KeyError("model_tokens not specified") from exc
-            return llm_params["model_instance"]
+            model_instance = llm_params["model_instance"]
+            if llm_cache is not None and hasattr(model_instance, "cache"):
+                model_instance.cache = llm_cache
+            limiter = self._create_admission_limiter(
+                rate_limit_params,
+                llm_params.get("model_provider", type(model_instance).__name__),
+                getattr(model_instance, "model_name", None)
+                or getattr(model_instance, "model", None)
+                or "",
+            )
+            if limiter is not None:
+                limiter.attach(model_instance)
+            return model_instance
 
         known_providers = {
             "openai",
@@ -233,6 +268,60 @@ class AbstractGraph(ABC):
         # Consumed by ScrapeGraphAI; must not be forwarded to the model client.
         llm_params.pop("model_tokens", None)
 
+        # A call abandoned at the node timeout is then ended by its client.
+        if (
+            llm_params["model_provider"]
+            in {
+                "openai",
+                "azure_openai",
+                "anthropic",
+                "mistralai",
+                "groq",
+                "google_genai",
+                "fireworks",
+                "togetherai",
+                "deepseek",
+                "oneapi",
+                "xai",
+                "minimax",
+                "clod",
+            }
+            and "timeout" not in llm_params
+            and "request_timeout" not in llm_params
+            and self.config.get("timeout", 480) is not None
+        ):
+            llm_params["timeout"] = self.config.get("timeout", 480)
+
+        def build_llm():
+            limiter = self._create_admission_limiter(
+                rate_limit_params, llm_params["model_provider"], llm_params["model"]
+            )
+            llm_model = self._instantiate_llm(dict(llm_params))
+            if limiter is not None:
+                limiter.attach(llm_model)
+            return llm_model
+
+        if (
+            not self.config.get("share_llm_client", True)
+            or llm_params["model_provider"] in UNSHARED_PROVIDERS
+        ):
+            return build_llm()
+        # Graphs configured alike (e.g. the sub-graphs of a multi-URL run)
+        # reuse one client, hence one connection pool.
+        return get_llm_client(
+            {**llm_params, "rate_limit": rate_limit_params}, build_llm
+        )
+
+    def _instantiate_llm(self, llm_params: dict) -> object:
+        """
+        Instantiates the model client of llm_params["model_provider"].
+
+        Args:
+            llm_params (dict): The resolved model parameters.
+
+        Returns:
+            object: An instance of the language model client.
+        """
         try:
             if llm_params["model_provider"] not in {
                 "oneapi",
@@ -290,6 +379,54 @@ class AbstractGraph(ABC):
         except Exception as e:
             raise Exception(f"Error instancing model: {e}")
 
+    def _create_admission_limiter(
+        self, rate_limit_params: dict, provider: str, model: str
+    ) -> Optional[AdmissionLimiter]:
+        """
+        Creates the rate limiter admitting the model's calls under the
+        process-wide budget of (provider, model), set from the "rate_limit"
+        llm key: "requests_per_second" or "requests_per_minute",
+        "tokens_per_minute" and "burst_seconds". Graphs using the same model
+        share the budget.
+
+        Returns:
+            AdmissionLimiter: The limiter, or None when no limit is set.
+        """
+        requests_per_minute = rate_limit_params.get("requests_per_minute")
+        if rate_limit_params.get("requests_per_second") is not None:
+            requests_per_minute = rate_limit_params["requests_per_second"] * 60
+        tokens_per_minute = rate_limit_params.get("tokens_per_minute")
+        if requests_per_minute is None and tokens_per_minute is None:
+            return None
+
+        scheduler = get_llm_scheduler()
+        scheduler.configure(
+            provider,
+            model,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            burst_seconds=rate_limit_params.get("burst_seconds"),
+        )
+        return AdmissionLimiter(scheduler, provider, model)
+
+    def _create_llm_cache(self):
+        """
+        Opens the LLM response cache enabled by the "llm_cache" config key:
+        True, or a dict with "path", "ttl" (seconds) and "max_size_mb". The
+        database defaults to a file under cache_path, else the working directory.
+
+        Returns:
+            SQLiteLLMCache: The cache, or None when it is not enabled.
+        """
+        options = self.config.get("llm_cache")
+        if not options:
+            return None
+        options = dict(options) if isinstance(options, dict) else {}
+        path = options.pop("path", None) or os.path.join(
+            str(self.config.get("cache_path") or "."), DEFAULT_FILENAME
+        )
+        return get_llm_cache(path, **options)
+
     def get_state(self, key=None) -> dict:
         """ ""
         Get the final state of the graph.
@@ -315,6 +452,101 @@ class AbstractGraph(ABC):
 
         self.graph.append_node(node)
 
+    def _with_main_content(self, fetch_node, nodes: list, edges: list):
+        """
+        Inserts a MainContentNode right after the fetch node when the
+        ``main_content`` option is set, so only the main content of the pages
+        reaches the LLM.
+
+        The option is True, or a dict of MainContentNode settings
+        (``min_text_length``, ``link_density_threshold``).
+
+        Args:
+            fetch_node (FetchNode): The node fetching the pages.
+            nodes (list): The nodes of the graph.
+            edges (list): The edges of the graph.
+
+        Returns:
+            tuple: The nodes and edges, with the extraction stage when enabled.
+        """
+        options = self.config.get("main_content")
+        if not options:
+            return nodes, edges
+
+        from ..nodes import MainContentNode
+
+        main_content_node = MainContentNode(
+            input="doc",
+            output=["doc"],
+            node_config={
+                "llm_model": self.llm_model,
+                **(options if isinstance(options, dict) else {}),
+            },
+        )
+        fetch_node.defer_markdown = True
+
+        edges = [
+            (main_content_node if source is fetch_node else source, target)
+            for source, target in edges
+        ]
+        index = nodes.index(fetch_node) + 1
+        nodes = nodes[:index] + [main_content_node] + nodes[index:]
+        return nodes, [(fetch_node, main_content_node)] + edges
+
+    def _with_structured_data(self, fetch_node, nodes: list, edges: list):
+        """
+        Inserts a StructuredDataNode right after the fetch node when the
+        ``structured_data`` option is set, followed by a ConditionalNode that
+        ends the run when the page's structured data already filled the schema.
+
+        The option needs a pydantic schema; it is ignored otherwise.
+
+        Args:
+            fetch_node (FetchNode): The node fetching the pages.
+            nodes (list): The nodes of the graph.
+            edges (list): The edges of the graph.
+
+        Returns:
+            tuple: The nodes and edges, with the fast path when enabled.
+        """
+        if not self.config.get("structured_data"):
+            return nodes, edges
+        if not (isinstance(self.schema, type) and issubclass(self.schema, BaseModel)):
+            logger.warning("structured_data needs a pydantic schema, ignoring it")
+            return nodes, edges
+
+        from ..nodes import ConditionalNode, StructuredDataNode
+
+        structured_data_node = StructuredDataNode(
+            input="doc",
+            output=["answer", "doc"],
+            node_config={
+                "schema": self.schema,
+                "defer_markdown": getattr(fetch_node, "defer_markdown", False),
+            },
+        )
+        answered_node = ConditionalNode(
+            input="answer",
+            output=["answer"],
+            node_name="StructuredDataCond",
+            node_config={"key_name": "answer", "condition": "not answer"},
+        )
+        fetch_node.defer_markdown = True
+
+        # The LLM nodes run when no answer was found; the run ends otherwise.
+        edges = [
+            (answered_node if source is fetch_node else source, target)
+            for source, target in edges
+        ]
+        index = nodes.index(fetch_node) + 1
+        nodes = nodes[:index] + [structured_data_node, answered_node] + nodes[index:]
+        return nodes, [
+            (fetch_node, structured_data_node),
+            (structured_data_node, answered_node),
+            *edges,
+            (answered_node, None),
+        ]
+
     def get_execution_info(self):
         """
         Returns the execution information of the graph.
@@ -331,15 +563,45 @@ class AbstractGraph(ABC):
         Abstract method to create a graph representation.
         """
 
-    @abstractmethod
+    def _run_inputs(self) -> dict:
+        """
+        Returns the initial state of a run; graphs reading other keys override it.
+        """
+        return {"user_prompt": self.prompt, self.input_key: self.source}
+
+    def _run_result(self):
+        """
+        Returns the result of a finished run from ``self.final_state``; graphs
+        returning another key, or acting on the result, override it.
+        """
+        return self.final_state.get("answer", "No answer found.")
+
     def run(self) -> str:
         """
-        Abstract method to execute the graph and return the result.
+        Executes the graph and returns the result.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+        self.final_state, self.execution_info = self.graph.execute(self._run_inputs())
+        return self._run_result()
+
+    async def arun(self) -> str:
+        """
+        Executes the graph on the running event loop and returns the result,
+        so many graphs can run concurrently without a thread each.
+
+        Returns:
+            str: The answer to the prompt.
         """
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-        result = self.final_state.get("answer", "No answer found.")
-        return result
+        if type(self).run is not AbstractGraph.run:
+            # Graphs overriding run rather than its hooks keep their own logic.
+            return await asyncio.to_thread(self.run)
+
+        self.final_state, self.execution_info = await self.graph.aexecute(
+            self._run_inputs()
+        )
+        return self._run_result()
 
     async def run_safe_async(self) -> str:
         """
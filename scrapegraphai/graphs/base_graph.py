@@ -2,13 +2,18 @@
 base_graph module
 """
 
+import asyncio
+import contextlib
 import time
 import warnings
-from typing import Tuple
+from typing import Generator, Tuple
 
 from ..telemetry import log_graph_execution
 from ..utils import CustomLLMCallbackManager
+from ..utils.deadline import check_deadline, deadline_scope
+from ..utils.llm_cache import SQLiteLLMCache, count_cache_lookups
 from ..utils.logging import get_logger
+from ..utils.steps import adrive_steps, drive_steps
 
 logger = get_logger(__name__)
 
@@ -30,6 +35,8 @@ class BaseGraph:
         edges (iterable): An iterable of tuples where each tuple represents a directed edge
                           in the graph, defined by a pair of nodes (from_node, to_node).
         entry_point (BaseNode): The node instance that represents the entry point of the graph.
+        deadline (float): Seconds allowed for a whole run, LLM calls included;
+                          None for no bound.
 
     Raises:
         Warning: If the entry point node is not the first node in the list.
@@ -61,6 +68,7 @@ class BaseGraph:
         use_burr: bool = False,
         burr_config: dict = None,
         graph_name: str = "Custom",
+        deadline: float = None,
     ):
         self.nodes = nodes
         self.raw_edges = edges
@@ -79,6 +87,7 @@ class BaseGraph:
 
         self.use_burr = use_burr
         self.burr_config = burr_config or {}
+        self.deadline = deadline
 
     def _create_edges(self, edges: list) -> dict:
         """
@@ -113,15 +122,11 @@ class BaseGraph:
                         f"ConditionalNode '{node.node_name}' must have exactly two outgoing edges."
                     )
                 node.true_node_name = outgoing_edges[0][1].node_name
-                try:
-                    node.false_node_name = outgoing_edges[1][1].node_name
-                except (IndexError, AttributeError) as e:
-                    # IndexError: If outgoing_edges[1] doesn't exist
-                    # AttributeError: If to_node is None or doesn't have node_name
-                    node.false_node_name = None
-                    raise ValueError(
-                        f"Failed to set false_node_name for ConditionalNode '{node.node_name}'"
-                    ) from e
+                # A false edge to None ends the run, e.g. (cond_node, None).
+                false_node = outgoing_edges[1][1]
+                node.false_node_name = (
+                    None if false_node is None else false_node.node_name
+                )
 
     def _get_node_by_name(self, node_name: str):
         """Returns a node instance by its name."""
@@ -195,14 +200,28 @@ class BaseGraph:
         except Exception:
             return None
 
-    def _execute_node(self, current_node, state, llm_model, llm_model_name):
-        """Executes a single node and returns execution information."""
+    @contextlib.contextmanager
+    def _node_metrics(self, current_node, llm_model, llm_model_name, scoped=False):
+        """
+        Measures the node run in the block, yielding a dict that holds its
+        execution time and, when a callback is available, its LLM usage.
+
+        Async runs use a callback scoped to their own context (``scoped``), so
+        concurrent graphs each get their metrics and no lock spans an await.
+        """
         curr_time = time.time()
+        uses_cache = isinstance(getattr(llm_model, "cache", None), SQLiteLLMCache)
+        metrics = {}
+        get_callback = (
+            self.callback_manager.scoped_get_callback
+            if scoped
+            else self.callback_manager.exclusive_get_callback
+        )
 
-        with self.callback_manager.exclusive_get_callback(
+        with get_callback(
             llm_model, llm_model_name
-        ) as cb:
-            result = current_node.execute(state)
+        ) as cb, count_cache_lookups() as cache_counts:
+            yield metrics
             node_exec_time = time.time() - curr_time
 
             cb_data = None
@@ -212,12 +231,34 @@ class BaseGraph:
                     "total_tokens": cb.total_tokens,
                     "prompt_tokens": cb.prompt_tokens,
                     "completion_tokens": cb.completion_tokens,
+                    "cached_tokens": getattr(
+                        cb, "cached_tokens", getattr(cb, "prompt_tokens_cached", 0)
+                    ),
                     "successful_requests": cb.successful_requests,
                     "total_cost_USD": cb.total_cost,
                     "exec_time": node_exec_time,
                 }
+                # Nodes may report their own figures, e.g. tokens saved.
+                cb_data.update(getattr(current_node, "execution_metrics", None) or {})
+                # Counted per run: the cache may serve concurrent graphs.
+                if uses_cache:
+                    cb_data.update(cache_counts)
+
+        metrics.update(exec_time=node_exec_time, cb_data=cb_data)
+
+    def _execute_node(self, current_node, state, llm_model, llm_model_name):
+        """Executes a single node and returns execution information."""
+        with self._node_metrics(current_node, llm_model, llm_model_name) as metrics:
+            result = current_node.execute(state)
+        return result, metrics["exec_time"], metrics["cb_data"]
 
-        return result, node_exec_time, cb_data
+    async def _aexecute_node(self, current_node, state, llm_model, llm_model_name):
+        """Awaits a single node and returns execution information."""
+        with self._node_metrics(
+            current_node, llm_model, llm_model_name, scoped=True
+        ) as metrics:
+            result = await current_node.aexecute(state)
+        return result, metrics["exec_time"], metrics["cb_data"]
 
     def _get_next_node(self, current_node, result):
         """Determines the next node to execute based on current node type and result."""
@@ -233,10 +274,12 @@ class BaseGraph:
 
         return self.edges.get(current_node.node_name)
 
-    def _execute_standard(self, initial_state: dict) -> Tuple[dict, list]:
+    def _steps(self, initial_state: dict) -> Generator:
         """
-        Executes the graph by traversing nodes
-        starting from the entry point using the standard method.
+        Traverses the graph from the entry point, shared by the sync and the
+        async drivers: yields the arguments of each node run, is sent back its
+        result and execution info, and returns the final state and the
+        execution info of the run.
         """
         current_node_name = self.entry_point
         state = initial_state
@@ -247,6 +290,7 @@ class BaseGraph:
             "total_tokens": 0,
             "prompt_tokens": 0,
             "completion_tokens": 0,
+            "cached_tokens": 0,
             "successful_requests": 0,
             "total_cost_USD": 0.0,
         }
@@ -278,7 +322,8 @@ class BaseGraph:
                 schema = self._get_schema(current_node)
 
             try:
-                result, node_exec_time, cb_data = self._execute_node(
+                check_deadline(f"The {self.graph_name} graph run")
+                result, node_exec_time, cb_data = yield (
                     current_node, state, llm_model, llm_model_name
                 )
                 total_exec_time += node_exec_time
@@ -307,17 +352,20 @@ class BaseGraph:
                 )
                 raise e
 
-        exec_info.append(
-            {
-                "node_name": "TOTAL RESULT",
-                "total_tokens": cb_total["total_tokens"],
-                "prompt_tokens": cb_total["prompt_tokens"],
-                "completion_tokens": cb_total["completion_tokens"],
-                "successful_requests": cb_total["successful_requests"],
-                "total_cost_USD": cb_total["total_cost_USD"],
-                "exec_time": total_exec_time,
-            }
-        )
+        total_result = {
+            "node_name": "TOTAL RESULT",
+            "total_tokens": cb_total["total_tokens"],
+            "prompt_tokens": cb_total["prompt_tokens"],
+            "completion_tokens": cb_total["completion_tokens"],
+            "cached_tokens": cb_total["cached_tokens"],
+            "successful_requests": cb_total["successful_requests"],
+            "total_cost_USD": cb_total["total_cost_USD"],
+            "exec_time": total_exec_time,
+        }
+        for key in ("llm_cache_hits", "llm_cache_misses"):
+            if any(key in cb_data for cb_data in exec_info):
+                total_result[key] = sum(cb_data.get(key, 0) for cb_data in exec_info)
+        exec_info.append(total_result)
 
         graph_execution_time = time.time() - start_time
         response = state.get("answer", None) if source_type == "url" else None
@@ -341,6 +389,19 @@ class BaseGraph:
 
         return state, exec_info
 
+    def _execute_standard(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Executes the graph by traversing nodes
+        starting from the entry point using the standard method.
+        """
+        return drive_steps(self._steps(initial_state), self._execute_node)
+
+    async def _aexecute_standard(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Executes the graph like ``_execute_standard``, awaiting each node.
+        """
+        return await adrive_steps(self._steps(initial_state), self._aexecute_node)
+
     def execute(self, initial_state: dict) -> Tuple[dict, list]:
         """
         Executes the graph by either using BurrBridge or the standard method.
@@ -353,15 +414,44 @@ class BaseGraph:
         """
 
         self.initial_state = initial_state
+        # The LLM calls of the run, including those of sub-graphs, share its budget.
+        with deadline_scope(self.deadline):
+            if self.use_burr:
+                from ..integrations import BurrBridge
+
+                bridge = BurrBridge(self, self.burr_config)
+                result = bridge.execute(initial_state)
+                state, exec_info = (result["_state"], [])
+            else:
+                state, exec_info = self._execute_standard(initial_state)
+
+        self._log_result(state)
+        return state, exec_info
+
+    async def aexecute(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Executes the graph on the running event loop: nodes with a native
+        ``aexecute`` are awaited, the others run in worker threads.
+        BurrBridge runs are synchronous and run in a worker thread as a whole.
+
+        Args:
+            initial_state (dict): The initial state to pass to the entry point node.
+
+        Returns:
+            Tuple[dict, list]: A tuple containing the final state and a list of execution info.
+        """
         if self.use_burr:
-            from ..integrations import BurrBridge
+            return await asyncio.to_thread(self.execute, initial_state)
 
-            bridge = BurrBridge(self, self.burr_config)
-            result = bridge.execute(initial_state)
-            state, exec_info = (result["_state"], [])
-        else:
-            state, exec_info = self._execute_standard(initial_state)
+        self.initial_state = initial_state
+        with deadline_scope(self.deadline):
+            state, exec_info = await self._aexecute_standard(initial_state)
+
+        self._log_result(state)
+        return state, exec_info
 
+    def _log_result(self, state: dict):
+        """Logs the main output of a finished run."""
         if "answer" in state:
             logger.info(state["answer"])
         elif "parsed_doc" in state:
@@ -373,8 +463,6 @@ class BaseGraph:
 
         logger.info("✨ Try enhanced version of ScrapegraphAI at %s ✨", CLICKABLE_URL)
 
-        return state, exec_info
-
     def append_node(self, node):
         """
         Adds a node to the graph.
@@ -167,17 +167,14 @@ class CodeGeneratorGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
+    def _run_result(self) -> str:
         """
-        Executes the scraping process and returns the generated code.
+        Saves the generated code to a file and returns it.
 
         Returns:
             str: The generated code.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
         generated_code = self.final_state.get("generated_code", "No code created.")
 
         if self.config.get("filename") is None:
@@ -140,17 +140,5 @@ class DepthSearchGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
-        """
-        Executes the scraping process and returns the generated code.
-
-        Returns:
-            str: The generated code.
-        """
-
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        docs = self.final_state.get("answer", "No answer")
-
-        return docs
+    def _run_result(self) -> str:
+        return self.final_state.get("answer", "No answer")
@@ -99,16 +99,3 @@ class DocumentScraperGraph(AbstractGraph):
             entry_point=fetch_node,
             graph_name=self.__class__.__name__,
         )
-
-    def run(self) -> str:
-        """
-        Executes the scraping process and returns the answer to the prompt.
-
-        Returns:
-            str: The answer to the prompt.
-        """
-
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
@@ -105,31 +105,24 @@ class OmniScraperGraph(AbstractGraph):
             },
         )
 
-        return BaseGraph(
-            nodes=[
+        nodes, edges = self._with_main_content(
+            fetch_node,
+            [
                 fetch_node,
                 parse_node,
                 image_to_text_node,
                 generate_answer_omni_node,
             ],
-            edges=[
+            [
                 (fetch_node, parse_node),
                 (parse_node, image_to_text_node),
                 (image_to_text_node, generate_answer_omni_node),
             ],
+        )
+        nodes, edges = self._with_structured_data(fetch_node, nodes, edges)
+        return BaseGraph(
+            nodes=nodes,
+            edges=edges,
             entry_point=fetch_node,
             graph_name=self.__class__.__name__,
         )
-
-    def run(self) -> str:
-        """
-        Executes the scraping process and returns the answer to the prompt.
-
-        Returns:
-            str: The answer to the prompt.
-        """
-
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
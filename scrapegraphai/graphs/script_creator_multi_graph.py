@@ -87,13 +87,8 @@ class ScriptCreatorMultiGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
-        """
-        Executes the web scraping and searching process.
-        Returns:
-            str: The answer to the prompt.
-        """
+    def _run_inputs(self) -> dict:
+        return {"user_prompt": self.prompt, "urls": self.source}
 
-        inputs = {"user_prompt": self.prompt, "urls": self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
+    def _run_result(self) -> str:
         return self.final_state.get("merged_script", "Failed to generate the script.")
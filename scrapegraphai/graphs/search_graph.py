@@ -100,17 +100,10 @@ class SearchGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
-        """
-        Executes the web scraping and searching process.
-
-        Returns:
-            str: The answer to the prompt.
-        """
-
-        inputs = {"user_prompt": self.prompt}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
+    def _run_inputs(self) -> dict:
+        return {"user_prompt": self.prompt}
 
+    def _run_result(self) -> str:
         # Store the URLs after execution
         if "urls" in self.final_state:
             self.considered_urls = self.final_state["urls"]
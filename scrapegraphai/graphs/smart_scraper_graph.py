@@ -262,31 +262,20 @@ class SmartScraperGraph(AbstractGraph):
         # Retrieve the appropriate graph configuration
         config = graph_variation_config.get((html_mode, reasoning, reattempt))
 
-        if config:
-            return BaseGraph(
-                nodes=config["nodes"],
-                edges=config["edges"],
-                entry_point=fetch_node,
-                graph_name=self.__class__.__name__,
-            )
+        if not config:
+            # Default graph if no conditions match
+            config = {
+                "nodes": [fetch_node, parse_node, generate_answer_node],
+                "edges": [(fetch_node, parse_node), (parse_node, generate_answer_node)],
+            }
 
-        # Default return if no conditions match
+        nodes, edges = self._with_main_content(
+            fetch_node, config["nodes"], config["edges"]
+        )
+        nodes, edges = self._with_structured_data(fetch_node, nodes, edges)
         return BaseGraph(
-            nodes=[fetch_node, parse_node, generate_answer_node],
-            edges=[(fetch_node, parse_node), (parse_node, generate_answer_node)],
+            nodes=nodes,
+            edges=edges,
             entry_point=fetch_node,
             graph_name=self.__class__.__name__,
         )
-
-    def run(self) -> str:
-        """
-        Executes the scraping process and returns the answer to the prompt.
-
-        Returns:
-            str: The answer to the prompt.
-        """
-
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
-        return self.final_state.get("answer", "No answer found.")
@@ -77,27 +77,22 @@ class SmartScraperLiteGraph(AbstractGraph):
             node_config={"llm_model": self.llm_model, "chunk_size": self.model_token},
         )
 
-        return BaseGraph(
-            nodes=[
+        nodes, edges = self._with_main_content(
+            fetch_node,
+            [
                 fetch_node,
                 parse_node,
             ],
-            edges=[
+            [
                 (fetch_node, parse_node),
             ],
+        )
+        return BaseGraph(
+            nodes=nodes,
+            edges=edges,
             entry_point=fetch_node,
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
-        """
-        Executes the scraping process and returns the scraping content.
-
-        Returns:
-            str: The scraping content.
-        """
-
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
+    def _run_result(self) -> str:
         return self.final_state.get("parsed_doc", "No document found.")
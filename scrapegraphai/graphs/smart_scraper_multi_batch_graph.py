@@ -67,9 +67,7 @@ class _FetchParseOnlyGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
+    def _run_result(self) -> str:
         return self.final_state.get("parsed_doc", "")
 
 
@@ -199,18 +197,5 @@ class SmartScraperMultiBatchGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
-        """Executes the full batch scraping pipeline.
-
-        This will:
-        1. Fetch and parse all URLs concurrently
-        2. Submit all LLM prompts as an OpenAI Batch
-        3. Poll until the batch completes (may take minutes to hours)
-        4. Merge results into a final answer
-
-        Returns:
-            str: The merged answer from all scraped URLs.
-        """
-        inputs = {"user_prompt": self.prompt, "urls": self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-        return self.final_state.get("answer", "No answer found.")
+    def _run_inputs(self) -> dict:
+        return {"user_prompt": self.prompt, "urls": self.source}
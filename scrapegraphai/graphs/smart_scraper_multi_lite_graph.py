@@ -92,14 +92,5 @@ class SmartScraperMultiLiteGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
-        """
-        Executes the web scraping and parsing process first and
-        then concatenate the content and generates answers to a given prompt.
-
-        Returns:
-            str: The answer to the prompt.
-        """
-        inputs = {"user_prompt": self.prompt, "urls": self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-        return self.final_state.get("answer", "No answer found.")
+    def _run_inputs(self) -> dict:
+        return {"user_prompt": self.prompt, "urls": self.source}
@@ -100,17 +100,14 @@ class SpeechGraph(AbstractGraph):
             graph_name=self.__class__.__name__,
         )
 
-    def run(self) -> str:
+    def _run_result(self) -> str:
         """
-        Executes the scraping process and returns the answer to the prompt.
+        Saves the generated audio and returns the answer to the prompt.
 
         Returns:
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
-        self.final_state, self.execution_info = self.graph.execute(inputs)
-
         audio = self.final_state.get("audio", None)
         if not audio:
             raise ValueError("No audio generated from the text.")
@@ -21,6 +21,7 @@ from .get_probable_tags_node import GetProbableTagsNode
 from .graph_iterator_node import GraphIteratorNode
 from .html_analyzer_node import HtmlAnalyzerNode
 from .image_to_text_node import ImageToTextNode
+from .main_content_node import MainContentNode
 from .markdownify_node import MarkdownifyNode
 from .merge_answers_node import MergeAnswersNode
 from .merge_generated_scripts_node import MergeGeneratedScriptsNode
@@ -33,6 +34,7 @@ from .robots_node import RobotsNode
 from .search_internet_node import SearchInternetNode
 from .search_link_node import SearchLinkNode
 from .search_node_with_context import SearchLinksWithContext
+from .structured_data_node import StructuredDataNode
 from .text_to_speech_node import TextToSpeechNode
 
 __all__ = [
@@ -48,6 +50,8 @@ __all__ = [
     "ParseNodeDepthK",
     "RobotsNode",
     "MarkdownifyNode",
+    "MainContentNode",
+    "StructuredDataNode",
     # Analysis nodes
     "HtmlAnalyzerNode",
     "GetProbableTagsNode",
@@ -2,11 +2,13 @@
 This module defines the base node class for the ScrapeGraphAI application.
 """
 
+import asyncio
 import re
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from ..utils import get_logger
+from ..utils.deadline import ainvoke_with_deadline, invoke_with_deadline
 
 
 class BaseNode(ABC):
@@ -81,6 +83,20 @@ class BaseNode(ABC):
 
         pass
 
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Asynchronous counterpart of ``execute``, used by ``BaseGraph.aexecute``.
+        Nodes without a native implementation run ``execute`` in a worker thread,
+        so they never block the event loop.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state after executing the node's logic.
+        """
+        return await asyncio.to_thread(self.execute, state)
+
     def update_config(self, params: dict, overwrite: bool = False):
         """
         Updates the node_config dictionary as well as attributes with same key.
@@ -95,6 +111,46 @@ class BaseNode(ABC):
                 continue
             setattr(self, key, val)
 
+    def invoke_chain(self, chain, inputs):
+        """
+        Invokes an LLM chain, giving up after the node's "timeout" or at the
+        deadline of the graph run, whichever comes first.
+
+        Args:
+            chain: The runnable to invoke.
+            inputs: Its input.
+
+        Returns:
+            The output of the chain.
+
+        Raises:
+            DeadlineExceeded: If the call did not finish in time.
+        """
+        return invoke_with_deadline(chain, inputs, self._chain_timeout())
+
+    async def ainvoke_chain(self, chain, inputs):
+        """
+        Awaits an LLM chain, cancelling it after the node's "timeout" or at the
+        deadline of the graph run, whichever comes first.
+
+        Args:
+            chain: The runnable to invoke.
+            inputs: Its input.
+
+        Returns:
+            The output of the chain.
+
+        Raises:
+            DeadlineExceeded: If the call did not finish in time.
+        """
+        return await ainvoke_with_deadline(chain, inputs, self._chain_timeout())
+
+    def _chain_timeout(self):
+        timeout = getattr(self, "timeout", None)
+        if timeout is None and self.node_config:
+            timeout = self.node_config.get("timeout")
+        return timeout
+
     def get_input_keys(self, state: dict) -> List[str]:
         """
         Determines the necessary state keys based on the input specification.
@@ -5,10 +5,10 @@ DescriptionNode Module
 from typing import List, Optional
 
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnableParallel
 from tqdm import tqdm
 
 from ..prompts.description_node_prompts import DESCRIPTION_NODE_PROMPT
+from ..utils.map_executor import get_map_executor
 from .base_node import BaseNode
 
 
@@ -61,8 +61,8 @@ class DescriptionNode(BaseNode):
             chain_name = f"chunk{i + 1}"
             chains_dict[chain_name] = prompt | self.llm_model
 
-        async_runner = RunnableParallel(**chains_dict)
-        batch_results = async_runner.invoke({})
+        async_runner = get_map_executor(self.llm_model).parallel(chains_dict)
+        batch_results = self.invoke_chain(async_runner, {})
 
         for i in range(1, len(docs) + 1):
             docs[i - 1]["summary"] = batch_results.get(f"chunk{i}").content
@@ -2,19 +2,73 @@
 FetchNode Module
 """
 
+import asyncio
 import json
+import os
+import tempfile
+import time
 from typing import List, Optional
+from urllib.parse import quote, urlparse
 import concurrent.futures
 
-import requests
 from langchain_core.documents import Document
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 from ..docloaders import ChromiumLoader
 from ..utils.cleanup_html import cleanup_html
+from ..utils.content_type import file_type_from_content_type, file_type_from_url
 from ..utils.convert_to_md import convert_to_md
+from ..utils.fetch_cache import CACHED_HEADERS, FetchCache
+from ..utils.http_client import get_http_client
+from ..utils.js_detection import detect_js_dependence
+from ..utils.proxy_rotation import parse_or_search_proxy
 from .base_node import BaseNode
 
+# Content types the HTTP tier may serve as a page.
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+def _proxy_url(proxy):
+    """Turns a ChromiumLoader proxy configuration into a proxy URL."""
+    settings = parse_or_search_proxy(proxy)
+    parsed = urlparse(settings["server"])
+    credentials = ""
+    if settings.get("username"):
+        credentials = quote(settings["username"], safe="")
+        if settings.get("password"):
+            credentials += f":{quote(settings['password'], safe='')}"
+        credentials += "@"
+    return f"{parsed.scheme}://{credentials}{parsed.netloc}"
+
+
+def _cookie_header(storage_state, url):
+    """
+    Builds the Cookie header a browser would send to ``url`` from a Playwright
+    storage state, given as a dict or as the path of its JSON file.
+    """
+    if isinstance(storage_state, (str, os.PathLike)):
+        with open(storage_state, encoding="utf-8") as f:
+            storage_state = json.load(f)
+
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    path = parsed.path or "/"
+    now = time.time()
+    cookies = []
+    for cookie in storage_state.get("cookies", []):
+        domain = cookie.get("domain", "").lower().lstrip(".")
+        if host != domain and not host.endswith(f".{domain}"):
+            continue
+        if not path.startswith(cookie.get("path", "/")):
+            continue
+        if cookie.get("secure") and parsed.scheme != "https":
+            continue
+        expires = cookie.get("expires", -1)
+        if expires is not None and 0 <= expires < now:
+            continue
+        cookies.append(f"{cookie['name']}={cookie['value']}")
+    return "; ".join(cookies) or None
+
 
 class FetchNode(BaseNode):
     """
@@ -90,6 +144,53 @@ class FetchNode(BaseNode):
             None if node_config is None else node_config.get("storage_state", None)
         )
 
+        # "browser" always renders with ChromiumLoader; "auto" tries a plain HTTP
+        # request first and only escalates to the browser when the page needs JS.
+        self.fetch_mode = (
+            "browser" if node_config is None else node_config.get("fetch_mode", "browser")
+        )
+        if self.fetch_mode not in ("browser", "auto"):
+            raise ValueError(
+                f"Invalid fetch_mode: {self.fetch_mode}. Use 'browser' or 'auto'."
+            )
+
+        # Fetched pages are cached under cache_path; fetch_cache tunes "ttl"
+        # (seconds) and "max_size_mb".
+        self.cache_path = (
+            False if node_config is None else node_config.get("cache_path", False)
+        )
+        self.fetch_cache = (
+            {} if node_config is None else node_config.get("fetch_cache", {})
+        )
+        self._fetch_cache = None
+
+        # Engine used by convert_to_md: "html2text" or "dom".
+        self.markdown_engine = (
+            "html2text"
+            if node_config is None
+            else node_config.get("markdown_engine", "html2text")
+        )
+
+        # URLs serving PDF, CSV, JSON or XML files (recognized by their extension)
+        # are downloaded and loaded like local files instead of being rendered as
+        # pages. content_type_probe also sends a HEAD request for the other URLs
+        # to recognize them by their Content-Type.
+        self.content_routing = (
+            True if node_config is None else node_config.get("content_routing", True)
+        )
+        self.content_type_probe = (
+            False
+            if node_config is None
+            else node_config.get("content_type_probe", False)
+        )
+
+        # Set when a later node still needs the page HTML (StructuredDataNode,
+        # MainContentNode): the page is handed over as HTML and the Markdown
+        # conversion is left to that node.
+        self.defer_markdown = (
+            False if node_config is None else node_config.get("defer_markdown", False)
+        )
+
     def execute(self, state):
         """
         Executes the node's logic to fetch HTML content from a specified URL and
@@ -125,6 +226,19 @@ class FetchNode(BaseNode):
         else:
             raise ValueError(f"Invalid input type: {input_type}")
 
+    async def aexecute(self, state):
+        """
+        Asynchronous counterpart of ``execute``: URLs are fetched natively on the
+        running event loop, local inputs are loaded in a worker thread.
+        """
+
+        input_keys = self.get_input_keys(state)
+        if input_keys[0] != "url":
+            return await super().aexecute(state)
+
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+        return await self.ahandle_web_source(state, state[input_keys[0]])
+
     def handle_directory(self, state, input_type, source):
         """
         Handles the directory by compressing the source document and updating the state.
@@ -251,12 +365,15 @@ class FetchNode(BaseNode):
             or self.force
             and not self.script_creator
         ):
-            parsed_content = convert_to_md(source)
+            parsed_content, md_metadata = self._convert_to_md(source)
         else:
-            parsed_content = source
+            parsed_content, md_metadata = source, {}
 
         compressed_document = [
-            Document(page_content=parsed_content, metadata={"source": "local_dir"})
+            Document(
+                page_content=parsed_content,
+                metadata={"source": "local_dir", **md_metadata},
+            )
         ]
 
         # return self.update_state(state, compressed_document)
@@ -280,130 +397,571 @@ class FetchNode(BaseNode):
         """
 
         self.logger.info(f"--- (Fetching HTML from: {source}) ---")
+        loader_kwargs = self._web_loader_kwargs()
+
         if self.use_soup:
-            # Apply configured timeout to blocking HTTP requests. If timeout is None,
-            # don't pass the timeout argument (requests will block until completion).
-            if self.timeout is None:
-                response = requests.get(source)
-            else:
-                response = requests.get(source, timeout=self.timeout)
-            if response.status_code == 200:
-                if not response.text.strip():
-                    raise ValueError("No HTML body content found in the response.")
-
-                if not self.cut:
-                    parsed_content = cleanup_html(response, source)
-
-                if (
-                    isinstance(self.llm_model, (ChatOpenAI, AzureChatOpenAI))
-                    and not self.script_creator
-                    or (self.force and not self.script_creator)
-                ):
-                    parsed_content = convert_to_md(source, parsed_content)
-
-                compressed_document = [Document(page_content=parsed_content)]
-            else:
-                self.logger.warning(
-                    f"Failed to retrieve contents from the webpage at url: {source}"
-                )
+            if self._routes_files():
+                document = self.fetch_remote_file(source, loader_kwargs)
+                if document is not None:
+                    return self._update_web_state(state, document, document)
+
+            # The shared client pools connections per host; a timeout of None
+            # lets the request block until completion.
+            response = get_http_client().get_sync(source, timeout=self.timeout)
+            return self._update_web_state(
+                state, None, self._soup_document(source, response)
+            )
+
+        cache, cache_options, cached = self._cache_lookup(source, loader_kwargs)
+        served_from_cache = cached is not None and cache.is_fresh(cached)
+
+        # Files are recognized only on a cache miss, so a warm cache never
+        # goes to the network.
+        if self._routes_files() and not served_from_cache:
+            file_document = self.fetch_remote_file(source, loader_kwargs)
+            if file_document is not None:
+                return self._update_web_state(state, file_document, file_document)
+
+        if served_from_cache:
+            self.logger.info(f"--- (Served {source} from the fetch cache) ---")
+            document = [cached.to_document(source, fetch_tier="cache")]
+        elif self._uses_third_party():
+            document = self._fetch_third_party(source)
+        elif self.fetch_mode == "auto":
+            document = self.fetch_tiered(source, loader_kwargs, cached)
         else:
-            loader_kwargs = {}
-
-            if self.node_config:
-                loader_kwargs = self.node_config.get("loader_kwargs", {})
-
-            # If a global timeout is configured on the node and no loader-specific timeout
-            # was provided, propagate it to ChromiumLoader so it can apply the same limit.
-            if "timeout" not in loader_kwargs and self.timeout is not None:
-                loader_kwargs["timeout"] = self.timeout
-
-            if self.browser_base:
-                try:
-                    from ..docloaders.browser_base import browser_base_fetch
-                except ImportError:
-                    raise ImportError(
-                        """The browserbase module is not installed.
-                                      Please install it using `pip install browserbase`."""
-                    )
+            document = self._chromium_loader(source, loader_kwargs).load()
 
-                data = browser_base_fetch(
-                    self.browser_base.get("api_key"),
-                    self.browser_base.get("project_id"),
-                    [source],
-                )
+        return self._finish_web_source(
+            state, source, document, cache, cache_options, served_from_cache
+        )
 
-                document = [
-                    Document(page_content=content, metadata={"source": source})
-                    for content in data
-                ]
-            elif self.scrape_do:
-                from ..docloaders.scrape_do import scrape_do_fetch
-
-                if (
-                    (self.scrape_do.get("use_proxy") is None)
-                    or self.scrape_do.get("geoCode") is None
-                    or self.scrape_do.get("super_proxy") is None
-                ):
-                    data = scrape_do_fetch(self.scrape_do.get("api_key"), source)
-                else:
-                    data = scrape_do_fetch(
-                        self.scrape_do.get("api_key"),
-                        source,
-                        self.scrape_do.get("use_proxy"),
-                        self.scrape_do.get("geoCode"),
-                        self.scrape_do.get("super_proxy"),
-                    )
+    async def ahandle_web_source(self, state, source):
+        """
+        Asynchronous counterpart of ``handle_web_source``: the page is fetched with
+        the shared HTTP client and ``ChromiumLoader.aload`` on the running loop,
+        while the parsing, conversion and cache writes run in a worker thread.
+        """
 
-                document = [Document(page_content=data, metadata={"source": source})]
-            elif self.plasmate is not None:
-                from ..docloaders.plasmate import PlasmateLoader
-
-                plasmate_cfg = self.plasmate if isinstance(self.plasmate, dict) else {}
-                loader = PlasmateLoader(
-                    [source],
-                    output_format=plasmate_cfg.get("output_format", "text"),
-                    timeout=plasmate_cfg.get("timeout", self.timeout or 30),
-                    selector=plasmate_cfg.get("selector"),
-                    extra_headers=plasmate_cfg.get("extra_headers", {}),
-                    fallback_to_chrome=plasmate_cfg.get("fallback_to_chrome", False),
-                )
-                document = loader.load()
-            else:
-                loader = ChromiumLoader(
-                    [source],
-                    headless=self.headless,
-                    storage_state=self.storage_state,
-                    **loader_kwargs,
-                )
-                document = loader.load()
+        self.logger.info(f"--- (Fetching HTML from: {source}) ---")
+        loader_kwargs = self._web_loader_kwargs()
+
+        if self.use_soup:
+            if self._routes_files():
+                document = await self.afetch_remote_file(source, loader_kwargs)
+                if document is not None:
+                    return self._update_web_state(state, document, document)
+
+            response = await get_http_client().get(source, timeout=self.timeout)
+            compressed_document = await asyncio.to_thread(
+                self._soup_document, source, response
+            )
+            return self._update_web_state(state, None, compressed_document)
+
+        cache, cache_options, cached = await asyncio.to_thread(
+            self._cache_lookup, source, loader_kwargs
+        )
+        served_from_cache = cached is not None and cache.is_fresh(cached)
+
+        if self._routes_files() and not served_from_cache:
+            file_document = await self.afetch_remote_file(source, loader_kwargs)
+            if file_document is not None:
+                return self._update_web_state(state, file_document, file_document)
+
+        if served_from_cache:
+            self.logger.info(f"--- (Served {source} from the fetch cache) ---")
+            document = [cached.to_document(source, fetch_tier="cache")]
+        elif self._uses_third_party():
+            document = await asyncio.to_thread(self._fetch_third_party, source)
+        elif self.fetch_mode == "auto":
+            document = await self.afetch_tiered(source, loader_kwargs, cached)
+        else:
+            document = await self._chromium_loader(source, loader_kwargs).aload()
+
+        return await asyncio.to_thread(
+            self._finish_web_source,
+            state,
+            source,
+            document,
+            cache,
+            cache_options,
+            served_from_cache,
+        )
+
+    def _web_loader_kwargs(self):
+        loader_kwargs = {}
+        if self.node_config:
+            loader_kwargs = self.node_config.get("loader_kwargs", {})
+
+        # If a global timeout is configured on the node and no loader-specific timeout
+        # was provided, propagate it to ChromiumLoader so it can apply the same limit.
+        if "timeout" not in loader_kwargs and self.timeout is not None:
+            loader_kwargs["timeout"] = self.timeout
+        return loader_kwargs
+
+    def _uses_third_party(self):
+        return bool(self.browser_base or self.scrape_do or self.plasmate is not None)
+
+    def _routes_files(self):
+        return self.content_routing and not self._uses_third_party()
+
+    def _cache_lookup(self, source, loader_kwargs):
+        cache = self.get_fetch_cache()
+        cache_options = self._fetch_cache_options(loader_kwargs)
+        cached = cache.get(source, cache_options) if cache is not None else None
+        return cache, cache_options, cached
+
+    def _update_web_state(self, state, document, compressed_document):
+        state["doc"] = document
+        state.update({self.output[0]: compressed_document})
+        return state
+
+    def _soup_document(self, source, response):
+        """Builds the compressed document from the plain HTTP response."""
+
+        if response.status != 200:
+            self.logger.warning(
+                f"Failed to retrieve contents from the webpage at url: {source}"
+            )
+            return None
+        if not response.text.strip():
+            raise ValueError("No HTML body content found in the response.")
+
+        parsed_content = response.text
+        if not self.cut:
+            title, minimized_body, *_ = cleanup_html(response.text, source)
+            parsed_content = f"Title: {title}, Body: {minimized_body}"
+
+        md_metadata = {}
+        if (
+            isinstance(self.llm_model, (ChatOpenAI, AzureChatOpenAI))
+            and not self.script_creator
+            or (self.force and not self.script_creator)
+        ):
+            parsed_content, md_metadata = self._convert_to_md(parsed_content, source)
+
+        return [Document(page_content=parsed_content, metadata=md_metadata)]
+
+    def _fetch_third_party(self, source):
+        """Fetches the page with the configured BrowserBase, Scrape.do or Plasmate."""
 
-            if not document or not document[0].page_content.strip():
-                raise ValueError(
-                    """No HTML body content found in
-                                 the document fetched by ChromiumLoader."""
+        if self.browser_base:
+            try:
+                from ..docloaders.browser_base import browser_base_fetch
+            except ImportError:
+                raise ImportError(
+                    """The browserbase module is not installed.
+                                  Please install it using `pip install browserbase`."""
                 )
 
-            parsed_content = document[0].page_content
+            data = browser_base_fetch(
+                self.browser_base.get("api_key"),
+                self.browser_base.get("project_id"),
+                [source],
+            )
+
+            return [
+                Document(page_content=content, metadata={"source": source})
+                for content in data
+            ]
+        if self.scrape_do:
+            from ..docloaders.scrape_do import scrape_do_fetch
 
             if (
-                (
-                    isinstance(self.llm_model, ChatOpenAI)
-                    or isinstance(self.llm_model, AzureChatOpenAI)
-                )
-                and not self.script_creator
-                or self.force
-                and not self.script_creator
-                and not self.openai_md_enabled
+                (self.scrape_do.get("use_proxy") is None)
+                or self.scrape_do.get("geoCode") is None
+                or self.scrape_do.get("super_proxy") is None
             ):
-                parsed_content = convert_to_md(document[0].page_content, parsed_content)
+                data = scrape_do_fetch(self.scrape_do.get("api_key"), source)
+            else:
+                data = scrape_do_fetch(
+                    self.scrape_do.get("api_key"),
+                    source,
+                    self.scrape_do.get("use_proxy"),
+                    self.scrape_do.get("geoCode"),
+                    self.scrape_do.get("super_proxy"),
+                )
 
-            compressed_document = [
-                Document(page_content=parsed_content, metadata={"source": "html file"})
-            ]
-        state["doc"] = document
-        state.update(
-            {
-                self.output[0]: compressed_document,
+            return [Document(page_content=data, metadata={"source": source})]
+
+        from ..docloaders.plasmate import PlasmateLoader
+
+        plasmate_cfg = self.plasmate if isinstance(self.plasmate, dict) else {}
+        loader = PlasmateLoader(
+            [source],
+            output_format=plasmate_cfg.get("output_format", "text"),
+            timeout=plasmate_cfg.get("timeout", self.timeout or 30),
+            selector=plasmate_cfg.get("selector"),
+            extra_headers=plasmate_cfg.get("extra_headers", {}),
+            fallback_to_chrome=plasmate_cfg.get("fallback_to_chrome", False),
+        )
+        return loader.load()
+
+    def _chromium_loader(self, source, loader_kwargs):
+        return ChromiumLoader(
+            [source],
+            headless=self.headless,
+            storage_state=self.storage_state,
+            **loader_kwargs,
+        )
+
+    def _finish_web_source(
+        self, state, source, document, cache, cache_options, served_from_cache
+    ):
+        """
+        Checks the fetched page, stores it in the fetch cache, converts it to
+        Markdown when the model calls for it and updates the state.
+        """
+
+        if not document or not document[0].page_content.strip():
+            raise ValueError(
+                """No HTML body content found in
+                             the document fetched by ChromiumLoader."""
+            )
+
+        if cache is not None and not served_from_cache:
+            metadata = document[0].metadata
+            if not isinstance(metadata, dict):
+                metadata = {}
+            cache.put(
+                source,
+                cache_options,
+                document[0].page_content,
+                headers=metadata.get("headers"),
+                metadata=metadata,
+            )
+
+        parsed_content = document[0].page_content
+        md_metadata = {}
+
+        if (
+            (
+                isinstance(self.llm_model, ChatOpenAI)
+                or isinstance(self.llm_model, AzureChatOpenAI)
+            )
+            and not self.script_creator
+            or self.force
+            and not self.script_creator
+            and not self.openai_md_enabled
+        ):
+            parsed_content, md_metadata = self._convert_to_md(
+                document[0].page_content, source
+            )
+
+        # Keep what the loaders recorded about the fetch (tier, network counters).
+        fetch_metadata = {}
+        if isinstance(getattr(document[0], "metadata", None), dict):
+            fetch_metadata = {
+                key: value
+                for key, value in document[0].metadata.items()
+                if key != "source"
             }
+        compressed_document = [
+            Document(
+                page_content=parsed_content,
+                metadata={"source": "html file", **fetch_metadata, **md_metadata},
+            )
+        ]
+        return self._update_web_state(state, document, compressed_document)
+
+    def _convert_to_md(self, content, source=None):
+        """
+        Converts fetched HTML to Markdown, unless the conversion is deferred: the
+        HTML is then kept and the document flagged so a later node converts it.
+
+        Returns:
+            tuple: The content and the metadata to record on the document.
+        """
+        if self.defer_markdown:
+            return content, {"markdown_pending": True}
+        return convert_to_md(content, source, engine=self.markdown_engine), {}
+
+    def fetch_remote_file(self, source, loader_kwargs=None):
+        """
+        Downloads a URL serving a PDF, CSV, JSON or XML file and loads it with
+        the matching local file handler.
+
+        The type is guessed from the URL extension, or else, with
+        content_type_probe, from the Content-Type of a HEAD request; the body is
+        streamed to a temporary file, and its Content-Type and magic number are
+        checked again before loading. The requests go through the proxy and
+        carry the cookies of the storage state the browser would use.
+
+        Parameters:
+        source (str): The URL to fetch.
+        loader_kwargs (dict): Keyword arguments the page would be fetched with.
+
+        Returns:
+        list: The loaded Documents, or None when the URL does not serve a
+        supported file and must be fetched as a page.
+        """
+
+        file_type = file_type_from_url(source)
+        if file_type is None and not self.content_type_probe:
+            return None
+
+        request_kwargs = self._http_request_kwargs(source, loader_kwargs)
+        client = get_http_client()
+        if file_type is None:
+            try:
+                response = client.head_sync(source, **request_kwargs)
+            except Exception as e:
+                self.logger.debug(f"HEAD request to {source} failed: {e}")
+                return None
+            file_type = self._probed_file_type(response)
+            if file_type is None:
+                return None
+
+        fd, path = tempfile.mkstemp(suffix=f".{file_type}")
+        os.close(fd)
+        try:
+            try:
+                response = client.download_sync(source, path, **request_kwargs)
+            except Exception as e:
+                self.logger.warning(f"Could not download {source}: {e}")
+                return None
+            return self._load_downloaded_file(source, path, response, file_type)
+        finally:
+            os.remove(path)
+
+    async def afetch_remote_file(self, source, loader_kwargs=None):
+        """
+        Asynchronous counterpart of ``fetch_remote_file``; the downloaded file is
+        loaded in a worker thread.
+        """
+
+        file_type = file_type_from_url(source)
+        if file_type is None and not self.content_type_probe:
+            return None
+
+        request_kwargs = self._http_request_kwargs(source, loader_kwargs)
+        client = get_http_client()
+        if file_type is None:
+            try:
+                response = await client.head(source, **request_kwargs)
+            except Exception as e:
+                self.logger.debug(f"HEAD request to {source} failed: {e}")
+                return None
+            file_type = self._probed_file_type(response)
+            if file_type is None:
+                return None
+
+        fd, path = tempfile.mkstemp(suffix=f".{file_type}")
+        os.close(fd)
+        try:
+            try:
+                response = await client.download(source, path, **request_kwargs)
+            except Exception as e:
+                self.logger.warning(f"Could not download {source}: {e}")
+                return None
+            return await asyncio.to_thread(
+                self._load_downloaded_file, source, path, response, file_type
+            )
+        finally:
+            os.remove(path)
+
+    def _probed_file_type(self, response):
+        if response.status != 200:
+            return None
+        return file_type_from_content_type(response.content_type)
+
+    def _load_downloaded_file(self, source, path, response, file_type):
+        """
+        Loads a file downloaded from source, or returns None when the response
+        turns out not to be a file the handlers can load.
+        """
+
+        if response.status != 200:
+            return None
+
+        with open(path, "rb") as f:
+            head = f.read(1024)
+        detected = file_type_from_content_type(response.content_type, head)
+        if detected is None and response.content_type in HTML_CONTENT_TYPES:
+            # e.g. a ".pdf" link answered with a login or error page
+            return None
+        file_type = detected or file_type
+
+        self.logger.info(f"--- (Loading {source} as a {file_type} file) ---")
+        try:
+            document = self.load_file_content(path, file_type)
+        except (ImportError, TimeoutError):
+            raise
+        except Exception as e:
+            # e.g. a ".json" link answered with an error page of another type
+            self.logger.warning(
+                f"Could not load {source} as a {file_type} file, "
+                f"fetching it as a page: {e}"
+            )
+            return None
+
+        for doc in document:
+            doc.metadata.update(
+                {"source": source, "fetch_tier": "file", "file_type": file_type}
+            )
+        return document
+
+    def _http_request_kwargs(self, source, loader_kwargs, headers=None):
+        """
+        Keyword arguments making a plain HTTP request look like the browser
+        fetch: the loader_kwargs proxy, and the storage_state cookies for the URL.
+        """
+
+        loader_kwargs = loader_kwargs or {}
+        request_kwargs = {"timeout": self.timeout}
+        if loader_kwargs.get("proxy"):
+            request_kwargs["proxy"] = _proxy_url(loader_kwargs["proxy"])
+
+        headers = dict(headers or {})
+        storage_state = loader_kwargs.get("storage_state", self.storage_state)
+        cookies = _cookie_header(storage_state, source) if storage_state else None
+        if cookies:
+            headers["Cookie"] = cookies
+        if headers:
+            request_kwargs["headers"] = headers
+        return request_kwargs
+
+    def get_fetch_cache(self):
+        """
+        Returns the on-disk fetch cache, or None when no cache_path is configured.
+
+        Returns:
+        FetchCache: The cache stored under cache_path.
+        """
+
+        if not self.cache_path:
+            return None
+        # cache_path may be pushed by the graph after construction.
+        if self._fetch_cache is None or self._fetch_cache.cache_path != str(
+            self.cache_path
+        ):
+            self._fetch_cache = FetchCache(
+                str(self.cache_path), **(self.fetch_cache or {})
+            )
+        return self._fetch_cache
+
+    def _fetch_cache_options(self, loader_kwargs):
+        """
+        Collects the options that shape a fetch; pages fetched with different
+        options are cached under different keys.
+        """
+
+        if self.browser_base:
+            backend = "browser_base"
+        elif self.scrape_do:
+            backend = "scrape_do"
+        elif self.plasmate is not None:
+            backend = "plasmate"
+        else:
+            backend = self.fetch_mode
+
+        return {
+            "backend": backend,
+            "loader_kwargs": {
+                key: value for key, value in loader_kwargs.items() if key != "timeout"
+            },
+            "storage_state": self.storage_state,
+            "plasmate": self.plasmate if backend == "plasmate" else None,
+        }
+
+    def fetch_tiered(self, source, loader_kwargs, cached=None):
+        """
+        Fetches a URL with a plain HTTP request and escalates to ChromiumLoader
+        only when the response is unusable, is not HTML, or the page depends on
+        JavaScript. The request goes through the same proxy and carries the same
+        storage_state cookies as the browser would.
+
+        Parameters:
+        source (str): The URL to fetch.
+        loader_kwargs (dict): Keyword arguments forwarded to ChromiumLoader.
+        cached (CachedPage): A stale fetch cache entry; its ETag/Last-Modified
+        validators make the request conditional, and a 304 serves it again.
+
+        Returns:
+        list: A list containing the fetched Document; its metadata records the
+        tier that served the page under "fetch_tier".
+        """
+
+        validators = cached.validators if cached is not None else {}
+        try:
+            response = get_http_client().get_sync(
+                source, **self._http_request_kwargs(source, loader_kwargs, validators)
+            )
+        except Exception as e:
+            document, reason = None, f"http_error: {e}"
+        else:
+            document, reason = self._http_tier_result(source, response, cached)
+        if document is not None:
+            return document
+
+        self.logger.info(
+            f"--- (Escalating {source} to the browser tier: {reason}) ---"
         )
-        return state
+        document = self._chromium_loader(source, loader_kwargs).load()
+        return self._escalated(document, reason)
+
+    async def afetch_tiered(self, source, loader_kwargs, cached=None):
+        """
+        Asynchronous counterpart of ``fetch_tiered``; the browser tier is awaited
+        with ``ChromiumLoader.aload``.
+        """
+
+        validators = cached.validators if cached is not None else {}
+        try:
+            response = await get_http_client().get(
+                source, **self._http_request_kwargs(source, loader_kwargs, validators)
+            )
+        except Exception as e:
+            document, reason = None, f"http_error: {e}"
+        else:
+            document, reason = self._http_tier_result(source, response, cached)
+        if document is not None:
+            return document
+
+        self.logger.info(
+            f"--- (Escalating {source} to the browser tier: {reason}) ---"
+        )
+        document = await self._chromium_loader(source, loader_kwargs).aload()
+        return self._escalated(document, reason)
+
+    def _http_tier_result(self, source, response, cached):
+        """
+        Returns the document the HTTP tier serves from response, or None and the
+        reason the page must be escalated to the browser tier.
+        """
+
+        if response.status == 304 and cached is not None and cached.validators:
+            self.logger.info(f"--- (Revalidated {source} in the fetch cache) ---")
+            return [
+                cached.to_document(source, fetch_tier="cache", headers=cached.headers)
+            ], None
+        if response.status != 200:
+            return None, f"http_status_{response.status}"
+        if response.content_type not in ("", *HTML_CONTENT_TYPES):
+            # e.g. an image or a JSON document answering the page URL
+            return None, f"content_type_{response.content_type}"
+        reason = detect_js_dependence(response.text)
+        if reason is not None:
+            return None, reason
+
+        self.logger.info(f"--- (Served {source} from the HTTP tier) ---")
+        return [
+            Document(
+                page_content=response.text,
+                metadata={
+                    "source": source,
+                    "fetch_tier": "http",
+                    "status": response.status,
+                    "headers": {
+                        key.lower(): value
+                        for key, value in response.headers.items()
+                        if key.lower() in CACHED_HEADERS
+                    },
+                },
+            )
+        ], None
+
+    def _escalated(self, document, reason):
+        for doc in document:
+            doc.metadata.update({"fetch_tier": "browser", "escalation_reason": reason})
+        return document
@@ -5,10 +5,10 @@ fetch_node_level_k module
 from typing import List, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 from langchain_core.documents import Document
 
 from ..docloaders import ChromiumLoader
+from ..utils.html_document import HtmlDocument
 from .base_node import BaseNode
 
 
@@ -157,8 +157,7 @@ class FetchNodeLevelK(BaseNode):
         Returns:
             list: A list of extracted hyperlinks.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-        links = [link["href"] for link in soup.find_all("a", href=True)]
+        links = HtmlDocument(html_content).hrefs
         self.logger.info(f"Extracted {len(links)} links.")
         return links
 
@@ -12,6 +12,9 @@ from .base_node import BaseNode
 class FetchScreenNode(BaseNode):
     """
     FetchScreenNode captures screenshots from a given URL and stores the image data as bytes.
+
+    When ``loader_kwargs`` enables ``browser_pool``, the screenshots are taken in a
+    context leased from the process-wide browser pool instead of a fresh browser.
     """
 
     def __init__(
@@ -23,6 +26,8 @@ class FetchScreenNode(BaseNode):
     ):
         super().__init__(node_name, "node", input, output, 2, node_config)
         self.url = node_config.get("link")
+        self.loader_kwargs = node_config.get("loader_kwargs", {})
+        self.headless = node_config.get("headless", True)
 
     def execute(self, state: dict) -> dict:
         """
@@ -30,6 +35,18 @@ class FetchScreenNode(BaseNode):
         """
         self.logger.info(f"--- Executing {self.node_name} Node ---")
 
+        browser_pool = (self.loader_kwargs or {}).get("browser_pool", False)
+        if browser_pool:
+            screenshot_data_list = self._capture_with_pool(browser_pool)
+        else:
+            screenshot_data_list = self._capture_with_new_browser()
+
+        state["link"] = self.url
+        state["screenshots"] = screenshot_data_list
+
+        return state
+
+    def _capture_with_new_browser(self) -> List[bytes]:
         with sync_playwright() as p:
             browser = p.chromium.launch()
             page = browser.new_page()
@@ -52,7 +69,26 @@ class FetchScreenNode(BaseNode):
 
             browser.close()
 
-        state["link"] = self.url
-        state["screenshots"] = screenshot_data_list
+        return screenshot_data_list
 
-        return state
+    def _capture_with_pool(self, browser_pool) -> List[bytes]:
+        from ..docloaders.browser_pool import get_browser_pool
+
+        pool_config = browser_pool if isinstance(browser_pool, dict) else {}
+        pool = get_browser_pool(
+            "chromium", {"headless": self.headless, "proxy": None}, **pool_config
+        )
+
+        async def _capture(context):
+            page = await context.new_page()
+            await page.goto(self.url)
+
+            viewport_height = page.viewport_size["height"]
+
+            screenshot_data_list = []
+            for scroll_position in (0, viewport_height):
+                await page.evaluate(f"window.scrollTo(0, {scroll_position});")
+                screenshot_data_list.append(await page.screenshot())
+            return screenshot_data_list
+
+        return pool.run_sync(_capture)
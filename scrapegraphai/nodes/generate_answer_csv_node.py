@@ -4,18 +4,18 @@ Module for generating the answer node
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.runnables import RunnableParallel
 from langchain_mistralai import ChatMistralAI
 from langchain_openai import ChatOpenAI
 from tqdm import tqdm
 
 from ..prompts import TEMPLATE_CHUKS_CSV, TEMPLATE_MERGE_CSV, TEMPLATE_NO_CHUKS_CSV
+from ..utils.map_executor import get_map_executor
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
 )
+from ..utils.prompt_caching import build_prompt, needs_cache_control
 from .base_node import BaseNode
 
 
@@ -66,6 +66,7 @@ class GenerateAnswerCSVNode(BaseNode):
         )
 
         self.additional_info = node_config.get("additional_info")
+        self.cache_control = node_config.get("cache_control")
 
     def execute(self, state):
         """
@@ -95,6 +96,10 @@ class GenerateAnswerCSVNode(BaseNode):
         user_prompt = input_data[0]
         doc = input_data[1]
 
+        cache_control = self.cache_control
+        if cache_control is None:
+            cache_control = needs_cache_control(self.llm_model)
+
         if self.node_config.get("schema", None) is not None:
             if isinstance(self.llm_model, (ChatOpenAI, ChatMistralAI)):
                 self.llm_model = self.llm_model.with_structured_output(
@@ -123,48 +128,53 @@ class GenerateAnswerCSVNode(BaseNode):
         chains_dict = {}
 
         if len(doc) == 1:
-            prompt = PromptTemplate(
-                template=TEMPLATE_NO_CHUKS_CSV_PROMPT,
+            prompt = build_prompt(
+                TEMPLATE_NO_CHUKS_CSV_PROMPT,
                 input_variables=["question"],
                 partial_variables={
                     "context": doc,
                     "format_instructions": format_instructions,
                 },
+                cache_control=cache_control,
             )
 
             chain = prompt | self.llm_model | output_parser
-            answer = chain.invoke({"question": user_prompt})
+            answer = self.invoke_chain(chain, {"question": user_prompt})
             state.update({self.output[0]: answer})
             return state
 
         for i, chunk in enumerate(
             tqdm(doc, desc="Processing chunks", disable=not self.verbose)
         ):
-            prompt = PromptTemplate(
-                template=TEMPLATE_CHUKS_CSV_PROMPT,
+            prompt = build_prompt(
+                TEMPLATE_CHUKS_CSV_PROMPT,
                 input_variables=["question"],
                 partial_variables={
                     "context": chunk,
                     "chunk_id": i + 1,
                     "format_instructions": format_instructions,
                 },
+                cache_control=cache_control,
             )
 
             chain_name = f"chunk{i + 1}"
             chains_dict[chain_name] = prompt | self.llm_model | output_parser
 
-        async_runner = RunnableParallel(**chains_dict)
+        async_runner = get_map_executor(self.llm_model).parallel(chains_dict)
 
-        batch_results = async_runner.invoke({"question": user_prompt})
+        batch_results = self.invoke_chain(async_runner, {"question": user_prompt})
 
-        merge_prompt = PromptTemplate(
-            template=TEMPLATE_MERGE_CSV_PROMPT,
+        merge_prompt = build_prompt(
+            TEMPLATE_MERGE_CSV_PROMPT,
             input_variables=["context", "question"],
             partial_variables={"format_instructions": format_instructions},
+            cache_control=cache_control,
         )
 
         merge_chain = merge_prompt | self.llm_model | output_parser
-        answer = merge_chain.invoke({"context": batch_results, "question": user_prompt})
+        answer = self.invoke_chain(
+            merge_chain, {"context": batch_results, "question": user_prompt}
+        )
 
         state.update({self.output[0]: answer})
         return state
@@ -6,8 +6,8 @@ import asyncio
 import base64
 from typing import List, Optional
 
-import aiohttp
-
+from ..utils.background_loop import run_sync
+from ..utils.http_client import get_http_client
 from .base_node import BaseNode
 
 
@@ -26,7 +26,7 @@ class GenerateAnswerFromImageNode(BaseNode):
     ):
         super().__init__(node_name, "node", input, output, 2, node_config)
 
-    async def process_image(self, session, api_key, image_data, user_prompt):
+    async def process_image(self, client, api_key, image_data, user_prompt):
         """
         async process image
         """
@@ -56,17 +56,22 @@ class GenerateAnswerFromImageNode(BaseNode):
             "max_tokens": 300,
         }
 
-        async with session.post(
-            "https://api.openai.com/v1/chat/completions", headers=headers, json=payload
-        ) as response:
-            result = await response.json()
-            return (
-                result.get("choices", [{}])[0]
-                .get("message", {})
-                .get("content", "No response")
-            )
-
-    async def execute_async(self, state: dict) -> dict:
+        # API calls share the pooled client but not the per-host page-fetch limits.
+        response = await client.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers=headers,
+            json=payload,
+            timeout=300,
+            schedule=False,
+        )
+        result = response.json()
+        return (
+            result.get("choices", [{}])[0]
+            .get("message", {})
+            .get("content", "No response")
+        )
+
+    async def aexecute(self, state: dict) -> dict:
         """
         Processes images from the state, generates answers,
         consolidates the results, and updates the state asynchronously.
@@ -90,18 +95,18 @@ class GenerateAnswerFromImageNode(BaseNode):
 
         api_key = self.node_config.get("config", {}).get("llm", {}).get("api_key", "")
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self.process_image(
-                    session,
-                    api_key,
-                    image_data,
-                    state.get("user_prompt", "Extract information from the image"),
-                )
-                for image_data in images
-            ]
+        client = get_http_client()
+        tasks = [
+            self.process_image(
+                client,
+                api_key,
+                image_data,
+                state.get("user_prompt", "Extract information from the image"),
+            )
+            for image_data in images
+        ]
 
-            analyses = await asyncio.gather(*tasks)
+        analyses = await asyncio.gather(*tasks)
 
         consolidated_analysis = " ".join(analyses)
 
@@ -111,17 +116,6 @@ class GenerateAnswerFromImageNode(BaseNode):
 
     def execute(self, state: dict) -> dict:
         """
-        Wrapper to run the asynchronous execute_async function in a synchronous context.
+        Wrapper to run the asynchronous aexecute function in a synchronous context.
         """
-        try:
-            eventloop = asyncio.get_event_loop()
-        except RuntimeError:
-            eventloop = None
-
-        if eventloop and eventloop.is_running():
-            task = eventloop.create_task(self.execute_async(state))
-            state = eventloop.run_until_complete(asyncio.gather(task))[0]
-        else:
-            state = asyncio.run(self.execute_async(state))
-
-        return state
+        return run_sync(self.aexecute(state))
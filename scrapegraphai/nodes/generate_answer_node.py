@@ -3,13 +3,10 @@ GenerateAnswerNode Module
 """
 
 import json
-import time
-from typing import List, Optional
+from typing import Generator, List, Optional
 
-from langchain_core.prompts import PromptTemplate
 from langchain_aws import ChatBedrock
 from langchain_ollama import ChatOllama
-from langchain_core.runnables import RunnableParallel
 from langchain_openai import ChatOpenAI
 from requests.exceptions import Timeout
 from tqdm import tqdm
@@ -22,10 +19,18 @@ from ..prompts import (
     TEMPLATE_NO_CHUNKS,
     TEMPLATE_NO_CHUNKS_MD,
 )
+from ..utils.deadline import (
+    DeadlineExceeded,
+    ainvoke_with_deadline,
+    invoke_with_deadline,
+)
+from ..utils.map_executor import get_map_executor
 from ..utils.output_parser import (
     TolerantJsonOutputParser,
     get_pydantic_output_parser,
 )
+from ..utils.prompt_caching import build_prompt, needs_cache_control
+from ..utils.steps import adrive_steps, drive_steps
 from .base_node import BaseNode
 
 
@@ -49,6 +54,9 @@ class GenerateAnswerNode(BaseNode):
         is_md_scraper (bool): Whether the node is scraping markdown data.
         additional_info (Optional[str]): Any additional information to be
         included in the prompt templates.
+        cache_control (Optional[bool]): Whether the stable prefix of the prompts
+        is marked for provider-side caching; None marks it for the providers
+        that need explicit markers.
     """
 
     def __init__(
@@ -73,16 +81,24 @@ class GenerateAnswerNode(BaseNode):
         self.is_md_scraper = node_config.get("is_md_scraper", False)
         self.additional_info = node_config.get("additional_info")
         self.timeout = node_config.get("timeout", 480)
+        self.cache_control = node_config.get("cache_control")
 
     def invoke_with_timeout(self, chain, inputs, timeout):
         """Helper method to invoke chain with timeout"""
         try:
-            start_time = time.time()
-            response = chain.invoke(inputs)
-            if time.time() - start_time > timeout:
-                raise Timeout(f"Response took longer than {timeout} seconds")
-            return response
-        except Timeout as e:
+            return invoke_with_deadline(chain, inputs, timeout)
+        except (Timeout, DeadlineExceeded) as e:
+            self.logger.error(f"Timeout error: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error during chain execution: {str(e)}")
+            raise
+
+    async def ainvoke_with_timeout(self, chain, inputs, timeout):
+        """Helper method to await chain with timeout"""
+        try:
+            return await ainvoke_with_deadline(chain, inputs, timeout)
+        except (Timeout, DeadlineExceeded) as e:
             self.logger.error(f"Timeout error: {str(e)}")
             raise
         except Exception as e:
@@ -130,6 +146,36 @@ class GenerateAnswerNode(BaseNode):
         """
         self.logger.info(f"--- Executing {self.node_name} Node ---")
 
+        return drive_steps(
+            self._calls(state),
+            lambda chain, inputs: self.invoke_with_timeout(chain, inputs, self.timeout),
+        )
+
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Executes the GenerateAnswerNode on the running event loop.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state with the output key containing the generated answer.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        return await adrive_steps(
+            self._calls(state),
+            lambda chain, inputs: self.ainvoke_with_timeout(
+                chain, inputs, self.timeout
+            ),
+        )
+
+    def _calls(self, state: dict) -> Generator:
+        """
+        Builds the LLM calls of the node, shared by ``execute`` and ``aexecute``:
+        yields each chain with its input, is sent back its output, and returns
+        the updated state.
+        """
         input_keys = self.get_input_keys(state)
         input_data = [state[key] for key in input_keys]
         user_prompt = input_data[0]
@@ -179,26 +225,29 @@ class GenerateAnswerNode(BaseNode):
             template_chunks_prompt = self.additional_info + template_chunks_prompt
             template_merge_prompt = self.additional_info + template_merge_prompt
 
+        cache_control = self.cache_control
+        if cache_control is None:
+            cache_control = needs_cache_control(self.llm_model)
+
         if len(doc) == 1:
-            prompt = PromptTemplate(
-                template=template_no_chunks_prompt,
+            prompt = build_prompt(
+                template_no_chunks_prompt,
                 input_variables=["content", "question"],
                 partial_variables={
                     "format_instructions": format_instructions,
                 },
+                cache_control=cache_control,
             )
             chain = prompt | self.llm_model
             if output_parser:
                 chain = chain | output_parser
 
             try:
-                answer = self.invoke_with_timeout(
-                    chain, {"content": doc, "question": user_prompt}, self.timeout
-                )
-            except (Timeout, json.JSONDecodeError) as e:
+                answer = yield chain, {"content": doc, "question": user_prompt}
+            except (Timeout, DeadlineExceeded, json.JSONDecodeError) as e:
                 error_msg = (
                     "Response timeout exceeded"
-                    if isinstance(e, Timeout)
+                    if isinstance(e, (Timeout, DeadlineExceeded))
                     else "Invalid JSON response format"
                 )
                 state.update(
@@ -213,53 +262,52 @@ class GenerateAnswerNode(BaseNode):
         for i, chunk in enumerate(
             tqdm(doc, desc="Processing chunks", disable=not self.verbose)
         ):
-            prompt = PromptTemplate(
-                template=template_chunks_prompt,
+            prompt = build_prompt(
+                template_chunks_prompt,
                 input_variables=["question"],
                 partial_variables={
                     "content": chunk,
                     "chunk_id": i + 1,
                     "format_instructions": format_instructions,
                 },
+                cache_control=cache_control,
             )
             chain_name = f"chunk{i + 1}"
             chains_dict[chain_name] = prompt | self.llm_model
             if output_parser:
                 chains_dict[chain_name] = chains_dict[chain_name] | output_parser
 
-        async_runner = RunnableParallel(**chains_dict)
+        async_runner = get_map_executor(self.llm_model).parallel(chains_dict)
         try:
-            batch_results = self.invoke_with_timeout(
-                async_runner, {"question": user_prompt}, self.timeout
-            )
-        except (Timeout, json.JSONDecodeError) as e:
+            batch_results = yield async_runner, {"question": user_prompt}
+        except (Timeout, DeadlineExceeded, json.JSONDecodeError) as e:
             error_msg = (
                 "Response timeout exceeded during chunk processing"
-                if isinstance(e, Timeout)
+                if isinstance(e, (Timeout, DeadlineExceeded))
                 else "Invalid JSON response format in chunk processing"
             )
             state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
             return state
 
-        merge_prompt = PromptTemplate(
-            template=template_merge_prompt,
+        merge_prompt = build_prompt(
+            template_merge_prompt,
             input_variables=["content", "question"],
             partial_variables={"format_instructions": format_instructions},
+            cache_control=cache_control,
         )
 
         merge_chain = merge_prompt | self.llm_model
         if output_parser:
             merge_chain = merge_chain | output_parser
         try:
-            answer = self.invoke_with_timeout(
-                merge_chain,
-                {"content": batch_results, "question": user_prompt},
-                self.timeout,
-            )
-        except (Timeout, json.JSONDecodeError) as e:
+            answer = yield merge_chain, {
+                "content": batch_results,
+                "question": user_prompt,
+            }
+        except (Timeout, DeadlineExceeded, json.JSONDecodeError) as e:
             error_msg = (
                 "Response timeout exceeded during merge"
-                if isinstance(e, Timeout)
+                if isinstance(e, (Timeout, DeadlineExceeded))
                 else "Invalid JSON response format during merge"
             )
             state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
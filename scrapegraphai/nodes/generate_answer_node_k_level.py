@@ -8,7 +8,6 @@ from langchain_aws import ChatBedrock
 from langchain_ollama import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnableParallel
 from langchain_mistralai import ChatMistralAI
 from langchain_openai import ChatOpenAI
 from tqdm import tqdm
@@ -21,6 +20,7 @@ from ..prompts import (
     TEMPLATE_NO_CHUNKS,
     TEMPLATE_NO_CHUNKS_MD,
 )
+from ..utils.map_executor import get_map_executor
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -158,8 +158,10 @@ class GenerateAnswerNodeKLevel(BaseNode):
             chain_name = f"chunk{i + 1}"
             chains_dict[chain_name] = prompt | self.llm_model
 
-        async_runner = RunnableParallel(**chains_dict)
-        batch_results = async_runner.invoke({"format_instructions": user_prompt})
+        async_runner = get_map_executor(self.llm_model).parallel(chains_dict)
+        batch_results = self.invoke_chain(
+            async_runner, {"format_instructions": user_prompt}
+        )
 
         merge_prompt = PromptTemplate(
             template=template_merge_prompt,
@@ -170,7 +172,9 @@ class GenerateAnswerNodeKLevel(BaseNode):
         merge_chain = merge_prompt | self.llm_model
         if output_parser:
             merge_chain = merge_chain | output_parser
-        answer = merge_chain.invoke({"content": batch_results, "question": user_prompt})
+        answer = self.invoke_chain(
+            merge_chain, {"content": batch_results, "question": user_prompt}
+        )
 
         state["answer"] = answer
 
@@ -7,7 +7,6 @@ from typing import List, Optional
 from langchain_core.prompts import PromptTemplate
 from langchain_ollama import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.runnables import RunnableParallel
 from langchain_mistralai import ChatMistralAI
 from langchain_openai import ChatOpenAI
 from tqdm import tqdm
@@ -17,6 +16,7 @@ from ..prompts.generate_answer_node_omni_prompts import (
     TEMPLATE_MERGE_OMNI,
     TEMPLATE_NO_CHUNKS_OMNI,
 )
+from ..utils.map_executor import get_map_executor
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -132,7 +132,7 @@ class GenerateAnswerOmniNode(BaseNode):
             )
 
             chain = prompt | self.llm_model | output_parser
-            answer = chain.invoke({"question": user_prompt})
+            answer = self.invoke_chain(chain, {"question": user_prompt})
 
             state.update({self.output[0]: answer})
             return state
@@ -153,9 +153,9 @@ class GenerateAnswerOmniNode(BaseNode):
             chain_name = f"chunk{i + 1}"
             chains_dict[chain_name] = prompt | self.llm_model | output_parser
 
-        async_runner = RunnableParallel(**chains_dict)
+        async_runner = get_map_executor(self.llm_model).parallel(chains_dict)
 
-        batch_results = async_runner.invoke({"question": user_prompt})
+        batch_results = self.invoke_chain(async_runner, {"question": user_prompt})
 
         merge_prompt = PromptTemplate(
             template=TEMPLATE_MERGE_OMNI_prompt,
@@ -164,7 +164,9 @@ class GenerateAnswerOmniNode(BaseNode):
         )
 
         merge_chain = merge_prompt | self.llm_model | output_parser
-        answer = merge_chain.invoke({"context": batch_results, "question": user_prompt})
+        answer = self.invoke_chain(
+            merge_chain, {"context": batch_results, "question": user_prompt}
+        )
 
         state.update({self.output[0]: answer})
         return state
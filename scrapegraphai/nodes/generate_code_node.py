@@ -356,7 +356,7 @@ class GenerateCodeNode(BaseNode):
         output_parser = StrOutputParser()
 
         chain = prompt | self.llm_model | output_parser
-        generated_code = chain.invoke({})
+        generated_code = self.invoke_chain(chain, {})
         return generated_code
 
     def semantic_comparison(
@@ -409,11 +409,12 @@ class GenerateCodeNode(BaseNode):
         )
 
         chain = prompt | self.llm_model | output_parser
-        return chain.invoke(
+        return self.invoke_chain(
+            chain,
             {
                 "generated_result": json.dumps(generated_result, indent=2),
                 "reference_result": json.dumps(reference_result_dict, indent=2),
-            }
+            },
         )
 
     def syntax_check(self, code):
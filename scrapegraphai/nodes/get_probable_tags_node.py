@@ -84,7 +84,7 @@ class GetProbableTagsNode(BaseNode):
         )
 
         tag_answer = tag_prompt | self.llm_model | output_parser
-        probable_tags = tag_answer.invoke({"question": user_prompt})
+        probable_tags = self.invoke_chain(tag_answer, {"question": user_prompt})
 
         state.update({self.output[0]: probable_tags})
         return state
@@ -8,6 +8,7 @@ from typing import List, Optional, Type
 from pydantic import BaseModel
 from tqdm.asyncio import tqdm
 
+from ..utils.background_loop import run_sync
 from .base_node import BaseNode
 
 DEFAULT_BATCHSIZE = 16
@@ -60,23 +61,25 @@ class GraphIteratorNode(BaseNode):
             indicating that thenecessary information for running
             the graph instances is missing.
         """
+        return run_sync(self.aexecute(state))
+
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Runs the graph instances concurrently on the running event loop.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state with the results of the graph instances.
+        """
         batchsize = self.node_config.get("batchsize", DEFAULT_BATCHSIZE)
 
         self.logger.info(
             f"--- Executing {self.node_name} Node with batchsize {batchsize} ---"
         )
 
-        try:
-            eventloop = asyncio.get_event_loop()
-        except RuntimeError:
-            eventloop = None
-
-        if eventloop and eventloop.is_running():
-            state = eventloop.run_until_complete(self._async_execute(state, batchsize))
-        else:
-            state = asyncio.run(self._async_execute(state, batchsize))
-
-        return state
+        return await self._async_execute(state, batchsize)
 
     async def _async_execute(self, state: dict, batchsize: int) -> dict:
         """asynchronously executes the node's logic with multiple graph instances
@@ -128,7 +131,7 @@ class GraphIteratorNode(BaseNode):
 
         async def _async_run(graph):
             async with semaphore:
-                return await asyncio.to_thread(graph.run)
+                return await graph.arun()
 
         for url, graph in zip(urls, graph_instance):
             graph.source = url
@@ -101,7 +101,7 @@ class HtmlAnalyzerNode(BaseNode):
         output_parser = StrOutputParser()
 
         chain = prompt | self.llm_model | output_parser
-        html_analysis = chain.invoke({})
+        html_analysis = self.invoke_chain(chain, {})
 
         state.update({self.output[0]: html_analysis, self.output[1]: reduced_html})
         return state
@@ -79,7 +79,7 @@ class ImageToTextNode(BaseNode):
                         },
                     ]
                 )
-                text_answer = self.llm_model.invoke([message]).content
+                text_answer = self.invoke_chain(self.llm_model, [message]).content
             except Exception:
                 text_answer = "Error: incompatible image format or model failure."
             img_desc.append(text_answer)
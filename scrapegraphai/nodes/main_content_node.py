@@ -0,0 +1,132 @@
+"""
+MainContentNode Module
+"""
+
+from typing import List, Optional
+
+from langchain_core.documents import Document
+
+from ..utils.convert_to_md import convert_to_md
+from ..utils.main_content import extract_main_content
+from ..utils.tokenizer import num_tokens_calculus
+from .base_node import BaseNode
+
+
+class MainContentNode(BaseNode):
+    """
+    A node that keeps only the main content of fetched pages, so the LLM is not
+    prompted with their navigation, footers, banners and link rails.
+
+    The content is located readability-style (text density scoring of the
+    containers, then pruning of link-heavy blocks). Pages on which no content
+    is found with confidence are passed on whole. When the FetchNode left the
+    Markdown conversion pending, it happens here, after the extraction.
+
+    After each run ``execution_metrics`` holds the token counts of the
+    documents before and after the extraction; the graph reports them in its
+    execution info.
+
+    Attributes:
+        min_text_length (int): Below this many characters of extracted text the
+            page is passed on whole.
+        link_density_threshold (float): Blocks with a larger share of link text
+            are pruned from the content.
+        markdown_engine (str): The engine used for the pending Markdown conversions.
+        verbose (bool): A flag indicating whether to show print statements during execution.
+
+    Args:
+        input (str): Boolean expression defining the input keys needed from the state.
+        output (List[str]): List of output keys to be updated in the state.
+        node_config (Optional[dict]): Additional configuration for the node.
+        node_name (str): The unique identifier name for the node, defaulting to "MainContent".
+    """
+
+    def __init__(
+        self,
+        input: str,
+        output: List[str],
+        node_config: Optional[dict] = None,
+        node_name: str = "MainContent",
+    ):
+        super().__init__(node_name, "node", input, output, 1, node_config)
+
+        node_config = node_config or {}
+        self.verbose = node_config.get("verbose", False)
+        self.min_text_length = node_config.get("min_text_length", 250)
+        self.link_density_threshold = node_config.get("link_density_threshold", 0.5)
+        self.markdown_engine = node_config.get("markdown_engine", "html2text")
+        self.llm_model = node_config.get("llm_model")
+        self.execution_metrics = {}
+
+    def execute(self, state: dict) -> dict:
+        """
+        Replaces each fetched page with its main content.
+
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                            to fetch the correct data from the state.
+
+        Returns:
+            dict: The updated state with the output key containing the reduced documents.
+
+        Raises:
+            KeyError: If the input keys are not found in the state, indicating
+                      that the necessary information for the extraction is missing.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        input_keys = self.get_input_keys(state)
+        documents = state[input_keys[0]]
+        url = state.get("url")
+
+        tokens_before = tokens_after = 0
+        reduced = []
+        for document in documents:
+            before, after, document = self._reduce(document, url)
+            tokens_before += before
+            tokens_after += after
+            reduced.append(document)
+
+        self.execution_metrics = {
+            "tokens_before": tokens_before,
+            "tokens_after": tokens_after,
+        }
+        self.logger.info(
+            f"Main content extraction: {tokens_before} -> {tokens_after} tokens"
+        )
+
+        state.update({self.output[0]: reduced})
+        return state
+
+    def _reduce(self, document, url: Optional[str]):
+        """Returns the token counts before and after, and the reduced document."""
+        if isinstance(document, Document):
+            content, metadata = document.page_content, dict(document.metadata)
+        else:
+            content, metadata = str(document), {}
+
+        pending = metadata.pop("markdown_pending", False)
+        main = None
+        if metadata.get("fetch_tier") != "file" and "<" in content:
+            main = extract_main_content(
+                content,
+                min_text_length=self.min_text_length,
+                link_density_threshold=self.link_density_threshold,
+            )
+
+        if pending:
+            full = convert_to_md(content, url, engine=self.markdown_engine)
+            reduced = (
+                convert_to_md(main, url, engine=self.markdown_engine)
+                if main is not None
+                else full
+            )
+        else:
+            full, reduced = content, main if main is not None else content
+
+        metadata["main_content"] = main is not None
+        return (
+            num_tokens_calculus(full, self.llm_model),
+            num_tokens_calculus(reduced, self.llm_model),
+            Document(page_content=reduced, metadata=metadata),
+        )
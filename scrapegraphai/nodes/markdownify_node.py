@@ -37,6 +37,11 @@ class MarkdownifyNode(BaseNode):
         self.verbose = (
             False if node_config is None else node_config.get("verbose", False)
         )
+        self.markdown_engine = (
+            "html2text"
+            if node_config is None
+            else node_config.get("markdown_engine", "html2text")
+        )
 
     def execute(self, state: dict) -> dict:
         """
@@ -59,7 +64,7 @@ class MarkdownifyNode(BaseNode):
         html_content = state[input_keys[0]]
 
         # Convert HTML to Markdown
-        markdown_content = convert_to_md(html_content)
+        markdown_content = convert_to_md(html_content, engine=self.markdown_engine)
 
         # Update state with markdown content
         state.update({self.output[0]: markdown_content})
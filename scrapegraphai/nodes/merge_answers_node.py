@@ -4,7 +4,6 @@ MergeAnswersNode Module
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
 from langchain_ollama import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_mistralai import ChatMistralAI
@@ -15,6 +14,7 @@ from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
 )
+from ..utils.prompt_caching import build_prompt, needs_cache_control
 from .base_node import BaseNode
 
 
@@ -53,6 +53,7 @@ class MergeAnswersNode(BaseNode):
         self.verbose = (
             False if node_config is None else node_config.get("verbose", False)
         )
+        self.cache_control = node_config.get("cache_control")
 
     def execute(self, state: dict) -> dict:
         """
@@ -84,6 +85,10 @@ class MergeAnswersNode(BaseNode):
         for i, answer in enumerate(answers):
             answers_str += f"CONTENT WEBSITE {i + 1}: {answer}\n"
 
+        cache_control = self.cache_control
+        if cache_control is None:
+            cache_control = needs_cache_control(self.llm_model)
+
         if self.node_config.get("schema", None) is not None:
             if isinstance(self.llm_model, (ChatOpenAI, ChatMistralAI)):
                 self.llm_model = self.llm_model.with_structured_output(
@@ -100,17 +105,18 @@ class MergeAnswersNode(BaseNode):
             output_parser = JsonOutputParser()
             format_instructions = output_parser.get_format_instructions()
 
-        prompt_template = PromptTemplate(
-            template=TEMPLATE_COMBINED,
+        prompt_template = build_prompt(
+            TEMPLATE_COMBINED,
             input_variables=["user_prompt"],
             partial_variables={
                 "format_instructions": format_instructions,
                 "website_content": answers_str,
             },
+            cache_control=cache_control,
         )
 
         merge_chain = prompt_template | self.llm_model | output_parser
-        answer = merge_chain.invoke({"user_prompt": user_prompt})
+        answer = self.invoke_chain(merge_chain, {"user_prompt": user_prompt})
 
         # Get the URLs from the state, ensuring we get the actual URLs used for scraping
         urls = []
@@ -77,7 +77,7 @@ class MergeGeneratedScriptsNode(BaseNode):
         )
 
         merge_chain = prompt_template | self.llm_model | StrOutputParser()
-        answer = merge_chain.invoke({"user_prompt": user_prompt})
+        answer = self.invoke_chain(merge_chain, {"user_prompt": user_prompt})
 
         state.update({self.output[0]: answer})
         return state
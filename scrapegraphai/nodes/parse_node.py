@@ -6,10 +6,10 @@ import re
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin
 
-from langchain_community.document_transformers import Html2TextTransformer
 from langchain_core.documents import Document
 
 from ..helpers import default_filters
+from ..utils.html_to_text import html_to_text
 from ..utils.split_text_into_chunks import split_text_into_chunks
 from .base_node import BaseNode
 
@@ -83,18 +83,21 @@ class ParseNode(BaseNode):
         source = input_data[1] if self.parse_urls else None
 
         if self.parse_html:
-            docs_transformed = Html2TextTransformer(
-                ignore_links=False
-            ).transform_documents(input_data[0])
-            docs_transformed = docs_transformed[0]
-
-            link_urls, img_urls = self._extract_urls(
-                docs_transformed.page_content, source
+            # Link and image URLs are collected from the tags while converting;
+            # the regex recovery is only needed when the input has no markup.
+            text, link_urls, img_urls = html_to_text(
+                docs_transformed[0].page_content,
+                source,
+                ignore_links=False,
+                collect_urls=self.parse_urls,
             )
+            if link_urls is None:
+                link_urls, img_urls = self._extract_urls(text, source)
 
             chunks = split_text_into_chunks(
-                text=docs_transformed.page_content,
+                text=text,
                 chunk_size=self.chunk_size - 250,
+                llm_model=self.llm_model,
             )
         else:
             docs_transformed = docs_transformed[0]
@@ -113,10 +116,13 @@ class ParseNode(BaseNode):
                 chunks = split_text_into_chunks(
                     text=docs_transformed.page_content,
                     chunk_size=chunk_size,
+                    llm_model=self.llm_model,
                 )
             else:
                 chunks = split_text_into_chunks(
-                    text=docs_transformed, chunk_size=chunk_size
+                    text=docs_transformed,
+                    chunk_size=chunk_size,
+                    llm_model=self.llm_model,
                 )
 
         state.update({self.output[0]: chunks})
@@ -102,7 +102,7 @@ class PromptRefinerNode(BaseNode):
         output_parser = StrOutputParser()
 
         chain = prompt | self.llm_model | output_parser
-        refined_prompt = chain.invoke({})
+        refined_prompt = self.invoke_chain(chain, {})
 
         state.update({self.output[0]: refined_prompt})
         return state
@@ -3,20 +3,26 @@ RobotsNode Module
 """
 
 from typing import List, Optional
-from urllib.parse import urlparse
 
 from langchain_core.output_parsers import CommaSeparatedListOutputParser
 from langchain_core.prompts import PromptTemplate
 
-from ..helpers import robots_dictionary
 from ..prompts import TEMPLATE_ROBOT
+from ..utils.fetch_scheduler import get_fetch_scheduler
+from ..utils.robots_cache import (
+    DEFAULT_ROBOTS_TTL,
+    get_robots_agents,
+    get_robots_cache,
+)
 from .base_node import BaseNode
 
 
 class RobotsNode(BaseNode):
     """
     A node responsible for checking if a website is scrapeable or not based on the robots.txt file.
-    It uses a language model to determine if the website allows scraping of the provided path.
+    The robots.txt rules are evaluated with a standards-compliant parser for the user agents
+    that ``robots_dictionary`` associates with the model; asking the language model instead
+    is an explicit opt-in.
 
     This node acts as a starting point in many scraping workflows, preparing the state
     with the necessary HTML content for further processing by subsequent nodes in the graph.
@@ -26,6 +32,8 @@ class RobotsNode(BaseNode):
         force_scraping (bool): A flag indicating whether scraping should be enforced even
                                if disallowed by robots.txt.
         verbose (bool): A flag indicating whether to show print statements during execution.
+        use_llm (bool): A flag indicating whether the language model decides instead of
+                        the robots.txt parser.
 
     Args:
         input (str): Boolean expression defining the input keys needed from the state.
@@ -53,12 +61,18 @@ class RobotsNode(BaseNode):
         self.verbose = (
             True if node_config is None else node_config.get("verbose", False)
         )
+        self.use_llm = node_config.get("use_llm", False)
+
+        # robots.txt files are cached per host, on disk as well when cache_path is set.
+        self.cache_path = node_config.get("cache_path", False)
+        self.robots_ttl = node_config.get("robots_ttl", DEFAULT_ROBOTS_TTL)
 
     def execute(self, state: dict) -> dict:
         """
         Checks if a website is scrapeable based on the robots.txt file and updates the state
-        with the scrapeability status. The method constructs a prompt for the language model,
-        submits it, and parses the output to determine if scraping is allowed.
+        with the scrapeability status. The rules are read from the robots cache and
+        evaluated for the model's user agents; any crawl delay they request is applied
+        to the fetch scheduler.
 
         Args:
             state (dict): The current state of the graph. The input keys will be used to fetch the
@@ -69,7 +83,6 @@ class RobotsNode(BaseNode):
         Raises:
             KeyError: If the input keys are not found in the state, indicating that the
                         necessary information for checking scrapeability is missing.
-            KeyError: If the large language model is not found in the robots_dictionary.
             ValueError: If the website is not scrapeable based on the robots.txt file and
                         scraping is not enforced.
         """
@@ -81,51 +94,50 @@ class RobotsNode(BaseNode):
         input_data = [state[key] for key in input_keys]
 
         source = input_data[0]
-        output_parser = CommaSeparatedListOutputParser()
 
         if not source.startswith("http"):
             raise ValueError("Operation not allowed")
 
-        else:
-            parsed_url = urlparse(source)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            from langchain_community.document_loaders import AsyncChromiumLoader
-            loader = AsyncChromiumLoader(f"{base_url}/robots.txt")
-            document = loader.load()
-            if "ollama" in self.llm_model.model:
-                self.llm_model.model = self.llm_model.model.split("/")[-1]
-                model = self.llm_model.model.split("/")[-1]
-            else:
-                model = self.llm_model.model
-            try:
-                agent = robots_dictionary[model]
+        if "ollama" in self.llm_model.model:
+            self.llm_model.model = self.llm_model.model.split("/")[-1]
+        agents = get_robots_agents(self.llm_model.model)
 
-            except KeyError:
-                agent = model
+        robots_cache = get_robots_cache(self.cache_path or None, ttl=self.robots_ttl)
+        allowed, rules = robots_cache.can_fetch(source, agents)
 
-            prompt = PromptTemplate(
-                template=TEMPLATE_ROBOT,
-                input_variables=["path"],
-                partial_variables={"context": document, "agent": agent},
-            )
+        crawl_delay = rules.crawl_delay(agents)
+        if crawl_delay:
+            get_fetch_scheduler().set_crawl_delay(source, crawl_delay)
 
-            chain = prompt | self.llm_model | output_parser
-            is_scrapable = chain.invoke({"path": source})[0]
+        if self.use_llm:
+            is_scrapable = self._ask_llm(source, rules.body, agents)
+        else:
+            is_scrapable = "yes" if allowed else "no"
 
-            if "no" in is_scrapable:
-                self.logger.warning(
-                    "\033[31m(Scraping this website is not allowed)\033[0m"
-                )
+        if "no" in is_scrapable:
+            self.logger.warning("\033[31m(Scraping this website is not allowed)\033[0m")
 
-                if not self.force_scraping:
-                    raise ValueError("The website you selected is not scrapable")
-                else:
-                    self.logger.warning(
-                        """\033[33m(WARNING: Scraping this website is
-                        not allowed but you decided to force it)\033[0m"""
-                    )
+            if not self.force_scraping:
+                raise ValueError("The website you selected is not scrapable")
             else:
-                self.logger.warning("\033[32m(Scraping this website is allowed)\033[0m")
+                self.logger.warning(
+                    """\033[33m(WARNING: Scraping this website is
+                    not allowed but you decided to force it)\033[0m"""
+                )
+        else:
+            self.logger.warning("\033[32m(Scraping this website is allowed)\033[0m")
 
         state.update({self.output[0]: is_scrapable})
         return state
+
+    def _ask_llm(self, source: str, robots_txt: str, agents: List[str]) -> str:
+        """Asks the language model whether the robots.txt allows scraping ``source``."""
+        output_parser = CommaSeparatedListOutputParser()
+        prompt = PromptTemplate(
+            template=TEMPLATE_ROBOT,
+            input_variables=["path"],
+            partial_variables={"context": robots_txt, "agent": agents},
+        )
+
+        chain = prompt | self.llm_model | output_parser
+        return self.invoke_chain(chain, {"path": source})[0]
@@ -95,10 +95,14 @@ class SearchInternetNode(BaseNode):
 
         if isinstance(self.llm_model, ChatOllama) and self.llm_model.format == "json":
             self.llm_model.format = None
-            search_query = search_answer.invoke({"user_prompt": user_prompt})[0]
+            search_query = self.invoke_chain(
+                search_answer, {"user_prompt": user_prompt}
+            )[0]
             self.llm_model.format = "json"
         else:
-            search_query = search_answer.invoke({"user_prompt": user_prompt})[0]
+            search_query = self.invoke_chain(
+                search_answer, {"user_prompt": user_prompt}
+            )[0]
 
         self.logger.info(f"Search Query: {search_query}")
 
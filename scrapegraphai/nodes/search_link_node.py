@@ -151,7 +151,7 @@ class SearchLinkNode(BaseNode):
                     input_variables=["content", "user_prompt"],
                 )
                 merge_chain = merge_prompt | self.llm_model | output_parser
-                answer = merge_chain.invoke({"content": chunk.page_content})
+                answer = self.invoke_chain(merge_chain, {"content": chunk.page_content})
                 relevant_links += answer
 
         state.update({self.output[0]: relevant_links})
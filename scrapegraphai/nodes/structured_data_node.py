@@ -0,0 +1,117 @@
+"""
+StructuredDataNode Module
+"""
+
+from typing import List, Optional
+
+from langchain_core.documents import Document
+from pydantic import BaseModel
+
+from ..utils.convert_to_md import convert_to_md
+from ..utils.structured_data import extract_structured_data, map_to_schema
+from .base_node import BaseNode
+
+
+class StructuredDataNode(BaseNode):
+    """
+    A node answering from the structured data a page embeds (JSON-LD,
+    microdata, OpenGraph, ``__NEXT_DATA__``-style payloads) when it fills the
+    user's schema, so the LLM does not need to be called.
+
+    The answer (first output key) is only filled when every required field of
+    the schema validates; otherwise it is set to None and the documents
+    (second output key) are passed on to the LLM nodes. In the graphs a
+    ConditionalNode on the answer follows this node and ends the run when it
+    is filled.
+
+    As the data lives in the page HTML, the FetchNode defers its Markdown
+    conversion when this node follows; the conversion happens here, unless a
+    later node (MainContentNode) also needs the HTML.
+
+    Attributes:
+        schema (BaseModel): The pydantic model the answer must validate against.
+        defer_markdown (bool): Whether pending Markdown conversions are left to a
+            later node.
+        markdown_engine (str): The engine used for the pending Markdown conversions.
+        verbose (bool): A flag indicating whether to show print statements during execution.
+
+    Args:
+        input (str): Boolean expression defining the input keys needed from the state.
+        output (List[str]): List of output keys to be updated in the state.
+        node_config (Optional[dict]): Additional configuration for the node.
+        node_name (str): The unique identifier name for the node, defaulting to "StructuredData".
+    """
+
+    def __init__(
+        self,
+        input: str,
+        output: List[str],
+        node_config: Optional[dict] = None,
+        node_name: str = "StructuredData",
+    ):
+        super().__init__(node_name, "node", input, output, 1, node_config)
+
+        node_config = node_config or {}
+        self.verbose = node_config.get("verbose", False)
+        self.schema = node_config.get("schema")
+        self.defer_markdown = node_config.get("defer_markdown", False)
+        self.markdown_engine = node_config.get("markdown_engine", "html2text")
+        self.execution_metrics = {}
+
+    def execute(self, state: dict) -> dict:
+        """
+        Fills the schema from the structured data of the fetched pages.
+
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                            to fetch the correct data from the state.
+
+        Returns:
+            dict: The updated state, with the output key containing the answer when
+                  the structured data satisfied the schema.
+
+        Raises:
+            KeyError: If the input keys are not found in the state, indicating
+                      that the necessary information for the extraction is missing.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        input_keys = self.get_input_keys(state)
+        documents = state[input_keys[0]]
+
+        answer = None
+        if isinstance(self.schema, type) and issubclass(self.schema, BaseModel):
+            for document in documents:
+                content = getattr(document, "page_content", document)
+                if isinstance(content, str) and "<" in content:
+                    data = extract_structured_data(content)
+                    answer = map_to_schema(data, self.schema)
+                    if answer is not None:
+                        break
+
+        self.execution_metrics = {"structured_data": answer is not None}
+        if answer is not None:
+            self.logger.info("Answered from the page's structured data")
+            state.update({self.output[0]: answer.model_dump()})
+            return state
+
+        if not self.defer_markdown:
+            documents = [self._convert(doc, state.get("url")) for doc in documents]
+        state.update({self.output[0]: None, self.output[1]: documents})
+        return state
+
+    def _convert(self, document, url: Optional[str]):
+        """Runs the Markdown conversion the FetchNode left pending, if any."""
+        if not isinstance(document, Document):
+            return document
+        if not document.metadata.get("markdown_pending"):
+            return document
+        metadata = {
+            key: value
+            for key, value in document.metadata.items()
+            if key != "markdown_pending"
+        }
+        content = convert_to_md(
+            document.page_content, url, engine=self.markdown_engine
+        )
+        return Document(page_content=content, metadata=metadata)
@@ -26,8 +26,8 @@ Make sure the output is a valid json format without any errors, do not include a
 and things that will invalidate the dictionary. \n
 Do not start the response with ```json because it will invalidate the postprocessing. \n
 OUTPUT INSTRUCTIONS: {format_instructions}\n
-USER QUESTION: {question}\n
 WEBSITE CONTENT:  {content}\n
+USER QUESTION: {question}\n
 """
 
 TEMPLATE_MERGE_MD = """
@@ -41,8 +41,8 @@ Make sure the output is a valid json format without any errors, do not include a
 and things that will invalidate the dictionary. \n
 Do not start the response with ```json because it will invalidate the postprocessing. \n
 OUTPUT INSTRUCTIONS: {format_instructions}\n
-USER QUESTION: {question}\n
 WEBSITE CONTENT: {content}\n
+USER QUESTION: {question}\n
 """
 
 TEMPLATE_CHUNKS = """
@@ -69,8 +69,8 @@ Make sure the output is a valid json format without any errors, do not include a
 and things that will invalidate the dictionary. \n
 Do not start the response with ```json because it will invalidate the postprocessing. \n
 OUTPUT INSTRUCTIONS: {format_instructions}\n
-USER QUESTION: {question}\n
 WEBSITE CONTENT:  {content}\n
+USER QUESTION: {question}\n
 """
 
 TEMPLATE_MERGE = """
@@ -83,8 +83,8 @@ Make sure the output is a valid json format without any errors, do not include a
 and things that will invalidate the dictionary. \n
 Do not start the response with ```json because it will invalidate the postprocessing. \n
 OUTPUT INSTRUCTIONS: {format_instructions}\n
-USER QUESTION: {question}\n
 WEBSITE CONTENT: {content}\n
+USER QUESTION: {question}\n
 """
 
 REGEN_ADDITIONAL_INFO = """
@@ -11,6 +11,6 @@ Make sure the output is a valid json format without any errors, do not include a
 and things that will invalidate the dictionary. \n
 Do not start the response with ```json because it will invalidate the postprocessing. \n
 OUTPUT INSTRUCTIONS: {format_instructions}\n
-USER PROMPT: {user_prompt}\n
-WEBSITE CONTENT: {website_content}
+WEBSITE CONTENT: {website_content}\n
+USER PROMPT: {user_prompt}
 """
@@ -4,6 +4,8 @@ __init__.py file for utils folder
 
 from .cleanup_code import extract_code
 from .cleanup_html import cleanup_html, reduce_html
+from .html_document import HtmlDocument
+from .main_content import extract_main_content, link_density
 from .code_error_analysis import (
     execution_focused_analysis,
     semantic_focused_analysis,
@@ -16,9 +18,30 @@ from .code_error_correction import (
     syntax_focused_code_generation,
     validation_focused_code_generation,
 )
-from .convert_to_md import convert_to_md
+from .convert_to_md import (
+    MarkdownConverter,
+    convert_to_md,
+    get_markdown_converter,
+    register_markdown_converter,
+)
 from .data_export import export_to_csv, export_to_json, export_to_xml
+from .deadline import DeadlineExceeded, deadline_scope, invoke_with_deadline
 from .dict_content_compare import are_content_equal
+from .fetch_cache import CachedPage, FetchCache
+from .fetch_scheduler import FetchScheduler, get_fetch_scheduler
+from .http_client import (
+    AsyncHttpClient,
+    HttpResponse,
+    HttpStatusError,
+    configure_http_client,
+    get_http_client,
+)
+from .content_type import file_type_from_content_type, file_type_from_url
+from .js_detection import detect_js_dependence
+from .robots_cache import RobotsCache, get_robots_agents, get_robots_cache
+from .llm_cache import SQLiteLLMCache, get_llm_cache
+from .llm_clients import clear_llm_clients, get_llm_client
+from .llm_scheduler import AdmissionLimiter, LLMScheduler, get_llm_scheduler
 from .llm_callback_manager import CustomLLMCallbackManager
 from .logging import (
     get_logger,
@@ -52,14 +75,27 @@ from .screenshot_scraping.screenshot_preparation import (
 )
 from .screenshot_scraping.text_detection import detect_text
 from .split_text_into_chunks import split_text_into_chunks
+from .structured_data import extract_structured_data, map_to_schema
 from .sys_dynamic_import import dynamic_import, srcfile_import
-from .tokenizer import num_tokens_calculus
+from .tokenizer import (
+    count_many,
+    get_token_counter,
+    num_tokens_calculus,
+    register_tokenizer,
+    warmup,
+)
+from .tokenizers.encoding_cache import configure_encoding_cache, download_encodings
 
 __all__ = [
     # Code cleanup and analysis
     "extract_code",
     "cleanup_html",
     "reduce_html",
+    "HtmlDocument",
+    "extract_main_content",
+    "link_density",
+    "extract_structured_data",
+    "map_to_schema",
     # Error analysis functions
     "execution_focused_analysis",
     "semantic_focused_analysis",
@@ -72,6 +108,9 @@ __all__ = [
     "validation_focused_code_generation",
     # File and data handling
     "convert_to_md",
+    "MarkdownConverter",
+    "get_markdown_converter",
+    "register_markdown_converter",
     "export_to_csv",
     "export_to_json",
     "export_to_xml",
@@ -80,12 +119,44 @@ __all__ = [
     # Utility functions
     "are_content_equal",
     "CustomLLMCallbackManager",
+    "SQLiteLLMCache",
+    "get_llm_cache",
+    "AdmissionLimiter",
+    "LLMScheduler",
+    "get_llm_scheduler",
+    "get_llm_client",
+    "clear_llm_clients",
+    "DeadlineExceeded",
+    "deadline_scope",
+    "invoke_with_deadline",
     "prettify_exec_info",
     "transform_schema",
     "split_text_into_chunks",
     "dynamic_import",
     "srcfile_import",
     "num_tokens_calculus",
+    "count_many",
+    "get_token_counter",
+    "register_tokenizer",
+    "warmup",
+    "configure_encoding_cache",
+    "download_encodings",
+    # Fetching
+    "AsyncHttpClient",
+    "CachedPage",
+    "FetchCache",
+    "FetchScheduler",
+    "get_fetch_scheduler",
+    "HttpResponse",
+    "HttpStatusError",
+    "configure_http_client",
+    "get_http_client",
+    "detect_js_dependence",
+    "file_type_from_content_type",
+    "file_type_from_url",
+    "RobotsCache",
+    "get_robots_agents",
+    "get_robots_cache",
     # Proxy handling
     "Proxy",
     "parse_or_search_proxy",
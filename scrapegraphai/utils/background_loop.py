@@ -0,0 +1,148 @@
+"""
+Module for running coroutines from synchronous code and on a process-wide
+background event loop
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Awaitable, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the process-wide background event loop, starting it on first use.
+
+    Resources bound to an event loop (browsers, HTTP sessions) can be shared
+    across graph runs only if they outlive the short-lived loops created by
+    ``asyncio.run``; they live on this loop instead.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running background loop.
+    """
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            _thread = threading.Thread(
+                target=_run, name="scrapegraphai-background-loop", daemon=True
+            )
+            _thread.start()
+            ready.wait()
+            _loop = loop
+
+    return _loop
+
+
+def in_background_loop() -> bool:
+    """Returns True when called from the background loop thread."""
+    return _thread is not None and threading.current_thread() is _thread
+
+
+def run_in_background(coro: Awaitable[Any]) -> concurrent.futures.Future:
+    """
+    Schedules a coroutine on the background loop.
+
+    Args:
+        coro: The coroutine to schedule.
+
+    Returns:
+        concurrent.futures.Future: A future resolving to the coroutine result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+
+
+async def arun_in_background(coro: Awaitable[Any]) -> Any:
+    """
+    Awaits a coroutine on the background loop from any other event loop.
+
+    Cancelling the awaiting task cancels the coroutine on the background loop.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        Any: The coroutine result.
+    """
+    if in_background_loop():
+        return await coro
+    return await asyncio.wrap_future(run_in_background(coro))
+
+
+def run_sync_in_background(
+    coro: Awaitable[Any], timeout: Optional[float] = None
+) -> Any:
+    """
+    Runs a coroutine on the background loop and blocks until it completes.
+
+    Args:
+        coro: The coroutine to run.
+        timeout: Maximum number of seconds to wait; None waits indefinitely.
+
+    Returns:
+        Any: The coroutine result.
+
+    Raises:
+        RuntimeError: If called from the background loop itself.
+        TimeoutError: If the coroutine does not finish within ``timeout``.
+    """
+    if in_background_loop():
+        raise RuntimeError("Cannot block on the background loop from within it.")
+
+    future = run_in_background(coro)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"Background task exceeded timeout of {timeout} seconds")
+
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    Runs a coroutine to completion from synchronous code, in the caller's
+    context. When the calling thread already runs an event loop (a notebook,
+    an async server calling a sync API), where ``asyncio.run`` fails, the
+    coroutine gets its own loop in a worker thread.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        Any: The coroutine result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    context = contextvars.copy_context()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(context.run, asyncio.run, coro).result()
+
+
+def _shutdown():
+    global _loop
+
+    with _lock:
+        loop = _loop
+        _loop = None
+
+    if loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(loop.stop)
+
+
+atexit.register(_shutdown)
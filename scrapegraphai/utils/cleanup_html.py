@@ -2,56 +2,35 @@
 Module for minimizing the code
 """
 
-import json
 import re
-from urllib.parse import urljoin
+from typing import Union
 
-from bs4 import BeautifulSoup, Comment
 from minify_html import minify
 
+from .html_document import HtmlDocument, script_data
+
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
 
 def extract_from_script_tags(soup):
-    script_content = []
-
-    for script in soup.find_all("script"):
-        content = script.string
-        if content:
-            try:
-                json_pattern = r"(?:const|let|var)?\s*\w+\s*=\s*({[\s\S]*?});?$"
-                json_matches = re.findall(json_pattern, content)
-
-                for potential_json in json_matches:
-                    try:
-                        parsed = json.loads(potential_json)
-                        if parsed:
-                            script_content.append(
-                                f"JSON data from script: {json.dumps(parsed, indent=2)}"
-                            )
-                    except json.JSONDecodeError:
-                        pass
-
-                if "window." in content or "document." in content:
-                    data_pattern = r"(?:window|document)\.(\w+)\s*=\s*([^;]+);"
-                    data_matches = re.findall(data_pattern, content)
-
-                    for var_name, var_value in data_matches:
-                        script_content.append(
-                            f"Dynamic data - {var_name}: {var_value.strip()}"
-                        )
-            except Exception:
-                if len(content) < 1000:
-                    script_content.append(f"Script content: {content.strip()}")
-
-    return "\n\n".join(script_content)
-
-
-def cleanup_html(html_content: str, base_url: str) -> str:
+    """
+    Extracts JSON objects and global assignments from the script tags of a
+    parsed page, either an HtmlDocument or a BeautifulSoup object.
+    """
+    if isinstance(soup, HtmlDocument):
+        return soup.script_content
+    return script_data(script.string for script in soup.find_all("script"))
+
+
+def cleanup_html(html_content: Union[str, HtmlDocument], base_url: str) -> str:
     """
     Processes HTML content by removing unnecessary tags,
     minifying the HTML, and extracting the title and body content.
 
     Args:
-        html_content (str): The HTML content to be processed.
+        html_content (str): The HTML content to be processed, or the page
+            already parsed as an HtmlDocument.
+        base_url (str): The URL relative links and images are resolved against.
 
     Returns:
         str: A string combining the parsed title and the minified body content.
@@ -66,38 +45,27 @@ def cleanup_html(html_content: str, base_url: str) -> str:
     environments where bandwidth usage needs to be minimized.
     """
 
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    title_tag = soup.find("title")
-    title = title_tag.get_text() if title_tag else ""
-
-    script_content = extract_from_script_tags(soup)
-
-    for tag in soup.find_all("style"):
-        tag.extract()
-
-    link_urls = [
-        urljoin(base_url, link["href"]) for link in soup.find_all("a", href=True)
-    ]
-
-    images = soup.find_all("img")
-    image_urls = []
-    for image in images:
-        if "src" in image.attrs:
-            if "http" not in image["src"]:
-                image_urls.append(urljoin(base_url, image["src"]))
-            else:
-                image_urls.append(image["src"])
-
-    body_content = soup.find("body")
-    if body_content:
-        minimized_body = minify(str(body_content))
-        return title, minimized_body, link_urls, image_urls, script_content
+    if isinstance(html_content, HtmlDocument):
+        document = html_content
+        document.base_url = base_url
+    else:
+        document = HtmlDocument(html_content, base_url)
+
+    body_content = document.body_html()
+    if body_content is not None:
+        minimized_body = minify(body_content)
+        return (
+            document.title,
+            minimized_body,
+            document.links,
+            document.images,
+            document.script_content,
+        )
 
     else:
         raise ValueError(
             f"""No HTML body content found, please try setting the 'headless'
-                         flag to False in the graph configuration. HTML content: {html_content}"""
+                         flag to False in the graph configuration. HTML content: {document.html}"""
         )
 
 
@@ -105,28 +73,23 @@ def minify_html(html):
     """
     minify_html function
     """
-    # Combine multiple regex operations into one for better performance
-    patterns = [
-        (r"<!--.*?-->", "", re.DOTALL),
-        (r">\s+<", "><", 0),
-        (r"\s+>", ">", 0),
-        (r"<\s+", "<", 0),
-        (r"\s+", " ", 0),
-        (r"\s*=\s*", "=", 0),
-    ]
-
-    for pattern, repl, flags in patterns:
-        html = re.sub(pattern, repl, html, flags=flags)
+    if "<!--" in html:
+        html = _COMMENT_RE.sub("", html)
 
-    return html.strip()
+    # Once whitespace runs are collapsed to single spaces, the remaining rules
+    # ('>\s+<', '\s+>', '<\s+' and '\s*=\s*') are plain substring replacements.
+    html = " ".join(html.split())
+    html = html.replace("> <", "><").replace(" >", ">").replace("< ", "<")
+    return html.replace(" =", "=").replace("= ", "=")
 
 
-def reduce_html(html, reduction):
+def reduce_html(html: Union[str, HtmlDocument], reduction: int) -> str:
     """
     Reduces the size of the HTML content based on the specified level of reduction.
 
     Args:
-        html (str): The HTML content to reduce.
+        html (str): The HTML content to reduce, or the page already parsed as
+            an HtmlDocument.
         reduction (int): The level of reduction to apply to the HTML content.
             0: minification only,
             1: minification and removig unnecessary tags and attributes,
@@ -136,39 +99,14 @@ def reduce_html(html, reduction):
     Returns:
         str: The reduced HTML content based on the specified reduction level.
     """
+    document = html if isinstance(html, HtmlDocument) else None
     if reduction == 0:
-        return minify_html(html)
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
-
-    for tag in soup(["style"]):
-        tag.string = ""
-
-    attrs_to_keep = ["class", "id", "href", "src", "type"]
-    for tag in soup.find_all(True):
-        for attr in list(tag.attrs):
-            if attr not in attrs_to_keep:
-                del tag[attr]
-
-    if reduction == 1:
-        return minify_html(str(soup))
-
-    for tag in soup(["style"]):
-        tag.decompose()
-
-    body = soup.body
-    if not body:
-        return "No <body> tag found in the HTML"
-
-    for tag in body.find_all(string=True):
-        if tag.parent.name not in ["script"]:
-            tag.replace_with(re.sub(r"\s+", " ", tag.strip())[:20])
-
-    reduced_html = str(body)
+        return minify_html(document.html if document is not None else html)
 
-    reduced_html = minify_html(reduced_html)
+    if document is None:
+        document = HtmlDocument(html)
+    reduced_html = document.reduced_html(reduction)
+    if reduction >= 2 and document.body is None:
+        return reduced_html
 
-    return reduced_html
+    return minify_html(reduced_html)
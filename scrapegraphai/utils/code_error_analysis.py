@@ -24,6 +24,7 @@ from ..prompts import (
     TEMPLATE_SYNTAX_ANALYSIS,
     TEMPLATE_VALIDATION_ANALYSIS,
 )
+from .deadline import invoke_with_deadline
 
 
 class AnalysisError(Exception):
@@ -143,11 +144,12 @@ def syntax_focused_analysis(state: Dict[str, Any], llm_model) -> str:
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated state
-        return chain.invoke(
+        return invoke_with_deadline(
+            chain,
             {
                 "generated_code": validated_state.generated_code,
                 "errors": validated_state.errors["syntax"],
-            }
+            },
         )
 
     except KeyError as e:
@@ -196,13 +198,14 @@ def execution_focused_analysis(state: Dict[str, Any], llm_model) -> str:
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated state
-        return chain.invoke(
+        return invoke_with_deadline(
+            chain,
             {
                 "generated_code": validated_state.generated_code,
                 "errors": validated_state.errors["execution"],
                 "html_code": validated_state.html_code,
                 "html_analysis": validated_state.html_analysis,
-            }
+            },
         )
 
     except KeyError as e:
@@ -257,13 +260,14 @@ def validation_focused_analysis(state: Dict[str, Any], llm_model) -> str:
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated state
-        return chain.invoke(
+        return invoke_with_deadline(
+            chain,
             {
                 "generated_code": validated_state.generated_code,
                 "errors": validated_state.errors["validation"],
                 "json_schema": validated_state.json_schema,
                 "execution_result": validated_state.execution_result,
-            }
+            },
         )
 
     except KeyError as e:
@@ -321,12 +325,13 @@ def semantic_focused_analysis(
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated inputs
-        return chain.invoke(
+        return invoke_with_deadline(
+            chain,
             {
                 "generated_code": validated_state.generated_code,
                 "differences": json.dumps(comparison_result["differences"], indent=2),
                 "explanation": comparison_result["explanation"],
-            }
+            },
         )
 
     except KeyError as e:
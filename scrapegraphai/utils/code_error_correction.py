@@ -24,6 +24,7 @@ from ..prompts import (
     TEMPLATE_SYNTAX_CODE_GENERATION,
     TEMPLATE_VALIDATION_CODE_GENERATION,
 )
+from .deadline import invoke_with_deadline
 
 
 class CodeGenerationError(Exception):
@@ -124,8 +125,9 @@ def syntax_focused_code_generation(
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated state
-        return chain.invoke(
-            {"analysis": analysis, "generated_code": validated_state.generated_code}
+        return invoke_with_deadline(
+            chain,
+            {"analysis": analysis, "generated_code": validated_state.generated_code},
         )
 
     except KeyError as e:
@@ -177,8 +179,9 @@ def execution_focused_code_generation(
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated state
-        return chain.invoke(
-            {"analysis": analysis, "generated_code": validated_state.generated_code}
+        return invoke_with_deadline(
+            chain,
+            {"analysis": analysis, "generated_code": validated_state.generated_code},
         )
 
     except KeyError as e:
@@ -232,12 +235,13 @@ def validation_focused_code_generation(
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated state
-        return chain.invoke(
+        return invoke_with_deadline(
+            chain,
             {
                 "analysis": analysis,
                 "generated_code": validated_state.generated_code,
                 "json_schema": validated_state.json_schema,
-            }
+            },
         )
 
     except KeyError as e:
@@ -298,7 +302,8 @@ def semantic_focused_code_generation(
         chain = prompt | llm_model | StrOutputParser()
 
         # Execute chain with validated state
-        return chain.invoke(
+        return invoke_with_deadline(
+            chain,
             {
                 "analysis": analysis,
                 "generated_code": validated_state.generated_code,
@@ -308,7 +313,7 @@ def semantic_focused_code_generation(
                 "reference_result": json.dumps(
                     validated_state.reference_answer, indent=2
                 ),
-            }
+            },
         )
 
     except KeyError as e:
@@ -0,0 +1,79 @@
+"""
+Module for recognizing the file types FetchNode can load without a browser
+"""
+
+import os
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+# Media types mapped to the FetchNode input type that loads them.
+FILE_TYPES_BY_MEDIA_TYPE = {
+    "application/pdf": "pdf",
+    "application/x-pdf": "pdf",
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "text/comma-separated-values": "csv",
+    "application/json": "json",
+    "text/json": "json",
+    "application/xml": "xml",
+    "text/xml": "xml",
+}
+
+FILE_TYPES_BY_EXTENSION = {
+    ".pdf": "pdf",
+    ".csv": "csv",
+    ".json": "json",
+    ".xml": "xml",
+}
+
+# XML dialects that browsers render as pages rather than data files.
+_HTML_LIKE_MEDIA_TYPES = ("application/xhtml+xml",)
+
+
+def file_type_from_url(url: str) -> Optional[str]:
+    """
+    Guesses the file type of a URL from the extension of its path.
+
+    Args:
+        url (str): The URL.
+
+    Returns:
+        Optional[str]: 'pdf', 'csv', 'json' or 'xml', or None for anything else.
+    """
+    path = unquote(urlsplit(url).path)
+    return FILE_TYPES_BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+
+
+def file_type_from_content_type(
+    content_type: Optional[str], head: bytes = b""
+) -> Optional[str]:
+    """
+    Maps a Content-Type header, and optionally the first bytes of the body, to
+    a file type.
+
+    Structured syntax suffixes are honored (``application/ld+json`` is JSON,
+    ``application/rss+xml`` is XML), and PDFs served as
+    ``application/octet-stream`` are recognized by their magic number.
+
+    Args:
+        content_type (str): The Content-Type header, parameters allowed.
+        head (bytes): The first bytes of the body, if already known.
+
+    Returns:
+        Optional[str]: 'pdf', 'csv', 'json' or 'xml', or None for anything else.
+    """
+    if head.lstrip()[:5] == b"%PDF-":
+        return "pdf"
+    if not isinstance(content_type, str):
+        return None
+
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in FILE_TYPES_BY_MEDIA_TYPE:
+        return FILE_TYPES_BY_MEDIA_TYPE[media_type]
+    if media_type in _HTML_LIKE_MEDIA_TYPES:
+        return None
+    if media_type.endswith("+json"):
+        return "json"
+    if media_type.endswith("+xml"):
+        return "xml"
+    return None
@@ -2,16 +2,333 @@
 convert_to_md module
 """
 
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import urljoin
+
 import html2text
 
+from .html_document import HtmlDocument
+
+DEFAULT_MARKDOWN_ENGINE = "html2text"
+
+
+class MarkdownConverter(ABC):
+    """
+    Base class of the HTML-to-Markdown engines used by ``convert_to_md``.
+
+    Converters hold their options only and are cheap to create; the registry
+    builds one per ``get_markdown_converter`` call.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def convert(
+        self, html: Union[str, HtmlDocument], url: Optional[str] = None
+    ) -> str:
+        """
+        Converts a page to Markdown.
+
+        Args:
+            html: The HTML content, or the page already parsed as an HtmlDocument.
+            url: The page URL relative links and images are resolved against.
+
+        Returns:
+            str: The Markdown content.
+        """
+
+
+class Html2TextConverter(MarkdownConverter):
+    """
+    Converter backed by the html2text library.
+
+    html2text parsers keep their output in instance state, so a fresh one is
+    configured for every page.
+    """
+
+    name = "html2text"
+
+    def __init__(self, ignore_links: bool = False, body_width: int = 0):
+        self.ignore_links = ignore_links
+        self.body_width = body_width
+
+    def convert(
+        self, html: Union[str, HtmlDocument], url: Optional[str] = None
+    ) -> str:
+        if isinstance(html, HtmlDocument):
+            html = html.html
+
+        h = html2text.HTML2Text()
+        h.ignore_links = self.ignore_links
+        h.body_width = self.body_width
+
+        if url is not None:
+            h.baseurl = url
+
+        return h.handle(html)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_SPACES_RE = re.compile(r" {2,}")
+
+_SKIPPED_TAGS = frozenset(
+    "head script style noscript template svg iframe select".split()
+)
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_BLOCK_TAGS = frozenset(
+    "p div section article main header footer nav aside figure figcaption form "
+    "fieldset address details summary dl dt dd center body html".split()
+)
+_UNLINKABLE_PREFIXES = ("javascript:", "#", "data:")
+
+
+class _MarkdownRenderer:
+    """Renders an lxml subtree as Markdown blocks."""
+
+    def __init__(self, base_url: Optional[str]):
+        self.base_url = base_url
+        self.blocks: List[str] = []
+        self.inline: List[str] = []
+
+    def _url(self, url: str) -> str:
+        return urljoin(self.base_url, url) if self.base_url else url
+
+    def text(self, text: Optional[str]):
+        if text:
+            self.inline.append(_WHITESPACE_RE.sub(" ", text))
+
+    def flush(self):
+        if not self.inline:
+            return
+        lines = _SPACES_RE.sub(" ", "".join(self.inline)).split("\n")
+        self.inline = []
+        paragraph = "\n".join(line.strip() for line in lines).strip()
+        if paragraph:
+            self.blocks.append(paragraph)
+
+    def children(self, element):
+        self.text(element.text)
+        for child in element:
+            self.node(child)
+            self.text(child.tail)
+
+    def inline_of(self, element) -> str:
+        renderer = _MarkdownRenderer(self.base_url)
+        renderer.children(element)
+        renderer.flush()
+        return " ".join(renderer.blocks)
 
-def convert_to_md(html: str, url: str = None) -> str:
+    def node(self, element):
+        tag = element.tag
+        if not isinstance(tag, str) or tag in _SKIPPED_TAGS:
+            return
+
+        if tag in _BLOCK_TAGS:
+            self.flush()
+            self.children(element)
+            self.flush()
+        elif tag in _HEADINGS:
+            self.flush()
+            content = self.inline_of(element)
+            if content:
+                self.blocks.append(f"{'#' * _HEADINGS[tag]} {content}")
+        elif tag == "a":
+            label = self.inline_of(element)
+            href = (element.get("href") or "").strip()
+            if href and not href.startswith(_UNLINKABLE_PREFIXES):
+                self.inline.append(f"[{label}]({self._url(href)})")
+            else:
+                self.inline.append(label)
+        elif tag == "img":
+            src = (element.get("src") or "").strip()
+            if src and not src.startswith("data:"):
+                alt = _WHITESPACE_RE.sub(" ", element.get("alt") or "").strip()
+                self.inline.append(f"![{alt}]({self._url(src)})")
+        elif tag in ("strong", "b"):
+            content = self.inline_of(element)
+            if content:
+                self.inline.append(f"**{content}**")
+        elif tag in ("em", "i"):
+            content = self.inline_of(element)
+            if content:
+                self.inline.append(f"_{content}_")
+        elif tag == "code":
+            content = element.text_content()
+            if content.strip():
+                self.inline.append(f"`{content}`")
+        elif tag == "br":
+            self.inline.append("\n")
+        elif tag == "hr":
+            self.flush()
+            self.blocks.append("* * *")
+        elif tag in ("ul", "ol"):
+            self.flush()
+            self.list(element, ordered=tag == "ol")
+        elif tag == "pre":
+            self.flush()
+            code = element.text_content().strip("\n")
+            if code.strip():
+                self.blocks.append(f"```\n{code}\n```")
+        elif tag == "blockquote":
+            self.flush()
+            renderer = _MarkdownRenderer(self.base_url)
+            renderer.children(element)
+            renderer.flush()
+            if renderer.blocks:
+                quoted = "\n\n".join(renderer.blocks).split("\n")
+                self.blocks.append(
+                    "\n".join(f"> {line}".rstrip() for line in quoted)
+                )
+        elif tag == "table":
+            self.flush()
+            self.table(element)
+        else:
+            self.children(element)
+
+    def list(self, element, ordered: bool):
+        items = []
+        for index, item in enumerate(
+            (child for child in element if child.tag == "li"), start=1
+        ):
+            renderer = _MarkdownRenderer(self.base_url)
+            renderer.children(item)
+            renderer.flush()
+            lines = "\n".join(renderer.blocks).split("\n")
+            marker = f"{index}. " if ordered else "* "
+            indent = " " * len(marker)
+            items.append(
+                "\n".join(
+                    [marker + lines[0]] + [indent + line for line in lines[1:]]
+                )
+            )
+        if items:
+            self.blocks.append("\n".join(items))
+
+    def table(self, element):
+        rows = []
+        for row in element.iter("tr"):
+            cells = [
+                self.inline_of(cell).replace("|", "\\|")
+                for cell in row
+                if cell.tag in ("td", "th")
+            ]
+            if cells:
+                rows.append(cells)
+        if not rows:
+            return
+
+        width = max(len(row) for row in rows)
+        lines = []
+        for index, row in enumerate(rows):
+            row = row + [""] * (width - len(row))
+            lines.append("| " + " | ".join(row) + " |")
+            if index == 0:
+                lines.append("|" + " --- |" * width)
+        self.blocks.append("\n".join(lines))
+
+
+class DomConverter(MarkdownConverter):
+    """
+    Converter walking the lxml tree of an HtmlDocument.
+
+    It renders headings, paragraphs, emphasis, links, images, lists, code,
+    quotes and tables, and reuses the parse when given an HtmlDocument. Pages
+    nested too deeply to walk fall back to html2text.
+    """
+
+    name = "dom"
+
+    def convert(
+        self, html: Union[str, HtmlDocument], url: Optional[str] = None
+    ) -> str:
+        document = html if isinstance(html, HtmlDocument) else HtmlDocument(html)
+        if document.root is None:
+            return ""
+
+        start = document.body if document.body is not None else document.root
+        renderer = _MarkdownRenderer(url or document.base_url)
+        try:
+            renderer.node(start)
+        except RecursionError:
+            return Html2TextConverter().convert(document, url)
+        renderer.flush()
+        return "\n\n".join(renderer.blocks) + "\n"
+
+
+_engines: Dict[str, Callable[[], MarkdownConverter]] = {
+    Html2TextConverter.name: Html2TextConverter,
+    DomConverter.name: DomConverter,
+}
+_engines_lock = threading.Lock()
+
+
+def register_markdown_converter(
+    name: str, factory: Callable[[], MarkdownConverter]
+):
+    """
+    Registers a Markdown engine under ``name``, replacing any engine of that name.
+
+    The factory is called once here, so an engine that cannot be built (e.g. a
+    converter not implementing ``convert``) is rejected at registration.
+
+    Args:
+        name (str): The engine name used by ``convert_to_md`` and the
+            ``markdown_engine`` graph option.
+        factory: A callable returning a converter.
+
+    Raises:
+        TypeError: If the factory does not build a MarkdownConverter.
+    """
+    converter = factory()
+    if not isinstance(converter, MarkdownConverter):
+        raise TypeError(
+            f"Markdown engine {name} must build a MarkdownConverter, "
+            f"got {type(converter).__name__}."
+        )
+    with _engines_lock:
+        _engines[name] = factory
+
+
+def get_markdown_converter(name: str = DEFAULT_MARKDOWN_ENGINE) -> MarkdownConverter:
+    """
+    Returns a converter of an engine.
+
+    Args:
+        name (str): The engine name, e.g. 'html2text' or 'dom'.
+
+    Returns:
+        MarkdownConverter: The converter.
+
+    Raises:
+        ValueError: If no engine is registered under ``name``.
+    """
+    with _engines_lock:
+        factory = _engines.get(name)
+        if factory is None:
+            raise ValueError(
+                f"Unknown markdown engine: {name}. "
+                f"Available engines: {', '.join(sorted(_engines))}."
+            )
+    return factory()
+
+
+def convert_to_md(
+    html: Union[str, HtmlDocument],
+    url: str = None,
+    engine: str = DEFAULT_MARKDOWN_ENGINE,
+) -> str:
     """Convert HTML to Markdown.
-    This function uses the html2text library to convert the provided HTML content to Markdown
-    format.
+    This function converts the provided HTML content to Markdown format with
+    the selected engine: 'html2text' (the html2text library) or 'dom' (a faster
+    converter walking the lxml tree shared with the other HTML helpers).
     The function returns the converted Markdown content as a string.
 
-    Args: html (str): The HTML content to be converted.
+    Args: html (str): The HTML content to be converted, or an HtmlDocument.
+    url (str): The page URL relative links and images are resolved against.
+    engine (str): The name of a registered Markdown engine.
 
     Returns: str: The equivalent Markdown content.
 
@@ -19,14 +336,7 @@ def convert_to_md(html: str, url: str = None) -> str:
     <h1>This is a heading.</h1></body></html>")
     'This is a paragraph.\n\n# This is a heading.'
 
-    Note: All the styles and links are ignored during the conversion.
+    Note: All the styles are ignored during the conversion.
     """
 
-    h = html2text.HTML2Text()
-    h.ignore_links = False
-    h.body_width = 0
-
-    if url is not None:
-        h.baseurl = url
-
-    return h.handle(html)
+    return get_markdown_converter(engine).convert(html, url)
@@ -69,6 +69,8 @@ class CustomCallbackHandler(BaseCallbackHandler):
     total_tokens: int = 0
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    # Prompt tokens the provider read from its prompt cache.
+    cached_tokens: int = 0
     successful_requests: int = 0
     total_cost: float = 0.0
 
@@ -83,6 +85,7 @@ class CustomCallbackHandler(BaseCallbackHandler):
             f"Tokens Used: {self.total_tokens}\n"
             f"\tPrompt Tokens: {self.prompt_tokens}\n"
             f"\tCompletion Tokens: {self.completion_tokens}\n"
+            f"\tCached Prompt Tokens: {self.cached_tokens}\n"
             f"Successful Requests: {self.successful_requests}\n"
             f"Total Cost (USD): ${self.total_cost}"
         )
@@ -124,6 +127,8 @@ class CustomCallbackHandler(BaseCallbackHandler):
             token_usage = {"total_tokens": usage_metadata["total_tokens"]}
             completion_tokens = usage_metadata["output_tokens"]
             prompt_tokens = usage_metadata["input_tokens"]
+            input_details = usage_metadata.get("input_token_details") or {}
+            cached_tokens = input_details.get("cache_read", 0) or 0
 
         else:
             if response.llm_output is None:
@@ -138,6 +143,12 @@ class CustomCallbackHandler(BaseCallbackHandler):
             token_usage = response.llm_output["token_usage"]
             completion_tokens = token_usage.get("completion_tokens", 0)
             prompt_tokens = token_usage.get("prompt_tokens", 0)
+            prompt_details = token_usage.get("prompt_tokens_details") or {}
+            cached_tokens = (
+                prompt_details.get("cached_tokens")
+                or token_usage.get("cache_read_input_tokens")
+                or 0
+            )
         if (
             self.model_name in MODEL_COST_PER_1K_TOKENS_INPUT
             or self.model_name in MODEL_COST_TIERS_PER_1K_TOKENS
@@ -165,6 +176,7 @@ class CustomCallbackHandler(BaseCallbackHandler):
             self.total_tokens += token_usage.get("total_tokens", 0)
             self.prompt_tokens += prompt_tokens
             self.completion_tokens += completion_tokens
+            self.cached_tokens += cached_tokens
             self.successful_requests += 1
 
     def __copy__(self) -> "CustomCallbackHandler":
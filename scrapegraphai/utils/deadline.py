@@ -0,0 +1,171 @@
+"""
+Module for propagating the time budget of a graph run down to its LLM calls
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Optional
+
+# Monotonic time at which the current run must be over; None when unbounded.
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "scrapegraphai_deadline", default=None
+)
+
+
+# Timed calls run on a bounded pool: an abandoned call keeps its worker (and
+# delays interpreter exit) until the client-level timeout ends it, so the pool
+# caps how many can pile up.
+MAX_TIMED_CALLS = 32
+_POOL_PREFIX = "scrapegraphai-llm-call"
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call or a graph run outlives its time budget."""
+
+
+def _call_pool() -> ThreadPoolExecutor:
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=MAX_TIMED_CALLS, thread_name_prefix=_POOL_PREFIX
+            )
+    return _pool
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline, or None when there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def effective_timeout(timeout: Optional[float] = None) -> Optional[float]:
+    """The smaller of ``timeout`` and the time left before the current deadline."""
+    remaining = remaining_time()
+    if timeout is None:
+        return remaining
+    if remaining is None:
+        return timeout
+    return min(timeout, remaining)
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """
+    Bounds the code run in the block, and every call it makes, to ``seconds``.
+    A scope never extends the deadline of an enclosing one; None keeps it.
+
+    Args:
+        seconds (float): The time budget.
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def check_deadline(what: str = "The graph run"):
+    """
+    Fails fast once the current deadline has passed.
+
+    Args:
+        what (str): The operation named in the error.
+
+    Raises:
+        DeadlineExceeded: If the current deadline has passed.
+    """
+    if remaining_time() == 0:
+        raise DeadlineExceeded(f"{what} exceeded its time budget")
+
+
+def invoke_with_deadline(chain, inputs: Any, timeout: Optional[float] = None) -> Any:
+    """
+    Invokes a chain, giving up once ``timeout`` or the current deadline,
+    whichever comes first, has passed.
+
+    The call runs on a shared, bounded pool of workers and carries the
+    deadline, so the map executor stops starting and retrying its chunks.
+    A call that times out is abandoned, not stopped: it keeps running, and
+    spending tokens, until the client-level timeout ends the request (the
+    graphs give their LLM clients the graph "timeout"). A call still queued
+    for a worker is dropped.
+
+    Args:
+        chain: The runnable to invoke.
+        inputs: Its input.
+        timeout (float): Seconds allowed for the call; None for the deadline only.
+
+    Returns:
+        The output of the chain.
+
+    Raises:
+        DeadlineExceeded: If the call did not finish in time.
+    """
+    limit = effective_timeout(timeout)
+    if limit is None:
+        return chain.invoke(inputs)
+    check_deadline("The LLM call")
+
+    def run():
+        with deadline_scope(limit):
+            return chain.invoke(inputs)
+
+    if threading.current_thread().name.startswith(_POOL_PREFIX):
+        # Nested in a timed call, which already waits at most its own limit.
+        return run()
+
+    future = _call_pool().submit(contextvars.copy_context().run, run)
+    try:
+        return future.result(timeout=limit)
+    except FutureTimeoutError:
+        future.cancel()
+        raise DeadlineExceeded(f"Response took longer than {limit:g} seconds") from None
+
+
+async def ainvoke_with_deadline(
+    chain, inputs: Any, timeout: Optional[float] = None
+) -> Any:
+    """
+    Awaits a chain, cancelling it once ``timeout`` or the current deadline,
+    whichever comes first, has passed.
+
+    Args:
+        chain: The runnable to invoke.
+        inputs: Its input.
+        timeout (float): Seconds allowed for the call; None for the deadline only.
+
+    Returns:
+        The output of the chain.
+
+    Raises:
+        DeadlineExceeded: If the call did not finish in time.
+    """
+    limit = effective_timeout(timeout)
+    if limit is None:
+        return await chain.ainvoke(inputs)
+    check_deadline("The LLM call")
+
+    with deadline_scope(limit):
+        try:
+            return await asyncio.wait_for(chain.ainvoke(inputs), limit)
+        except TimeoutError:
+            raise DeadlineExceeded(
+                f"Response took longer than {limit:g} seconds"
+            ) from None
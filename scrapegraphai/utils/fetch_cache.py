@@ -0,0 +1,308 @@
+"""
+Module for the on-disk, content-addressed cache of fetched pages
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from langchain_core.documents import Document
+
+from .logging import get_logger
+
+logger = get_logger("fetch-cache")
+
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_SIZE_MB = 512
+# Share of the size bound an eviction frees down to, so it runs seldom.
+EVICT_TO = 0.9
+
+# Response headers worth keeping for HTTP revalidation and content routing.
+CACHED_HEADERS = ("content-type", "etag", "last-modified")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalizes a URL so that equivalent spellings share a cache entry.
+
+    The scheme and host are lowercased, default ports and fragments are
+    dropped, an empty path becomes '/', and query parameters are sorted.
+
+    Args:
+        url (str): The URL to normalize.
+
+    Returns:
+        str: The canonical URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        credentials = parts.username
+        if parts.password:
+            credentials += f":{parts.password}"
+        host = f"{credentials}@{host}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+@dataclass
+class CachedPage:
+    """
+    A page read back from the fetch cache.
+
+    Attributes:
+        url: The canonical URL of the page.
+        content: The raw page content, as returned by the fetcher.
+        headers: The cached response headers (lowercase names).
+        metadata: The Document metadata recorded when the page was fetched.
+        fetched_at: Unix timestamp of the fetch or last successful revalidation.
+    """
+
+    url: str
+    content: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    metadata: dict = field(default_factory=dict)
+    fetched_at: float = 0.0
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that let the server answer 304."""
+        validators = {}
+        if self.headers.get("etag"):
+            validators["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            validators["If-Modified-Since"] = self.headers["last-modified"]
+        return validators
+
+    def to_document(self, source: str, **metadata) -> Document:
+        """Rebuilds the Document served by the cache."""
+        return Document(
+            page_content=self.content,
+            metadata={**self.metadata, "source": source, **metadata},
+        )
+
+
+class FetchCache:
+    """
+    A content-addressed cache of fetched pages stored under ``cache_path``.
+
+    Entries are keyed by the canonical URL plus the loader options that shaped
+    the fetch, and stored as a gzip-compressed body with a JSON sidecar holding
+    headers and metadata. Reads refresh an entry's modification time, which the
+    size-bounded eviction uses as its LRU clock. The total size is counted once
+    and then kept up to date on writes; the cache is only walked again when it
+    grows past its bound.
+
+    Attributes:
+        cache_path: The configured cache root.
+        cache_dir: Directory holding the entries.
+        ttl: Seconds after which an entry is stale and must be refetched or revalidated.
+        max_size_bytes: Upper bound for the total size of the cache on disk.
+    """
+
+    def __init__(
+        self,
+        cache_path: str,
+        ttl: float = DEFAULT_TTL,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+    ):
+        self.cache_path = cache_path
+        self.cache_dir = os.path.join(cache_path, "fetch")
+        self.ttl = ttl
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._total_size: Optional[int] = None
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, options: Optional[dict] = None) -> str:
+        """Returns the cache key of a URL fetched with the given loader options."""
+        payload = json.dumps(
+            {"url": canonicalize_url(url), "options": options or {}},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.html.gz", f"{base}.json"
+
+    def is_fresh(self, entry: CachedPage) -> bool:
+        """Whether an entry is younger than the cache TTL."""
+        return time.time() - entry.fetched_at < self.ttl
+
+    def get(self, url: str, options: Optional[dict] = None) -> Optional[CachedPage]:
+        """
+        Reads an entry, fresh or stale.
+
+        Args:
+            url (str): The fetched URL.
+            options (dict): The loader options used for the fetch.
+
+        Returns:
+            Optional[CachedPage]: The entry, or None on a miss.
+        """
+        body_path, meta_path = self._paths(self.make_key(url, options))
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with gzip.open(body_path, "rt", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+        return CachedPage(
+            url=meta.get("url", url),
+            content=content,
+            headers=meta.get("headers", {}),
+            metadata=meta.get("metadata", {}),
+            fetched_at=meta.get("fetched_at", 0.0),
+        )
+
+    def put(
+        self,
+        url: str,
+        options: Optional[dict],
+        content: str,
+        headers: Optional[Dict[str, str]] = None,
+        metadata: Optional[dict] = None,
+    ):
+        """
+        Stores a fetched page, replacing any previous entry atomically.
+
+        Args:
+            url (str): The fetched URL.
+            options (dict): The loader options used for the fetch.
+            content (str): The raw page content.
+            headers (dict): Response headers; only the revalidation ones are kept.
+            metadata (dict): The Document metadata to restore on a hit.
+        """
+        body_path, meta_path = self._paths(self.make_key(url, options))
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+
+        kept_headers = {
+            key.lower(): value
+            for key, value in (headers or {}).items()
+            if key.lower() in CACHED_HEADERS
+        }
+        meta = {
+            "url": canonicalize_url(url),
+            "headers": kept_headers,
+            "metadata": {
+                key: value
+                for key, value in (metadata or {}).items()
+                if key != "source"
+            },
+            "fetched_at": time.time(),
+        }
+
+        body = gzip.compress(content.encode("utf-8"))
+        meta_data = json.dumps(meta, default=str).encode("utf-8")
+
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = self._stored_size()
+            replaced = self._entry_size(body_path, meta_path)
+            self._atomic_write(body_path, body)
+            self._atomic_write(meta_path, meta_data)
+            self._total_size += len(body) + len(meta_data) - replaced
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+
+    def _atomic_write(self, path: str, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _entry_size(body_path: str, meta_path: str) -> int:
+        size = 0
+        for path in (body_path, meta_path):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _stored_size(self) -> int:
+        return sum(size for _, size, _, _ in self._entries())
+
+    def _entries(self) -> List[Tuple[float, int, str, str]]:
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(root, name)
+                body_path = meta_path[: -len(".json")] + ".html.gz"
+                try:
+                    size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+                    last_used = os.path.getmtime(meta_path)
+                except OSError:
+                    continue
+                entries.append((last_used, size, body_path, meta_path))
+        return entries
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits its size bound."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        """
+        Recounts the cache from disk, then drops the least recently used entries
+        down below the size bound.
+        """
+        entries = self._entries()
+        self._total_size = sum(size for _, size, _, _ in entries)
+        if self._total_size <= self.max_size_bytes:
+            return
+
+        target = self.max_size_bytes * EVICT_TO
+        for _, size, body_path, meta_path in sorted(entries):
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_size -= size
+            logger.debug(f"Evicted {body_path} from the fetch cache")
+            if self._total_size <= target:
+                break
+
+    def clear(self):
+        """Removes every entry of the cache."""
+        with self._lock:
+            for _, _, body_path, meta_path in self._entries():
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._total_size = 0
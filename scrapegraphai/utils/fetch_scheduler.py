@@ -0,0 +1,395 @@
+"""
+Module for the process-wide, per-host politeness scheduler shared by the fetchers
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Deque, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+from .logging import get_logger
+
+logger = get_logger("fetch-scheduler")
+
+# Statuses meaning the host wants us to slow down.
+THROTTLE_STATUSES = (429, 503)
+
+
+def host_of(url: str) -> str:
+    """Returns the lowercased host (with port) a URL is scheduled under."""
+    return (urlparse(url).netloc or url).lower()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header given either as seconds or as an HTTP date.
+
+    Args:
+        value (str): The header value.
+
+    Returns:
+        Optional[float]: The delay in seconds, or None when the value is unusable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class _HostState:
+    max_concurrency: Optional[int]
+    rate: Optional[float]
+    burst: float
+    tokens: float
+    updated: float
+    active: int = 0
+    crawl_delay: float = 0.0
+    last_start: Optional[float] = None
+    not_before: float = 0.0
+    failures: int = 0
+    # Wake-up callbacks of the fetches waiting for the host, in arrival order.
+    waiters: Deque[Callable[[], None]] = field(default_factory=deque)
+
+
+class FetchScheduler:
+    """
+    Throttles fetches per host, across threads and event loops.
+
+    Every host gets an optional concurrency cap and an optional token bucket. A
+    crawl delay (e.g. from robots.txt) spaces consecutive request starts. A 429/503
+    response pauses the host for its Retry-After, or for an exponential backoff.
+    Fetches waiting for the same host are served in arrival order.
+
+    Attributes:
+        max_concurrency_per_host: Requests allowed in flight per host; None means
+            no cap.
+        rate_per_host: Sustained requests per second per host; None disables the bucket.
+        burst: Bucket capacity, i.e. requests allowed back to back.
+        backoff_base: First backoff delay in seconds without a Retry-After.
+        max_backoff: Upper bound for any backoff, Retry-After included.
+        max_retries: Times a fetcher retries a throttled request after the backoff.
+    """
+
+    def __init__(
+        self,
+        max_concurrency_per_host: Optional[int] = None,
+        rate_per_host: Optional[float] = None,
+        burst: float = 1,
+        backoff_base: float = 1.0,
+        max_backoff: float = 300.0,
+        max_retries: int = 2,
+    ):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+        self._overrides: Dict[str, dict] = {}
+        self.configure(
+            max_concurrency_per_host=max_concurrency_per_host,
+            rate_per_host=rate_per_host,
+            burst=burst,
+            backoff_base=backoff_base,
+            max_backoff=max_backoff,
+            max_retries=max_retries,
+        )
+
+    def configure(
+        self,
+        max_concurrency_per_host: Optional[int] = None,
+        rate_per_host: Optional[float] = None,
+        burst: Optional[float] = None,
+        backoff_base: Optional[float] = None,
+        max_backoff: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        hosts: Optional[Mapping[str, dict]] = None,
+    ):
+        """
+        Updates the default limits and per-host overrides.
+
+        Args:
+            max_concurrency_per_host: Requests allowed in flight per host.
+            rate_per_host: Sustained requests per second per host.
+            burst: Bucket capacity.
+            backoff_base: First backoff delay in seconds.
+            max_backoff: Upper bound for any backoff.
+            max_retries: Times a fetcher retries a throttled request.
+            hosts: Per-host overrides, e.g. ``{"example.com": {"rate": 0.5}}``
+                with keys ``max_concurrency``, ``rate`` and ``burst``.
+
+        Raises:
+            ValueError: If a concurrency cap is below 1 or a rate is not positive.
+        """
+        with self._lock:
+            if max_concurrency_per_host is not None:
+                if max_concurrency_per_host < 1:
+                    raise ValueError("max_concurrency_per_host must be greater than 0.")
+                self.max_concurrency_per_host = max_concurrency_per_host
+            elif not hasattr(self, "max_concurrency_per_host"):
+                self.max_concurrency_per_host = None
+            if rate_per_host is not None:
+                if rate_per_host <= 0:
+                    raise ValueError("rate_per_host must be greater than 0.")
+                self.rate_per_host = rate_per_host
+            elif not hasattr(self, "rate_per_host"):
+                self.rate_per_host = None
+            if burst is not None:
+                self.burst = max(1.0, float(burst))
+            if backoff_base is not None:
+                self.backoff_base = backoff_base
+            if max_backoff is not None:
+                self.max_backoff = max_backoff
+            if max_retries is not None:
+                self.max_retries = max(0, max_retries)
+            for host, override in (hosts or {}).items():
+                self._overrides[host.lower()] = dict(override)
+
+            # Existing hosts pick up the new limits; their runtime state is kept.
+            for host, state in self._hosts.items():
+                self._apply_limits(host, state)
+                self._wake_next(state)
+
+    def _apply_limits(self, host: str, state: _HostState):
+        override = self._overrides.get(host, {})
+        state.max_concurrency = override.get(
+            "max_concurrency", self.max_concurrency_per_host
+        )
+        state.rate = override.get("rate", self.rate_per_host)
+        state.burst = max(1.0, float(override.get("burst", self.burst)))
+        state.tokens = min(state.tokens, state.burst)
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(
+                max_concurrency=self.max_concurrency_per_host,
+                rate=self.rate_per_host,
+                burst=self.burst,
+                tokens=self.burst,
+                updated=time.monotonic(),
+            )
+            self._apply_limits(host, state)
+            state.tokens = state.burst
+            self._hosts[host] = state
+        return state
+
+    def set_crawl_delay(self, url_or_host: str, delay: Optional[float]):
+        """
+        Spaces request starts to the host by at least ``delay`` seconds.
+
+        Args:
+            url_or_host: A URL or a bare host.
+            delay: The crawl delay in seconds; None or 0 removes it.
+        """
+        host = host_of(url_or_host) if "//" in url_or_host else url_or_host.lower()
+        with self._lock:
+            state = self._state(host)
+            state.crawl_delay = max(0.0, float(delay or 0))
+            self._wake_next(state)
+
+    def remaining_pause(self, url: str) -> float:
+        """Returns the seconds left before the URL's host may be fetched again."""
+        with self._lock:
+            state = self._hosts.get(host_of(url))
+            if state is None:
+                return 0.0
+            return max(0.0, state.not_before - time.monotonic())
+
+    @staticmethod
+    def _wake_next(state: _HostState):
+        if state.waiters:
+            state.waiters[0]()
+
+    def _enqueue(self, host: str, wake: Callable[[], None]):
+        with self._lock:
+            self._state(host).waiters.append(wake)
+
+    def _leave(self, host: str, wake: Callable[[], None]):
+        """Drops a waiter that gave up, letting the next one in line try."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or wake not in state.waiters:
+                return
+            was_next = state.waiters[0] is wake
+            state.waiters.remove(wake)
+            if was_next:
+                self._wake_next(state)
+
+    def _try_acquire(self, host: str, wake: Callable[[], None]) -> Optional[float]:
+        """
+        Takes a slot for the waiter, or returns how long it must wait before
+        trying again: a delay in seconds, or None until it is woken up.
+        """
+        with self._lock:
+            state = self._state(host)
+            if state.waiters[0] is not wake:
+                return None
+            now = time.monotonic()
+
+            if now < state.not_before:
+                return state.not_before - now
+            if state.crawl_delay and state.last_start is not None:
+                ready_at = state.last_start + state.crawl_delay
+                if now < ready_at:
+                    return ready_at - now
+            if (
+                state.max_concurrency is not None
+                and state.active >= state.max_concurrency
+            ):
+                return None
+            if state.rate:
+                state.tokens = min(
+                    state.burst, state.tokens + (now - state.updated) * state.rate
+                )
+                state.updated = now
+                if state.tokens < 1:
+                    return (1 - state.tokens) / state.rate
+                state.tokens -= 1
+
+            state.waiters.popleft()
+            state.active += 1
+            state.last_start = now
+            self._wake_next(state)
+            return 0.0
+
+    def _release(self, host: str):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is not None and state.active > 0:
+                state.active -= 1
+                self._wake_next(state)
+
+    def acquire(self, url: str) -> str:
+        """Blocks until a fetch of ``url`` may start; returns the host to release."""
+        host = host_of(url)
+        ready = threading.Event()
+        wake = ready.set
+        self._enqueue(host, wake)
+        try:
+            while True:
+                ready.clear()
+                wait = self._try_acquire(host, wake)
+                if wait == 0.0:
+                    return host
+                ready.wait(wait)
+        finally:
+            self._leave(host, wake)
+
+    async def aacquire(self, url: str) -> str:
+        """Asynchronous counterpart of ``acquire``."""
+        host = host_of(url)
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+
+        def wake():
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                # The waiter's loop is closed; _leave drops it from the queue.
+                pass
+
+        self._enqueue(host, wake)
+        try:
+            while True:
+                ready.clear()
+                wait = self._try_acquire(host, wake)
+                if wait == 0.0:
+                    return host
+                try:
+                    await asyncio.wait_for(ready.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._leave(host, wake)
+
+    def release(self, host: str):
+        """Frees a slot taken by ``acquire``/``aacquire``."""
+        self._release(host)
+
+    @contextlib.contextmanager
+    def slot(self, url: str):
+        """Context manager holding a fetch slot for the URL's host."""
+        host = self.acquire(url)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    @contextlib.asynccontextmanager
+    async def aslot(self, url: str):
+        """Asynchronous counterpart of ``slot``."""
+        host = await self.aacquire(url)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    def report(
+        self,
+        url: str,
+        status: Optional[int],
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        Feeds a response back into the scheduler.
+
+        Throttling statuses pause the host for the Retry-After delay, or for an
+        exponential backoff when the server does not give one; any other
+        successful response resets the backoff.
+
+        Args:
+            url: The fetched URL.
+            status: The HTTP status code; anything else than an int is ignored.
+            headers: The response headers.
+        """
+        if not isinstance(status, int):
+            return
+
+        host = host_of(url)
+        with self._lock:
+            state = self._state(host)
+            if status in THROTTLE_STATUSES:
+                retry_after = None
+                for key, value in (headers or {}).items():
+                    if key.lower() == "retry-after":
+                        retry_after = parse_retry_after(value)
+                        break
+                if retry_after is None:
+                    retry_after = self.backoff_base * 2**state.failures
+                delay = min(retry_after, self.max_backoff)
+                state.failures += 1
+                state.not_before = max(state.not_before, time.monotonic() + delay)
+                logger.warning(
+                    f"{host} answered {status}; pausing it for {delay:.1f} seconds"
+                )
+            elif status < 400:
+                state.failures = 0
+
+
+_scheduler: Optional[FetchScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_fetch_scheduler() -> FetchScheduler:
+    """
+    Returns the process-wide fetch scheduler, creating it on first use.
+
+    Returns:
+        FetchScheduler: The shared scheduler.
+    """
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FetchScheduler()
+    return _scheduler
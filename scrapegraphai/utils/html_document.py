@@ -0,0 +1,206 @@
+"""
+Module for the parsed HTML document shared by the HTML processing helpers
+"""
+
+import copy
+import json
+import re
+from typing import Iterable, List, Optional
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+_PARSER = lxml.html.HTMLParser(encoding="utf-8", remove_blank_text=False)
+
+_JSON_ASSIGNMENT_RE = re.compile(r"(?:const|let|var)?\s*\w+\s*=\s*({[\s\S]*?});?$")
+_GLOBAL_ASSIGNMENT_RE = re.compile(r"(?:window|document)\.(\w+)\s*=\s*([^;]+);")
+
+ATTRIBUTES_TO_KEEP = ("class", "id", "href", "src", "type")
+
+
+def script_data(scripts: Iterable[str]) -> str:
+    """
+    Extracts JSON objects and ``window``/``document`` assignments from the
+    content of script tags.
+
+    Args:
+        scripts: The text of each script tag.
+
+    Returns:
+        str: The extracted data, one block per finding.
+    """
+    script_content = []
+
+    for content in scripts:
+        if not content:
+            continue
+        try:
+            for potential_json in _JSON_ASSIGNMENT_RE.findall(content):
+                try:
+                    parsed = json.loads(potential_json)
+                    if parsed:
+                        script_content.append(
+                            f"JSON data from script: {json.dumps(parsed, indent=2)}"
+                        )
+                except json.JSONDecodeError:
+                    pass
+
+            if "window." in content or "document." in content:
+                for var_name, var_value in _GLOBAL_ASSIGNMENT_RE.findall(content):
+                    script_content.append(
+                        f"Dynamic data - {var_name}: {var_value.strip()}"
+                    )
+        except Exception:
+            if len(content) < 1000:
+                script_content.append(f"Script content: {content.strip()}")
+
+    return "\n\n".join(script_content)
+
+
+class HtmlDocument:
+    """
+    An HTML page parsed once with lxml, from which every view the scraping
+    pipeline needs is derived.
+
+    The tree is walked a single time on construction to collect the title,
+    links, images and scripts; the serialized views (the body, the reduced
+    HTML) are computed lazily from the same tree.
+
+    Attributes:
+        html: The original HTML.
+        base_url: The URL relative links and images are resolved against.
+        title: The text of the title tag, or an empty string.
+        hrefs: The href of every link, as written in the page.
+        image_sources: The src of every image, as written in the page.
+        scripts: The text of every script tag that has content.
+    """
+
+    def __init__(self, html: str, base_url: Optional[str] = None):
+        self.html = html
+        self.base_url = base_url
+        self.root = self._parse(html)
+        self.title = ""
+        self.hrefs: List[str] = []
+        self.image_sources: List[str] = []
+        self.scripts: List[str] = []
+        self._script_content: Optional[str] = None
+
+        if self.root is None:
+            return
+        for element in self.root.iter(etree.Element):
+            tag = element.tag
+            if tag == "a":
+                href = element.get("href")
+                if href is not None:
+                    self.hrefs.append(href)
+            elif tag == "img":
+                src = element.get("src")
+                if src is not None:
+                    self.image_sources.append(src)
+            elif tag == "script":
+                if element.text:
+                    self.scripts.append(element.text)
+            elif tag == "title" and not self.title:
+                self.title = element.text_content()
+
+    @staticmethod
+    def _parse(html: str):
+        if not html or not html.strip():
+            return None
+        try:
+            return lxml.html.document_fromstring(
+                html.encode("utf-8", errors="replace"), parser=_PARSER
+            )
+        except (etree.ParserError, ValueError):
+            return None
+
+    @property
+    def body(self):
+        """The body element, or None."""
+        return self.root.find("body") if self.root is not None else None
+
+    @property
+    def links(self) -> List[str]:
+        """The href of every link, resolved against ``base_url``."""
+        if not self.base_url:
+            return list(self.hrefs)
+        return [urljoin(self.base_url, href) for href in self.hrefs]
+
+    @property
+    def images(self) -> List[str]:
+        """The src of every image; relative ones are resolved against ``base_url``."""
+        if not self.base_url:
+            return list(self.image_sources)
+        return [
+            src if "http" in src else urljoin(self.base_url, src)
+            for src in self.image_sources
+        ]
+
+    @property
+    def script_content(self) -> str:
+        """The data found in the page's scripts, see ``script_data``."""
+        if self._script_content is None:
+            self._script_content = script_data(self.scripts)
+        return self._script_content
+
+    def body_html(self) -> Optional[str]:
+        """Serializes the body without its style tags; None when there is no body."""
+        body = self.body
+        if body is None:
+            return None
+        if body.find(".//style") is not None:
+            body = copy.deepcopy(body)
+            for style in list(body.iter("style")):
+                style.drop_tree()
+        return _serialize(body)
+
+    def reduced_html(self, reduction: int) -> str:
+        """
+        Returns a reduced copy of the page, see ``reduce_html``.
+
+        Args:
+            reduction (int): 1 strips comments and attributes, 2 additionally
+                keeps only the body with its text truncated.
+
+        Returns:
+            str: The reduced HTML, not minified.
+        """
+        if self.root is None:
+            return "" if reduction < 2 else "No <body> tag found in the HTML"
+
+        root = copy.deepcopy(self.root)
+        for comment in root.xpath("//comment()"):
+            comment.drop_tree()
+        for element in root.iter(etree.Element):
+            for attr in list(element.attrib):
+                if attr not in ATTRIBUTES_TO_KEEP:
+                    del element.attrib[attr]
+            if element.tag == "style":
+                for child in list(element):
+                    element.remove(child)
+                element.text = "" if reduction == 1 else None
+
+        if reduction == 1:
+            return _serialize(root)
+
+        body = root.find("body")
+        if body is None:
+            return "No <body> tag found in the HTML"
+        for style in list(body.iter("style")):
+            style.drop_tree()
+        for element in body.iter(etree.Element):
+            if element.tag != "script" and element.text is not None:
+                element.text = _truncate(element.text)
+            if element is not body and element.tail is not None:
+                if element.getparent().tag != "script":
+                    element.tail = _truncate(element.tail)
+        return _serialize(body)
+
+
+def _serialize(element) -> str:
+    return lxml.html.tostring(element, encoding="unicode", with_tail=False)
+
+
+def _truncate(text: str) -> str:
+    return re.sub(r"\s+", " ", text.strip())[:20]
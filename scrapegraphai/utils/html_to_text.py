@@ -0,0 +1,91 @@
+"""
+Module for converting HTML to text while collecting its link and image URLs
+"""
+
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import html2text
+
+from ..helpers import default_filters
+
+
+class _UrlCollectingHTML2Text(html2text.HTML2Text):
+    """HTML2Text that records the href and src attributes it walks past."""
+
+    def __init__(self, collect_urls: bool):
+        super().__init__()
+        self.collect_urls = collect_urls
+        self.saw_markup = False
+        self.hrefs: List[str] = []
+        self.image_sources: List[str] = []
+
+    def handle_tag(
+        self, tag: str, attrs: Dict[str, Optional[str]], start: bool
+    ) -> None:
+        self.saw_markup = True
+        if start and self.collect_urls:
+            if tag == "a" and attrs.get("href"):
+                self.hrefs.append(attrs["href"])
+            elif tag == "img" and attrs.get("src"):
+                self.image_sources.append(attrs["src"])
+        super().handle_tag(tag, attrs, start)
+
+
+def _absolute_urls(urls: List[str], base_url: Optional[str]) -> List[str]:
+    """Resolves URLs against base_url, keeping unique http(s) ones in page order."""
+    resolve = bool(base_url) and base_url.startswith("http")
+    seen = set()
+    absolute = []
+    for url in urls:
+        url = url.strip()
+        if resolve:
+            url = urljoin(base_url, url)
+        if not url.startswith(("http://", "https://")) or url in seen:
+            continue
+        seen.add(url)
+        absolute.append(url)
+    return absolute
+
+
+def _is_image_url(url: str) -> bool:
+    path = urlsplit(url).path.lower()
+    return path.endswith(tuple(default_filters.filter_dict["img_exts"]))
+
+
+def html_to_text(
+    html: str,
+    base_url: Optional[str] = None,
+    ignore_links: bool = False,
+    ignore_images: bool = True,
+    collect_urls: bool = True,
+) -> Tuple[str, Optional[List[str]], Optional[List[str]]]:
+    """
+    Converts HTML to markdown-flavored text with html2text and, in the same
+    pass, collects the page's link and image URLs from its tags.
+
+    Args:
+        html (str): The HTML to convert.
+        base_url (str): The page URL relative URLs are resolved against; when it
+            is not an http(s) URL only absolute URLs are kept.
+        ignore_links (bool): Whether links are left out of the text.
+        ignore_images (bool): Whether images are left out of the text.
+        collect_urls (bool): Whether link and image URLs are collected.
+
+    Returns:
+        Tuple[str, Optional[List[str]], Optional[List[str]]]: The text, the link
+        URLs and the image URLs (links pointing at images count as images). The
+        URL lists are None when the input had no markup to collect them from.
+    """
+    converter = _UrlCollectingHTML2Text(collect_urls)
+    converter.ignore_links = ignore_links
+    converter.ignore_images = ignore_images
+    text = converter.handle(html)
+
+    if not collect_urls or not converter.saw_markup:
+        return text, None, None
+
+    links, images = [], _absolute_urls(converter.image_sources, base_url)
+    for url in _absolute_urls(converter.hrefs, base_url):
+        (images if _is_image_url(url) else links).append(url)
+    return text, links, list(dict.fromkeys(images))
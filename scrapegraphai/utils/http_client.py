@@ -0,0 +1,475 @@
+"""
+Module for the shared, connection-pooling HTTP client used by the fetchers
+"""
+
+import json as jsonlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from .background_loop import (
+    arun_in_background,
+    run_in_background,
+    run_sync_in_background,
+)
+from .fetch_scheduler import THROTTLE_STATUSES, get_fetch_scheduler
+from .logging import get_logger
+
+logger = get_logger("http-client")
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class HttpStatusError(Exception):
+    """Raised by ``HttpResponse.raise_for_status`` for 4xx and 5xx responses."""
+
+    def __init__(self, response: "HttpResponse"):
+        super().__init__(f"HTTP {response.status} for url {response.url}")
+        self.response = response
+
+
+@dataclass
+class HttpResponse:
+    """
+    A fully read HTTP response.
+
+    Attributes:
+        url: The final URL, after redirects.
+        status: The HTTP status code.
+        headers: The response headers.
+        content: The raw response body, already decompressed.
+        encoding: The charset announced or detected for the body.
+        http_version: The protocol version the response was received over.
+    """
+
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    encoding: Optional[str] = None
+    http_version: str = "HTTP/1.1"
+
+    @property
+    def text(self) -> str:
+        """The body decoded with the response encoding."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    @property
+    def content_type(self) -> str:
+        """The media type of the body, without parameters."""
+        for key, value in self.headers.items():
+            if key.lower() == "content-type":
+                return value.split(";", 1)[0].strip().lower()
+        return ""
+
+    def json(self) -> Any:
+        """The body parsed as JSON."""
+        return jsonlib.loads(self.text)
+
+    def raise_for_status(self):
+        """Raises HttpStatusError if the response is a 4xx or 5xx."""
+        if self.status >= 400:
+            raise HttpStatusError(self)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class AsyncHttpClient:
+    """
+    An HTTP client sharing one connection pool across every graph of the process.
+
+    The underlying sessions live on the process-wide background event loop, so
+    keep-alive connections and cached DNS answers survive the short-lived loops
+    of synchronous callers. Responses compressed with gzip or deflate are
+    decoded transparently, and brotli too when the ``brotli`` package is
+    installed. Requests are throttled per host by the shared fetch scheduler, and
+    a 429/503 answer is retried once the scheduler's backoff for the host is over.
+
+    Attributes:
+        limit: Maximum number of open connections.
+        limit_per_host: Maximum number of open connections per host.
+        headers: Default headers sent with every request.
+        http2: Whether requests are sent over HTTP/2 when the server supports it.
+            Needs the ``http2`` extra (httpx with h2); requests that need a proxy or
+            skip TLS verification keep using HTTP/1.1.
+        dns_ttl: Seconds DNS answers are cached for.
+        keepalive_timeout: Seconds an idle connection is kept open.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+        http2: bool = False,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.http2 = http2 and _http2_available()
+        if http2 and not self.http2:
+            logger.warning(
+                "HTTP/2 needs httpx with h2 (`pip install scrapegraphai[http2]`); "
+                "falling back to HTTP/1.1."
+            )
+        self._options = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "headers": headers,
+            "http2": http2,
+            "dns_ttl": dns_ttl,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._http2_client = None
+        self._in_flight = 0
+        self._retired = False
+        self._state_lock = threading.Lock()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers=self.headers
+            )
+        return self._session
+
+    async def _get_http2_client(self):
+        if self._http2_client is None or self._http2_client.is_closed:
+            import httpx
+
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.limit,
+                    keepalive_expiry=self.keepalive_timeout,
+                ),
+            )
+        return self._http2_client
+
+    async def _send_http2(self, method, url, headers, timeout, **kwargs):
+        client = await self._get_http2_client()
+        response = await client.request(
+            method, url, headers=headers, timeout=timeout, **kwargs
+        )
+        return HttpResponse(
+            url=str(response.url),
+            status=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            encoding=response.encoding,
+            http_version=response.http_version,
+        )
+
+    async def _send_http1(self, method, url, headers, timeout, proxy, verify, **kwargs):
+        session = await self._get_session()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            proxy=proxy,
+            ssl=verify,
+            **kwargs,
+        ) as response:
+            content = await response.read()
+            try:
+                encoding = response.get_encoding()
+            except RuntimeError:
+                encoding = None
+            return HttpResponse(
+                url=str(response.url),
+                status=response.status,
+                headers=dict(response.headers),
+                content=content,
+                encoding=encoding,
+                http_version=f"HTTP/{response.version.major}.{response.version.minor}",
+            )
+
+    async def _download(self, url, path, headers, timeout, proxy, verify, chunk_size):
+        session = await self._get_session()
+        async with session.get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            proxy=proxy,
+            ssl=verify,
+        ) as response:
+            if response.status == 200:
+                with open(path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        f.write(chunk)
+            return HttpResponse(
+                url=str(response.url),
+                status=response.status,
+                headers=dict(response.headers),
+                http_version=f"HTTP/{response.version.major}.{response.version.minor}",
+            )
+
+    async def _scheduled(self, url: str, send) -> HttpResponse:
+        # A throttled request is retried once the scheduler's pause for the host
+        # is over, i.e. when the next slot is granted.
+        scheduler = get_fetch_scheduler()
+        attempt = 0
+        while True:
+            async with scheduler.aslot(url):
+                result = await send()
+            scheduler.report(url, result.status, result.headers)
+            if (
+                result.status not in THROTTLE_STATUSES
+                or attempt >= scheduler.max_retries
+            ):
+                return result
+            attempt += 1
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        proxy: Optional[str],
+        verify: bool,
+        schedule: bool,
+        **kwargs,
+    ) -> HttpResponse:
+        def _send():
+            if self.http2 and proxy is None and verify:
+                return self._send_http2(method, url, headers, timeout, **kwargs)
+            return self._send_http1(
+                method, url, headers, timeout, proxy, verify, **kwargs
+            )
+
+        if not schedule:
+            return await _send()
+        return await self._scheduled(url, _send)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Any = None,
+        timeout: Optional[float] = 30,
+        proxy: Optional[str] = None,
+        verify: bool = True,
+        schedule: bool = True,
+    ) -> HttpResponse:
+        """
+        Sends a request through the shared connection pool.
+
+        Args:
+            method: The HTTP method.
+            url: The URL to request.
+            headers: Extra headers merged over the client defaults.
+            params: Query string parameters.
+            json: A body serialized as JSON.
+            data: A raw or form-encoded body.
+            timeout: Total timeout in seconds; None disables it.
+            proxy: Optional proxy URL.
+            verify: Whether TLS certificates are verified.
+            schedule: Whether the request goes through the per-host fetch
+                scheduler; API calls that are not page fetches can opt out.
+
+        Returns:
+            HttpResponse: The fully read response.
+        """
+        kwargs = {
+            key: value
+            for key, value in (("params", params), ("json", json), ("data", data))
+            if value is not None
+        }
+        return await self._tracked(
+            self._request(
+                method, url, headers, timeout, proxy, verify, schedule, **kwargs
+            )
+        )
+
+    async def _tracked(self, coro) -> HttpResponse:
+        """Runs a request on the background loop, counting it while in flight."""
+        with self._state_lock:
+            self._in_flight += 1
+        try:
+            return await arun_in_background(coro)
+        finally:
+            with self._state_lock:
+                self._in_flight -= 1
+                drained = self._retired and self._in_flight == 0
+            if drained:
+                run_in_background(self._close_if_idle())
+
+    async def get(self, url: str, **kwargs) -> HttpResponse:
+        """Sends a GET request; see ``request``."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HttpResponse:
+        """Sends a POST request; see ``request``."""
+        return await self.request("POST", url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> HttpResponse:
+        """Sends a HEAD request; see ``request``."""
+        return await self.request("HEAD", url, **kwargs)
+
+    async def download(
+        self,
+        url: str,
+        path: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = 300,
+        proxy: Optional[str] = None,
+        verify: bool = True,
+        schedule: bool = True,
+        chunk_size: int = 64 * 1024,
+    ) -> HttpResponse:
+        """
+        Streams the body of a GET request to a file instead of holding it in memory.
+
+        The file is only written when the server answers 200.
+
+        Args:
+            url: The URL to download.
+            path: The file the body is written to.
+            headers: Extra headers merged over the client defaults.
+            timeout: Total timeout in seconds; None disables it.
+            proxy: Optional proxy URL.
+            verify: Whether TLS certificates are verified.
+            schedule: Whether the request goes through the per-host fetch scheduler.
+            chunk_size: Size in bytes of the chunks written to the file.
+
+        Returns:
+            HttpResponse: The response, with an empty ``content``.
+        """
+
+        def _send():
+            return self._download(
+                url, path, headers, timeout, proxy, verify, chunk_size
+            )
+
+        return await self._tracked(self._scheduled(url, _send) if schedule else _send())
+
+    def request_sync(self, method: str, url: str, **kwargs) -> HttpResponse:
+        """Blocking counterpart of ``request`` for synchronous callers."""
+        return run_sync_in_background(self.request(method, url, **kwargs))
+
+    def get_sync(self, url: str, **kwargs) -> HttpResponse:
+        """Blocking counterpart of ``get`` for synchronous callers."""
+        return self.request_sync("GET", url, **kwargs)
+
+    def post_sync(self, url: str, **kwargs) -> HttpResponse:
+        """Blocking counterpart of ``post`` for synchronous callers."""
+        return self.request_sync("POST", url, **kwargs)
+
+    def head_sync(self, url: str, **kwargs) -> HttpResponse:
+        """Blocking counterpart of ``head`` for synchronous callers."""
+        return self.request_sync("HEAD", url, **kwargs)
+
+    def download_sync(self, url: str, path: str, **kwargs) -> HttpResponse:
+        """Blocking counterpart of ``download`` for synchronous callers."""
+        return run_sync_in_background(self.download(url, path, **kwargs))
+
+    async def _close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._http2_client is not None:
+            await self._http2_client.aclose()
+        self._http2_client = None
+
+    async def _close_if_idle(self):
+        # A request may have started since the close was scheduled.
+        with self._state_lock:
+            if self._in_flight:
+                return
+        await self._close()
+
+    def close(self):
+        """Closes the connection pools."""
+        if self._session is not None or self._http2_client is not None:
+            run_sync_in_background(self._close())
+
+    def retire(self):
+        """
+        Closes the connection pools once the requests in flight are done,
+        without waiting for them; a later request reopens them and closes
+        them again when it is done.
+        """
+        with self._state_lock:
+            self._retired = True
+            idle = self._in_flight == 0
+        if idle and (self._session is not None or self._http2_client is not None):
+            run_in_background(self._close_if_idle())
+
+
+_client: Optional[AsyncHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> AsyncHttpClient:
+    """
+    Returns the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        AsyncHttpClient: The shared client.
+    """
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            _client = AsyncHttpClient()
+    return _client
+
+
+def configure_http_client(**kwargs) -> AsyncHttpClient:
+    """
+    Replaces the process-wide HTTP client with one built from ``kwargs``; the
+    current client, and its open connections, is kept if it has the same options.
+    A replaced client is retired: the requests other graphs have in flight on
+    it complete, then its connections are closed.
+
+    Args:
+        kwargs: The ``AsyncHttpClient`` options (limits, HTTP/2, DNS cache TTL...).
+
+    Returns:
+        AsyncHttpClient: The new shared client.
+    """
+    global _client
+
+    with _client_lock:
+        client = AsyncHttpClient(**kwargs)
+        if _client is not None and _client._options == client._options:
+            return _client
+        previous, _client = _client, client
+    if previous is not None:
+        previous.retire()
+    return _client
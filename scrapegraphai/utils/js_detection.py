@@ -0,0 +1,75 @@
+"""
+Module for deciding whether a page needs a JavaScript-capable browser
+"""
+
+import re
+from typing import Optional
+
+_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style|template|noscript)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_BODY_RE = re.compile(r"<body\b[^>]*>(.*)</body\s*>", re.IGNORECASE | re.DOTALL)
+_NOSCRIPT_RE = re.compile(
+    r"<noscript\b[^>]*>(.*?)</noscript\s*>", re.IGNORECASE | re.DOTALL
+)
+_SPA_ROOT_RE = re.compile(
+    r"<div\b[^>]*\bid\s*=\s*[\"'](root|app|__next|__nuxt|svelte|main-app)[\"'][^>]*>"
+    r"\s*</div>"
+    r"|\bng-app\b|\bng-version\b|\bdata-reactroot\b",
+    re.IGNORECASE,
+)
+_NOSCRIPT_WALL_RE = re.compile(
+    r"(enable|turn on|requires?|need)\s+(your\s+)?javascript"
+    r"|javascript\s+(is\s+)?(required|disabled|must be enabled)",
+    re.IGNORECASE,
+)
+
+# Below this many visible characters a page is considered a shell, not content.
+MIN_TEXT_LENGTH = 200
+# Visible text as a share of the whole document under which markup dominates.
+MIN_TEXT_TO_MARKUP_RATIO = 0.02
+
+
+def visible_text(html: str) -> str:
+    """Returns the visible text of an HTML document with whitespace collapsed."""
+    body_match = _BODY_RE.search(html)
+    body = body_match.group(1) if body_match else html
+    text = _TAG_RE.sub(" ", _SCRIPT_STYLE_RE.sub(" ", body))
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def detect_js_dependence(html: str) -> Optional[str]:
+    """
+    Checks whether an HTML document fetched without a browser still needs
+    JavaScript rendering to expose its content.
+
+    Args:
+        html (str): The HTML returned by a plain HTTP request.
+
+    Returns:
+        Optional[str]: The reason the page needs a browser ('empty_body',
+        'noscript_wall', 'spa_root' or 'low_text_ratio'), or None when the
+        static HTML is usable as is.
+    """
+    if not html or not html.strip():
+        return "empty_body"
+
+    text = visible_text(html)
+    short_page = len(text) < MIN_TEXT_LENGTH
+
+    for noscript in _NOSCRIPT_RE.findall(html):
+        if _NOSCRIPT_WALL_RE.search(noscript) and short_page:
+            return "noscript_wall"
+
+    if short_page and _SPA_ROOT_RE.search(html):
+        return "spa_root"
+
+    if not text:
+        return "empty_body"
+
+    if short_page and len(text) / len(html) < MIN_TEXT_TO_MARKUP_RATIO:
+        return "low_text_ratio"
+
+    return None
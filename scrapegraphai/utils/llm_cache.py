@@ -0,0 +1,276 @@
+"""
+Module for the persistent, SQLite-backed cache of LLM responses
+"""
+
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from .logging import get_logger
+
+logger = get_logger("llm-cache")
+
+DEFAULT_TTL = 7 * 24 * 60 * 60
+DEFAULT_MAX_SIZE_MB = 256
+DEFAULT_FILENAME = "llm_cache.sqlite"
+# Writes between two sweeps of the expired entries; a sweep also resyncs the
+# running size total with the entries written by other processes.
+SWEEP_EVERY = 100
+# Share of the size bound an eviction frees down to, so it runs seldom.
+EVICT_TO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+
+
+# Hit and miss counters of the enclosing count_cache_lookups blocks.
+_counters: contextvars.ContextVar[Tuple[Dict[str, int], ...]] = contextvars.ContextVar(
+    "scrapegraphai_llm_cache_counters", default=()
+)
+_counters_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def count_cache_lookups():
+    """
+    Counts the hits and misses of the cache lookups made in the block,
+    including those of the threads and tasks it starts with its context, so
+    concurrent graphs each see their own figures.
+
+    Yields:
+        Dict[str, int]: The counts, under "llm_cache_hits" and "llm_cache_misses".
+    """
+    counts = {"llm_cache_hits": 0, "llm_cache_misses": 0}
+    token = _counters.set(_counters.get() + (counts,))
+    try:
+        yield counts
+    finally:
+        _counters.reset(token)
+
+
+def _count(key: str):
+    with _counters_lock:
+        for counts in _counters.get():
+            counts[key] += 1
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    A LangChain LLM cache stored in a SQLite database.
+
+    Entries are keyed by the model configuration LangChain reports for a call
+    (model id and generation parameters) plus the fully rendered prompt, so a
+    call is only answered from the cache when it would have been sent
+    unchanged. Entries expire after ``ttl`` seconds, and the least recently
+    used ones are evicted when the stored responses exceed ``max_size_mb``.
+
+    Attributes:
+        path: The database file.
+        ttl: Seconds after which an entry is ignored and replaced.
+        max_size_bytes: Upper bound for the total size of the stored responses.
+        hits: Lookups answered from the cache.
+        misses: Lookups that reached the model.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_TTL,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+    ):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.ttl = ttl
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.execute(_INDEX)
+        self._total_size = self._stored_size()
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """Returns the cache key of a prompt sent to a configured model."""
+        payload = f"{llm_string}\x00{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """
+        Reads the cached response to a prompt.
+
+        Args:
+            prompt (str): The serialized prompt.
+            llm_string (str): The serialized model configuration.
+
+        Returns:
+            Optional[Sequence[Generation]]: The cached generations, or None on a miss.
+        """
+        key = self.make_key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] < self.ttl:
+                self._connection.execute(
+                    "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+                )
+                generations = self._load(row[0])
+                if generations is not None:
+                    self.hits += 1
+                    _count("llm_cache_hits")
+                    return generations
+            self.misses += 1
+            _count("llm_cache_misses")
+        return None
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]):
+        """
+        Stores the response to a prompt, then evicts entries over the size bound.
+
+        Args:
+            prompt (str): The serialized prompt.
+            llm_string (str): The serialized model configuration.
+            return_val (Sequence[Generation]): The generations returned by the model.
+        """
+        response = json.dumps([self._dump(generation) for generation in return_val])
+        key = self.make_key(prompt, llm_string)
+        size = len(response.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            replaced = self._connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, now, now),
+            )
+            self._total_size += size - (replaced[0] if replaced else 0)
+            self._writes += 1
+            if self._writes % SWEEP_EVERY == 0:
+                self._sweep(now)
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+
+    @staticmethod
+    def _dump(generation: Generation) -> dict:
+        entry = {"text": generation.text, "generation_info": generation.generation_info}
+        if isinstance(generation, ChatGeneration):
+            entry["message"] = message_to_dict(generation.message)
+        return entry
+
+    @staticmethod
+    def _load(response: str) -> Optional[list]:
+        try:
+            generations = []
+            for entry in json.loads(response):
+                if "message" in entry:
+                    generations.append(
+                        ChatGeneration(
+                            message=messages_from_dict([entry["message"]])[0],
+                            generation_info=entry["generation_info"],
+                        )
+                    )
+                else:
+                    generations.append(
+                        Generation(
+                            text=entry["text"], generation_info=entry["generation_info"]
+                        )
+                    )
+            return generations
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring an unreadable LLM cache entry: {e}")
+            return None
+
+    def _stored_size(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _sweep(self, now: float):
+        """Drops the expired entries and recounts the stored size."""
+        self._connection.execute(
+            "DELETE FROM responses WHERE created_at <= ?", (now - self.ttl,)
+        )
+        self._total_size = self._stored_size()
+
+    def _evict(self):
+        """Drops the least recently used entries, down below the size bound."""
+        target = self.max_size_bytes * EVICT_TO
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        )
+        evicted = []
+        for key, size in rows:
+            if self._total_size <= target:
+                break
+            evicted.append((key,))
+            self._total_size -= size
+        rows.close()
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} entries from the LLM cache")
+
+    def clear(self, **kwargs):
+        """Removes every entry of the cache."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._total_size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        The hits and misses counted since the cache was opened, by every
+        caller; see ``count_cache_lookups`` for the figures of one run.
+        """
+        with self._lock:
+            return {"llm_cache_hits": self.hits, "llm_cache_misses": self.misses}
+
+
+_caches: Dict[tuple, SQLiteLLMCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(
+    path: str, ttl: float = DEFAULT_TTL, max_size_mb: float = DEFAULT_MAX_SIZE_MB
+) -> SQLiteLLMCache:
+    """
+    Returns the cache stored at ``path``, opening it on first use, so graphs
+    configured alike share one connection and one set of statistics.
+
+    Args:
+        path (str): The database file.
+        ttl (float): Seconds after which an entry is ignored and replaced.
+        max_size_mb (float): Upper bound for the total size of the stored responses.
+
+    Returns:
+        SQLiteLLMCache: The cache.
+    """
+    key = (os.path.abspath(os.path.expanduser(path)), ttl, max_size_mb)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = SQLiteLLMCache(*key)
+        return _caches[key]
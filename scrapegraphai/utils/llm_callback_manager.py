@@ -7,6 +7,7 @@ Classes:
 
 import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
 
 from langchain_aws import ChatBedrock
 from langchain_community.callbacks.manager import (
@@ -17,6 +18,9 @@ from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 from .custom_callback import get_custom_callback
 
+# Set while a callback counts the LLM calls of the current context.
+_measuring: ContextVar[bool] = ContextVar("scrapegraphai_measuring", default=False)
+
 
 class CustomLLMCallbackManager:
     """
@@ -29,6 +33,8 @@ class CustomLLMCallbackManager:
     Methods:
     exclusive_get_callback: A context manager that yields the appropriate callback based on
     the LLM model and its name, ensuring exclusive access to the callback.
+    scoped_get_callback: A context manager that yields a callback counting the LLM calls
+    of the current context only, for concurrent async runs.
     """
 
     _lock = threading.Lock()
@@ -47,30 +53,58 @@ class CustomLLMCallbackManager:
         """
         if CustomLLMCallbackManager._lock.acquire(blocking=False):
             try:
-                from ..models.minimax import MiniMax
-
-                if isinstance(llm_model, MiniMax):
-                    service_tier = llm_model.service_tier or "standard"
-                    with get_custom_callback(
-                        llm_model_name, service_tier=service_tier
-                    ) as cb:
-                        yield cb
-                elif isinstance(llm_model, ChatOpenAI) or isinstance(
-                    llm_model, AzureChatOpenAI
-                ):
-                    with get_openai_callback() as cb:
-                        yield cb
-                elif (
-                    isinstance(llm_model, ChatBedrock)
-                    and llm_model_name is not None
-                    and "claude" in llm_model_name
-                ):
-                    with get_bedrock_anthropic_callback() as cb:
-                        yield cb
-                else:
-                    with get_custom_callback(llm_model_name) as cb:
-                        yield cb
+                with self._measured(llm_model, llm_model_name) as cb:
+                    yield cb
             finally:
                 CustomLLMCallbackManager._lock.release()
         else:
             yield None
+
+    @contextmanager
+    def scoped_get_callback(self, llm_model, llm_model_name):
+        """
+        Provides a callback for the LLM calls made in the current context only.
+
+        The callbacks are context variables, so concurrent asyncio tasks each count
+        their own calls and no process-wide lock is held across awaits. A run
+        nested in a measured one yields None: its calls count towards the outer one.
+
+        Args:
+            llm_model: The LLM model instance.
+            llm_model_name (str): The name of the LLM model.
+
+        Yields:
+            The appropriate callback for the LLM model, or None when nested.
+        """
+        if _measuring.get():
+            yield None
+            return
+        with self._measured(llm_model, llm_model_name) as cb:
+            yield cb
+
+    @contextmanager
+    def _measured(self, llm_model, llm_model_name):
+        token = _measuring.set(True)
+        try:
+            with _get_callback(llm_model, llm_model_name) as cb:
+                yield cb
+        finally:
+            _measuring.reset(token)
+
+
+def _get_callback(llm_model, llm_model_name):
+    """Returns the usage callback context manager matching the LLM model."""
+    from ..models.minimax import MiniMax
+
+    if isinstance(llm_model, MiniMax):
+        service_tier = llm_model.service_tier or "standard"
+        return get_custom_callback(llm_model_name, service_tier=service_tier)
+    if isinstance(llm_model, ChatOpenAI) or isinstance(llm_model, AzureChatOpenAI):
+        return get_openai_callback()
+    if (
+        isinstance(llm_model, ChatBedrock)
+        and llm_model_name is not None
+        and "claude" in llm_model_name
+    ):
+        return get_bedrock_anthropic_callback()
+    return get_custom_callback(llm_model_name)
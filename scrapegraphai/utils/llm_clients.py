@@ -0,0 +1,75 @@
+"""
+Module for the process-wide registry of LLM clients shared by graph instances
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Mapping
+
+from .logging import get_logger
+
+logger = get_logger("llm-clients")
+
+# Clients kept at most; the least recently used one is dropped beyond it.
+MAX_CLIENTS = 32
+
+# Providers whose clients the nodes reconfigure in place (ChatOllama.format),
+# so each graph needs its own.
+UNSHARED_PROVIDERS = frozenset({"ollama"})
+
+_clients: "OrderedDict[str, Any]" = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _normalize(value: Any) -> str:
+    # Objects such as a shared LLM cache are told apart by identity.
+    return f"{type(value).__name__}@{id(value)}"
+
+
+def llm_client_key(llm_params: Mapping[str, Any]) -> str:
+    """
+    Returns the key of a resolved model configuration: equal for configurations
+    differing only in key order, and hashed so no credential is kept in it.
+
+    Args:
+        llm_params: The model parameters, as passed to the client.
+
+    Returns:
+        str: The key.
+    """
+    payload = json.dumps(llm_params, sort_keys=True, default=_normalize)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_llm_client(llm_params: Mapping[str, Any], factory: Callable[[], Any]) -> Any:
+    """
+    Returns the client built for an identical configuration, or builds it
+    with ``factory``, so the sub-graphs of a multi-URL run share one client
+    and its connection pool. The LangChain chat models are thread-safe.
+
+    Args:
+        llm_params: The model parameters the client is built from.
+        factory: Builds the client; called once per configuration.
+
+    Returns:
+        The chat model client.
+    """
+    key = llm_client_key(llm_params)
+    with _clients_lock:
+        if key in _clients:
+            _clients.move_to_end(key)
+            return _clients[key]
+        client = factory()
+        _clients[key] = client
+        if len(_clients) > MAX_CLIENTS:
+            _clients.popitem(last=False)
+        logger.debug(f"Created a shared {type(client).__name__} client")
+        return client
+
+
+def clear_llm_clients():
+    """Forgets every shared client; graphs created afterwards build new ones."""
+    with _clients_lock:
+        _clients.clear()
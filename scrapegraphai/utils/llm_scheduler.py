@@ -0,0 +1,453 @@
+"""
+Module for the process-wide admission scheduler enforcing the LLM rate limits
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from .logging import get_logger
+from .tokenizer import get_token_counter
+
+logger = get_logger("llm-scheduler")
+
+# How often an asynchronous caller queued behind others checks its turn.
+_POLL_INTERVAL = 0.05
+
+# Invocation parameters bounding the completion, by provider naming.
+_MAX_TOKENS_PARAMS = ("max_tokens", "max_completion_tokens", "max_output_tokens")
+
+
+@dataclass
+class _Budget:
+    requests_per_minute: Optional[float]
+    tokens_per_minute: Optional[float]
+    burst_seconds: float
+    requests: float = 0.0
+    tokens: float = 0.0
+    updated: float = field(default_factory=time.monotonic)
+    queue: Deque[object] = field(default_factory=deque)
+
+    @property
+    def request_capacity(self) -> float:
+        return max(1.0, self.requests_per_minute / 60 * self.burst_seconds)
+
+    @property
+    def token_capacity(self) -> float:
+        return max(1.0, self.tokens_per_minute / 60 * self.burst_seconds)
+
+    def fill(self):
+        self.requests = self.request_capacity if self.requests_per_minute else 0.0
+        self.tokens = self.token_capacity if self.tokens_per_minute else 0.0
+
+    def refill(self, now: float):
+        elapsed = now - self.updated
+        self.updated = now
+        if self.requests_per_minute:
+            self.requests = min(
+                self.request_capacity,
+                self.requests + elapsed * self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute:
+            self.tokens = min(
+                self.token_capacity,
+                self.tokens + elapsed * self.tokens_per_minute / 60,
+            )
+
+    def wait_for(self, cost: float) -> float:
+        """Seconds until a call of ``cost`` tokens fits in both buckets."""
+        wait = 0.0
+        if self.requests_per_minute and self.requests < 1:
+            wait = (1 - self.requests) * 60 / self.requests_per_minute
+        if self.tokens_per_minute:
+            # A call larger than the bucket goes once it is full, leaving a debt.
+            needed = min(cost, self.token_capacity)
+            if self.tokens < needed:
+                wait = max(wait, (needed - self.tokens) * 60 / self.tokens_per_minute)
+        return wait
+
+
+class LLMScheduler:
+    """
+    Admits LLM calls under requests-per-minute and tokens-per-minute budgets,
+    across threads, event loops and graph instances.
+
+    Every (provider, model) pair gets its own budget: one token bucket for
+    requests and one for tokens, each refilled continuously and holding at
+    most ``burst_seconds`` worth of its rate. A call is charged one request
+    and its estimated tokens (prompt plus completion bound); the estimate is
+    corrected with the usage the provider reports once the call ends. Callers
+    are admitted in arrival order, so no graph starves the others.
+
+    Attributes:
+        burst_seconds: Default size of the buckets, in seconds of budget.
+    """
+
+    def __init__(self, burst_seconds: float = 1.0):
+        self._condition = threading.Condition()
+        self._budgets: Dict[Tuple[str, str], _Budget] = {}
+        self.burst_seconds = burst_seconds
+
+    def configure(
+        self,
+        provider: str,
+        model: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        burst_seconds: Optional[float] = None,
+    ):
+        """
+        Sets the budget of a model; graphs configuring the same model share
+        it, the latest limits winning.
+
+        Args:
+            provider (str): The model provider, e.g. 'openai'.
+            model (str): The model name.
+            requests_per_minute (float): Calls admitted per minute; None for no limit.
+            tokens_per_minute (float): Tokens admitted per minute; None for no limit.
+            burst_seconds (float): Size of the buckets, in seconds of budget.
+
+        Raises:
+            ValueError: If a limit is not positive, or neither limit is set.
+        """
+        for name, value in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+            ("burst_seconds", burst_seconds),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be greater than 0.")
+        if requests_per_minute is None and tokens_per_minute is None:
+            raise ValueError("Set requests_per_minute, tokens_per_minute or both.")
+
+        with self._condition:
+            budget = self._budgets.get((provider, model))
+            if budget is None:
+                budget = self._budgets[(provider, model)] = _Budget(
+                    requests_per_minute,
+                    tokens_per_minute,
+                    burst_seconds or self.burst_seconds,
+                )
+                budget.fill()
+            else:
+                budget.refill(time.monotonic())
+                budget.requests_per_minute = requests_per_minute
+                budget.tokens_per_minute = tokens_per_minute
+                if burst_seconds is not None:
+                    budget.burst_seconds = burst_seconds
+                if requests_per_minute:
+                    budget.requests = min(budget.requests, budget.request_capacity)
+                if tokens_per_minute:
+                    budget.tokens = min(budget.tokens, budget.token_capacity)
+            self._condition.notify_all()
+
+    def limits(self, provider: str, model: str) -> Dict[str, Optional[float]]:
+        """The limits of a model's budget; empty when it has none."""
+        with self._condition:
+            budget = self._budgets.get((provider, model))
+            if budget is None:
+                return {}
+            return {
+                "requests_per_minute": budget.requests_per_minute,
+                "tokens_per_minute": budget.tokens_per_minute,
+                "burst_seconds": budget.burst_seconds,
+            }
+
+    def _admit(self, budget: _Budget, ticket: object, cost: float) -> Optional[float]:
+        """
+        Charges the call if it is first in line and fits; returns 0.0 then, the
+        seconds to wait when it is first but does not fit, or None when others
+        are ahead of it.
+        """
+        if budget.queue[0] is not ticket:
+            return None
+        budget.refill(time.monotonic())
+        wait = budget.wait_for(cost)
+        if wait:
+            return wait
+        if budget.requests_per_minute:
+            budget.requests -= 1
+        if budget.tokens_per_minute:
+            budget.tokens -= cost
+        budget.queue.popleft()
+        self._condition.notify_all()
+        return 0.0
+
+    def _leave(self, budget: _Budget, ticket: object):
+        if ticket in budget.queue:
+            budget.queue.remove(ticket)
+            self._condition.notify_all()
+
+    def acquire(
+        self, provider: str, model: str, tokens: float = 0, blocking: bool = True
+    ) -> bool:
+        """
+        Waits for the turn of a call and charges it to the model's budget.
+
+        Args:
+            provider (str): The model provider.
+            model (str): The model name.
+            tokens (float): The estimated tokens of the call.
+            blocking (bool): Whether to wait; otherwise the call is only
+                admitted when the budget allows it right away.
+
+        Returns:
+            bool: Whether the call was admitted; always True when blocking.
+        """
+        ticket = object()
+        with self._condition:
+            budget = self._budgets.get((provider, model))
+            if budget is None:
+                return True
+            if not blocking and budget.queue:
+                return False
+            budget.queue.append(ticket)
+            try:
+                while True:
+                    wait = self._admit(budget, ticket, tokens)
+                    if wait == 0.0:
+                        return True
+                    if not blocking:
+                        return False
+                    self._condition.wait(wait)
+            finally:
+                self._leave(budget, ticket)
+
+    async def aacquire(
+        self, provider: str, model: str, tokens: float = 0, blocking: bool = True
+    ) -> bool:
+        """Asynchronous counterpart of ``acquire``."""
+        ticket = object()
+        with self._condition:
+            budget = self._budgets.get((provider, model))
+            if budget is None:
+                return True
+            if not blocking and budget.queue:
+                return False
+            budget.queue.append(ticket)
+        try:
+            while True:
+                with self._condition:
+                    wait = self._admit(budget, ticket, tokens)
+                if wait == 0.0:
+                    return True
+                if not blocking:
+                    return False
+                await asyncio.sleep(_POLL_INTERVAL if wait is None else wait)
+        finally:
+            with self._condition:
+                self._leave(budget, ticket)
+
+    def reconcile(self, provider: str, model: str, estimated: float, actual: float):
+        """
+        Corrects the tokens charged for a call with the usage it reported:
+        an overestimate is given back, an underestimate is charged.
+        """
+        with self._condition:
+            budget = self._budgets.get((provider, model))
+            if budget is None or not budget.tokens_per_minute:
+                return
+            budget.refill(time.monotonic())
+            budget.tokens = min(
+                budget.token_capacity, budget.tokens + estimated - actual
+            )
+            self._condition.notify_all()
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """
+    Returns the process-wide LLM scheduler, creating it on first use.
+
+    Returns:
+        LLMScheduler: The shared scheduler.
+    """
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+    return _scheduler
+
+
+@dataclass
+class _Charge:
+    estimate: int
+    admitted: bool = False
+    done: bool = False
+
+
+# The charges estimated for the calls started in this context and not admitted yet.
+_pending: ContextVar[Tuple[_Charge, ...]] = ContextVar(
+    "llm_admission_pending", default=()
+)
+_charge_lock = threading.Lock()
+
+
+def _message_text(message) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else str(block.get("text", ""))
+        for block in content
+    )
+
+
+def _usage_of(response) -> Optional[int]:
+    """The total tokens a finished call reports, if it does."""
+    total = 0
+    found = False
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            usage = getattr(message, "usage_metadata", None)
+            if usage and usage.get("total_tokens") is not None:
+                total += usage["total_tokens"]
+                found = True
+    if found:
+        return total
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    return token_usage.get("total_tokens")
+
+
+class AdmissionTracker(BaseCallbackHandler):
+    """
+    Estimates the tokens of each call when it starts, for the limiter to
+    charge, and reconciles the charge with the reported usage when it ends.
+    Runs inline so the estimate is visible to the limiter's context.
+    """
+
+    run_inline = True
+
+    def __init__(self, limiter: "AdmissionLimiter"):
+        self.limiter = limiter
+        self._charges: Dict[UUID, _Charge] = {}
+
+    def _estimate(self, messages: List[List[Any]], invocation_params: dict) -> int:
+        texts = [_message_text(message) for batch in messages for message in batch]
+        counter = get_token_counter(self.limiter.llm_model)
+        estimate = sum(counter.count_many(texts)) if texts else 0
+        for name in _MAX_TOKENS_PARAMS:
+            if isinstance(invocation_params.get(name), int):
+                return estimate + invocation_params[name]
+        return estimate
+
+    def on_chat_model_start(
+        self, serialized, messages, *, run_id: UUID, **kwargs: Any
+    ) -> Any:
+        try:
+            estimate = self._estimate(messages, kwargs.get("invocation_params") or {})
+        except Exception as e:
+            logger.debug(f"Could not estimate the prompt tokens: {e}")
+            estimate = 0
+        charge = _Charge(estimate)
+        self._charges[run_id] = charge
+        pending = tuple(c for c in _pending.get() if not (c.admitted or c.done))
+        _pending.set(pending + (charge,))
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any) -> Any:
+        charge = self._charges.pop(run_id, None)
+        if charge is None:
+            return
+        charge.done = True
+        # Answers read from the LLM cache were never admitted, nor charged.
+        if not charge.admitted:
+            return
+        actual = _usage_of(response)
+        if actual is not None:
+            self.limiter.scheduler.reconcile(
+                self.limiter.provider, self.limiter.model, charge.estimate, actual
+            )
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs: Any) -> Any:
+        charge = self._charges.pop(run_id, None)
+        if charge is not None:
+            charge.done = True
+
+
+class AdmissionLimiter(BaseRateLimiter):
+    """
+    The rate limiter of a chat model, admitting its calls through the
+    process-wide scheduler budget of its provider and model.
+
+    Attributes:
+        scheduler: The scheduler holding the budget.
+        provider: The model provider.
+        model: The model name.
+        llm_model: The chat model, whose tokenizer estimates the prompts.
+        tracker: The callback handler to register on the chat model.
+    """
+
+    def __init__(self, scheduler: LLMScheduler, provider: str, model: str):
+        self.scheduler = scheduler
+        self.provider = provider
+        self.model = model
+        self.llm_model = None
+        self.tracker = AdmissionTracker(self)
+
+    def attach(self, llm_model):
+        """
+        Makes the chat model's calls go through this limiter. A model reused
+        by several graphs keeps a single tracker: the one of its last limiter.
+        """
+        self.llm_model = llm_model
+        llm_model.rate_limiter = self
+        callbacks = llm_model.callbacks
+        if callbacks is None or isinstance(callbacks, list):
+            kept = [
+                handler
+                for handler in callbacks or []
+                if not isinstance(handler, AdmissionTracker)
+            ]
+            llm_model.callbacks = [*kept, self.tracker]
+        else:
+            for handler in list(callbacks.handlers):
+                if isinstance(handler, AdmissionTracker):
+                    callbacks.remove_handler(handler)
+            callbacks.add_handler(self.tracker)
+        return llm_model
+
+    @staticmethod
+    def _take_charge() -> Optional[_Charge]:
+        with _charge_lock:
+            for charge in _pending.get():
+                if not (charge.admitted or charge.done):
+                    charge.admitted = True
+                    return charge
+        return None
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        charge = self._take_charge()
+        admitted = self.scheduler.acquire(
+            self.provider,
+            self.model,
+            charge.estimate if charge else 0,
+            blocking=blocking,
+        )
+        if not admitted and charge is not None:
+            charge.admitted = False
+        return admitted
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        charge = self._take_charge()
+        admitted = await self.scheduler.aacquire(
+            self.provider,
+            self.model,
+            charge.estimate if charge else 0,
+            blocking=blocking,
+        )
+        if not admitted and charge is not None:
+            charge.admitted = False
+        return admitted
@@ -0,0 +1,211 @@
+"""
+Module for extracting the main content of a page and dropping its boilerplate
+"""
+
+import copy
+import re
+from typing import Dict, Optional, Union
+
+import lxml.html
+from lxml import etree
+
+from .html_document import HtmlDocument
+
+# Class/id fragments of page chrome, and of containers likely to hold the content.
+_NEGATIVE_RE = re.compile(
+    r"advert|\bads?\b|banner|breadcrumb|combx|comment|community|cookie|consent|"
+    r"disqus|footer|gdpr|menu|modal|nav|newsletter|outbrain|pager|pagination|"
+    r"popup|promo|related|remark|rss|share|shoutbox|sidebar|skyscraper|social|"
+    r"sponsor|subscribe|taboola|tags|tool|widget",
+    re.IGNORECASE,
+)
+_POSITIVE_RE = re.compile(
+    r"article|body|content|entry|hentry|h-entry|main|page|post|text|blog|story",
+    re.IGNORECASE,
+)
+_REMOVED_TAGS = tuple(
+    "script style noscript template iframe button nav footer aside svg canvas "
+    "select input dialog".split()
+)
+_PARAGRAPH_TAGS = frozenset(("p", "pre", "td", "blockquote", "li", "dd"))
+_BLOCK_CHILD_TAGS = frozenset(
+    "a blockquote dl div img ol p pre table ul section article figure".split()
+)
+_TAG_WEIGHTS = {
+    **dict.fromkeys(("article", "main"), 10),
+    **dict.fromkeys(("section", "div"), 5),
+    **dict.fromkeys(("pre", "td", "blockquote"), 3),
+    **dict.fromkeys(("address", "ol", "ul", "dl", "dd", "dt", "li", "form"), -3),
+    **dict.fromkeys(("h1", "h2", "h3", "h4", "h5", "h6", "th"), -5),
+}
+_PRUNABLE_TAGS = ("div", "section", "ul", "ol", "table", "header", "dl")
+
+# Paragraphs shorter than this many characters do not vote for their container.
+MIN_PARAGRAPH_LENGTH = 25
+
+
+def _class_weight(element) -> int:
+    weight = 0
+    for value in (element.get("class"), element.get("id")):
+        if value:
+            if _NEGATIVE_RE.search(value):
+                weight -= 25
+            if _POSITIVE_RE.search(value):
+                weight += 25
+    return weight
+
+
+def _text_length(element) -> int:
+    return len(" ".join(element.text_content().split()))
+
+
+def link_density(element) -> float:
+    """The share of an element's text that sits inside links."""
+    text_length = _text_length(element)
+    if not text_length:
+        return 0.0
+    link_length = sum(_text_length(link) for link in element.iter("a"))
+    return min(1.0, link_length / text_length)
+
+
+def _is_unlikely(element) -> bool:
+    if element.tag in ("html", "body", "article", "main", "a"):
+        return False
+    signature = f"{element.get('class') or ''} {element.get('id') or ''}"
+    if element.get("role") in ("navigation", "banner", "contentinfo", "dialog"):
+        return True
+    if element.get("aria-hidden") == "true" or element.get("hidden") is not None:
+        return True
+    return bool(_NEGATIVE_RE.search(signature)) and not _POSITIVE_RE.search(signature)
+
+
+def _strip_boilerplate(body):
+    etree.strip_elements(body, *_REMOVED_TAGS, with_tail=False)
+    for comment in body.xpath("//comment()"):
+        comment.drop_tree()
+    for element in list(body.iter(etree.Element)):
+        if element.getparent() is not None and _is_unlikely(element):
+            element.drop_tree()
+
+
+def _score(body) -> Dict:
+    scores = {}
+
+    def initial(element):
+        if element not in scores:
+            scores[element] = _TAG_WEIGHTS.get(element.tag, 0) + _class_weight(
+                element
+            )
+        return scores[element]
+
+    for element in body.iter(etree.Element):
+        if element.tag == "div" and not any(
+            child.tag in _BLOCK_CHILD_TAGS for child in element
+        ):
+            is_paragraph = True
+        else:
+            is_paragraph = element.tag in _PARAGRAPH_TAGS
+        if not is_paragraph:
+            continue
+
+        text = " ".join(element.text_content().split())
+        if len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+        points = 1 + text.count(",") + min(len(text) // 100, 3)
+
+        parent = element.getparent()
+        if parent is None:
+            continue
+        initial(parent)
+        scores[parent] += points
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            initial(grandparent)
+            scores[grandparent] += points / 2
+
+    return {
+        element: score * (1 - link_density(element))
+        for element, score in scores.items()
+    }
+
+
+def _is_content_paragraph(paragraph) -> bool:
+    text_length = _text_length(paragraph)
+    density = link_density(paragraph)
+    if text_length > 80:
+        return density < 0.25
+    return text_length > 0 and density == 0 and "." in paragraph.text_content()
+
+
+def _prune(content, link_density_threshold: float):
+    for element in list(content.iter(*_PRUNABLE_TAGS)):
+        if element is content or element.getparent() is None:
+            continue
+        text_length = _text_length(element)
+        density = link_density(element)
+        if density > link_density_threshold and text_length < 1000:
+            element.drop_tree()
+        elif _class_weight(element) < 0 and text_length < 200:
+            element.drop_tree()
+
+
+def extract_main_content(
+    html: Union[str, HtmlDocument],
+    min_text_length: int = 250,
+    link_density_threshold: float = 0.5,
+) -> Optional[str]:
+    """
+    Extracts the main content of a page, readability-style.
+
+    Page chrome (scripts, navigation, footers, cookie banners, share and
+    related-article rails) is removed, text blocks vote for their containers
+    with a density score, the best container is kept together with its
+    relevant siblings, and link-heavy blocks left inside it are pruned.
+
+    Args:
+        html: The page HTML, or the page already parsed as an HtmlDocument.
+        min_text_length (int): Below this many characters of extracted text the
+            extraction is considered failed.
+        link_density_threshold (float): Blocks whose text is more than this share
+            of link text are pruned from the content.
+
+    Returns:
+        Optional[str]: The HTML of the main content, with the page title, or
+        None when no content could be identified with confidence.
+    """
+    document = html if isinstance(html, HtmlDocument) else HtmlDocument(html)
+    if document.body is None:
+        return None
+
+    body = copy.deepcopy(document.body)
+    _strip_boilerplate(body)
+
+    scores = _score(body)
+    if scores:
+        top = max(scores, key=scores.get)
+        threshold = max(10.0, scores[top] * 0.2)
+        parent = top.getparent()
+        siblings = [top] if parent is None else list(parent)
+        content = lxml.html.Element("div")
+        for sibling in siblings:
+            if not isinstance(sibling.tag, str):
+                continue
+            keep = sibling is top or scores.get(sibling, 0) >= threshold
+            if not keep and sibling.tag == "p":
+                keep = _is_content_paragraph(sibling)
+            if keep:
+                kept = copy.deepcopy(sibling)
+                kept.tail = None
+                content.append(kept)
+    else:
+        content = body
+
+    _prune(content, link_density_threshold)
+    if _text_length(content) < min_text_length:
+        return None
+
+    body_html = lxml.html.tostring(content, encoding="unicode", with_tail=False)
+    title = lxml.html.Element("title")
+    title.text = document.title
+    title_html = lxml.html.tostring(title, encoding="unicode")
+    return f"<html><head>{title_html}</head><body>{body_html}</body></html>"
@@ -0,0 +1,317 @@
+"""
+Module for the process-wide executors running the per-chunk chains of the map phases
+"""
+
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor, wait
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from .deadline import DeadlineExceeded, check_deadline, remaining_time
+from .fetch_scheduler import parse_retry_after
+from .logging import get_logger
+
+logger = get_logger("map-executor")
+
+# Statuses providers answer when they want the client to slow down.
+THROTTLE_STATUSES = (429, 503, 529)
+_THROTTLE_MARKERS = ("rate limit", "ratelimit", "too many requests", "overloaded")
+_TRANSIENT_ERROR_NAMES = (
+    "APIConnectionError",
+    "APITimeoutError",
+    "ConnectError",
+    "ConnectionError",
+    "InternalServerError",
+    "ReadTimeout",
+    "ServiceUnavailableError",
+    "Timeout",
+    "TimeoutError",
+)
+
+
+def _status_of(exc: BaseException) -> Optional[int]:
+    for source in (exc, getattr(exc, "response", None)):
+        status = getattr(source, "status_code", None) or getattr(source, "status", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """Whether a provider error asks the client to slow down (429, 529, overloaded)."""
+    if _status_of(exc) in THROTTLE_STATUSES:
+        return True
+    name = type(exc).__name__.lower()
+    if "ratelimit" in name or "overloaded" in name:
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in _THROTTLE_MARKERS)
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether a failed call is worth retrying: throttling, 5xx, timeouts, resets."""
+    if is_throttle_error(exc):
+        return True
+    status = _status_of(exc)
+    if status is not None and status >= 500:
+        return True
+    return any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+def retry_after_of(exc: BaseException) -> Optional[float]:
+    """The delay a throttled response asks for in its Retry-After header, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return parse_retry_after(headers.get("retry-after"))
+    except AttributeError:
+        return None
+
+
+class MapExecutor:
+    """
+    Runs the chains of a map phase (one per chunk) concurrently, under a
+    concurrency limit that adapts to the provider.
+
+    The limit follows AIMD: every success raises it by ``1 / limit`` (one
+    slot per round of calls) up to ``max_concurrency``, and a throttling
+    error (429, 529, "overloaded") halves it, at most once per backoff
+    window, down to ``min_concurrency``. Calls failing with a transient
+    error are retried on their own after a jittered exponential backoff
+    (or the Retry-After the provider sent), so one chunk does not fail the
+    whole map.
+
+    There is one executor per provider and model (see ``get_map_executor``),
+    shared by every node and graph calling it, so a throttled provider slows
+    down its own calls only.
+
+    Attributes:
+        max_concurrency: Upper bound for the calls in flight.
+        min_concurrency: Lower bound the limit shrinks to.
+        max_retries: Retries of a chunk after its first transient failure.
+        backoff_base: First backoff delay in seconds.
+        max_backoff: Upper bound for any backoff, Retry-After included.
+        limit: The current concurrency limit.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self._condition = threading.Condition()
+        self._active = 0
+        self._last_decrease = 0.0
+        self.limit = float(max_concurrency)
+        self.configure(
+            max_concurrency=max_concurrency,
+            min_concurrency=min_concurrency,
+            max_retries=max_retries,
+            backoff_base=backoff_base,
+            max_backoff=max_backoff,
+        )
+
+    def configure(
+        self,
+        max_concurrency: Optional[int] = None,
+        min_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        max_backoff: Optional[float] = None,
+    ):
+        """
+        Updates the limits; the current concurrency limit is kept within them.
+
+        Args:
+            max_concurrency: Upper bound for the calls in flight.
+            min_concurrency: Lower bound the limit shrinks to.
+            max_retries: Retries of a chunk after its first transient failure.
+            backoff_base: First backoff delay in seconds.
+            max_backoff: Upper bound for any backoff.
+
+        Raises:
+            ValueError: If a concurrency bound is below 1 or the bounds are inverted.
+        """
+        with self._condition:
+            if max_concurrency is not None:
+                if max_concurrency < 1:
+                    raise ValueError("max_concurrency must be greater than 0.")
+                self.max_concurrency = max_concurrency
+            if min_concurrency is not None:
+                if min_concurrency < 1:
+                    raise ValueError("min_concurrency must be greater than 0.")
+                self.min_concurrency = min_concurrency
+            if self.min_concurrency > self.max_concurrency:
+                raise ValueError("min_concurrency must not exceed max_concurrency.")
+            if max_retries is not None:
+                self.max_retries = max_retries
+            if backoff_base is not None:
+                self.backoff_base = backoff_base
+            if max_backoff is not None:
+                self.max_backoff = max_backoff
+            self.limit = min(
+                max(self.limit, self.min_concurrency), self.max_concurrency
+            )
+            self._condition.notify_all()
+
+    def _acquire(self):
+        with self._condition:
+            while self._active >= int(self.limit):
+                self._condition.wait()
+            self._active += 1
+
+    def _release(self, succeeded: bool):
+        with self._condition:
+            self._active -= 1
+            if succeeded:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def _throttled(self):
+        """Halves the limit, once per backoff window however many calls failed."""
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease < self.backoff_base:
+                return
+            self._last_decrease = now
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            logger.info(f"Provider throttled; concurrency lowered to {self.limit:g}")
+
+    def _backoff(self, attempt: int, exc: BaseException) -> float:
+        retry_after = retry_after_of(exc)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        # Full jitter spreads the retries of the chunks throttled together.
+        return random.uniform(0, min(self.max_backoff, self.backoff_base * 2**attempt))
+
+    def _run(
+        self, name: str, chain: Runnable, inputs: Any, stop: threading.Event
+    ) -> Any:
+        attempt = 0
+        while True:
+            if stop.is_set():
+                raise CancelledError(f"{name} was cancelled")
+            check_deadline(name)
+            self._acquire()
+            try:
+                result = chain.invoke(inputs)
+            except Exception as exc:
+                self._release(succeeded=False)
+                if attempt >= self.max_retries or not is_transient_error(exc):
+                    raise
+                if is_throttle_error(exc):
+                    self._throttled()
+                delay = self._backoff(attempt, exc)
+                remaining = remaining_time()
+                if remaining is not None and delay >= remaining:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"{name} failed ({type(exc).__name__}: {exc}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f} seconds"
+                )
+                # A map already decided by another chunk wakes it up at once.
+                stop.wait(delay)
+                continue
+            self._release(succeeded=True)
+            return result
+
+    def map(self, chains: Mapping[str, Runnable], inputs: Any) -> Dict[str, Any]:
+        """
+        Invokes every chain with the same inputs.
+
+        Args:
+            chains: The chains by result key, e.g. ``{"chunk1": ..., "chunk2": ...}``.
+            inputs: The input of every chain.
+
+        Returns:
+            Dict[str, Any]: The result of each chain, under its key.
+
+        Raises:
+            Exception: The error of the first chain that failed for good.
+            DeadlineExceeded: If the current deadline passed first.
+
+        Either error is raised at once: the chains not started yet are
+        cancelled, and those in flight are abandoned and not retried.
+        """
+        if not chains:
+            return {}
+        workers = min(len(chains), self.max_concurrency)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        stop = threading.Event()
+        try:
+            # Each call keeps the caller's context, hence its LangChain callbacks.
+            futures = {
+                pool.submit(
+                    contextvars.copy_context().run, self._run, name, chain, inputs, stop
+                ): name
+                for name, chain in chains.items()
+            }
+            done, pending = wait(
+                futures, timeout=remaining_time(), return_when="FIRST_EXCEPTION"
+            )
+            failed = [future for future in done if future.exception() is not None]
+            if failed:
+                raise failed[0].exception()
+            if pending:
+                raise DeadlineExceeded(
+                    f"{len(pending)} of {len(futures)} chunks were not answered in time"
+                )
+        finally:
+            # Once the result is decided the calls in flight are not waited
+            # for; they end with their client timeout and are not retried.
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+        return {futures[future]: future.result() for future in futures}
+
+    def parallel(self, chains: Mapping[str, Runnable]) -> Runnable:
+        """
+        Wraps ``map`` over the given chains as a runnable, a drop-in
+        replacement for ``RunnableParallel(**chains)``.
+        """
+        return RunnableLambda(lambda inputs: self.map(chains, inputs))
+
+
+_executors: Dict[Tuple[str, str], MapExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor_key(llm_model) -> Tuple[str, str]:
+    if llm_model is None:
+        return "", ""
+    # The admission limiter knows the configured provider and model names.
+    limiter = getattr(llm_model, "rate_limiter", None)
+    provider = getattr(limiter, "provider", None) or type(llm_model).__name__
+    model = (
+        getattr(limiter, "model", None)
+        or getattr(llm_model, "model_name", None)
+        or getattr(llm_model, "model", None)
+        or ""
+    )
+    return str(provider), str(model)
+
+
+def get_map_executor(llm_model=None) -> MapExecutor:
+    """
+    Returns the process-wide map executor of the provider and model of a chat
+    model, creating it on first use.
+
+    Args:
+        llm_model: The chat model the chains call; None for a default executor.
+
+    Returns:
+        MapExecutor: The executor shared by every caller of that model.
+    """
+    key = _executor_key(llm_model)
+    with _executors_lock:
+        if key not in _executors:
+            _executors[key] = MapExecutor()
+        return _executors[key]
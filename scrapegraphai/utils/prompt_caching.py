@@ -0,0 +1,113 @@
+"""
+Module for assembling prompts so that providers can cache their stable prefix
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from langchain_core.messages import HumanMessage
+from langchain_core.prompt_values import ChatPromptValue
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+# Template variables whose value is the same for every call of a node run.
+STABLE_VARIABLES = frozenset({"format_instructions"})
+
+# Template variables holding the scraped document.
+DOCUMENT_VARIABLES = frozenset({"content", "context", "website_content"})
+
+_VARIABLE_RE = re.compile(r"(?<!\{)\{([A-Za-z_][A-Za-z0-9_]*)\}(?!\})")
+
+
+def needs_cache_control(llm_model) -> bool:
+    """
+    Whether the model's provider only caches prompt prefixes marked with a
+    cache-control block (Anthropic models, also through Bedrock). OpenAI,
+    DeepSeek, Gemini and others cache any repeated prefix on their own.
+    """
+    name = type(llm_model).__name__
+    if name in ("ChatAnthropic", "ChatAnthropicVertex"):
+        return True
+    if name == "ChatBedrock":
+        model_id = str(getattr(llm_model, "model_id", "") or "")
+        return "anthropic" in model_id or "claude" in model_id
+    return False
+
+
+def split_template(template: str) -> List[str]:
+    """
+    Cuts a template where its cacheable prefixes end: before the first
+    variable that changes between calls, and after the document when the
+    question follows it.
+
+    Args:
+        template (str): The prompt template.
+
+    Returns:
+        List[str]: The consecutive pieces of the template.
+    """
+    variables = [
+        match
+        for match in _VARIABLE_RE.finditer(template)
+        if match.group(1) not in STABLE_VARIABLES
+    ]
+    cuts = [variables[0].start()] if variables else []
+    for match in variables[:-1]:
+        if match.group(1) in DOCUMENT_VARIABLES:
+            cuts.append(match.end())
+            break
+    bounds = [0, *cuts, len(template)]
+    return [
+        template[start:end]
+        for start, end in zip(bounds, bounds[1:])
+        if template[start:end]
+    ]
+
+
+def build_prompt(
+    template: str,
+    input_variables: List[str],
+    partial_variables: Optional[Dict] = None,
+    cache_control: bool = False,
+):
+    """
+    Builds the prompt of a chain from one of the answer templates.
+
+    Without cache control this is the plain PromptTemplate. With it, the
+    prompt is one human message made of the template pieces returned by
+    ``split_template``, each but the last carrying an ephemeral
+    ``cache_control`` marker, so the instructions (and the document, when
+    several questions are asked about it) are read from the provider cache.
+
+    Args:
+        template (str): The prompt template.
+        input_variables (List[str]): The variables given at invocation.
+        partial_variables (dict): The variables bound now.
+        cache_control (bool): Whether to mark the cacheable prefixes.
+
+    Returns:
+        A runnable turning the chain input into the prompt.
+    """
+    partial_variables = partial_variables or {}
+    prompt = PromptTemplate(
+        template=template,
+        input_variables=input_variables,
+        partial_variables=partial_variables,
+    )
+    pieces = split_template(template)
+    if not cache_control or len(pieces) < 2:
+        return prompt
+
+    templates = [
+        PromptTemplate.from_template(piece, partial_variables=partial_variables)
+        for piece in pieces
+    ]
+
+    def to_messages(inputs: dict) -> ChatPromptValue:
+        texts = [piece.format(**inputs) for piece in templates]
+        blocks = [{"type": "text", "text": text} for text in texts if text]
+        for block in blocks[:-1]:
+            block["cache_control"] = {"type": "ephemeral"}
+        return ChatPromptValue(messages=[HumanMessage(content=blocks)])
+
+    return RunnableLambda(to_messages)
@@ -3,16 +3,19 @@ research_web module for web searching across different search engines with impro
 error handling, validation, and security features.
 """
 
+import asyncio
 import random
 import re
 import time
 from functools import wraps
 from typing import Dict, List, Optional, Union
 
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field, validator
 
+from .http_client import get_http_client
+
 
 class ResearchWebError(Exception):
     """Base exception for research web errors."""
@@ -235,9 +238,9 @@ def search_on_web(
 
         return filter_pdf_links(results)
 
-    except requests.Timeout:
+    except (TimeoutError, asyncio.TimeoutError):
         raise TimeoutError(f"Search request timed out after {timeout} seconds")
-    except requests.RequestException as e:
+    except aiohttp.ClientError as e:
         raise SearchRequestError(f"Search request failed: {str(e)}")
     except ValueError as e:
         raise SearchConfigError(f"Invalid search configuration: {str(e)}")
@@ -301,14 +304,12 @@ def _search_bing(
 
     params = {"q": query, "count": max_results}
 
-    proxies = {"http": proxy, "https": proxy} if proxy else None
-
     try:
-        response = requests.get(
+        response = get_http_client().get_sync(
             "https://www.bing.com/search",
             params=params,
             headers=headers,
-            proxies=proxies,
+            proxy=proxy,
             timeout=timeout,
         )
         response.raise_for_status()
@@ -355,7 +356,7 @@ def _search_searxng(query: str, max_results: int, port: int, timeout: int) -> Li
     }
 
     try:
-        response = requests.get(
+        response = get_http_client().get_sync(
             f"http://localhost:{port}/search",
             params=params,
             headers=headers,
@@ -393,11 +394,12 @@ def _search_serper(
     data = {"q": query, "num": max_results}
 
     try:
-        response = requests.post(
+        response = get_http_client().post_sync(
             "https://google.serper.dev/search",
             json=data,
             headers=headers,
             timeout=timeout,
+            schedule=False,
         )
         response.raise_for_status()
 
@@ -0,0 +1,251 @@
+"""
+Module for fetching, caching and evaluating robots.txt files
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from ..helpers import robots_dictionary
+from .http_client import get_http_client
+from .logging import get_logger
+
+logger = get_logger("robots-cache")
+
+DEFAULT_ROBOTS_TTL = 24 * 60 * 60
+# Unreachable hosts (network errors, 5xx) disallow everything, so they are
+# asked again after a few minutes rather than after a day.
+UNREACHABLE_ROBOTS_TTL = 5 * 60
+
+
+def get_robots_agents(model_name: str) -> List[str]:
+    """
+    Returns the user agents robots.txt rules are evaluated for, given a model name.
+
+    The model name is looked up in ``robots_dictionary``, first exactly and then
+    by its longest matching prefix (e.g. 'claude-3-5-sonnet' uses 'claude');
+    unknown models are evaluated under their own name.
+
+    Args:
+        model_name (str): The model name, optionally prefixed by its provider.
+
+    Returns:
+        List[str]: The user agents.
+    """
+    model = model_name.split("/")[-1]
+    agents = robots_dictionary.get(model)
+    if agents is None:
+        prefixes = [key for key in robots_dictionary if model.startswith(key)]
+        if prefixes:
+            agents = robots_dictionary[max(prefixes, key=len)]
+    if agents is None:
+        agents = model
+    return [agents] if isinstance(agents, str) else list(agents)
+
+
+@dataclass
+class RobotsRules:
+    """
+    The parsed robots.txt of a host.
+
+    Attributes:
+        robots_url: The URL the rules were fetched from.
+        status: The HTTP status of the fetch, None when the host was unreachable.
+        body: The robots.txt content.
+        fetched_at: Unix timestamp of the fetch.
+    """
+
+    robots_url: str
+    status: Optional[int]
+    body: str
+    fetched_at: float
+
+    def __post_init__(self):
+        self._parser = RobotFileParser(self.robots_url)
+        # RFC 9309: unavailable (4xx) files allow everything, unreachable (5xx or
+        # network errors) ones disallow everything; 401/403 are treated as
+        # unreachable like urllib.robotparser does.
+        if self.status is None or self.status in (401, 403) or self.status >= 500:
+            self._parser.disallow_all = True
+        elif self.status >= 400:
+            self._parser.allow_all = True
+        else:
+            self._parser.parse(self.body.splitlines())
+
+    @property
+    def unreachable(self) -> bool:
+        """Whether the fetch failed transiently (network error or 5xx)."""
+        return self.status is None or self.status >= 500
+
+    def can_fetch(self, url: str, agents: Sequence[str]) -> bool:
+        """Whether every one of ``agents`` may fetch ``url``."""
+        return all(self._parser.can_fetch(agent, url) for agent in agents)
+
+    def crawl_delay(self, agents: Sequence[str]) -> Optional[float]:
+        """The largest crawl delay requested for ``agents``, if any."""
+        delays = []
+        for agent in agents:
+            delay = self._parser.crawl_delay(agent)
+            if delay is None:
+                rate = self._parser.request_rate(agent)
+                if rate is not None and rate.requests:
+                    delay = rate.seconds / rate.requests
+            if delay is not None:
+                delays.append(float(delay))
+        return max(delays) if delays else None
+
+
+class RobotsCache:
+    """
+    Per-host cache of robots.txt rules, kept in memory and optionally on disk.
+
+    Rules of unreachable hosts are kept in memory only, for ``retry_ttl``, so a
+    transient failure does not block a host for the whole TTL.
+
+    Attributes:
+        cache_dir: Directory holding the on-disk entries, None for memory only.
+        ttl: Seconds after which a host's robots.txt is fetched again.
+        retry_ttl: Seconds after which an unreachable host is asked again.
+        timeout: Timeout in seconds for robots.txt requests.
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        ttl: float = DEFAULT_ROBOTS_TTL,
+        timeout: Optional[float] = 30,
+        retry_ttl: float = UNREACHABLE_ROBOTS_TTL,
+    ):
+        self.cache_dir = os.path.join(cache_path, "robots") if cache_path else None
+        self.ttl = ttl
+        self.retry_ttl = retry_ttl
+        self.timeout = timeout
+        self._rules: Dict[str, RobotsRules] = {}
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def robots_url(url: str) -> str:
+        """Returns the robots.txt URL governing ``url``."""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+    def _disk_path(self, robots_url: str) -> str:
+        key = hashlib.sha256(robots_url.lower().encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _is_fresh(self, rules: RobotsRules) -> bool:
+        ttl = min(self.ttl, self.retry_ttl) if rules.unreachable else self.ttl
+        return time.time() - rules.fetched_at < ttl
+
+    def _read_disk(self, robots_url: str) -> Optional[RobotsRules]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(robots_url), encoding="utf-8") as f:
+                entry = json.load(f)
+            return RobotsRules(
+                robots_url, entry["status"], entry["body"], entry["fetched_at"]
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_disk(self, rules: RobotsRules):
+        if not self.cache_dir or rules.unreachable:
+            return
+        path = self._disk_path(rules.robots_url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "status": rules.status,
+                    "body": rules.body,
+                    "fetched_at": rules.fetched_at,
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+
+    def _fetch(self, robots_url: str) -> RobotsRules:
+        try:
+            response = get_http_client().get_sync(robots_url, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Could not fetch {robots_url}: {e}")
+            return RobotsRules(robots_url, None, "", time.time())
+        body = response.text if response.status < 400 else ""
+        return RobotsRules(robots_url, response.status, body, time.time())
+
+    def get_rules(self, url: str) -> RobotsRules:
+        """
+        Returns the robots.txt rules governing ``url``, fetching them when the
+        cached copy is missing or older than the TTL.
+
+        Args:
+            url (str): Any URL of the host.
+
+        Returns:
+            RobotsRules: The parsed rules.
+        """
+        robots_url = self.robots_url(url)
+        with self._lock:
+            rules = self._rules.get(robots_url)
+        if rules is not None and self._is_fresh(rules):
+            return rules
+
+        rules = self._read_disk(robots_url)
+        if rules is None or not self._is_fresh(rules):
+            rules = self._fetch(robots_url)
+            self._write_disk(rules)
+
+        with self._lock:
+            self._rules[robots_url] = rules
+        return rules
+
+    def can_fetch(
+        self, url: str, agents: Union[str, Sequence[str]]
+    ) -> Tuple[bool, RobotsRules]:
+        """
+        Checks whether ``url`` may be fetched by every one of ``agents``.
+
+        Args:
+            url (str): The URL to check.
+            agents: A user agent or a list of user agents.
+
+        Returns:
+            Tuple[bool, RobotsRules]: The verdict and the rules it was based on.
+        """
+        if isinstance(agents, str):
+            agents = [agents]
+        rules = self.get_rules(url)
+        return rules.can_fetch(url, agents), rules
+
+
+_caches: Dict[Tuple[Optional[str], float], RobotsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_robots_cache(
+    cache_path: Optional[str] = None, ttl: float = DEFAULT_ROBOTS_TTL
+) -> RobotsCache:
+    """
+    Returns the process-wide robots cache for a cache directory and TTL.
+
+    Args:
+        cache_path (str): The configured cache root; None keeps entries in memory only.
+        ttl (float): Seconds after which a host's robots.txt is fetched again.
+
+    Returns:
+        RobotsCache: The shared cache.
+    """
+    key = (str(cache_path) if cache_path else None, ttl)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = RobotsCache(key[0], ttl=ttl)
+        return _caches[key]
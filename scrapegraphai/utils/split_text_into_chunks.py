@@ -2,38 +2,127 @@
 split_text_into_chunks module
 """
 
+import re
+from bisect import bisect_left, bisect_right
 from typing import List
 
-from .tokenizer import num_tokens_calculus
+from .tokenizer import get_token_counter
 
+# Places a chunk may end, best first: before a Markdown heading, after a blank
+# line, after a line, after a sentence, after a word. Each position is where
+# the next chunk starts.
+_BOUNDARY_PATTERNS = (
+    re.compile(r"^#{1,6}\s", re.MULTILINE),
+    re.compile(r"\n[ \t]*\n\s*"),
+    re.compile(r"\n\s*"),
+    re.compile(r"[.!?…][\"')\]]*\s+"),
+    re.compile(r"\s+"),
+)
 
-def split_text_into_chunks(text: str, chunk_size: int, use_semchunk=True) -> List[str]:
+# A chunk cut on a boundary keeps at least this share of the token budget, so
+# an early heading does not leave a tiny chunk behind.
+MIN_CHUNK_FILL = 0.5
+
+
+def _boundary_positions(text: str, pattern: re.Pattern) -> List[int]:
+    if pattern.pattern.startswith("^"):
+        return [match.start() for match in pattern.finditer(text)]
+    return [match.end() for match in pattern.finditer(text)]
+
+
+def split_text_by_token_offsets(
+    text: str, offsets: List[int], chunk_size: int
+) -> List[str]:
+    """
+    Splits a text already encoded once into chunks of at most ``chunk_size``
+    tokens, cutting on the best boundary found in the last half of each
+    chunk's budget (heading, paragraph, line, sentence, then word).
+
+    Args:
+        text (str): The text to split.
+        offsets (List[int]): The character offset at which each token starts.
+        chunk_size (int): The maximum number of tokens per chunk.
+
+    Returns:
+        List[str]: The chunks, stripped of surrounding whitespace.
+    """
+    if len(offsets) <= chunk_size:
+        return [text.strip()] if text.strip() else []
+
+    boundaries = [_boundary_positions(text, pattern) for pattern in _BOUNDARY_PATTERNS]
+    min_fill = max(1, int(chunk_size * MIN_CHUNK_FILL))
+    chunks = []
+    start = 0
+    while start < len(offsets):
+        end = start + chunk_size
+        if end >= len(offsets):
+            cut, next_start = len(text), len(offsets)
+        else:
+            lower, limit = offsets[start + min_fill], offsets[end]
+            cut = limit
+            for positions in boundaries:
+                index = bisect_right(positions, limit) - 1
+                if index >= 0 and positions[index] >= lower:
+                    cut = positions[index]
+                    break
+            # A heading ending the chunk moves on with the section it titles.
+            headings = boundaries[0]
+            index = bisect_left(headings, cut) - 1
+            if index >= 0 and headings[index] > offsets[start]:
+                if "\n" not in text[headings[index] : cut].rstrip():
+                    cut = headings[index]
+            # The chunk ends with the last token starting before the cut.
+            next_start = bisect_left(offsets, cut, start + 1, end)
+            cut = offsets[next_start]
+
+        chunk = text[offsets[start] : cut].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = next_start
+    return chunks
+
+
+def split_text_into_chunks(
+    text: str,
+    chunk_size: int,
+    use_semchunk=True,
+    llm_model=None,
+    single_encode: bool = True,
+) -> List[str]:
     """
     Splits the text into chunks based on the number of tokens.
 
     Args:
         text (str): The text to split.
         chunk_size (int): The maximum number of tokens per chunk.
+        llm_model: The chat model whose tokenizer counts the tokens; None
+            counts with the gpt-4o encoding.
+        single_encode (bool): Whether the text is encoded once and cut on the
+            token offsets, when the model's tokenizer reports them; otherwise
+            semchunk re-counts candidate pieces.
 
     Returns:
         List[str]: A list of text chunks.
     """
 
+    counter = get_token_counter(llm_model)
+
     if use_semchunk:
-        from semchunk import chunk
+        chunk_size = min(chunk_size, int(chunk_size * 0.9))
 
-        def count_tokens(text):
-            return num_tokens_calculus(text)
+        if single_encode and hasattr(counter, "token_offsets"):
+            offsets = counter.token_offsets(text)
+            return split_text_by_token_offsets(text, offsets, chunk_size)
 
-        chunk_size = min(chunk_size, int(chunk_size * 0.9))
+        from semchunk import chunk
 
         chunks = chunk(
-            text=text, chunk_size=chunk_size, token_counter=count_tokens, memoize=False
+            text=text, chunk_size=chunk_size, token_counter=counter.count, memoize=False
         )
         return chunks
 
     else:
-        tokens = num_tokens_calculus(text)
+        tokens = counter.count(text)
 
         if tokens <= chunk_size:
             return [text]
@@ -43,8 +132,7 @@ def split_text_into_chunks(text: str, chunk_size: int, use_semchunk=True) -> Lis
         current_length = 0
 
         words = text.split()
-        for word in words:
-            word_tokens = num_tokens_calculus(word)
+        for word, word_tokens in zip(words, counter.count_many(words)):
             if current_length + word_tokens > chunk_size:
                 chunks.append(" ".join(current_chunk))
                 current_chunk = [word]
@@ -0,0 +1,56 @@
+"""
+Module for driving step generators, so one piece of logic serves both the
+synchronous and the asynchronous code paths
+"""
+
+from typing import Any, Awaitable, Callable, Generator
+
+
+def drive_steps(steps: Generator, call: Callable[..., Any]) -> Any:
+    """
+    Runs a step generator to completion: each value it yields is a tuple of
+    arguments for ``call``, whose result is sent back, or whose exception is
+    thrown back, into the generator.
+
+    Args:
+        steps: The generator; its return value is the result.
+        call: Performs one step.
+
+    Returns:
+        The value returned by the generator.
+    """
+    try:
+        step = next(steps)
+        while True:
+            try:
+                outcome = call(*step)
+            except Exception as e:
+                step = steps.throw(e)
+            else:
+                step = steps.send(outcome)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def adrive_steps(steps: Generator, call: Callable[..., Awaitable[Any]]) -> Any:
+    """
+    Runs a step generator to completion like ``drive_steps``, awaiting each step.
+
+    Args:
+        steps: The generator; its return value is the result.
+        call: Performs one step asynchronously.
+
+    Returns:
+        The value returned by the generator.
+    """
+    try:
+        step = next(steps)
+        while True:
+            try:
+                outcome = await call(*step)
+            except Exception as e:
+                step = steps.throw(e)
+            else:
+                step = steps.send(outcome)
+    except StopIteration as stop:
+        return stop.value
@@ -0,0 +1,327 @@
+"""
+Module for reading the structured data pages embed for machines (JSON-LD,
+microdata, OpenGraph, framework payloads) and mapping it onto a pydantic schema
+"""
+
+import json
+import re
+import types
+import typing
+from typing import Any, Dict, Iterator, List, Optional, Type, Union
+
+from lxml import etree
+from pydantic import BaseModel, ValidationError
+
+from .html_document import HtmlDocument
+
+_JSON_SCRIPT_TYPES = ("application/json", "application/ld+json")
+_STATE_ASSIGNMENT_RE = re.compile(
+    r"window\.(__[A-Z_]+__)\s*=\s*(\{.*\})\s*;?\s*$", re.DOTALL
+)
+_META_PREFIXES = ("og:", "product:", "article:", "twitter:")
+_KEY_RE = re.compile(r"[^a-z0-9]")
+
+# Schema field names and the names the usual vocabularies (schema.org,
+# OpenGraph) give the same value.
+_SYNONYMS = {
+    "title": ("name", "headline"),
+    "name": ("title", "headline"),
+    "headline": ("name", "title"),
+    "image": ("imageurl", "thumbnailurl"),
+    "imageurl": ("image", "thumbnailurl"),
+    "price": ("priceamount", "lowprice"),
+    "currency": ("pricecurrency",),
+    "rating": ("ratingvalue",),
+    "author": ("creator",),
+    "date": ("datepublished",),
+    "publisheddate": ("datepublished",),
+    "link": ("url",),
+}
+
+# Nested objects are searched this deep for candidates and field values.
+MAX_DEPTH = 6
+
+
+def _parse_json(text: Optional[str]) -> Any:
+    if not text or not text.strip():
+        return None
+    try:
+        return json.loads(text.strip().rstrip(";"), strict=False)
+    except ValueError:
+        return None
+
+
+def _json_ld_items(data: Any) -> Iterator[dict]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_items(item)
+    elif isinstance(data, dict):
+        graph = data.get("@graph")
+        if isinstance(graph, list):
+            yield from _json_ld_items(graph)
+            data = {key: value for key, value in data.items() if key != "@graph"}
+            if len(data) <= 1:
+                return
+        yield data
+
+
+def _property_value(element) -> Any:
+    if element.get("itemscope") is not None:
+        return _microdata_item(element)
+    for attribute in ("content", "datetime", "value"):
+        if element.get(attribute) is not None:
+            return element.get(attribute).strip()
+    if element.tag in ("a", "link", "area") and element.get("href"):
+        return element.get("href")
+    if element.tag in ("img", "audio", "video", "source", "iframe", "embed"):
+        if element.get("src"):
+            return element.get("src")
+    return " ".join(element.text_content().split())
+
+
+def _collect_properties(element, item: dict):
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+        names = (child.get("itemprop") or "").split()
+        if names:
+            value = _property_value(child)
+            for name in names:
+                if name in item:
+                    if not isinstance(item[name], list):
+                        item[name] = [item[name]]
+                    item[name].append(value)
+                else:
+                    item[name] = value
+        if child.get("itemscope") is None:
+            _collect_properties(child, item)
+
+
+def _microdata_item(element) -> dict:
+    item = {}
+    item_type = element.get("itemtype")
+    if item_type:
+        item["@type"] = item_type.rstrip("/").rsplit("/", 1)[-1]
+    _collect_properties(element, item)
+    return item
+
+
+def extract_structured_data(
+    html: Union[str, HtmlDocument],
+) -> Dict[str, List[dict]]:
+    """
+    Extracts the machine-readable data embedded in a page.
+
+    Args:
+        html: The page HTML, or the page already parsed as an HtmlDocument.
+
+    Returns:
+        Dict[str, List[dict]]: The objects found, by origin: 'json_ld' (with
+        ``@graph`` lists flattened), 'microdata' (one dict per top-level
+        itemscope), 'opengraph' (one dict of the og:, product:, article: and
+        twitter: meta properties, prefix removed for og:) and 'embedded'
+        (JSON script payloads such as ``__NEXT_DATA__`` and
+        ``window.__INITIAL_STATE__`` assignments).
+    """
+    document = html if isinstance(html, HtmlDocument) else HtmlDocument(html)
+    found = {"json_ld": [], "microdata": [], "opengraph": [], "embedded": []}
+    if document.root is None:
+        return found
+
+    opengraph = {}
+    for element in document.root.iter(etree.Element):
+        tag = element.tag
+        if tag == "script":
+            script_type = (element.get("type") or "").split(";")[0].strip().lower()
+            if script_type == "application/ld+json":
+                found["json_ld"].extend(_json_ld_items(_parse_json(element.text)))
+            elif script_type in _JSON_SCRIPT_TYPES:
+                data = _parse_json(element.text)
+                if isinstance(data, dict):
+                    found["embedded"].append(data)
+            elif element.text and "window.__" in element.text:
+                match = _STATE_ASSIGNMENT_RE.search(element.text.strip())
+                data = _parse_json(match.group(2)) if match else None
+                if isinstance(data, dict):
+                    found["embedded"].append(data)
+        elif tag == "meta":
+            key = element.get("property") or element.get("name") or ""
+            content = element.get("content")
+            if content is not None and key.startswith(_META_PREFIXES):
+                key = key[3:] if key.startswith("og:") else key
+                opengraph.setdefault(key, content.strip())
+        elif element.get("itemscope") is not None and element.get("itemprop") is None:
+            found["microdata"].append(_microdata_item(element))
+
+    if opengraph:
+        found["opengraph"].append(opengraph)
+    return found
+
+
+def _normalize(key: str) -> str:
+    return _KEY_RE.sub("", key.lower())
+
+
+def _candidates(value: Any, depth: int = 0) -> Iterator[dict]:
+    """Every object in the data, outermost first."""
+    if depth > MAX_DEPTH:
+        return
+    if isinstance(value, dict):
+        yield value
+        for child in value.values():
+            yield from _candidates(child, depth + 1)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _candidates(child, depth + 1)
+
+
+def _index(obj: dict) -> Dict[str, Any]:
+    """The values of an object by normalized key, nested objects' keys included."""
+    index = {}
+    pending = [(obj, 0)]
+    while pending:
+        current, depth = pending.pop(0)
+        for key, value in current.items():
+            # "product:price:amount" is also found as "priceamount".
+            for name in (_normalize(key), _normalize(key.split(":", 1)[-1])):
+                if name and name not in index:
+                    index[name] = value
+            if depth < 2:
+                for child in value if isinstance(value, list) else [value]:
+                    if isinstance(child, dict):
+                        pending.append((child, depth + 1))
+    return index
+
+
+def _unwrap_optional(annotation):
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _model_of(annotation) -> Optional[Type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _list_item(annotation):
+    if typing.get_origin(annotation) in (list, List):
+        args = typing.get_args(annotation)
+        return args[0] if args else Any
+    return None
+
+
+def _scalar(value: Any) -> Any:
+    """Reduces schema.org style values (``{"@type": "Brand", "name": ...}``) to text."""
+    if isinstance(value, dict):
+        for key in ("name", "@value", "url", "value", "text"):
+            if key in value and not isinstance(value[key], (dict, list)):
+                return value[key]
+        return value
+    if isinstance(value, list):
+        return _scalar(value[0]) if value else None
+    return value
+
+
+def _coerce(value: Any, annotation) -> Any:
+    annotation = _unwrap_optional(annotation)
+    model = _model_of(annotation)
+    if model is not None:
+        if isinstance(value, list) and value:
+            value = value[0]
+        return _map_object(value, model) if isinstance(value, dict) else None
+
+    item_annotation = _list_item(annotation)
+    if item_annotation is not None:
+        values = value if isinstance(value, list) else [value]
+        coerced = [_coerce(item, item_annotation) for item in values]
+        return [item for item in coerced if item is not None]
+
+    value = _scalar(value)
+    if annotation is str and isinstance(value, (int, float)):
+        return str(value)
+    return value
+
+
+def _map_object(obj: dict, model: Type[BaseModel]) -> Optional[dict]:
+    """The fields of ``model`` found in ``obj``; None if a required one is missing."""
+    index = _index(obj)
+    mapped = {}
+    for name, field in model.model_fields.items():
+        keys = [_normalize(name)]
+        if field.alias:
+            keys.append(_normalize(field.alias))
+        keys.extend(_SYNONYMS.get(keys[0], ()))
+        value = next((index[key] for key in keys if key in index), None)
+        if value is not None:
+            value = _coerce(value, field.annotation)
+        if value is None or value == []:
+            if field.is_required():
+                return None
+            continue
+        mapped[field.alias or name] = value
+    return mapped or None
+
+
+def _validate(data: dict, schema: Type[BaseModel]) -> Optional[BaseModel]:
+    try:
+        return schema.model_validate(data)
+    except ValidationError:
+        return None
+
+
+def map_to_schema(
+    data: Dict[str, List[dict]], schema: Type[BaseModel]
+) -> Optional[BaseModel]:
+    """
+    Fills a pydantic schema from the structured data of a page.
+
+    Every object found in the data (nested ones included) is tried as the
+    source of the schema; the one filling the most fields wins. A schema
+    holding a list of models (``products: List[Product]``) is filled with
+    every object that validates as an item.
+
+    Field names are matched case- and punctuation-insensitively, also
+    against a few common vocabulary synonyms (``title`` for ``name``,
+    ``price`` for ``lowPrice``...), and against the keys of nested objects
+    (``offers.price``).
+
+    Args:
+        data: The output of ``extract_structured_data``.
+        schema: The pydantic model to fill.
+
+    Returns:
+        Optional[BaseModel]: The validated schema instance, or None when the
+        data does not provide every required field.
+    """
+    objects = [obj for values in data.values() for obj in values]
+    candidates = [candidate for obj in objects for candidate in _candidates(obj)]
+
+    best, best_size = None, 0
+    for candidate in candidates:
+        mapped = _map_object(candidate, schema)
+        if mapped and len(mapped) > best_size:
+            instance = _validate(mapped, schema)
+            if instance is not None:
+                best, best_size = instance, len(mapped)
+    if best is not None:
+        return best
+
+    # Listing pages: a wrapper schema whose fields are lists of models.
+    collected = {}
+    for name, field in schema.model_fields.items():
+        item_model = _model_of(_list_item(_unwrap_optional(field.annotation)))
+        if item_model is None:
+            continue
+        items = []
+        for candidate in candidates:
+            mapped = _map_object(candidate, item_model)
+            if mapped and _validate(mapped, item_model) is not None:
+                if mapped not in items:
+                    items.append(mapped)
+        if items:
+            collected[field.alias or name] = items
+    return _validate(collected, schema) if collected else None
@@ -2,15 +2,176 @@
 Module for counting tokens and splitting text into chunks
 """
 
-from .tokenizers.tokenizer_openai import num_tokens_openai
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Tuple
 
+from .logging import get_logger
+from .tokenizers.encoding_cache import cached_file, default_cache_dir
+from .tokenizers.tokenizer_mistral import MistralCounter
+from .tokenizers.tokenizer_ollama import OllamaCounter
+from .tokenizers.tokenizer_openai import TiktokenCounter
 
-def num_tokens_calculus(string: str) -> int:
+logger = get_logger(__name__)
+
+
+class TokenCounter(Protocol):
+    """Counts the tokens of texts for one model."""
+
+    def count(self, text: str) -> int: ...
+
+    def count_many(self, texts: Iterable[str]) -> List[int]: ...
+
+
+def _tiktoken_counter(model_name: Optional[str], llm_model) -> TokenCounter:
+    return TiktokenCounter(model_name)
+
+
+def _mistral_counter(model_name: Optional[str], llm_model) -> TokenCounter:
+    try:
+        return MistralCounter(model_name)
+    except ImportError:
+        logger.warning(
+            "mistral_common is not installed, Mistral token counts are estimated "
+            "with tiktoken. Install it with 'pip install mistral-common'."
+        )
+        return TiktokenCounter()
+
+
+def _ollama_counter(model_name: Optional[str], llm_model) -> TokenCounter:
+    return OllamaCounter(llm_model)
+
+
+# Tokenizer families by name; a factory receives the model name and the model.
+_factories: Dict[str, Callable[[Optional[str], object], TokenCounter]] = {
+    "tiktoken": _tiktoken_counter,
+    "mistral": _mistral_counter,
+    "ollama": _ollama_counter,
+}
+# Model class names mapped to the tokenizer family counting for them; the
+# other models (Anthropic, Bedrock, Groq...) are estimated with tiktoken.
+_families_by_model_class = {
+    "ChatOpenAI": "tiktoken",
+    "AzureChatOpenAI": "tiktoken",
+    "ChatMistralAI": "mistral",
+    "ChatOllama": "ollama",
+    "OllamaLLM": "ollama",
+}
+_counters: Dict[Tuple[str, Optional[str]], TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def register_tokenizer(
+    family: str,
+    factory: Callable[[Optional[str], object], TokenCounter],
+    model_classes: Iterable[str] = (),
+):
+    """
+    Registers a tokenizer family, replacing any family of that name.
+
+    Args:
+        family (str): The family name, e.g. 'tiktoken'.
+        factory: A callable taking the model name and the model instance and
+            returning the counter; it is called once per model name.
+        model_classes: Class names of the chat models counted with this family.
+    """
+    with _counters_lock:
+        _factories[family] = factory
+        for model_class in model_classes:
+            _families_by_model_class[model_class] = family
+        for key in [key for key in _counters if key[0] == family]:
+            del _counters[key]
+
+
+def _family_of(llm_model) -> Tuple[str, Optional[str]]:
+    class_name = type(llm_model).__name__
+    if class_name not in _families_by_model_class:
+        # Other providers' model names mean nothing to tiktoken.
+        return "tiktoken", None
+    model_name = getattr(llm_model, "model_name", None) or getattr(
+        llm_model, "model", None
+    )
+    family = _families_by_model_class[class_name]
+    return family, model_name if isinstance(model_name, str) else None
+
+
+def get_token_counter(llm_model=None) -> TokenCounter:
+    """
+    Returns the shared token counter of a model.
+
+    OpenAI models use their tiktoken encoding, Mistral models the
+    mistral_common tokenizer and Ollama models their own counting; other
+    models, and no model at all, are estimated with the gpt-4o encoding.
+    Counters (and the encoders they load) are built once per model name.
+
+    Args:
+        llm_model: The graph's chat model, or None.
+
+    Returns:
+        TokenCounter: The counter.
+    """
+    key = _family_of(llm_model)
+    counter = _counters.get(key)
+    if counter is None:
+        with _counters_lock:
+            counter = _counters.get(key)
+            if counter is None:
+                counter = _counters[key] = _factories[key[0]](key[1], llm_model)
+    return counter
+
+
+def num_tokens_calculus(string: str, llm_model=None) -> int:
     """
     Returns the number of tokens in a text string.
     """
 
-    num_tokens_fn = num_tokens_openai
+    return get_token_counter(llm_model).count(string)
 
-    num_tokens = num_tokens_fn(string)
-    return num_tokens
+
+def count_many(texts: Iterable[str], llm_model=None) -> List[int]:
+    """
+    Returns the number of tokens of each text, counted in one batch.
+    """
+
+    return get_token_counter(llm_model).count_many(texts)
+
+
+def warmup(llm_models: Iterable = (None,), offline: bool = False) -> Dict[str, float]:
+    """
+    Loads the tokenizers of the given models now, typically at process start,
+    so the first graph run does not pay for loading (or downloading) them.
+
+    Args:
+        llm_models: The chat models whose tokenizers are loaded; None stands for
+            the default gpt-4o encoding.
+        offline (bool): Fail at once when a tiktoken encoding is not in the local
+            cache instead of downloading it; see
+            ``python -m scrapegraphai.utils.tokenizers.encoding_cache``.
+
+    Returns:
+        Dict[str, float]: The seconds spent loading each tokenizer, by family and
+        model name.
+
+    Raises:
+        FileNotFoundError: If ``offline`` and an encoding file is not cached.
+    """
+    timings = {}
+    for llm_model in llm_models:
+        counter = get_token_counter(llm_model)
+        label = ":".join(filter(None, _family_of(llm_model)))
+        if offline and isinstance(counter, TiktokenCounter):
+            cache_dir = os.environ.get("TIKTOKEN_CACHE_DIR") or default_cache_dir()
+            path = cached_file(counter.encoding_name, cache_dir)
+            if not os.path.exists(path):
+                raise FileNotFoundError(
+                    f"The {counter.encoding_name} encoding is not cached in "
+                    f"{cache_dir}. Run 'python -m "
+                    "scrapegraphai.utils.tokenizers.encoding_cache download' "
+                    "where the network is available, or 'install' a copied file."
+                )
+        start = time.perf_counter()
+        counter.count("warm up")
+        timings[label] = time.perf_counter() - start
+        logger.info(f"Loaded the {label} tokenizer in {timings[label]:.2f}s")
+    return timings
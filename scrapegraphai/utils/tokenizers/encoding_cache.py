@@ -0,0 +1,156 @@
+"""
+Local cache of the tiktoken encoding files, so token counting works offline
+
+tiktoken downloads its BPE files on first use and keeps them in
+``TIKTOKEN_CACHE_DIR``. This module points that directory at a persistent
+location and fills it ahead of time, from the network or from copied files:
+
+    python -m scrapegraphai.utils.tokenizers.encoding_cache download --dir DIR
+    python -m scrapegraphai.utils.tokenizers.encoding_cache install o200k_base FILE
+    python -m scrapegraphai.utils.tokenizers.encoding_cache list
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+from typing import Dict, Iterable, Optional
+
+# Set to a directory to use it as the encoding cache in every process.
+CACHE_DIR_ENV = "SCRAPEGRAPHAI_TOKENIZER_CACHE"
+
+ENCODING_URLS = {
+    name: f"https://openaipublic.blob.core.windows.net/encodings/{name}.tiktoken"
+    for name in ("o200k_base", "cl100k_base", "p50k_base", "r50k_base")
+}
+# gpt-4o and newer models, then gpt-4 and gpt-3.5.
+DEFAULT_ENCODINGS = ("o200k_base", "cl100k_base")
+
+
+def default_cache_dir() -> str:
+    """``$SCRAPEGRAPHAI_TOKENIZER_CACHE``, else a directory in the user cache."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "scrapegraphai", "tiktoken")
+
+
+def configure_encoding_cache(cache_dir: Optional[str] = None) -> str:
+    """
+    Makes tiktoken read and store its encoding files in ``cache_dir``.
+
+    Args:
+        cache_dir (str): The directory; defaults to ``default_cache_dir()``.
+
+    Returns:
+        str: The directory in use.
+    """
+    cache_dir = os.path.abspath(os.path.expanduser(cache_dir or default_cache_dir()))
+    os.environ["TIKTOKEN_CACHE_DIR"] = cache_dir
+    return cache_dir
+
+
+def apply_env_cache_dir():
+    """Applies ``$SCRAPEGRAPHAI_TOKENIZER_CACHE`` unless tiktoken's own is set."""
+    if os.environ.get(CACHE_DIR_ENV) and "TIKTOKEN_CACHE_DIR" not in os.environ:
+        configure_encoding_cache(os.environ[CACHE_DIR_ENV])
+
+
+def cached_file(name: str, cache_dir: str) -> str:
+    """The path tiktoken reads the file of encoding ``name`` from in ``cache_dir``."""
+    if name not in ENCODING_URLS:
+        raise ValueError(
+            f"Unknown encoding: {name}. "
+            f"Available encodings: {', '.join(sorted(ENCODING_URLS))}."
+        )
+    cache_key = hashlib.sha1(ENCODING_URLS[name].encode()).hexdigest()
+    return os.path.join(cache_dir, cache_key)
+
+
+def cached_encodings(cache_dir: Optional[str] = None) -> Dict[str, bool]:
+    """Whether the file of each known encoding is present in the cache."""
+    cache_dir = cache_dir or os.environ.get("TIKTOKEN_CACHE_DIR") or default_cache_dir()
+    return {
+        name: os.path.exists(cached_file(name, cache_dir)) for name in ENCODING_URLS
+    }
+
+
+def download_encodings(
+    names: Iterable[str] = DEFAULT_ENCODINGS, cache_dir: Optional[str] = None
+) -> str:
+    """
+    Downloads encoding files into the cache and makes tiktoken use it.
+
+    Args:
+        names: The encodings to download.
+        cache_dir (str): The cache directory; defaults to ``default_cache_dir()``.
+
+    Returns:
+        str: The cache directory.
+    """
+    import tiktoken
+
+    cache_dir = configure_encoding_cache(cache_dir)
+    for name in names:
+        cached_file(name, cache_dir)
+        tiktoken.get_encoding(name)
+    return cache_dir
+
+
+def install_encoding(name: str, path: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Copies an encoding file obtained elsewhere (e.g. ``o200k_base.tiktoken``
+    carried to an air-gapped machine) into the cache.
+
+    Args:
+        name (str): The encoding name.
+        path (str): The encoding file.
+        cache_dir (str): The cache directory; defaults to ``default_cache_dir()``.
+
+    Returns:
+        str: The path of the cached file.
+    """
+    cache_dir = configure_encoding_cache(cache_dir)
+    target = cached_file(name, cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    shutil.copyfile(path, target)
+    return target
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m scrapegraphai.utils.tokenizers.encoding_cache",
+        description="Manage the local cache of tiktoken encoding files.",
+    )
+    parser.add_argument(
+        "--dir",
+        default=None,
+        help=f"cache directory (default: ${CACHE_DIR_ENV} or ~/.cache/scrapegraphai)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    download = commands.add_parser("download", help="download encodings")
+    download.add_argument("encodings", nargs="*", default=list(DEFAULT_ENCODINGS))
+    install = commands.add_parser("install", help="install a copied encoding file")
+    install.add_argument("encoding")
+    install.add_argument("file")
+    commands.add_parser("list", help="show which encodings are cached")
+    args = parser.parse_args(argv)
+
+    cache_dir = args.dir or default_cache_dir()
+    if args.command == "download":
+        download_encodings(args.encodings, cache_dir)
+        print(f"Downloaded {', '.join(args.encodings)} to {cache_dir}")
+    elif args.command == "install":
+        print(install_encoding(args.encoding, args.file, cache_dir))
+    else:
+        for name, present in cached_encodings(cache_dir).items():
+            print(f"{name:<12} {'cached' if present else 'missing'}")
+        print(f"(cache directory: {cache_dir})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,61 @@
 Tokenization utilities for Mistral models
 """
 
+from functools import lru_cache
+from typing import Iterable, List
+
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from ..logging import get_logger
 
 
+@lru_cache(maxsize=None)
+def get_mistral_tokenizer(model: str):
+    """
+    Returns the tokenizer of a Mistral model, built once per process.
+
+    Args:
+        model (str): The Mistral model name.
+
+    Raises:
+        ImportError: If mistral_common is not installed.
+    """
+    try:
+        from mistral_common.tokens.tokenizers.mistral import MistralTokenizer
+    except ImportError:
+        raise ImportError(
+            "mistral_common is not installed. Please install it using 'pip install mistral-common'."
+        )
+
+    return MistralTokenizer.from_model(model)
+
+
+class MistralCounter:
+    """Counts tokens with the tokenizer of a Mistral model."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.tokenizer = get_mistral_tokenizer(model)
+
+    def count(self, text: str) -> int:
+        from mistral_common.protocol.instruct.messages import UserMessage
+        from mistral_common.protocol.instruct.request import ChatCompletionRequest
+
+        tokenized = self.tokenizer.encode_chat_completion(
+            ChatCompletionRequest(
+                tools=[],
+                messages=[
+                    UserMessage(content=text),
+                ],
+                model=self.model,
+            )
+        )
+        return len(tokenized.tokens)
+
+    def count_many(self, texts: Iterable[str]) -> List[int]:
+        return [self.count(text) for text in texts]
+
+
 def num_tokens_mistral(text: str, llm_model: BaseChatModel) -> int:
     """
     Estimate the number of tokens in a given text using Mistral's tokenization method,
@@ -31,25 +81,4 @@ def num_tokens_mistral(text: str, llm_model: BaseChatModel) -> int:
             "does not give us a model name so we cannot identify which encoding to use"
         )
 
-    try:
-        from mistral_common.protocol.instruct.messages import UserMessage
-        from mistral_common.protocol.instruct.request import ChatCompletionRequest
-        from mistral_common.tokens.tokenizers.mistral import MistralTokenizer
-    except ImportError:
-        raise ImportError(
-            "mistral_common is not installed. Please install it using 'pip install mistral-common'."
-        )
-
-    tokenizer = MistralTokenizer.from_model(model)
-
-    tokenized = tokenizer.encode_chat_completion(
-        ChatCompletionRequest(
-            tools=[],
-            messages=[
-                UserMessage(content=text),
-            ],
-            model=model,
-        )
-    )
-    tokens = tokenized.tokens
-    return len(tokens)
+    return MistralCounter(model).count(text)
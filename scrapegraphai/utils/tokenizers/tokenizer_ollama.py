@@ -2,11 +2,27 @@
 Tokenization utilities for Ollama models
 """
 
+from typing import Iterable, List
+
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from ..logging import get_logger
 
 
+class OllamaCounter:
+    """Counts tokens with the model's own ``get_num_tokens``."""
+
+    def __init__(self, llm_model: BaseChatModel):
+        self.llm_model = llm_model
+
+    def count(self, text: str) -> int:
+        # NB: https://github.com/ollama/ollama/issues/1716#issuecomment-2074265507
+        return self.llm_model.get_num_tokens(text)
+
+    def count_many(self, texts: Iterable[str]) -> List[int]:
+        return [self.count(text) for text in texts]
+
+
 def num_tokens_ollama(text: str, llm_model: BaseChatModel) -> int:
     """
     Estimate the number of tokens in a given text using Ollama's tokenization method,
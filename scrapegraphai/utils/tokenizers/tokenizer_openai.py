@@ -2,9 +2,68 @@
 Tokenization utilities for OpenAI models
 """
 
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
 import tiktoken
+from tiktoken.model import encoding_name_for_model
 
 from ..logging import get_logger
+from .encoding_cache import apply_env_cache_dir
+
+DEFAULT_ENCODING_MODEL = "gpt-4o"
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model_name: Optional[str] = None) -> tiktoken.Encoding:
+    """
+    Returns the tiktoken encoding of a model, loaded once per process.
+
+    Args:
+        model_name (str): The OpenAI model name; models tiktoken does not know
+            use the encoding of gpt-4o.
+
+    Returns:
+        tiktoken.Encoding: The encoding.
+    """
+    apply_env_cache_dir()
+    return tiktoken.get_encoding(get_encoding_name(model_name))
+
+
+def get_encoding_name(model_name: Optional[str] = None) -> str:
+    """The name of a model's tiktoken encoding, without loading it."""
+    try:
+        return encoding_name_for_model(model_name or DEFAULT_ENCODING_MODEL)
+    except KeyError:
+        return encoding_name_for_model(DEFAULT_ENCODING_MODEL)
+
+
+class TiktokenCounter:
+    """Counts tokens with the tiktoken encoding of an OpenAI model."""
+
+    def __init__(self, model_name: Optional[str] = None):
+        self.model_name = model_name
+
+    @property
+    def encoding_name(self) -> str:
+        return get_encoding_name(self.model_name)
+
+    @property
+    def encoding(self) -> tiktoken.Encoding:
+        return get_encoding(self.model_name)
+
+    def count(self, text: str) -> int:
+        # Special tokens in scraped pages are counted as text, not rejected.
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def count_many(self, texts: Iterable[str]) -> List[int]:
+        encoded = self.encoding.encode_batch(list(texts), disallowed_special=())
+        return [len(tokens) for tokens in encoded]
+
+    def token_offsets(self, text: str) -> List[int]:
+        """The character offset at which each token of the text starts."""
+        tokens = self.encoding.encode(text, disallowed_special=())
+        return self.encoding.decode_with_offsets(tokens)[1]
 
 
 def num_tokens_openai(text: str) -> int:
@@ -23,7 +82,7 @@ def num_tokens_openai(text: str) -> int:
 
     logger.debug(f"Counting tokens for text of {len(text)} characters")
 
-    encoding = tiktoken.encoding_for_model("gpt-4o")
+    encoding = get_encoding(DEFAULT_ENCODING_MODEL)
 
     num_tokens = len(encoding.encode(text))
     return num_tokens
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from langchain_aws import ChatBedrock
@@ -280,6 +280,35 @@ class TestAbstractGraph:
             assert result == "Async result"
             mock_run.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_arun_awaits_the_graph_with_the_run_hooks(self):
+        class HookGraph(TestGraph):
+            run = AbstractGraph.run
+
+            def _run_result(self):
+                return self.final_state["parsed_doc"]
+
+        graph = HookGraph(
+            "Test prompt",
+            {
+                "llm": {
+                    "model": "openai/gpt-3.5-turbo",
+                    "openai_api_key": "sk-randomtest001",
+                }
+            },
+        )
+        graph.input_key, graph.source = "url", "https://example.com"
+        final_state = ({"parsed_doc": "Async result"}, [])
+
+        with patch.object(
+            graph.graph, "aexecute", AsyncMock(return_value=final_state)
+        ) as mock_aexecute:
+            assert await graph.arun() == "Async result"
+
+        mock_aexecute.assert_awaited_once_with(
+            {"user_prompt": "Test prompt", "url": "https://example.com"}
+        )
+
     def test_create_llm_with_custom_model_instance(self):
         """
         Test that the _create_llm method correctly uses a custom model instance
@@ -369,3 +398,88 @@ class TestAbstractGraph:
         graph.execution_info = dummy_info
         info = graph.get_execution_info()
         assert info == dummy_info
+
+
+def test_main_content_node_is_inserted_after_fetch():
+    from scrapegraphai.graphs import SmartScraperGraph
+
+    graph = SmartScraperGraph(
+        prompt="List the products",
+        source="https://example.com",
+        config={
+            "llm": {"model": "openai/gpt-4o-mini", "api_key": "sk-test"},
+            "main_content": {"min_text_length": 100},
+        },
+    )
+
+    names = [node.node_name for node in graph.graph.nodes]
+    assert names[:3] == ["Fetch", "MainContent", "ParseNode"]
+    assert graph.graph.edges["Fetch"] == "MainContent"
+    assert graph.graph.edges["MainContent"] == "ParseNode"
+    assert graph.graph.nodes[0].defer_markdown is True
+    assert graph.graph.nodes[1].min_text_length == 100
+
+
+def test_llm_cache_is_attached_to_the_model(tmp_path):
+    from scrapegraphai.utils.llm_cache import SQLiteLLMCache
+
+    graph = TestGraph(
+        "dummy",
+        {
+            "llm": {"model": "openai/gpt-4o-mini", "api_key": "sk-test"},
+            "cache_path": str(tmp_path),
+            "llm_cache": {"ttl": 60},
+        },
+    )
+
+    assert isinstance(graph.llm_model.cache, SQLiteLLMCache)
+    assert graph.llm_model.cache.path == str(tmp_path / "llm_cache.sqlite")
+    assert graph.llm_model.cache.ttl == 60
+
+
+def test_rate_limit_budget_is_shared_across_graphs():
+    from scrapegraphai.utils.llm_scheduler import AdmissionLimiter, get_llm_scheduler
+
+    llm_config = {
+        "model": "openai/gpt-4o-mini",
+        "api_key": "sk-test",
+        "rate_limit": {"requests_per_minute": 500, "tokens_per_minute": 200000},
+    }
+    first = TestGraph("dummy", {"llm": dict(llm_config)})
+    second = TestGraph("dummy", {"llm": dict(llm_config)})
+
+    for graph in (first, second):
+        assert isinstance(graph.llm_model.rate_limiter, AdmissionLimiter)
+        assert graph.llm_model.rate_limiter.tracker in graph.llm_model.callbacks
+        assert graph.llm_model.rate_limiter.model == "gpt-4o-mini"
+    assert get_llm_scheduler().limits("openai", "gpt-4o-mini") == {
+        "requests_per_minute": 500,
+        "tokens_per_minute": 200000,
+        "burst_seconds": 1.0,
+    }
+
+
+def test_graphs_configured_alike_share_the_llm_client():
+    from scrapegraphai.utils.llm_clients import clear_llm_clients
+
+    clear_llm_clients()
+    llm_config = {"model": "openai/gpt-4o-mini", "api_key": "sk-test"}
+
+    first = TestGraph("dummy", {"llm": dict(llm_config)})
+    second = TestGraph("dummy", {"llm": dict(llm_config)})
+    other = TestGraph("dummy", {"llm": {**llm_config, "temperature": 0}})
+    unshared = TestGraph("dummy", {"llm": dict(llm_config), "share_llm_client": False})
+
+    assert first.llm_model is second.llm_model
+    assert first.model_token == second.model_token
+    assert other.llm_model is not first.llm_model
+    assert unshared.llm_model is not first.llm_model
+
+
+def test_ollama_clients_are_not_shared():
+    llm_config = {"model": "ollama/llama3"}
+
+    first = TestGraph("dummy", {"llm": dict(llm_config)})
+    second = TestGraph("dummy", {"llm": dict(llm_config)})
+
+    assert first.llm_model is not second.llm_model
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from scrapegraphai.graphs import BaseGraph
+from scrapegraphai.nodes import GraphIteratorNode
+from scrapegraphai.nodes.base_node import BaseNode
+from scrapegraphai.utils.deadline import DeadlineExceeded
+
+"""
+Tests for the async execution of graphs and nodes.
+"""
+
+
+class SyncNode(BaseNode):
+    def __init__(self, name):
+        super().__init__(name, "node", "question", ["answer"], 1, {})
+        self.thread = None
+
+    def execute(self, state):
+        self.thread = threading.current_thread()
+        state.setdefault("order", []).append(self.node_name)
+        return state
+
+
+class AsyncNode(SyncNode):
+    async def aexecute(self, state):
+        self.thread = threading.current_thread()
+        state.setdefault("order", []).append(self.node_name)
+        state["answer"] = await self.ainvoke_chain(
+            RunnableLambda(lambda inputs: inputs["question"].upper()), state
+        )
+        return state
+
+
+class SlowNode(SyncNode):
+    async def aexecute(self, state):
+        async def sleep(inputs):
+            await asyncio.sleep(5)
+
+        await self.ainvoke_chain(RunnableLambda(lambda inputs: None, afunc=sleep), {})
+        return state
+
+
+class WaitingNode(SyncNode):
+    async def aexecute(self, state):
+        await asyncio.sleep(0.05)
+        return state
+
+
+class FakeGraph:
+    """Stands in for a scraper graph run by GraphIteratorNode."""
+
+    def __init__(self, prompt, source, config, schema=None):
+        self.prompt = prompt
+        self.source = source
+        self.config = dict(config)
+
+    async def arun(self):
+        await asyncio.sleep(0.01)
+        return f"{self.prompt} {self.source}"
+
+
+def two_node_graph(first, second):
+    return BaseGraph(nodes=[first, second], edges=[(first, second)], entry_point=first)
+
+
+@pytest.mark.asyncio
+async def test_aexecute_awaits_native_nodes_and_threads_the_others():
+    native, fallback = AsyncNode("Native"), SyncNode("Fallback")
+    graph = two_node_graph(native, fallback)
+
+    state, exec_info = await graph.aexecute({"question": "what?"})
+
+    assert state["order"] == ["Native", "Fallback"]
+    assert state["answer"] == "WHAT?"
+    assert native.thread is threading.current_thread()
+    assert fallback.thread is not threading.current_thread()
+    assert exec_info[-1]["node_name"] == "TOTAL RESULT"
+
+
+@pytest.mark.asyncio
+async def test_aexecute_stops_at_the_deadline():
+    slow, never = SlowNode("Slow"), SyncNode("Never")
+    graph = two_node_graph(slow, never)
+    graph.deadline = 0.2
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        await graph.aexecute({"question": "?"})
+
+    assert time.monotonic() - start < 1
+    assert never.thread is None
+
+
+def test_graph_iterator_runs_sub_graphs_from_sync_code():
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={"graph_instance": FakeGraph, "scraper_config": {}},
+    )
+
+    state = node.execute({"user_prompt": "find", "urls": ["a", "b"]})
+
+    assert state["results"] == ["find a", "find b"]
+
+
+@pytest.mark.asyncio
+async def test_graph_iterator_execute_inside_a_running_loop():
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={"graph_instance": FakeGraph, "scraper_config": {}},
+    )
+
+    # Sync callers inside an event loop, e.g. a notebook, used to fail.
+    state = node.execute({"user_prompt": "find", "urls": ["a"]})
+    assert state["results"] == ["find a"]
+
+    state = await node.aexecute({"user_prompt": "find", "urls": ["a", "b"]})
+    assert state["results"] == ["find a", "find b"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_graphs_each_get_their_usage_metrics():
+    nodes = [WaitingNode("First"), WaitingNode("Second")]
+    graphs = [BaseGraph(nodes=[node], edges=[], entry_point=node) for node in nodes]
+
+    # A process-wide lock held across the await left one graph without metrics.
+    results = await asyncio.gather(
+        *(graph.aexecute({"question": "?"}) for graph in graphs)
+    )
+
+    for node, (_, exec_info) in zip(nodes, results):
+        assert [info["node_name"] for info in exec_info] == [
+            node.node_name,
+            "TOTAL RESULT",
+        ]
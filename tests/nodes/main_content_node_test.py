@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import pytest
+from langchain_core.documents import Document
+
+from scrapegraphai.nodes import FetchNode, MainContentNode
+
+PARAGRAPH = (
+    "Structured extraction works best on the text of the page itself, without "
+    "its menus, footers, banners, and lists of related articles. "
+)
+PAGE = f"""
+<html><head><title>Article</title></head><body>
+  <nav>{"".join(f'<a href="/{i}">Section {i}</a>' for i in range(40))}</nav>
+  <main><h1>Article</h1><p>{PARAGRAPH}</p><p>{PARAGRAPH * 3}</p></main>
+  <footer>{"".join(f'<a href="/f{i}">Footer link {i}</a>' for i in range(40))}</footer>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def count_words():
+    # Token counting needs the tiktoken encodings; words are enough here.
+    with patch(
+        "scrapegraphai.nodes.main_content_node.num_tokens_calculus",
+        side_effect=lambda text, llm_model=None: len(text.split()),
+    ):
+        yield
+
+
+def test_main_content_replaces_the_page_and_reports_tokens():
+    node = MainContentNode(input="doc", output=["doc"])
+
+    state = node.execute({"doc": [Document(page_content=PAGE)]})
+
+    document = state["doc"][0]
+    assert "Section 1" not in document.page_content
+    assert "Footer link" not in document.page_content
+    assert "Structured extraction" in document.page_content
+    assert document.metadata["main_content"] is True
+    metrics = node.execution_metrics
+    assert metrics["tokens_after"] < metrics["tokens_before"] / 2
+
+
+def test_pending_markdown_conversion_happens_after_the_extraction():
+    fetch_node = FetchNode(
+        input="url | local_dir",
+        output=["doc"],
+        node_config={"force": True, "defer_markdown": True},
+    )
+    state = fetch_node.execute({"local_dir": PAGE})
+    assert state["doc"][0].metadata["markdown_pending"] is True
+    assert state["doc"][0].page_content == PAGE
+
+    node = MainContentNode(input="doc", output=["doc"])
+    document = node.execute(state)["doc"][0]
+
+    assert document.page_content.startswith("# Article")
+    assert "markdown_pending" not in document.metadata
+    assert "Section 1" not in document.page_content
+
+
+def test_pages_without_clear_content_are_kept_whole():
+    node = MainContentNode(input="doc", output=["doc"])
+    page = "<html><body><p>Too short.</p></body></html>"
+
+    document = node.execute({"doc": [Document(page_content=page)]})["doc"][0]
+
+    assert document.page_content == page
+    assert document.metadata["main_content"] is False
+    assert node.execution_metrics["tokens_before"] == node.execution_metrics[
+        "tokens_after"
+    ]
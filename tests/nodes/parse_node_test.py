@@ -0,0 +1,71 @@
+import pytest
+from langchain_community.document_transformers import Html2TextTransformer
+from langchain_core.documents import Document
+
+from scrapegraphai.nodes import ParseNode
+from scrapegraphai.utils.html_to_text import html_to_text
+
+
+@pytest.fixture(autouse=True)
+def whole_text_chunks(mocker):
+    mocker.patch(
+        "scrapegraphai.nodes.parse_node.split_text_into_chunks",
+        side_effect=lambda text, chunk_size, **kwargs: [text],
+    )
+
+
+def make_node(**config):
+    return ParseNode(
+        input="doc & (url | local_dir)",
+        output=["parsed_doc", "link_urls", "img_urls"],
+        node_config={"chunk_size": 4096, "llm_model": None, **config},
+    )
+
+
+def test_parse_collects_urls_from_tags():
+    html = (
+        "<html><body><p>Intro</p>"
+        '<a href="/docs">Docs</a><img src="/logo.png">'
+        "</body></html>"
+    )
+    state = make_node(parse_urls=True).execute(
+        {"doc": [Document(page_content=html)], "url": "https://example.com/"}
+    )
+
+    assert "Intro" in state["parsed_doc"][0]
+    assert state["link_urls"] == ["https://example.com/docs"]
+    assert state["img_urls"] == ["https://example.com/logo.png"]
+
+
+def test_parse_falls_back_to_text_urls_for_markdown_input():
+    markdown = "See [the docs](https://example.com/docs) for more."
+    state = make_node(parse_urls=True).execute(
+        {"doc": [Document(page_content=markdown)], "url": "https://example.com/"}
+    )
+
+    assert any(url.endswith("/docs") for url in state["link_urls"])
+
+
+def test_fused_conversion_matches_regex_url_recovery():
+    items = "".join(
+        f'<li><a href="/product/{i}?ref=list">Product {i} with a long name</a>'
+        f'<img src="/img/p{i}.jpg"><span>{i}.99</span></li>'
+        for i in range(300)
+    )
+    html = f"<html><body><ul>{items}</ul></body></html>"
+    source = "https://shop.example.com/"
+    node = make_node(parse_urls=True)
+
+    doc = Html2TextTransformer(ignore_links=False).transform_documents(
+        [Document(page_content=html)]
+    )[0]
+    regex_links, regex_images = node._extract_urls(doc.page_content, source)
+    text, links, images = html_to_text(html, source)
+
+    assert text == doc.page_content
+    assert sorted(links) == sorted(regex_links)
+    # Images left out of the text are still collected from their tags.
+    assert set(regex_images) <= set(images)
+    assert sorted(images) == sorted(
+        f"https://shop.example.com/img/p{i}.jpg" for i in range(300)
+    )
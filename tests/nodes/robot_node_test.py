@@ -80,5 +80,32 @@ def test_robots_node_force_scrapable(robots_node):
     assert result == ("is_scrapable", "no")
 
 
+def test_robots_node_uses_parser_without_llm(mocker, mock_llm_model):
+    from scrapegraphai.utils.http_client import HttpResponse
+
+    client = mocker.patch("scrapegraphai.utils.robots_cache.get_http_client")
+    client.return_value.get_sync.return_value = HttpResponse(
+        url="https://robots-node.example/robots.txt",
+        status=200,
+        content=b"User-agent: *\nDisallow: /private/\nCrawl-delay: 1",
+    )
+    scheduler = mocker.patch("scrapegraphai.nodes.robots_node.get_fetch_scheduler")
+    node = RobotsNode(
+        input="url",
+        output=["is_scrapable"],
+        node_config={"llm_model": mock_llm_model, "robots_ttl": 0},
+    )
+
+    state = node.execute({"url": "https://robots-node.example/public"})
+    assert state["is_scrapable"] == "yes"
+    scheduler.return_value.set_crawl_delay.assert_called_with(
+        "https://robots-node.example/public", 1.0
+    )
+
+    with pytest.raises(ValueError):
+        node.execute({"url": "https://robots-node.example/private/page"})
+    mock_llm_model.invoke.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from langchain_core.documents import Document
+from pydantic import BaseModel
+
+from scrapegraphai.graphs import SmartScraperGraph
+from scrapegraphai.nodes import StructuredDataNode
+
+PAGE = """
+<html><head><title>Lemon tart</title>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Recipe", "name": "Lemon tart",
+ "recipeYield": "8 servings", "totalTime": "PT1H30M",
+ "recipeIngredient": ["3 lemons", "200 g sugar", "4 eggs"]}
+</script>
+</head><body><h1>Lemon tart</h1><p>A sharp, sweet tart.</p></body></html>
+"""
+
+
+class Recipe(BaseModel):
+    name: str
+    recipe_yield: str
+    recipe_ingredient: list[str]
+
+
+class Nutrition(BaseModel):
+    calories: int
+
+
+def test_answers_from_json_ld():
+    node = StructuredDataNode(
+        input="doc", output=["answer", "doc"], node_config={"schema": Recipe}
+    )
+
+    state = node.execute({"doc": [Document(page_content=PAGE)]})
+
+    assert state["answer"] == {
+        "name": "Lemon tart",
+        "recipe_yield": "8 servings",
+        "recipe_ingredient": ["3 lemons", "200 g sugar", "4 eggs"],
+    }
+    assert node.execution_metrics == {"structured_data": True}
+
+
+def test_unanswered_pages_get_their_pending_markdown():
+    node = StructuredDataNode(
+        input="doc", output=["answer", "doc"], node_config={"schema": Nutrition}
+    )
+    document = Document(page_content=PAGE, metadata={"markdown_pending": True})
+
+    state = node.execute({"doc": [document]})
+
+    assert state["answer"] is None
+    assert state["doc"][0].page_content.startswith("# Lemon tart")
+    assert state["doc"][0].metadata == {}
+
+
+def test_smart_scraper_skips_the_llm_when_the_schema_is_filled():
+    graph = SmartScraperGraph(
+        prompt="Extract the recipe",
+        source=PAGE,
+        config={
+            "llm": {"model": "openai/gpt-4o-mini", "api_key": "sk-test"},
+            "structured_data": True,
+        },
+        schema=Recipe,
+    )
+
+    with patch("scrapegraphai.graphs.base_graph.log_graph_execution"), patch(
+        "scrapegraphai.nodes.GenerateAnswerNode.execute"
+    ) as generate:
+        answer = graph.run()
+
+    generate.assert_not_called()
+    assert answer["recipe_yield"] == "8 servings"
+    assert [entry["node_name"] for entry in graph.get_execution_info()] == [
+        "Fetch",
+        "StructuredData",
+        "StructuredDataCond",
+        "TOTAL RESULT",
+    ]
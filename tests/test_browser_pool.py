@@ -0,0 +1,212 @@
+"""Tests for the process-wide BrowserPool."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from scrapegraphai.docloaders import browser_pool as browser_pool_module
+from scrapegraphai.docloaders.browser_pool import BrowserPool, get_browser_pool
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+
+
+class FakePage:
+    def __init__(self):
+        self.url = None
+
+    async def goto(self, url, wait_until=None):
+        self.url = url
+
+    async def wait_for_load_state(self, state):
+        pass
+
+    async def content(self):
+        return f"<html><body>{self.url}</body></html>"
+
+
+class FakeContext:
+    def __init__(self, browser, kwargs):
+        self.browser = browser
+        self.kwargs = kwargs
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def add_init_script(self, *args, **kwargs):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        context = FakeContext(self, kwargs)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowserType:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeBrowserType()
+        self.firefox = FakeBrowserType()
+        self.stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+class FakePlaywrightManager:
+    def __init__(self, playwright):
+        self.playwright = playwright
+
+    async def start(self):
+        return self.playwright
+
+
+@pytest.fixture
+def fake_playwright():
+    playwright = FakePlaywright()
+    with patch(
+        "playwright.async_api.async_playwright",
+        return_value=FakePlaywrightManager(playwright),
+    ):
+        yield playwright
+
+
+async def _content(context):
+    page = await context.new_page()
+    await page.goto("http://example.com")
+    return await page.content()
+
+
+def test_pool_reuses_browser_across_runs(fake_playwright):
+    pool = BrowserPool(max_browsers=2, max_pages_per_browser=4)
+    try:
+        assert "example.com" in pool.run_sync(_content)
+        assert "example.com" in pool.run_sync(_content)
+
+        assert len(fake_playwright.chromium.launched) == 1
+        browser = fake_playwright.chromium.launched[0]
+        assert len(browser.contexts) == 2
+        assert all(context.closed for context in browser.contexts)
+    finally:
+        pool.close()
+
+    assert browser.closed
+    assert fake_playwright.stopped
+
+
+def test_pool_respects_page_limits(fake_playwright):
+    pool = BrowserPool(max_browsers=2, max_pages_per_browser=1)
+    in_flight = 0
+    peak = 0
+
+    async def _slow(context):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return True
+
+    async def _run_many():
+        return await asyncio.gather(*(pool.run(_slow) for _ in range(6)))
+
+    try:
+        assert asyncio.run(_run_many()) == [True] * 6
+    finally:
+        pool.close()
+
+    assert peak == 2
+    assert len(fake_playwright.chromium.launched) == 2
+
+
+def test_pool_replaces_disconnected_browser(fake_playwright):
+    pool = BrowserPool(max_browsers=1, max_pages_per_browser=1)
+    try:
+        pool.run_sync(_content)
+        fake_playwright.chromium.launched[0].connected = False
+        pool.run_sync(_content)
+    finally:
+        pool.close()
+
+    assert len(fake_playwright.chromium.launched) == 2
+
+
+def test_pool_forwards_context_kwargs(fake_playwright):
+    pool = BrowserPool()
+    try:
+        pool.run_sync(_content, storage_state="state.json")
+    finally:
+        pool.close()
+
+    context = fake_playwright.chromium.launched[0].contexts[0]
+    assert context.kwargs == {"storage_state": "state.json"}
+
+
+def test_pool_invalid_arguments():
+    with pytest.raises(ValueError):
+        BrowserPool(browser_name="webkit")
+    with pytest.raises(ValueError):
+        BrowserPool(max_pages_per_browser=0)
+
+
+def test_get_browser_pool_is_keyed_by_launch_options(monkeypatch):
+    monkeypatch.setattr(browser_pool_module, "_pools", {})
+
+    first = get_browser_pool("chromium", {"headless": True})
+    assert get_browser_pool("chromium", {"headless": True}) is first
+    assert get_browser_pool("chromium", {"headless": False}) is not first
+    assert get_browser_pool("firefox", {"headless": True}) is not first
+
+
+@pytest.mark.asyncio
+async def test_chromium_loader_leases_from_pool(monkeypatch, fake_playwright):
+    monkeypatch.setattr(browser_pool_module, "_pools", {})
+
+    async def _apply_stealth(context):
+        pass
+
+    monkeypatch.setattr(
+        "undetected_playwright.Malenia.apply_stealth", _apply_stealth
+    )
+
+    loader = ChromiumLoader(
+        ["http://example.com"],
+        backend="playwright",
+        browser_pool={"max_browsers": 1, "max_pages_per_browser": 2},
+    )
+    try:
+        first = await loader.ascrape_playwright("http://example.com")
+        second = await loader.ascrape_playwright("http://example.org")
+    finally:
+        browser_pool_module.close_browser_pools()
+
+    assert "example.com" in first
+    assert "example.org" in second
+    assert len(fake_playwright.chromium.launched) == 1
+    context = fake_playwright.chromium.launched[0].contexts[0]
+    assert context.kwargs["ignore_https_errors"] is True
@@ -7,7 +7,7 @@ import aiohttp
 import pytest
 from langchain_core.documents import Document
 
-from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.chromium import ChromiumLoader, _fetch_stats
 
 
 class MockPlaywright:
@@ -2181,3 +2181,362 @@ def test_lazy_load_with_tuple_urls(monkeypatch):
     for doc, url in zip(docs, urls):
         assert f"Tuple content for {url}" in doc.page_content
         assert doc.metadata["source"] == url
+
+
+@pytest.mark.asyncio
+async def test_alazy_load_max_concurrency(monkeypatch):
+    """Test that alazy_load never runs more than max_concurrency scrapes at once."""
+    urls = [f"http://example.com/{i}" for i in range(6)]
+    loader = ChromiumLoader(urls, backend="playwright", max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def dummy_scraper(url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return f"<html>{url}</html>"
+
+    monkeypatch.setattr(loader, "ascrape_playwright", dummy_scraper)
+    docs = [doc async for doc in loader.alazy_load()]
+
+    assert peak == 2
+    assert [doc.metadata["source"] for doc in docs] == urls
+
+
+@pytest.mark.asyncio
+async def test_alazy_load_completion_order(monkeypatch):
+    """Test that alazy_load yields in completion order when preserve_order is False."""
+    urls = ["http://example.com/slow", "http://example.com/fast"]
+    loader = ChromiumLoader(urls, backend="playwright", preserve_order=False)
+
+    async def dummy_scraper(url):
+        await asyncio.sleep(0.2 if "slow" in url else 0.01)
+        return f"<html>{url}</html>"
+
+    monkeypatch.setattr(loader, "ascrape_playwright", dummy_scraper)
+    docs = [doc async for doc in loader.alazy_load()]
+
+    assert [doc.metadata["source"] for doc in docs] == urls[::-1]
+
+
+def test_lazy_load_shares_event_loop(monkeypatch):
+    """Test that lazy_load scrapes every URL on the same event loop, concurrently when allowed."""
+    urls = ["http://example.com/1", "http://example.com/2", "http://example.com/3"]
+    loader = ChromiumLoader(urls, backend="playwright", max_concurrency=3)
+    loops = set()
+
+    async def dummy_scraper(url):
+        loops.add(id(asyncio.get_running_loop()))
+        await asyncio.sleep(0.3)
+        return f"<html>{url}</html>"
+
+    monkeypatch.setattr(loader, "ascrape_playwright", dummy_scraper)
+    start = time.monotonic()
+    docs = list(loader.lazy_load())
+    elapsed = time.monotonic() - start
+
+    assert len(loops) == 1
+    assert elapsed < 0.8
+    assert [doc.metadata["source"] for doc in docs] == urls
+
+
+def test_invalid_max_concurrency():
+    """Test that a non-positive max_concurrency is rejected."""
+    with pytest.raises(ValueError):
+        ChromiumLoader(["http://example.com"], max_concurrency=0)
+
+
+class _FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = type(
+            "Request", (), {"url": url, "resource_type": resource_type}
+        )()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class _FakeFinishedRequest:
+    async def sizes(self):
+        return {"responseBodySize": 1000, "responseHeadersSize": 24}
+
+
+class _RoutingContext:
+    def __init__(self):
+        self.route_handler = None
+        self.listeners = {}
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    def on(self, event, handler):
+        self.listeners[event] = handler
+
+
+@pytest.mark.asyncio
+async def test_setup_resource_blocking_filters_and_counts():
+    """Test that blocked resource types and domains are aborted and network usage is counted."""
+    url = "http://example.com"
+    loader = ChromiumLoader(
+        [url],
+        backend="playwright",
+        block_resources={"resource_types": ["image"], "domains": ["tracker.io"]},
+    )
+    context = _RoutingContext()
+    stats = {}
+    _fetch_stats.set(stats)
+    await loader._setup_resource_blocking(context)
+
+    routes = [
+        _FakeRoute("http://example.com/", "document"),
+        _FakeRoute("http://example.com/logo.png", "image"),
+        _FakeRoute("https://cdn.tracker.io/t.js", "script"),
+        _FakeRoute("https://nottracker.io/app.js", "script"),
+    ]
+    for route in routes:
+        await context.route_handler(route)
+    await context.listeners["requestfinished"](_FakeFinishedRequest())
+
+    assert [route.outcome for route in routes] == [
+        "continued",
+        "aborted",
+        "aborted",
+        "continued",
+    ]
+    assert stats == {
+        "requests_completed": 1,
+        "requests_blocked": 2,
+        "bytes_received": 1024,
+    }
+
+
+@pytest.mark.asyncio
+async def test_setup_resource_blocking_disabled_by_default():
+    """Test that no route is installed unless block_resources is set."""
+    loader = ChromiumLoader(["http://example.com"], backend="playwright")
+    context = _RoutingContext()
+    stats = {}
+    _fetch_stats.set(stats)
+    await loader._setup_resource_blocking(context)
+    assert context.route_handler is None
+    assert stats == {}
+
+
+@pytest.mark.asyncio
+async def test_alazy_load_reports_network_counters(monkeypatch):
+    """Test that per-fetch network counters are merged into the Document metadata."""
+    url = "http://example.com"
+    loader = ChromiumLoader([url], backend="playwright", block_resources=True)
+
+    async def dummy_scraper(url):
+        _fetch_stats.get().update({"bytes_received": 2048, "requests_blocked": 3})
+        return "<html></html>"
+
+    monkeypatch.setattr(loader, "ascrape_playwright", dummy_scraper)
+    docs = [doc async for doc in loader.alazy_load()]
+
+    assert docs[0].metadata == {
+        "source": url,
+        "bytes_received": 2048,
+        "requests_blocked": 3,
+    }
+    assert _fetch_stats.get() is None
+
+
+@pytest.mark.asyncio
+async def test_network_counters_are_kept_per_fetch(monkeypatch):
+    """Test that the same URL fetched twice, on the pool loop, keeps both counters."""
+    from scrapegraphai.utils.background_loop import arun_in_background
+
+    url = "http://example.com"
+    loader = ChromiumLoader([url, url], backend="playwright", block_resources=True)
+    calls = []
+
+    async def count(value):
+        _fetch_stats.get()["bytes_received"] = value
+
+    async def dummy_scraper(url):
+        calls.append(url)
+        # Pooled pages are fetched on the background loop.
+        await arun_in_background(count(len(calls)))
+        await asyncio.sleep(0.01)
+        return "<html></html>"
+
+    monkeypatch.setattr(loader, "ascrape_playwright", dummy_scraper)
+    docs = [doc async for doc in loader.alazy_load()]
+
+    assert [doc.metadata["bytes_received"] for doc in docs] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_throttled_navigation_is_retried_after_the_backoff(monkeypatch):
+    """Test that a 429 navigation is retried once the host's backoff is over."""
+    from scrapegraphai.utils.fetch_scheduler import FetchScheduler
+
+    scheduler = FetchScheduler(backoff_base=0.05)
+    monkeypatch.setattr(
+        "scrapegraphai.docloaders.chromium.get_fetch_scheduler", lambda: scheduler
+    )
+    loader = ChromiumLoader(["http://example.com"], backend="playwright")
+    page = MockPage()
+    page.goto.side_effect = [
+        type("Response", (), {"status": 429, "headers": {}})(),
+        type("Response", (), {"status": 200, "headers": {}})(),
+    ]
+
+    start = time.monotonic()
+    response = await loader._navigate(page, "http://example.com", "networkidle")
+
+    assert response.status == 200
+    assert page.goto.call_count == 2
+    assert time.monotonic() - start >= 0.04
+    assert scheduler._hosts["example.com"].failures == 0
+
+
+class _ScrollingPage:
+    """Fake page whose content grows by one item per scroll until it runs out."""
+
+    def __init__(self, total_items, grow_delay=0.0):
+        self.items = 1
+        self.total_items = total_items
+        self.grow_delay = grow_delay
+        self.wheel_calls = 0
+        self.mouse = self
+
+    async def goto(self, url, wait_until):
+        return None
+
+    async def wait_for_load_state(self, state):
+        return None
+
+    async def evaluate(self, script, arg=None):
+        if "MutationObserver" in script:
+            return None
+        return {
+            "height": self.items * 100,
+            "nodes": self.items,
+            "mutations": self.items,
+            "items": self.items,
+        }
+
+    async def wheel(self, x, y):
+        self.wheel_calls += 1
+
+    async def wait_for_function(self, script, arg, timeout):
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        if self.items >= self.total_items:
+            await asyncio.sleep(timeout / 1000)
+            raise PlaywrightTimeoutError("no new content")
+        await asyncio.sleep(self.grow_delay)
+        self.items += 1
+
+    async def content(self):
+        return f"<html>{self.items} items</html>"
+
+
+def _patch_scroll_playwright(monkeypatch, pages):
+    class DummyContext:
+        async def new_page(self):
+            return pages.pop(0)
+
+    class DummyBrowser:
+        async def new_context(self, **kwargs):
+            return DummyContext()
+
+        async def close(self):
+            return None
+
+    class DummyPW:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return None
+
+        class chromium:
+            @staticmethod
+            async def launch(headless, proxy, **kwargs):
+                return DummyBrowser()
+
+    monkeypatch.setattr("playwright.async_api.async_playwright", lambda: DummyPW())
+    monkeypatch.setattr("undetected_playwright.Malenia.apply_stealth", AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_ascrape_playwright_scroll_stops_at_max_items(monkeypatch):
+    page = _ScrollingPage(total_items=100)
+    _patch_scroll_playwright(monkeypatch, [page])
+    loader = ChromiumLoader(["http://example.com"], backend="playwright")
+
+    result = await loader.ascrape_playwright_scroll(
+        "http://example.com", sleep=1, max_items=5, item_selector="article"
+    )
+
+    assert result == "<html>5 items</html>"
+    assert page.wheel_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_ascrape_playwright_scroll_stops_after_stalls(monkeypatch):
+    page = _ScrollingPage(total_items=3)
+    _patch_scroll_playwright(monkeypatch, [page])
+    loader = ChromiumLoader(["http://example.com"], backend="playwright")
+
+    result = await loader.ascrape_playwright_scroll(
+        "http://example.com", timeout=None, sleep=0.01, max_stalls=2
+    )
+
+    assert result == "<html>3 items</html>"
+    assert page.wheel_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_ascrape_playwright_scroll_does_not_block_other_pages(monkeypatch):
+    pages = [_ScrollingPage(total_items=1), _ScrollingPage(total_items=1)]
+    _patch_scroll_playwright(monkeypatch, pages)
+    loader = ChromiumLoader(["http://example.com"], backend="playwright")
+
+    start = time.monotonic()
+    await asyncio.gather(
+        loader.ascrape_playwright_scroll(
+            "http://example.com/a", sleep=0.3, scroll_to_bottom=True
+        ),
+        loader.ascrape_playwright_scroll(
+            "http://example.com/b", sleep=0.3, scroll_to_bottom=True
+        ),
+    )
+
+    assert time.monotonic() - start < 0.55
+
+
+@pytest.mark.asyncio
+async def test_ascrape_playwright_scroll_requires_item_selector():
+    loader = ChromiumLoader(["http://example.com"], backend="playwright")
+    with pytest.raises(ValueError, match="item_selector"):
+        await loader.ascrape_playwright_scroll("http://example.com", max_items=10)
+
+
+def test_scroll_option_selects_scrolling_scraper(monkeypatch):
+    loader = ChromiumLoader(
+        ["http://example.com"],
+        backend="playwright",
+        infinite_scroll={"max_items": 3, "item_selector": "li"},
+    )
+    received = {}
+
+    async def fake_scroll(url, **kwargs):
+        received.update(kwargs)
+        return "<html></html>"
+
+    monkeypatch.setattr(loader, "ascrape_playwright_scroll", fake_scroll)
+    list(loader.lazy_load())
+
+    assert received == {"max_items": 3, "item_selector": "li"}
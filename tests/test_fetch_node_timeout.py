@@ -98,13 +98,13 @@ class TestFetchNodeTimeout(unittest.TestCase):
         )
         self.assertEqual(node.timeout, 30)
 
-    @patch('scrapegraphai.nodes.fetch_node.requests')
-    def test_requests_get_with_timeout(self, mock_requests):
-        """Test that requests.get is called with timeout when use_soup=True."""
+    @patch('scrapegraphai.nodes.fetch_node.get_http_client')
+    def test_requests_get_with_timeout(self, mock_get_client):
+        """Test that the HTTP client is called with timeout when use_soup=True."""
         mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response.status = 200
         mock_response.text = "<html><body>Test content</body></html>"
-        mock_requests.get.return_value = mock_response
+        mock_get_client.return_value.get_sync.return_value = mock_response
 
         node = self.FetchNode(
             input="url",
@@ -116,18 +116,19 @@ class TestFetchNodeTimeout(unittest.TestCase):
         state = {"url": "https://example.com"}
         node.execute(state)
 
-        # Verify requests.get was called with timeout
-        mock_requests.get.assert_called_once()
-        call_args = mock_requests.get.call_args
+        # Verify the client was called with timeout
+        mock_get = mock_get_client.return_value.get_sync
+        mock_get.assert_called_once()
+        call_args = mock_get.call_args
         self.assertEqual(call_args[1].get('timeout'), 15)
 
-    @patch('scrapegraphai.nodes.fetch_node.requests')
-    def test_requests_get_without_timeout_when_none(self, mock_requests):
-        """Test that requests.get is called without timeout argument when timeout=None."""
+    @patch('scrapegraphai.nodes.fetch_node.get_http_client')
+    def test_requests_get_without_timeout_when_none(self, mock_get_client):
+        """Test that the HTTP client is called without a time limit when timeout=None."""
         mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response.status = 200
         mock_response.text = "<html><body>Test content</body></html>"
-        mock_requests.get.return_value = mock_response
+        mock_get_client.return_value.get_sync.return_value = mock_response
 
         node = self.FetchNode(
             input="url",
@@ -139,10 +140,11 @@ class TestFetchNodeTimeout(unittest.TestCase):
         state = {"url": "https://example.com"}
         node.execute(state)
 
-        # Verify requests.get was called without timeout
-        mock_requests.get.assert_called_once()
-        call_args = mock_requests.get.call_args
-        self.assertNotIn('timeout', call_args[1])
+        # Verify the client was called without a time limit
+        mock_get = mock_get_client.return_value.get_sync
+        mock_get.assert_called_once()
+        call_args = mock_get.call_args
+        self.assertIsNone(call_args[1].get('timeout'))
 
     def test_pdf_parsing_with_timeout(self):
         """Test that PDF parsing completes within timeout."""
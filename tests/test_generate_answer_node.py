@@ -5,7 +5,7 @@ from langchain_community.chat_models import (
     ChatOllama,
 )
 from langchain_core.runnables import (
-    RunnableParallel,
+    RunnableLambda,
 )
 from requests.exceptions import (
     Timeout,
@@ -92,7 +92,7 @@ def test_execute_multiple_chunks(dummy_node_with_pipe):
     }
 
     def fake_invoke_with_timeout(chain, inputs, timeout):
-        if isinstance(chain, RunnableParallel):
+        if isinstance(chain, RunnableLambda):
             return {
                 "chunk1": {"content": "answer for chunk 1"},
                 "chunk2": {"content": "answer for chunk 2"},
@@ -132,7 +132,7 @@ def test_execute_merge_json_decode_error(dummy_node_with_pipe):
     }
 
     def fake_invoke_with_timeout(chain, inputs, timeout):
-        if isinstance(chain, RunnableParallel):
+        if isinstance(chain, RunnableLambda):
             return {
                 "chunk1": {"content": "answer for chunk 1"},
                 "chunk2": {"content": "answer for chunk 2"},
@@ -5,6 +5,8 @@ import pytest
 
 from scrapegraphai.docloaders.scrape_do import scrape_do_fetch
 
+HTTP_GET = "scrapegraphai.utils.http_client.AsyncHttpClient.get_sync"
+
 
 def test_scrape_do_fetch_without_proxy():
     """
@@ -20,7 +22,7 @@ def test_scrape_do_fetch_without_proxy():
     encoded_url = urllib.parse.quote(target_url)
     expected_response = "Mocked API response"
 
-    with patch("requests.get") as mock_get:
+    with patch(HTTP_GET) as mock_get:
         mock_response = Mock()
         mock_response.text = expected_response
         mock_get.return_value = mock_response
@@ -28,7 +30,7 @@ def test_scrape_do_fetch_without_proxy():
         result = scrape_do_fetch(token, target_url, use_proxy=False)
 
         expected_url = f"http://api.scrape.do?token={token}&url={encoded_url}"
-        mock_get.assert_called_once_with(expected_url)
+        mock_get.assert_called_once_with(expected_url, schedule=False)
 
         assert result == expected_response
 
@@ -38,7 +40,7 @@ def test_scrape_do_fetch_with_proxy_no_geo():
     Test scrape_do_fetch function using proxy mode without geoCode.
     This test verifies that:
         - The function constructs the correct proxy URL with the default proxy endpoint.
-        - The function calls requests.get with the proper proxies, verify flag and empty params.
+        - The function calls the shared HTTP client with the proper proxies, verify flag and empty params.
         - The function returns the expected response text.
     """
     token = "test_token"
@@ -48,12 +50,8 @@ def test_scrape_do_fetch_with_proxy_no_geo():
     # The default proxy endpoint is used as defined in the function
     expected_proxy_scrape_do_url = "proxy.scrape.do:8080"
     expected_proxy_mode_url = f"http://{token}:@{expected_proxy_scrape_do_url}"
-    expected_proxies = {
-        "http": expected_proxy_mode_url,
-        "https": expected_proxy_mode_url,
-    }
 
-    with patch("requests.get") as mock_get:
+    with patch(HTTP_GET) as mock_get:
         mock_response = Mock()
         mock_response.text = expected_response
         mock_get.return_value = mock_response
@@ -62,7 +60,7 @@ def test_scrape_do_fetch_with_proxy_no_geo():
 
         # For proxy usage without geoCode, params should be an empty dict.
         mock_get.assert_called_once_with(
-            target_url, proxies=expected_proxies, verify=False, params={}
+            target_url, proxy=expected_proxy_mode_url, verify=False, params={}
         )
         assert result == expected_response
 
@@ -83,12 +81,8 @@ def test_scrape_do_fetch_with_proxy_with_geo():
 
     expected_proxy_scrape_do_url = "proxy.scrape.do:8080"
     expected_proxy_mode_url = f"http://{token}:@{expected_proxy_scrape_do_url}"
-    expected_proxies = {
-        "http": expected_proxy_mode_url,
-        "https": expected_proxy_mode_url,
-    }
 
-    with patch("requests.get") as mock_get:
+    with patch(HTTP_GET) as mock_get:
         mock_response = Mock()
         mock_response.text = expected_response
         mock_get.return_value = mock_response
@@ -99,7 +93,7 @@ def test_scrape_do_fetch_with_proxy_with_geo():
 
         expected_params = {"geoCode": geo_code, "super": "true"}
         mock_get.assert_called_once_with(
-            target_url, proxies=expected_proxies, verify=False, params=expected_params
+            target_url, proxy=expected_proxy_mode_url, verify=False, params=expected_params
         )
         assert result == expected_response
 
@@ -114,7 +108,7 @@ def test_scrape_do_fetch_without_proxy_custom_env():
     expected_response = "Custom API response"
 
     with patch.dict("os.environ", {"API_SCRAPE_DO_URL": "custom.api.scrape.do"}):
-        with patch("requests.get") as mock_get:
+        with patch(HTTP_GET) as mock_get:
             mock_response = Mock()
             mock_response.text = expected_response
             mock_get.return_value = mock_response
@@ -124,7 +118,7 @@ def test_scrape_do_fetch_without_proxy_custom_env():
             expected_url = (
                 f"http://custom.api.scrape.do?token={token}&url={encoded_url}"
             )
-            mock_get.assert_called_once_with(expected_url)
+            mock_get.assert_called_once_with(expected_url, schedule=False)
             assert result == expected_response
 
 
@@ -140,12 +134,8 @@ def test_scrape_do_fetch_with_proxy_custom_env():
         "os.environ", {"PROXY_SCRAPE_DO_URL": "custom.proxy.scrape.do:8888"}
     ):
         expected_proxy_mode_url = f"http://{token}:@custom.proxy.scrape.do:8888"
-        expected_proxies = {
-            "http": expected_proxy_mode_url,
-            "https": expected_proxy_mode_url,
-        }
 
-        with patch("requests.get") as mock_get:
+        with patch(HTTP_GET) as mock_get:
             mock_response = Mock()
             mock_response.text = expected_response
             mock_get.return_value = mock_response
@@ -153,19 +143,19 @@ def test_scrape_do_fetch_with_proxy_custom_env():
             result = scrape_do_fetch(token, target_url, use_proxy=True)
 
             mock_get.assert_called_once_with(
-                target_url, proxies=expected_proxies, verify=False, params={}
+                target_url, proxy=expected_proxy_mode_url, verify=False, params={}
             )
             assert result == expected_response
 
 
 def test_scrape_do_fetch_exception_propagation():
     """
-    Test that scrape_do_fetch properly propagates exceptions raised by requests.get.
+    Test that scrape_do_fetch properly propagates exceptions raised by the shared HTTP client.
     """
     token = "test_token"
     target_url = "https://example.com"
 
-    with patch("requests.get", side_effect=Exception("Network Error")):
+    with patch(HTTP_GET, side_effect=Exception("Network Error")):
         with pytest.raises(Exception) as excinfo:
             scrape_do_fetch(token, target_url, use_proxy=False)
         assert "Network Error" in str(excinfo.value)
@@ -184,13 +174,9 @@ def test_scrape_do_fetch_with_proxy_with_geo_and_super_false():
 
     expected_proxy_scrape_do_url = "proxy.scrape.do:8080"
     expected_proxy_mode_url = f"http://{token}:@{expected_proxy_scrape_do_url}"
-    expected_proxies = {
-        "http": expected_proxy_mode_url,
-        "https": expected_proxy_mode_url,
-    }
     expected_params = {"geoCode": geo_code, "super": "false"}
 
-    with patch("requests.get") as mock_get:
+    with patch(HTTP_GET) as mock_get:
         mock_response = Mock()
         mock_response.text = expected_response
         mock_get.return_value = mock_response
@@ -200,7 +186,7 @@ def test_scrape_do_fetch_with_proxy_with_geo_and_super_false():
         )
 
         mock_get.assert_called_once_with(
-            target_url, proxies=expected_proxies, verify=False, params=expected_params
+            target_url, proxy=expected_proxy_mode_url, verify=False, params=expected_params
         )
         assert result == expected_response
 
@@ -215,7 +201,7 @@ def test_scrape_do_fetch_empty_token_without_proxy():
     encoded_url = urllib.parse.quote(target_url)
     expected_response = "Empty token response"
 
-    with patch("requests.get") as mock_get:
+    with patch(HTTP_GET) as mock_get:
         mock_response = Mock()
         mock_response.text = expected_response
         mock_get.return_value = mock_response
@@ -223,7 +209,7 @@ def test_scrape_do_fetch_empty_token_without_proxy():
         result = scrape_do_fetch(token, target_url, use_proxy=False)
 
         expected_url = f"http://api.scrape.do?token={token}&url={encoded_url}"
-        mock_get.assert_called_once_with(expected_url)
+        mock_get.assert_called_once_with(expected_url, schedule=False)
         assert result == expected_response
 
 
@@ -241,13 +227,9 @@ def test_scrape_do_fetch_with_proxy_with_empty_geo():
 
     expected_proxy_scrape_do_url = "proxy.scrape.do:8080"
     expected_proxy_mode_url = f"http://{token}:@{expected_proxy_scrape_do_url}"
-    expected_proxies = {
-        "http": expected_proxy_mode_url,
-        "https": expected_proxy_mode_url,
-    }
     # Since geo_code is an empty string, the condition will be false and params should be an empty dict.
 
-    with patch("requests.get") as mock_get:
+    with patch(HTTP_GET) as mock_get:
         mock_response = Mock()
         mock_response.text = expected_response
         mock_get.return_value = mock_response
@@ -257,7 +239,7 @@ def test_scrape_do_fetch_with_proxy_with_empty_geo():
         )
 
         mock_get.assert_called_once_with(
-            target_url, proxies=expected_proxies, verify=False, params={}
+            target_url, proxy=expected_proxy_mode_url, verify=False, params={}
         )
         assert result == expected_response
 
@@ -273,7 +255,7 @@ def test_scrape_do_fetch_api_encoding_special_characters():
     encoded_url = urllib.parse.quote(target_url)
     expected_response = "Encoded API response"
 
-    with patch("requests.get") as mock_get:
+    with patch(HTTP_GET) as mock_get:
         mock_response = Mock()
         mock_response.text = expected_response
         mock_get.return_value = mock_response
@@ -281,5 +263,5 @@ def test_scrape_do_fetch_api_encoding_special_characters():
         result = scrape_do_fetch(token, target_url, use_proxy=False)
 
         expected_url = f"http://api.scrape.do?token={token}&url={encoded_url}"
-        mock_get.assert_called_once_with(expected_url)
+        mock_get.assert_called_once_with(expected_url, schedule=False)
         assert result == expected_response
@@ -0,0 +1,47 @@
+import pytest
+
+from scrapegraphai.utils.content_type import (
+    file_type_from_content_type,
+    file_type_from_url,
+)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.com/report.PDF", "pdf"),
+        ("https://example.com/data.csv?download=1", "csv"),
+        ("https://example.com/api/items.json#top", "json"),
+        ("https://example.com/feed.xml", "xml"),
+        ("https://example.com/my%20file.pdf", "pdf"),
+        ("https://example.com/page.html", None),
+        ("https://example.com/pdf", None),
+    ],
+)
+def test_file_type_from_url(url, expected):
+    assert file_type_from_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        ("application/pdf", "pdf"),
+        ("text/csv; charset=utf-8", "csv"),
+        ("application/JSON", "json"),
+        ("application/ld+json", "json"),
+        ("application/rss+xml", "xml"),
+        ("text/xml", "xml"),
+        ("application/xhtml+xml", None),
+        ("text/html; charset=utf-8", None),
+        (None, None),
+    ],
+)
+def test_file_type_from_content_type(content_type, expected):
+    assert file_type_from_content_type(content_type) == expected
+
+
+def test_pdf_magic_number_wins_over_generic_content_type():
+    assert (
+        file_type_from_content_type("application/octet-stream", b"%PDF-1.7\n")
+        == "pdf"
+    )
@@ -0,0 +1,68 @@
+"""
+Benchmark of the Markdown engines over the saved pages in tests/inputs/pages.
+
+Run with: pytest tests/utils/convert_to_md_benchmark_test.py --slow -s
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from scrapegraphai.utils.convert_to_md import get_markdown_converter
+
+PAGES_DIR = Path(__file__).resolve().parent.parent / "inputs" / "pages"
+ENGINES = ("html2text", "dom")
+RUNS = 5
+# Largest relative gap allowed between the token counts of two engines.
+TOKEN_TOLERANCE = 0.1
+
+
+def _token_counter():
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return "cl100k_base", lambda text: len(encoding.encode(text))
+    except Exception:
+        # Offline fallback: roughly one token per 4 characters.
+        return "chars/4", lambda text: len(text) // 4
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_markdown_engines_throughput_and_tokens():
+    pages = {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(PAGES_DIR.glob("*.html"))
+    }
+    assert pages, f"no saved pages in {PAGES_DIR}"
+    tokenizer_name, count_tokens = _token_counter()
+    total_bytes = sum(len(html.encode("utf-8")) for html in pages.values())
+
+    results = {}
+    for engine in ENGINES:
+        converter = get_markdown_converter(engine)
+        outputs = {}
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            for name, html in pages.items():
+                outputs[name] = converter.convert(html, f"https://example.com/{name}")
+        elapsed = time.perf_counter() - start
+        results[engine] = {
+            "mb_per_s": total_bytes * RUNS / elapsed / 1e6,
+            "tokens": {name: count_tokens(text) for name, text in outputs.items()},
+        }
+
+    print(f"\nMarkdown engines over {len(pages)} pages (tokens: {tokenizer_name})")
+    for engine, result in results.items():
+        tokens = ", ".join(f"{name}={n}" for name, n in result["tokens"].items())
+        print(f"  {engine:<10} {result['mb_per_s']:6.2f} MB/s  {tokens}")
+
+    # Throughput is reported only: timings are too noisy to gate on.
+    for engine in ENGINES:
+        assert all(n > 0 for n in results[engine]["tokens"].values())
+    for name, expected in results["html2text"]["tokens"].items():
+        assert results["dom"]["tokens"][name] == pytest.approx(
+            expected, rel=TOKEN_TOLERANCE
+        )
@@ -1,3 +1,5 @@
+import pytest
+
 from scrapegraphai.utils.convert_to_md import convert_to_md
 
 
@@ -52,3 +54,66 @@ def test_complex_html_structure():
     </html>
     """
     assert convert_to_md(html) is not None
+
+
+def test_unknown_engine_is_rejected():
+    import pytest
+
+    with pytest.raises(ValueError, match="Unknown markdown engine"):
+        convert_to_md("<p>x</p>", engine="nope")
+
+
+def test_dom_engine_renders_common_blocks():
+    html = """
+    <html><head><title>T</title><script>var x = 1;</script></head><body>
+      <h2>Heading</h2>
+      <p>Some <strong>bold</strong> and <a href="/rel">a link</a>.</p>
+      <ul><li>One</li><li>Two<ol><li>Nested</li></ol></li></ul>
+      <table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>
+      <img src="pic.png" alt="Pic">
+    </body></html>
+    """
+
+    markdown = convert_to_md(html, "https://example.com/docs/", engine="dom")
+
+    assert "## Heading" in markdown
+    assert "Some **bold** and [a link](https://example.com/rel)." in markdown
+    assert "* One\n* Two\n  1. Nested" in markdown
+    assert "| A | B |\n| --- | --- |\n| 1 | 2 |" in markdown
+    assert "![Pic](https://example.com/docs/pic.png)" in markdown
+    assert "var x" not in markdown
+
+
+def test_engines_accept_a_parsed_document():
+    from scrapegraphai.utils.html_document import HtmlDocument
+
+    document = HtmlDocument("<html><body><p>Shared parse</p></body></html>")
+
+    for engine in ("html2text", "dom"):
+        assert "Shared parse" in convert_to_md(document, engine=engine)
+
+
+def test_registered_engine_is_used_and_checked_at_registration():
+    from scrapegraphai.utils.convert_to_md import (
+        MarkdownConverter,
+        get_markdown_converter,
+        register_markdown_converter,
+    )
+
+    class UpperConverter(MarkdownConverter):
+        name = "upper"
+
+        def convert(self, html, url=None):
+            return html.upper()
+
+    class IncompleteConverter(MarkdownConverter):
+        name = "incomplete"
+
+    register_markdown_converter("upper", UpperConverter)
+
+    assert convert_to_md("<p>x</p>", engine="upper") == "<P>X</P>"
+    assert isinstance(get_markdown_converter("upper"), UpperConverter)
+    with pytest.raises(TypeError):
+        register_markdown_converter("incomplete", IncompleteConverter)
+    with pytest.raises(ValueError):
+        get_markdown_converter("incomplete")
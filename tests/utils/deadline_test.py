@@ -0,0 +1,99 @@
+import time
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+from requests.exceptions import Timeout
+
+from scrapegraphai.graphs import BaseGraph
+from scrapegraphai.nodes.base_node import BaseNode
+from scrapegraphai.utils.deadline import (
+    DeadlineExceeded,
+    deadline_scope,
+    effective_timeout,
+    invoke_with_deadline,
+    remaining_time,
+)
+from scrapegraphai.utils.map_executor import MapExecutor
+
+
+def sleeper(seconds, result="done"):
+    def call(inputs):
+        time.sleep(seconds)
+        return result
+
+    return RunnableLambda(call)
+
+
+class SleepNode(BaseNode):
+    def __init__(self, name, seconds):
+        super().__init__(name, "node", "question", ["answer"], 1, {})
+        self.seconds = seconds
+        self.executed = False
+
+    def execute(self, state):
+        self.executed = True
+        state["answer"] = self.invoke_chain(sleeper(self.seconds, self.node_name), {})
+        return state
+
+
+def test_scopes_never_extend_an_enclosing_deadline():
+    assert remaining_time() is None
+    with deadline_scope(1):
+        with deadline_scope(60):
+            assert remaining_time() <= 1
+            assert effective_timeout(30) <= 1
+        assert effective_timeout(0.5) == 0.5
+    assert effective_timeout(30) == 30
+
+
+def test_calls_finishing_in_time_return_their_result():
+    assert invoke_with_deadline(sleeper(0), {}, timeout=5) == "done"
+    assert invoke_with_deadline(sleeper(0), {}) == "done"
+
+
+def test_hung_call_is_abandoned_at_the_timeout():
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        invoke_with_deadline(sleeper(5), {}, timeout=0.2)
+
+    assert time.monotonic() - start < 1
+    # Handlers of network timeouts do not mistake it for one.
+    assert isinstance(exc_info.value, TimeoutError)
+    assert not isinstance(exc_info.value, Timeout)
+
+
+def test_errors_of_the_call_are_raised():
+    def fail(inputs):
+        raise ValueError("bad answer")
+
+    with pytest.raises(ValueError, match="bad answer"):
+        invoke_with_deadline(RunnableLambda(fail), {}, timeout=5)
+
+
+def test_map_gives_up_on_chunks_at_the_deadline():
+    executor = MapExecutor(max_concurrency=2)
+    chains = {"chunk1": sleeper(0), "chunk2": sleeper(5), "chunk3": sleeper(5)}
+
+    start = time.monotonic()
+    with deadline_scope(0.3), pytest.raises(DeadlineExceeded):
+        executor.map(chains, {})
+
+    assert time.monotonic() - start < 1
+
+
+def test_graph_run_stops_at_its_deadline():
+    slow = SleepNode("Slow", 5)
+    never = SleepNode("Never", 0)
+    graph = BaseGraph(
+        nodes=[slow, never],
+        edges=[(slow, never)],
+        entry_point=slow,
+        deadline=0.3,
+    )
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        graph.execute({"question": "?"})
+
+    assert time.monotonic() - start < 1
+    assert not never.executed
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from scrapegraphai.utils import tokenizer
+from scrapegraphai.utils.tokenizer import warmup
+from scrapegraphai.utils.tokenizers import encoding_cache
+from scrapegraphai.utils.tokenizers.encoding_cache import (
+    cached_encodings,
+    cached_file,
+    configure_encoding_cache,
+    install_encoding,
+    main,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+    monkeypatch.delenv(encoding_cache.CACHE_DIR_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setattr(tokenizer, "_counters", {})
+
+
+def test_configure_points_tiktoken_at_the_directory(tmp_path):
+    assert configure_encoding_cache(str(tmp_path)) == str(tmp_path)
+    assert os.environ["TIKTOKEN_CACHE_DIR"] == str(tmp_path)
+
+
+def test_default_directory_is_persistent(tmp_path, monkeypatch):
+    assert configure_encoding_cache() == str(tmp_path / "xdg" / "scrapegraphai" / "tiktoken")
+
+    monkeypatch.setenv(encoding_cache.CACHE_DIR_ENV, str(tmp_path / "shared"))
+    assert configure_encoding_cache() == str(tmp_path / "shared")
+
+
+def test_installed_files_land_where_tiktoken_reads_them(tmp_path):
+    copied = tmp_path / "o200k_base.tiktoken"
+    copied.write_bytes(b"aGVsbG8= 0\n")
+
+    path = install_encoding("o200k_base", str(copied), str(tmp_path / "cache"))
+
+    # tiktoken keys its cache by the SHA-1 of the download URL.
+    assert os.path.basename(path) == "fb374d419588a4632f3f557e76b4b70aebbca790"
+    assert path == cached_file("o200k_base", str(tmp_path / "cache"))
+    assert cached_encodings(str(tmp_path / "cache"))["o200k_base"] is True
+    assert cached_encodings(str(tmp_path / "cache"))["cl100k_base"] is False
+
+
+def test_offline_warmup_fails_fast_without_the_encoding(tmp_path):
+    configure_encoding_cache(str(tmp_path))
+
+    with pytest.raises(FileNotFoundError, match="o200k_base encoding is not cached"):
+        warmup(offline=True)
+
+
+def test_cli_lists_the_cache(tmp_path, capsys):
+    assert main(["--dir", str(tmp_path), "list"]) == 0
+
+    output = capsys.readouterr().out
+    assert "o200k_base   missing" in output
+    assert str(tmp_path) in output
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from scrapegraphai.utils.fetch_cache import FetchCache, canonicalize_url
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("HTTPS://Example.COM", "https://example.com/"),
+        ("https://example.com:443/a#section", "https://example.com/a"),
+        ("http://example.com:8080/a?b=2&a=1", "http://example.com:8080/a?a=1&b=2"),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_key_depends_on_canonical_url_and_options():
+    key = FetchCache.make_key("https://example.com/?b=2&a=1", {"backend": "browser"})
+
+    assert key == FetchCache.make_key(
+        "https://EXAMPLE.com/?a=1&b=2#top", {"backend": "browser"}
+    )
+    assert key != FetchCache.make_key(
+        "https://example.com/?a=1&b=2", {"backend": "auto"}
+    )
+
+
+def test_put_and_get_roundtrip(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    cache.put(
+        "https://example.com",
+        {},
+        "<html>cached</html>",
+        headers={"ETag": '"abc"', "Set-Cookie": "secret"},
+        metadata={"source": "https://example.com", "fetch_tier": "http"},
+    )
+
+    entry = cache.get("https://example.com", {})
+
+    assert entry.content == "<html>cached</html>"
+    assert entry.headers == {"etag": '"abc"'}
+    assert entry.metadata == {"fetch_tier": "http"}
+    assert entry.validators == {"If-None-Match": '"abc"'}
+    assert cache.is_fresh(entry)
+    assert cache.get("https://example.com/other", {}) is None
+
+
+def test_entry_goes_stale_after_ttl(tmp_path):
+    cache = FetchCache(str(tmp_path), ttl=0)
+    cache.put("https://example.com", {}, "<html></html>")
+
+    entry = cache.get("https://example.com", {})
+
+    assert entry is not None
+    assert not cache.is_fresh(entry)
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    page = os.urandom(16 * 1024).hex()
+
+    for i, url in enumerate(["https://example.com/1", "https://example.com/2"]):
+        cache.put(url, {}, page)
+        _, meta_path = cache._paths(cache.make_key(url, {}))
+        os.utime(meta_path, (i, i))
+    entry_size = sum(size for _, size, _, _ in cache._entries()) // 2
+    cache.max_size_bytes = int(entry_size * 2.5)
+
+    # Reading the oldest entry makes the second one the least recently used.
+    cache.get("https://example.com/1", {})
+    cache.put("https://example.com/3", {}, page)
+
+    assert cache.get("https://example.com/2", {}) is None
+    assert cache.get("https://example.com/1", {}) is not None
+    assert cache.get("https://example.com/3", {}) is not None
+
+
+def test_put_walks_the_cache_only_once_below_the_bound(tmp_path, mocker):
+    cache = FetchCache(str(tmp_path))
+    entries = mocker.spy(cache, "_entries")
+
+    for i in range(5):
+        cache.put(f"https://example.com/{i}", {}, "<html>page</html>")
+    cache.put("https://example.com/0", {}, "<html>page, updated</html>")
+
+    assert entries.call_count == 1
+    assert cache._total_size == cache._stored_size()
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scrapegraphai.utils.fetch_scheduler import (
+    FetchScheduler,
+    host_of,
+    parse_retry_after,
+)
+
+
+def test_host_of():
+    assert host_of("https://Example.com:8080/a?b=1") == "example.com:8080"
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("5", 5.0), ("0", 0.0), (None, None), ("soon", None)]
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_concurrency_cap_is_per_host():
+    scheduler = FetchScheduler(max_concurrency_per_host=2)
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+    lock = threading.Lock()
+
+    def _fetch(host):
+        with scheduler.slot(f"https://{host}.example/page"):
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.05)
+            with lock:
+                active[host] -= 1
+
+    threads = [
+        threading.Thread(target=_fetch, args=(host,)) for host in "ab" * 4
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == {"a": 2, "b": 2}
+
+
+def test_concurrency_is_unlimited_by_default():
+    scheduler = FetchScheduler()
+    hosts = [scheduler.acquire("https://example.com/page") for _ in range(10)]
+
+    assert scheduler._hosts["example.com"].active == 10
+    for host in hosts:
+        scheduler.release(host)
+
+
+def test_waiters_are_served_in_arrival_order():
+    scheduler = FetchScheduler(max_concurrency_per_host=1)
+    order = []
+
+    async def _fetch(index):
+        async with scheduler.aslot("https://example.com"):
+            order.append(index)
+            await asyncio.sleep(0.01)
+
+    async def _main():
+        host = await scheduler.aacquire("https://example.com")
+        tasks = []
+        for index in range(5):
+            tasks.append(asyncio.ensure_future(_fetch(index)))
+            await asyncio.sleep(0)
+        scheduler.release(host)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(_main())
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_release_wakes_a_waiter_on_another_thread():
+    scheduler = FetchScheduler(max_concurrency_per_host=1)
+    host = scheduler.acquire("https://example.com")
+    acquired = threading.Event()
+
+    def _fetch():
+        with scheduler.slot("https://example.com"):
+            acquired.set()
+
+    thread = threading.Thread(target=_fetch)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    scheduler.release(host)
+    assert acquired.wait(1)
+    thread.join()
+    assert not scheduler._hosts["example.com"].waiters
+
+
+def test_token_bucket_spaces_requests():
+    scheduler = FetchScheduler(rate_per_host=20, burst=1)
+    start = time.monotonic()
+
+    for _ in range(3):
+        with scheduler.slot("https://example.com"):
+            pass
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_retry_after_pauses_the_host():
+    scheduler = FetchScheduler()
+    scheduler.report("https://example.com/a", 429, {"Retry-After": "0.2"})
+    start = time.monotonic()
+
+    async def _fetch():
+        async with scheduler.aslot("https://example.com/b"):
+            pass
+        async with scheduler.aslot("https://other.com/b"):
+            pass
+
+    asyncio.run(_fetch())
+
+    assert time.monotonic() - start >= 0.19
+
+
+def test_backoff_grows_without_retry_after_and_resets_on_success():
+    scheduler = FetchScheduler(backoff_base=0.01, max_backoff=1)
+    scheduler.report("https://example.com", 503)
+    scheduler.report("https://example.com", 503)
+    assert scheduler._hosts["example.com"].failures == 2
+
+    scheduler.report("https://example.com", 200)
+    assert scheduler._hosts["example.com"].failures == 0
+
+
+def test_crawl_delay_spaces_request_starts():
+    scheduler = FetchScheduler()
+    scheduler.set_crawl_delay("example.com", 0.1)
+    start = time.monotonic()
+
+    for _ in range(2):
+        with scheduler.slot("https://example.com"):
+            pass
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_configure_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        FetchScheduler(max_concurrency_per_host=0)
+    with pytest.raises(ValueError):
+        FetchScheduler(rate_per_host=0)
@@ -0,0 +1,62 @@
+from scrapegraphai.utils.cleanup_html import cleanup_html, minify_html, reduce_html
+from scrapegraphai.utils.html_document import HtmlDocument
+
+PAGE = """
+<html>
+  <head><title>Shop</title><style>.x { color: red; }</style></head>
+  <body>
+    <!-- promo -->
+    <a href="/item/1" data-track="1">One</a>
+    <a href="https://other.com/">Other</a>
+    <a>No href</a>
+    <img src="/img/1.png"><img src="https://cdn.com/2.png"><img alt="none">
+    <style>.y { color: blue; }</style>
+    <script>var state = {"items": 2};</script>
+  </body>
+</html>
+"""
+
+
+def test_single_parse_collects_page_parts():
+    document = HtmlDocument(PAGE, "https://shop.com/list")
+
+    assert document.title == "Shop"
+    assert document.hrefs == ["/item/1", "https://other.com/"]
+    assert document.links == ["https://shop.com/item/1", "https://other.com/"]
+    assert document.images == ["https://shop.com/img/1.png", "https://cdn.com/2.png"]
+    assert '"items": 2' in document.script_content
+
+
+def test_body_html_drops_styles_without_touching_the_tree():
+    document = HtmlDocument(PAGE)
+
+    body = document.body_html()
+
+    assert body.startswith("<body>") and ".y" not in body
+    assert document.body.find(".//style") is not None
+
+
+def test_cleanup_and_reduce_accept_a_parsed_document():
+    document = HtmlDocument(PAGE)
+
+    title, _, links, _, _ = cleanup_html(document, "https://shop.com/")
+    reduced = reduce_html(document, 1)
+
+    assert title == "Shop"
+    assert links[0] == "https://shop.com/item/1"
+    assert "data-track" not in reduced and "promo" not in reduced
+    assert 'href="/item/1"' in reduced
+
+
+def test_unparsable_input_yields_an_empty_document():
+    document = HtmlDocument("   ")
+
+    assert document.body is None
+    assert document.hrefs == []
+    assert reduce_html("   ", 2) == "No <body> tag found in the HTML"
+
+
+def test_minify_html_collapses_whitespace_around_tags_and_attributes():
+    html = '<div  class = "a" >\n  <p>\tHi   there </p> <!-- c -->\n</div >'
+
+    assert minify_html(html) == '<div class="a"><p> Hi there </p></div>'
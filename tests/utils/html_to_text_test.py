@@ -0,0 +1,39 @@
+from scrapegraphai.utils.html_to_text import html_to_text
+
+PAGE = """
+<html><body>
+  <h1>Catalog</h1>
+  <a href="/item/1">First item</a>
+  <a href="https://other.com/page">Elsewhere</a>
+  <a href="/item/1">First item again</a>
+  <a href="mailto:shop@example.com">Mail us</a>
+  <a href="/gallery/photo.JPG">Photo</a>
+  <img src="/img/logo.png" alt="logo">
+</body></html>
+"""
+
+
+def test_text_and_urls_come_from_one_pass():
+    text, links, images = html_to_text(PAGE, "https://shop.com/catalog/")
+
+    assert "# Catalog" in text
+    assert "[First item](/item/1)" in text
+    assert links == ["https://shop.com/item/1", "https://other.com/page"]
+    assert images == [
+        "https://shop.com/img/logo.png",
+        "https://shop.com/gallery/photo.JPG",
+    ]
+
+
+def test_relative_urls_are_dropped_without_an_http_base():
+    _, links, images = html_to_text(PAGE, None)
+
+    assert links == ["https://other.com/page"]
+    assert images == []
+
+
+def test_plain_text_input_reports_no_urls():
+    text, links, images = html_to_text("Just text, see https://example.com")
+
+    assert "Just text" in text
+    assert links is None and images is None
@@ -0,0 +1,179 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+
+from scrapegraphai.utils.http_client import (
+    AsyncHttpClient,
+    HttpResponse,
+    HttpStatusError,
+    configure_http_client,
+)
+
+
+@pytest.fixture
+def http_server():
+    """Serves a couple of routes on localhost from a dedicated thread."""
+    import threading
+
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state = {}
+
+    async def page(request):
+        return web.Response(
+            text="<html><body>héllo</body></html>",
+            content_type="text/html",
+            charset="utf-8",
+        )
+
+    async def slow(request):
+        await asyncio.sleep(0.3)
+        return web.Response(text="slow")
+
+    async def throttled(request):
+        state["throttled"] = state.get("throttled", 0) + 1
+        if state["throttled"] == 1:
+            return web.Response(status=429, headers={"Retry-After": "0.1"})
+        return web.Response(text="done")
+
+    async def echo_headers(request):
+        return web.json_response({"user_agent": request.headers.get("User-Agent")})
+
+    async def echo_json(request):
+        response = web.json_response(
+            {"query": dict(request.query), "body": await request.json()}
+        )
+        response.enable_compression()
+        return response
+
+    async def start():
+        app = web.Application()
+        app.router.add_get("/page", page)
+        app.router.add_get("/slow", slow)
+        app.router.add_get("/throttled", throttled)
+        app.router.add_get("/headers", echo_headers)
+        app.router.add_post("/echo", echo_json)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        state["runner"] = runner
+        state["port"] = site._server.sockets[0].getsockname()[1]
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(start())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait()
+    yield f"http://127.0.0.1:{state['port']}"
+    asyncio.run_coroutine_threadsafe(state["runner"].cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+
+
+def test_get_sync_reads_body_and_headers(http_server):
+    client = AsyncHttpClient()
+    try:
+        response = client.get_sync(f"{http_server}/page")
+    finally:
+        client.close()
+
+    assert response.status == 200
+    assert response.content_type == "text/html"
+    assert response.text == "<html><body>héllo</body></html>"
+
+
+def test_session_is_reused_across_event_loops(http_server):
+    client = AsyncHttpClient(headers={"User-Agent": "sgai-test"})
+    try:
+        first = asyncio.run(client.get(f"{http_server}/headers"))
+        session = client._session
+        second = asyncio.run(client.get(f"{http_server}/headers"))
+        assert client._session is session
+    finally:
+        client.close()
+
+    assert first.status == second.status == 200
+    assert '"sgai-test"' in second.text
+
+
+def test_http_response_defaults():
+    response = HttpResponse(url="http://x", status=204)
+    assert response.text == ""
+    assert response.content_type == ""
+
+
+def test_post_sends_params_and_json_and_decompresses(http_server):
+    client = AsyncHttpClient()
+    try:
+        response = client.post_sync(
+            f"{http_server}/echo", params={"q": "1"}, json={"a": [1, 2]}
+        )
+    finally:
+        client.close()
+
+    assert response.headers.get("Content-Encoding") in ("gzip", "deflate", "br")
+    assert response.json() == {"query": {"q": "1"}, "body": {"a": [1, 2]}}
+
+
+def test_raise_for_status():
+    HttpResponse(url="http://x", status=302).raise_for_status()
+    with pytest.raises(HttpStatusError):
+        HttpResponse(url="http://x", status=404).raise_for_status()
+
+
+def test_configure_http_client_keeps_client_with_same_options():
+    first = configure_http_client(limit=20, dns_ttl=60)
+    assert configure_http_client(limit=20, dns_ttl=60) is first
+    second = configure_http_client(limit=30)
+    assert second is not first
+    assert second.limit == 30
+
+
+def test_reconfiguring_lets_requests_in_flight_complete(http_server):
+    first = configure_http_client(limit=21)
+    first.get_sync(f"{http_server}/page")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(first.get_sync, f"{http_server}/slow")
+        time.sleep(0.1)
+        configure_http_client(limit=22)
+
+        assert pending.result(timeout=5).text == "slow"
+
+    deadline = time.monotonic() + 2
+    while first._session is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert first._session is None
+
+
+def test_throttled_request_is_retried_after_the_backoff(http_server):
+    client = AsyncHttpClient()
+    start = time.monotonic()
+    try:
+        response = client.get_sync(f"{http_server}/throttled")
+    finally:
+        client.close()
+
+    assert response.status == 200
+    assert response.text == "done"
+    assert time.monotonic() - start >= 0.09
+
+
+def test_download_streams_body_to_file(http_server, tmp_path):
+    client = AsyncHttpClient()
+    target = tmp_path / "page.html"
+    try:
+        response = client.download_sync(f"{http_server}/page", str(target))
+    finally:
+        client.close()
+
+    assert response.status == 200
+    assert response.content == b""
+    assert target.read_text(encoding="utf-8") == "<html><body>héllo</body></html>"
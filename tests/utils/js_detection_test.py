@@ -0,0 +1,59 @@
+import pytest
+
+from scrapegraphai.utils.js_detection import detect_js_dependence, visible_text
+
+ARTICLE = (
+    "<html><head><title>News</title><script>var x = 1;</script></head><body>"
+    + "<p>This article is rendered on the server and has real text.</p>" * 8
+    + "</body></html>"
+)
+
+
+def test_server_rendered_page_needs_no_browser():
+    assert detect_js_dependence(ARTICLE) is None
+
+
+@pytest.mark.parametrize("html", ["", "   ", "<html><body>   </body></html>"])
+def test_empty_body(html):
+    assert detect_js_dependence(html) == "empty_body"
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        '<html><body><div id="root"></div><p>Loading</p></body></html>',
+        '<html><body><div id="__next">  </div><p>Loading</p></body></html>',
+        "<html><body><app-root ng-version=\"17.0.0\"></app-root><p>Hi</p></body></html>",
+    ],
+)
+def test_spa_root(html):
+    assert detect_js_dependence(html) == "spa_root"
+
+
+def test_noscript_wall():
+    html = (
+        "<html><body><noscript>You need to enable JavaScript to run this app."
+        "</noscript><p>Loading...</p></body></html>"
+    )
+    assert detect_js_dependence(html) == "noscript_wall"
+
+
+def test_noscript_banner_on_full_page_is_ignored():
+    html = ARTICLE.replace(
+        "<body>", "<body><noscript>Please enable JavaScript.</noscript>"
+    )
+    assert detect_js_dependence(html) is None
+
+
+def test_low_text_ratio():
+    html = (
+        "<html><body>"
+        + '<div class="a"><span class="b"></span></div>' * 200
+        + "<p>Hi</p></body></html>"
+    )
+    assert detect_js_dependence(html) == "low_text_ratio"
+
+
+def test_visible_text_skips_scripts_and_styles():
+    html = "<html><body><style>p{}</style><p>Hello</p><script>x()</script> world</body></html>"
+    assert visible_text(html) == "Hello world"
@@ -0,0 +1,137 @@
+import contextvars
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.outputs import Generation
+
+from scrapegraphai.graphs import BaseGraph
+from scrapegraphai.utils.llm_cache import (
+    SQLiteLLMCache,
+    count_cache_lookups,
+    get_llm_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SQLiteLLMCache(str(tmp_path / "llm.sqlite"))
+
+
+def make_model(cache, responses=("first", "second", "third")):
+    return FakeListChatModel(responses=list(responses), cache=cache)
+
+
+def test_identical_calls_are_answered_from_the_cache(cache):
+    model = make_model(cache)
+
+    assert model.invoke("Summarize the page").content == "first"
+    assert model.invoke("Summarize the page").content == "first"
+    assert model.invoke("Summarize another page").content == "second"
+    assert cache.stats() == {"llm_cache_hits": 1, "llm_cache_misses": 2}
+
+
+def test_entries_persist_across_connections(tmp_path):
+    path = str(tmp_path / "llm.sqlite")
+    make_model(SQLiteLLMCache(path)).invoke("Summarize the page")
+
+    reopened = SQLiteLLMCache(path)
+    assert make_model(reopened).invoke("Summarize the page").content == "first"
+    assert reopened.stats()["llm_cache_hits"] == 1
+
+
+def test_model_parameters_are_part_of_the_key(cache):
+    make_model(cache).invoke("Summarize the page")
+
+    other = FakeListChatModel(responses=["other"], cache=cache, sleep=0.01)
+    assert other.invoke("Summarize the page").content == "other"
+
+
+def test_expired_entries_are_not_served(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"), ttl=0)
+    model = make_model(cache)
+
+    model.invoke("Summarize the page")
+    assert model.invoke("Summarize the page").content == "second"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"), max_size_mb=0.002)
+    model = make_model(cache, responses=["x" * 400] * 10)
+
+    for prompt in ("a", "b", "c", "a", "d", "e"):
+        model.invoke(prompt)
+
+    total = cache._connection.execute("SELECT SUM(size) FROM responses").fetchone()
+    assert total[0] <= cache.max_size_bytes
+    hits = cache.stats()["llm_cache_hits"]
+    model.invoke("e")
+    model.invoke("b")
+    assert cache.stats()["llm_cache_hits"] == hits + 1
+
+
+def test_unreadable_entries_count_as_misses(cache):
+    cache.update("prompt", "llm", [])
+    cache._connection.execute("UPDATE responses SET response = 'not json'")
+
+    assert cache.lookup("prompt", "llm") is None
+    assert cache.stats()["llm_cache_misses"] == 1
+
+
+def test_caches_are_shared_by_path(tmp_path):
+    path = str(tmp_path / "llm.sqlite")
+    assert get_llm_cache(path) is get_llm_cache(path)
+
+
+def test_cache_hits_are_reported_per_node(cache):
+    model = make_model(cache)
+
+    def node(name):
+        current = Mock(node_name=name, node_type="node", llm_model=model)
+        current.execution_metrics = None
+        current.execute.side_effect = lambda state: model.invoke(state["prompt"])
+        return current
+
+    first, second = node("First"), node("Second")
+    graph = BaseGraph(
+        nodes=[first, second], edges=[(first, second)], entry_point=first
+    )
+    with patch("scrapegraphai.graphs.base_graph.log_graph_execution"):
+        _, exec_info = graph.execute({"prompt": "Summarize the page"})
+
+    by_node = {info["node_name"]: info for info in exec_info}
+    assert by_node["First"]["llm_cache_misses"] == 1
+    assert by_node["Second"]["llm_cache_hits"] == 1
+    assert by_node["TOTAL RESULT"]["llm_cache_hits"] == 1
+    assert by_node["TOTAL RESULT"]["llm_cache_misses"] == 1
+
+
+def test_lookups_are_counted_per_block_across_threads(cache):
+    cache.update("prompt", "model", [Generation(text="answer")])
+
+    with count_cache_lookups() as outer:
+        with count_cache_lookups() as inner:
+            context = contextvars.copy_context()
+            worker = threading.Thread(
+                target=context.run, args=(cache.lookup, "prompt", "model")
+            )
+            worker.start()
+            worker.join()
+        cache.lookup("other", "model")
+    # Lookups outside any block only reach the cache-wide statistics.
+    cache.lookup("prompt", "model")
+
+    assert inner == {"llm_cache_hits": 1, "llm_cache_misses": 0}
+    assert outer == {"llm_cache_hits": 1, "llm_cache_misses": 1}
+    assert cache.stats()["llm_cache_hits"] == 2
+
+
+def test_size_total_is_kept_without_rescanning(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite"))
+    cache.update("prompt", "model", [Generation(text="first")])
+    cache.update("prompt", "model", [Generation(text="second answer")])
+
+    stored = cache._connection.execute("SELECT SUM(size) FROM responses").fetchone()
+    assert cache._total_size == stored[0]
+    assert SQLiteLLMCache(cache.path)._total_size == stored[0]
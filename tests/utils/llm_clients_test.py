@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+
+from scrapegraphai.utils import llm_clients
+from scrapegraphai.utils.llm_clients import (
+    clear_llm_clients,
+    get_llm_client,
+    llm_client_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    clear_llm_clients()
+    yield
+    clear_llm_clients()
+
+
+def test_key_ignores_order_and_hides_credentials():
+    first = llm_client_key({"model": "gpt-4o", "api_key": "sk-secret"})
+    second = llm_client_key({"api_key": "sk-secret", "model": "gpt-4o"})
+
+    assert first == second
+    assert "sk-secret" not in first
+    assert first != llm_client_key({"model": "gpt-4o", "api_key": "sk-other"})
+
+
+def test_objects_in_the_configuration_are_keyed_by_identity():
+    cache = object()
+
+    assert llm_client_key({"cache": cache}) == llm_client_key({"cache": cache})
+    assert llm_client_key({"cache": cache}) != llm_client_key({"cache": object()})
+
+
+def test_clients_are_built_once_per_configuration():
+    factory = Mock(side_effect=lambda: object())
+
+    first = get_llm_client({"model": "gpt-4o"}, factory)
+    second = get_llm_client({"model": "gpt-4o"}, factory)
+    other = get_llm_client({"model": "gpt-4o-mini"}, factory)
+
+    assert first is second
+    assert other is not first
+    assert factory.call_count == 2
+
+
+def test_least_recently_used_client_is_dropped(monkeypatch):
+    monkeypatch.setattr(llm_clients, "MAX_CLIENTS", 2)
+    first = get_llm_client({"model": "a"}, object)
+    get_llm_client({"model": "b"}, object)
+    get_llm_client({"model": "a"}, object)
+    get_llm_client({"model": "c"}, object)
+
+    assert get_llm_client({"model": "a"}, object) is first
+    assert llm_client_key({"model": "b"}) not in llm_clients._clients
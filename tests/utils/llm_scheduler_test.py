@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import (
+    FakeListChatModel,
+    GenericFakeChatModel,
+)
+from langchain_core.messages import AIMessage
+
+from scrapegraphai.utils import tokenizer
+from scrapegraphai.utils.llm_cache import SQLiteLLMCache
+from scrapegraphai.utils.llm_scheduler import (
+    AdmissionLimiter,
+    AdmissionTracker,
+    LLMScheduler,
+)
+from scrapegraphai.utils.tokenizer import register_tokenizer
+
+
+class WordCounter:
+    """Counts words; tiktoken needs its encodings, which are downloaded."""
+
+    def __init__(self, model_name, llm_model):
+        pass
+
+    def count(self, text):
+        return len(text.split())
+
+    def count_many(self, texts):
+        return [len(text.split()) for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(tokenizer, "_factories", dict(tokenizer._factories))
+    monkeypatch.setattr(tokenizer, "_counters", {})
+    register_tokenizer("tiktoken", WordCounter)
+
+
+def test_unknown_models_are_admitted_at_once():
+    scheduler = LLMScheduler()
+
+    assert scheduler.acquire("openai", "gpt-4o", tokens=10**6, blocking=False)
+
+
+def test_requests_per_minute_budget():
+    scheduler = LLMScheduler()
+    scheduler.configure(
+        "openai", "gpt-4o", requests_per_minute=600, burst_seconds=0.1
+    )
+
+    assert scheduler.acquire("openai", "gpt-4o", blocking=False)
+    assert not scheduler.acquire("openai", "gpt-4o", blocking=False)
+
+    start = time.monotonic()
+    assert scheduler.acquire("openai", "gpt-4o")
+    assert 0.05 < time.monotonic() - start < 0.5
+
+
+def test_tokens_per_minute_budget_charges_the_estimate():
+    scheduler = LLMScheduler()
+    scheduler.configure("openai", "gpt-4o", tokens_per_minute=6000)
+
+    # The bucket holds one second of budget: 100 tokens.
+    assert scheduler.acquire("openai", "gpt-4o", tokens=60, blocking=False)
+    assert not scheduler.acquire("openai", "gpt-4o", tokens=60, blocking=False)
+    # A call larger than the bucket is admitted once it is full again.
+    time.sleep(0.7)
+    assert scheduler.acquire("openai", "gpt-4o", tokens=500, blocking=False)
+    assert not scheduler.acquire("openai", "gpt-4o", tokens=1, blocking=False)
+
+
+def test_reconcile_returns_overestimated_tokens():
+    scheduler = LLMScheduler()
+    scheduler.configure("openai", "gpt-4o", tokens_per_minute=6000)
+
+    assert scheduler.acquire("openai", "gpt-4o", tokens=100, blocking=False)
+    scheduler.reconcile("openai", "gpt-4o", estimated=100, actual=10)
+
+    assert scheduler.acquire("openai", "gpt-4o", tokens=80, blocking=False)
+
+
+def test_callers_are_admitted_in_arrival_order():
+    scheduler = LLMScheduler()
+    scheduler.configure("openai", "gpt-4o", requests_per_minute=1200)
+    scheduler.acquire("openai", "gpt-4o")
+    order = []
+
+    def call(index):
+        scheduler.acquire("openai", "gpt-4o")
+        order.append(index)
+
+    threads = []
+    for index in range(4):
+        threads.append(threading.Thread(target=call, args=(index,)))
+        threads[-1].start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == [0, 1, 2, 3]
+
+
+def test_async_acquire_waits_for_the_budget():
+    scheduler = LLMScheduler()
+    scheduler.configure(
+        "openai", "gpt-4o", requests_per_minute=600, burst_seconds=0.1
+    )
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(
+            *(scheduler.aacquire("openai", "gpt-4o") for _ in range(3))
+        )
+        return time.monotonic() - start
+
+    assert 0.15 < asyncio.run(run()) < 1
+
+
+def test_configure_rejects_missing_or_invalid_limits():
+    scheduler = LLMScheduler()
+
+    with pytest.raises(ValueError):
+        scheduler.configure("openai", "gpt-4o")
+    with pytest.raises(ValueError):
+        scheduler.configure("openai", "gpt-4o", tokens_per_minute=0)
+
+
+def test_limiter_charges_prompt_estimate_and_reconciles_usage():
+    scheduler = LLMScheduler()
+    scheduler.configure("openai", "gpt-4o", tokens_per_minute=60000)
+    charged = []
+    reconcile = scheduler.reconcile
+    scheduler.acquire = lambda *args, **kwargs: charged.append(args[2]) or True
+    scheduler.reconcile = lambda *args: charged.append(args) or reconcile(*args)
+    reply = AIMessage(
+        content="ok",
+        usage_metadata={"input_tokens": 3, "output_tokens": 1, "total_tokens": 4},
+    )
+    model = GenericFakeChatModel(messages=iter([reply]))
+    AdmissionLimiter(scheduler, "openai", "gpt-4o").attach(model)
+
+    model.invoke("one two three four five six seven eight")
+
+    assert charged[0] == 8
+    assert charged[1] == ("openai", "gpt-4o", charged[0], 4)
+
+
+def test_cached_answers_are_not_charged(tmp_path):
+    scheduler = LLMScheduler()
+    scheduler.configure("openai", "gpt-4o", requests_per_minute=60)
+    model = FakeListChatModel(
+        responses=["first"], cache=SQLiteLLMCache(str(tmp_path / "llm.sqlite"))
+    )
+    AdmissionLimiter(scheduler, "openai", "gpt-4o").attach(model)
+
+    start = time.monotonic()
+    for _ in range(3):
+        assert model.invoke("Summarize the page").content == "first"
+
+    assert time.monotonic() - start < 0.5
+
+
+def test_reattaching_keeps_a_single_tracker():
+    scheduler = LLMScheduler()
+    model = FakeListChatModel(responses=["first"])
+
+    for _ in range(3):
+        AdmissionLimiter(scheduler, "openai", "gpt-4o").attach(model)
+
+    trackers = [cb for cb in model.callbacks if isinstance(cb, AdmissionTracker)]
+    assert trackers == [model.rate_limiter.tracker]
@@ -0,0 +1,61 @@
+from scrapegraphai.utils.html_document import HtmlDocument
+from scrapegraphai.utils.main_content import extract_main_content, link_density
+
+PARAGRAPH = (
+    "The pipeline fetches the page, removes its boilerplate, and hands the "
+    "remaining text to the model, which extracts the requested fields. "
+)
+
+PAGE = f"""
+<html><head><title>Scraping guide</title><script>var x = 1;</script></head>
+<body>
+  <header class="site-header"><a href="/">Home</a> <a href="/blog">Blog</a></header>
+  <nav><a href="/a">A</a> <a href="/b">B</a></nav>
+  <div id="cookie-banner">We use cookies to improve your experience on this site.</div>
+  <div class="layout">
+    <div class="sidebar">
+      <ul>{"".join(f'<li><a href="/tag/{i}">Tag number {i}</a></li>' for i in range(30))}</ul>
+    </div>
+    <article class="post">
+      <h1>How the pipeline works</h1>
+      <p>{PARAGRAPH}</p>
+      <p>{PARAGRAPH * 2}</p>
+      <p>{PARAGRAPH}</p>
+      <div class="related">
+        <a href="/p/1">Another post</a> <a href="/p/2">Yet another post</a>
+      </div>
+    </article>
+  </div>
+  <footer>Copyright, all rights reserved, contact us, privacy policy.</footer>
+</body></html>
+"""
+
+
+def test_keeps_the_article_and_drops_the_chrome():
+    content = extract_main_content(PAGE)
+
+    assert content.startswith("<html><head><title>Scraping guide</title>")
+    assert "How the pipeline works" in content
+    assert content.count("removes its boilerplate") == 4
+    for chrome in ("Tag number", "cookies", "Copyright", "Another post", "var x"):
+        assert chrome not in content
+
+
+def test_accepts_a_parsed_document():
+    assert extract_main_content(HtmlDocument(PAGE)) == extract_main_content(PAGE)
+
+
+def test_returns_none_when_no_content_is_found():
+    links = "".join(f'<a href="/{i}">Link {i}</a>' for i in range(50))
+
+    assert extract_main_content(f"<html><body><div>{links}</div></body></html>") is None
+    assert extract_main_content("") is None
+
+
+def test_link_density():
+    document = HtmlDocument(
+        '<html><body><p>four chars <a href="/">link</a></p></body></html>'
+    )
+    paragraph = document.body.find("p")
+
+    assert link_density(paragraph) == len("link") / len("four chars link")
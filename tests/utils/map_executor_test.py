@@ -0,0 +1,160 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from scrapegraphai.utils.map_executor import (
+    MapExecutor,
+    get_map_executor,
+    is_throttle_error,
+    is_transient_error,
+    retry_after_of,
+)
+
+
+class RateLimitError(Exception):
+    def __init__(self, message="Rate limit reached", retry_after=None):
+        super().__init__(message)
+        headers = {"retry-after": retry_after} if retry_after else {}
+        self.status_code = 429
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+class Provider:
+    """Accepts ``capacity`` concurrent calls and throttles the others."""
+
+    def __init__(self, capacity=None, failures=None):
+        self.capacity = capacity
+        self.failures = dict(failures or {})
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def chain(self, name):
+        def call(inputs):
+            with self.lock:
+                self.calls += 1
+                if self.failures.get(name):
+                    self.failures[name] -= 1
+                    raise ConnectionError("connection reset")
+                if self.capacity is not None and self.active >= self.capacity:
+                    raise RateLimitError()
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            try:
+                time.sleep(0.01)
+                return f"{name}: {inputs['question']}"
+            finally:
+                with self.lock:
+                    self.active -= 1
+
+        return RunnableLambda(call)
+
+
+@pytest.fixture
+def executor():
+    return MapExecutor(max_concurrency=4, backoff_base=0.01, max_backoff=0.05)
+
+
+def test_results_are_keyed_like_runnable_parallel(executor):
+    provider = Provider()
+    chains = {f"chunk{i}": provider.chain(f"chunk{i}") for i in range(1, 11)}
+
+    results = executor.parallel(chains).invoke({"question": "q"})
+
+    assert results == {f"chunk{i}": f"chunk{i}: q" for i in range(1, 11)}
+    assert provider.peak <= 4
+
+
+def test_throttling_lowers_the_limit_and_every_chunk_completes(executor):
+    executor.configure(max_retries=20)
+    provider = Provider(capacity=2)
+    chains = {f"chunk{i}": provider.chain(f"chunk{i}") for i in range(1, 31)}
+
+    results = executor.map(chains, {"question": "q"})
+
+    assert len(results) == 30
+    assert executor.limit < 4
+
+
+def test_successes_raise_the_limit_back(executor):
+    executor.limit = 1.0
+    provider = Provider()
+    chains = {f"chunk{i}": provider.chain(f"chunk{i}") for i in range(20)}
+
+    executor.map(chains, {"question": "q"})
+
+    assert executor.limit == 4
+
+
+def test_transient_failures_are_retried_per_chunk(executor):
+    provider = Provider(failures={"chunk2": 2})
+    chains = {name: provider.chain(name) for name in ("chunk1", "chunk2", "chunk3")}
+
+    results = executor.map(chains, {"question": "q"})
+
+    assert results["chunk2"] == "chunk2: q"
+    assert provider.calls == 5
+
+
+def test_permanent_failures_are_raised(executor):
+    def broken(inputs):
+        raise ValueError("bad prompt")
+
+    with pytest.raises(ValueError, match="bad prompt"):
+        executor.map({"chunk1": RunnableLambda(broken)}, {"question": "q"})
+
+
+def test_retries_are_bounded(executor):
+    executor.configure(max_retries=2)
+    provider = Provider(failures={"chunk1": 5})
+
+    with pytest.raises(ConnectionError):
+        executor.map({"chunk1": provider.chain("chunk1")}, {"question": "q"})
+    assert provider.calls == 3
+
+
+def test_error_classification():
+    assert is_throttle_error(RateLimitError())
+    assert is_throttle_error(Exception("Error code: 529 - Overloaded"))
+    assert is_transient_error(TimeoutError())
+    assert not is_transient_error(ValueError("bad prompt"))
+    assert retry_after_of(RateLimitError(retry_after="3")) == 3.0
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        MapExecutor(max_concurrency=0)
+    with pytest.raises(ValueError):
+        MapExecutor(max_concurrency=2, min_concurrency=3)
+
+
+def test_a_failure_is_raised_without_waiting_for_the_chunks_in_flight(executor):
+    def broken(inputs):
+        raise ValueError("bad prompt")
+
+    def slow(inputs):
+        time.sleep(2)
+
+    chains = {"chunk1": RunnableLambda(broken), "chunk2": RunnableLambda(slow)}
+
+    start = time.monotonic()
+    with pytest.raises(ValueError, match="bad prompt"):
+        executor.map(chains, {"question": "q"})
+    assert time.monotonic() - start < 1
+
+
+def test_executors_are_kept_per_provider_and_model():
+    openai = SimpleNamespace(model_name="gpt-4o")
+    other = SimpleNamespace(model_name="gpt-4o-mini")
+
+    get_map_executor(openai).limit = 1.0
+
+    assert get_map_executor(openai) is get_map_executor(
+        SimpleNamespace(model_name="gpt-4o")
+    )
+    assert get_map_executor(other) is not get_map_executor(openai)
+    assert get_map_executor(other).limit == get_map_executor(other).max_concurrency
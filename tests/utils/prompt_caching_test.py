@@ -0,0 +1,122 @@
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.prompts import PromptTemplate
+
+from scrapegraphai.nodes import GenerateAnswerNode
+from scrapegraphai.prompts import (
+    TEMPLATE_CHUNKS_MD,
+    TEMPLATE_COMBINED,
+    TEMPLATE_NO_CHUNKS_MD,
+)
+from scrapegraphai.utils.custom_callback import get_custom_callback
+from scrapegraphai.utils.prompt_caching import (
+    build_prompt,
+    needs_cache_control,
+    split_template,
+)
+
+sent_messages = []
+
+
+class ChatAnthropic(FakeListChatModel):
+    """Stands in for the Anthropic client, which needs cache-control markers."""
+
+    def _call(self, messages, *args, **kwargs):
+        sent_messages.append(messages)
+        return super()._call(messages, *args, **kwargs)
+
+
+def test_templates_keep_the_document_before_the_question():
+    for template, document, question in (
+        (TEMPLATE_NO_CHUNKS_MD, "{content}", "{question}"),
+        (TEMPLATE_COMBINED, "{website_content}", "{user_prompt}"),
+    ):
+        assert template.index("{format_instructions}") < template.index(document)
+        assert template.index(document) < template.index(question)
+
+
+def test_split_template_cuts_after_the_stable_prefix_and_the_document():
+    prefix, document, question = split_template(TEMPLATE_NO_CHUNKS_MD)
+
+    assert prefix.endswith("WEBSITE CONTENT:  ")
+    assert "{format_instructions}" in prefix
+    assert document == "{content}"
+    assert "{question}" in question
+
+    # Nothing varies after a chunk, so it is not cut again.
+    assert len(split_template(TEMPLATE_CHUNKS_MD)) == 2
+    assert split_template("No variables") == ["No variables"]
+
+
+def test_without_cache_control_the_prompt_is_unchanged():
+    prompt = build_prompt(
+        TEMPLATE_NO_CHUNKS_MD,
+        input_variables=["content", "question"],
+        partial_variables={"format_instructions": "Reply in JSON"},
+    )
+
+    assert isinstance(prompt, PromptTemplate)
+
+
+def test_cache_control_marks_every_block_but_the_last():
+    prompt = build_prompt(
+        TEMPLATE_NO_CHUNKS_MD,
+        input_variables=["content", "question"],
+        partial_variables={"format_instructions": "Reply in JSON"},
+        cache_control=True,
+    )
+    plain = PromptTemplate(
+        template=TEMPLATE_NO_CHUNKS_MD,
+        input_variables=["content", "question"],
+        partial_variables={"format_instructions": "Reply in JSON"},
+    )
+    inputs = {"content": "The page {with braces}", "question": "What is it?"}
+
+    (message,) = prompt.invoke(inputs).to_messages()
+    blocks = message.content
+
+    assert [block.get("cache_control") for block in blocks] == [
+        {"type": "ephemeral"},
+        {"type": "ephemeral"},
+        None,
+    ]
+    assert "".join(block["text"] for block in blocks) == plain.format(**inputs)
+
+
+def test_only_explicit_cache_providers_need_markers():
+    assert needs_cache_control(ChatAnthropic(responses=["{}"]))
+    assert not needs_cache_control(FakeListChatModel(responses=["{}"]))
+
+
+def test_generate_answer_node_marks_prompts_for_anthropic():
+    sent_messages.clear()
+    node = GenerateAnswerNode(
+        input="user_prompt & doc",
+        output=["answer"],
+        node_config={"llm_model": ChatAnthropic(responses=['{"content": "ok"}'])},
+    )
+
+    state = node.execute({"user_prompt": "What is it?", "doc": ["The page"]})
+
+    assert state["answer"] == {"content": "ok"}
+    (message,) = sent_messages[0]
+    assert message.content[0]["cache_control"] == {"type": "ephemeral"}
+    assert message.content[-1]["text"].strip() == "USER QUESTION: What is it?"
+
+
+def test_callback_counts_cached_prompt_tokens():
+    message = AIMessage(
+        content="ok",
+        usage_metadata={
+            "input_tokens": 1200,
+            "output_tokens": 10,
+            "total_tokens": 1210,
+            "input_token_details": {"cache_read": 1024},
+        },
+    )
+    with get_custom_callback("claude-3-5-sonnet") as cb:
+        cb.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+
+    assert cb.prompt_tokens == 1200
+    assert cb.cached_tokens == 1024
@@ -0,0 +1,83 @@
+import pytest
+
+from scrapegraphai.utils.http_client import HttpResponse
+from scrapegraphai.utils.robots_cache import RobotsCache, get_robots_agents
+
+ROBOTS_TXT = """
+User-agent: GPTBot
+Disallow: /private/
+Crawl-delay: 2
+
+User-agent: *
+Allow: /
+"""
+
+
+@pytest.fixture
+def mock_client(mocker):
+    client = mocker.patch("scrapegraphai.utils.robots_cache.get_http_client")
+    client.return_value.get_sync.return_value = HttpResponse(
+        url="https://example.com/robots.txt", status=200, content=ROBOTS_TXT.encode()
+    )
+    return client.return_value
+
+
+@pytest.mark.parametrize(
+    "model, agents",
+    [
+        ("gpt-4o", ["GPTBot", "ChatGPT-user"]),
+        ("openai/gpt-4o", ["GPTBot", "ChatGPT-user"]),
+        ("claude-3-5-sonnet", ["Claude-Web", "ClaudeBot"]),
+        ("llama3", ["llama3"]),
+    ],
+)
+def test_get_robots_agents(model, agents):
+    assert get_robots_agents(model) == agents
+
+
+def test_rules_are_evaluated_per_agent(mock_client):
+    cache = RobotsCache()
+
+    allowed, rules = cache.can_fetch("https://example.com/private/a", ["GPTBot"])
+    assert not allowed
+    assert cache.can_fetch("https://example.com/private/a", "PerplexityBot")[0]
+    assert cache.can_fetch("https://example.com/public", ["GPTBot"])[0]
+    assert rules.crawl_delay(["GPTBot"]) == 2.0
+    mock_client.get_sync.assert_called_once()
+
+
+@pytest.mark.parametrize("status, allowed", [(404, True), (403, False), (503, False)])
+def test_unavailable_robots_txt(mock_client, status, allowed):
+    mock_client.get_sync.return_value = HttpResponse(
+        url="https://example.com/robots.txt", status=status
+    )
+
+    assert RobotsCache().can_fetch("https://example.com/a", ["GPTBot"])[0] is allowed
+
+
+def test_disk_cache_survives_new_instances(mock_client, tmp_path):
+    RobotsCache(str(tmp_path)).get_rules("https://example.com/a")
+    rules = RobotsCache(str(tmp_path)).get_rules("https://example.com/b")
+
+    assert rules.body == ROBOTS_TXT
+    mock_client.get_sync.assert_called_once()
+
+
+def test_expired_entries_are_refetched(mock_client):
+    cache = RobotsCache(ttl=0)
+    cache.get_rules("https://example.com/a")
+    cache.get_rules("https://example.com/b")
+
+    assert mock_client.get_sync.call_count == 2
+
+
+def test_unreachable_hosts_are_retried_soon_and_not_written(mock_client, tmp_path):
+    mock_client.get_sync.side_effect = TimeoutError("timed out")
+    cache = RobotsCache(str(tmp_path), retry_ttl=0)
+
+    assert not cache.can_fetch("https://example.com/a", ["GPTBot"])[0]
+    assert not list((tmp_path / "robots").iterdir())
+
+    mock_client.get_sync.side_effect = None
+    assert cache.can_fetch("https://example.com/a", ["GPTBot"])[0]
+    assert mock_client.get_sync.call_count == 2
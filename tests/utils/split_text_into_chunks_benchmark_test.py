@@ -0,0 +1,74 @@
+"""
+Checks split_text_into_chunks, with semchunk re-counting pieces and with the
+single-encode chunker, on ~500KB of Markdown built from the saved pages in
+tests/inputs/pages.
+
+Run with: pytest tests/utils/split_text_into_chunks_benchmark_test.py --slow
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from scrapegraphai.utils import tokenizer
+from scrapegraphai.utils.convert_to_md import convert_to_md
+from scrapegraphai.utils.split_text_into_chunks import split_text_into_chunks
+from scrapegraphai.utils.tokenizer import register_tokenizer
+
+PAGES_DIR = Path(__file__).resolve().parent.parent / "inputs" / "pages"
+TARGET_BYTES = 500_000
+CHUNK_SIZE = 2048
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]|\s+")
+
+
+class _RegexCounter:
+    """Offline stand-in for tiktoken: words, punctuation and spaces are tokens."""
+
+    def __init__(self, model_name=None, llm_model=None):
+        pass
+
+    def count(self, text):
+        return sum(1 for _ in _TOKEN_RE.finditer(text))
+
+    def count_many(self, texts):
+        return [self.count(text) for text in texts]
+
+    def token_offsets(self, text):
+        return [match.start() for match in _TOKEN_RE.finditer(text)]
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    monkeypatch.setattr(tokenizer, "_counters", {})
+    try:
+        tokenizer.get_token_counter().count("warm up")
+    except Exception:
+        # Offline: tiktoken encodings cannot be downloaded.
+        monkeypatch.setattr(tokenizer, "_factories", dict(tokenizer._factories))
+        register_tokenizer("tiktoken", _RegexCounter)
+    return tokenizer.get_token_counter()
+
+
+def _markdown_corpus() -> str:
+    pages = [
+        convert_to_md(path.read_text(encoding="utf-8"))
+        for path in sorted(PAGES_DIR.glob("*.html"))
+    ]
+    assert pages, f"no saved pages in {PAGES_DIR}"
+    text = "\n\n".join(pages)
+    return "\n\n".join([text] * (TARGET_BYTES // len(text.encode("utf-8")) + 1))
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("single_encode", [False, True])
+def test_chunks_fit_the_chunk_size_and_cover_the_text(counter, single_encode):
+    text = _markdown_corpus()
+
+    chunks = split_text_into_chunks(text, CHUNK_SIZE, single_encode=single_encode)
+
+    # Re-encoding a chunk alone may merge a token or two differently at its ends.
+    assert max(counter.count_many(chunks)) <= int(CHUNK_SIZE * 0.9) + 2
+    # Only the whitespace between chunks may be dropped.
+    assert re.sub(r"\s", "", "".join(chunks)) == re.sub(r"\s", "", text)
@@ -0,0 +1,83 @@
+import re
+
+import pytest
+
+from scrapegraphai.utils import tokenizer
+from scrapegraphai.utils.split_text_into_chunks import (
+    split_text_by_token_offsets,
+    split_text_into_chunks,
+)
+from scrapegraphai.utils.tokenizer import register_tokenizer
+
+TOKEN_RE = re.compile(r"\S+|\s+")
+
+
+class WordPieceCounter:
+    """Words and whitespace runs are tokens; reports offsets like tiktoken."""
+
+    def __init__(self, model_name=None, llm_model=None):
+        self.encodes = 0
+
+    def count(self, text):
+        self.encodes += 1
+        return len(TOKEN_RE.findall(text))
+
+    def count_many(self, texts):
+        return [self.count(text) for text in texts]
+
+    def token_offsets(self, text):
+        self.encodes += 1
+        return [match.start() for match in TOKEN_RE.finditer(text)]
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    monkeypatch.setattr(tokenizer, "_factories", dict(tokenizer._factories))
+    monkeypatch.setattr(tokenizer, "_counters", {})
+    register_tokenizer("tiktoken", WordPieceCounter)
+    return tokenizer.get_token_counter()
+
+
+def section(number):
+    sentences = " ".join(f"Fact {i} about topic {number} is here." for i in range(8))
+    return f"## Topic {number}\n\n{sentences}"
+
+
+def test_chunks_respect_the_budget_and_keep_the_text(counter):
+    text = "\n\n".join(section(i) for i in range(6))
+
+    chunks = split_text_into_chunks(text, 100)
+
+    assert counter.encodes == 1
+    assert all(counter.count(chunk) <= 90 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "").replace("\n", "") == text.replace(
+        " ", ""
+    ).replace("\n", "")
+
+
+def test_cuts_prefer_headings_then_sentences():
+    text = "\n\n".join(section(i) for i in range(3))
+    offsets = [match.start() for match in TOKEN_RE.finditer(text)]
+
+    chunks = split_text_by_token_offsets(text, offsets, 130)
+
+    assert [chunk.splitlines()[0] for chunk in chunks] == [
+        "## Topic 0",
+        "## Topic 1",
+        "## Topic 2",
+    ]
+    chunks = split_text_by_token_offsets(text, offsets, 60)
+    assert all(chunk.endswith((".", "here.")) for chunk in chunks)
+
+
+def test_unbreakable_text_is_cut_on_tokens():
+    text = "x" * 50
+    offsets = list(range(50))
+
+    chunks = split_text_by_token_offsets(text, offsets, 20)
+
+    assert [len(chunk) for chunk in chunks] == [20, 20, 10]
+
+
+def test_short_text_is_one_chunk(counter):
+    assert split_text_into_chunks("  a few words ", 100) == ["a few words"]
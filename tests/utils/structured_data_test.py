@@ -0,0 +1,106 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from scrapegraphai.utils.structured_data import extract_structured_data, map_to_schema
+
+PRODUCT_PAGE = """
+<html><head>
+<meta property="og:title" content="Trail Shoe">
+<meta property="product:price:amount" content="89.00">
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [
+  {"@type": "BreadcrumbList", "itemListElement": [{"name": "Shoes"}]},
+  {"@type": "Product", "name": "Trail Shoe", "sku": 4411,
+   "brand": {"@type": "Brand", "name": "Peak"},
+   "offers": {"@type": "Offer", "price": "89.00", "priceCurrency": "EUR"}}
+]}
+</script>
+</head><body><h1>Trail Shoe</h1></body></html>
+"""
+
+LISTING_PAGE = """
+<html><body>
+<ul>
+  <li itemscope itemtype="https://schema.org/Product">
+    <span itemprop="name">Red mug</span>
+    <div itemprop="offers" itemscope itemtype="https://schema.org/Offer">
+      <meta itemprop="price" content="12.5">
+    </div>
+  </li>
+  <li itemscope itemtype="https://schema.org/Product">
+    <span itemprop="name">Blue mug</span>
+    <div itemprop="offers" itemscope itemtype="https://schema.org/Offer">
+      <meta itemprop="price" content="13">
+    </div>
+  </li>
+</ul>
+<script id="__NEXT_DATA__" type="application/json">
+{"props": {"pageProps": {"category": {"title": "Mugs", "count": 2}}}}
+</script>
+</body></html>
+"""
+
+
+class Product(BaseModel):
+    name: str
+    price: float
+    currency: str
+    brand: Optional[str] = None
+    sku: Optional[str] = None
+
+
+class Mug(BaseModel):
+    name: str
+    price: float
+
+
+class Mugs(BaseModel):
+    products: List[Mug]
+
+
+class Review(BaseModel):
+    author: str
+    rating: float
+
+
+def test_extracts_every_kind_of_embedded_data():
+    data = extract_structured_data(PRODUCT_PAGE)
+
+    assert [item["@type"] for item in data["json_ld"]] == [
+        "BreadcrumbList",
+        "Product",
+    ]
+    assert data["opengraph"] == [
+        {"title": "Trail Shoe", "product:price:amount": "89.00"}
+    ]
+
+    data = extract_structured_data(LISTING_PAGE)
+
+    assert data["microdata"][0] == {
+        "@type": "Product",
+        "name": "Red mug",
+        "offers": {"@type": "Offer", "price": "12.5"},
+    }
+    assert data["embedded"][0]["props"]["pageProps"]["category"]["title"] == "Mugs"
+
+
+def test_maps_json_ld_onto_the_schema():
+    product = map_to_schema(extract_structured_data(PRODUCT_PAGE), Product)
+
+    assert product == Product(
+        name="Trail Shoe", price=89.0, currency="EUR", brand="Peak", sku="4411"
+    )
+
+
+def test_fills_list_schemas_from_every_matching_item():
+    mugs = map_to_schema(extract_structured_data(LISTING_PAGE), Mugs)
+
+    assert mugs == Mugs(
+        products=[Mug(name="Red mug", price=12.5), Mug(name="Blue mug", price=13)]
+    )
+
+
+def test_missing_required_fields_give_no_answer():
+    assert map_to_schema(extract_structured_data(PRODUCT_PAGE), Review) is None
+    assert map_to_schema(extract_structured_data("<p>No data</p>"), Mug) is None
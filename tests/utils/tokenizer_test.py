@@ -0,0 +1,80 @@
+from unittest.mock import Mock
+
+import pytest
+from langchain_mistralai import ChatMistralAI
+from langchain_ollama import ChatOllama
+from langchain_openai import ChatOpenAI
+
+from scrapegraphai.utils import tokenizer
+from scrapegraphai.utils.split_text_into_chunks import split_text_into_chunks
+from scrapegraphai.utils.tokenizer import (
+    count_many,
+    get_token_counter,
+    num_tokens_calculus,
+    register_tokenizer,
+)
+from scrapegraphai.utils.tokenizers.tokenizer_ollama import OllamaCounter
+
+
+class WordCounter:
+    """Counts words; tiktoken needs its encodings, which are downloaded."""
+
+    instances = 0
+
+    def __init__(self, model_name, llm_model):
+        WordCounter.instances += 1
+        self.model_name = model_name
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return len(text.split())
+
+    def count_many(self, texts):
+        return [len(text.split()) for text in texts]
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(tokenizer, "_factories", dict(tokenizer._factories))
+    monkeypatch.setattr(
+        tokenizer, "_families_by_model_class", dict(tokenizer._families_by_model_class)
+    )
+    monkeypatch.setattr(tokenizer, "_counters", {})
+    WordCounter.instances = 0
+    register_tokenizer("tiktoken", WordCounter)
+
+
+def test_counters_are_built_once_per_model():
+    openai = ChatOpenAI(model="gpt-4o-mini", api_key="sk-test")
+
+    assert num_tokens_calculus("one two three", openai) == 3
+    assert num_tokens_calculus("one two", openai) == 2
+    assert get_token_counter(openai).model_name == "gpt-4o-mini"
+    assert get_token_counter() is get_token_counter(None)
+    assert WordCounter.instances == 2
+
+
+def test_models_pick_their_tokenizer_family():
+    register_tokenizer("mistral", WordCounter)
+    mistral = ChatMistralAI(model="mistral-small-latest", api_key="test")
+    ollama = ChatOllama(model="llama3")
+
+    assert get_token_counter(mistral).model_name == "mistral-small-latest"
+    assert isinstance(get_token_counter(ollama), OllamaCounter)
+    # Models without a tokenizer of their own share the default estimate.
+    assert get_token_counter(Mock()) is get_token_counter()
+
+
+def test_count_many_counts_in_one_batch():
+    assert count_many(["a b", "c", ""]) == [2, 1, 0]
+
+
+def test_chunking_uses_the_model_counter():
+    openai = ChatOpenAI(model="gpt-4o-mini", api_key="sk-test")
+    text = " ".join(f"word{i}" for i in range(100))
+
+    chunks = split_text_into_chunks(text, 30, use_semchunk=False, llm_model=openai)
+
+    assert [len(chunk.split()) for chunk in chunks] == [30, 30, 30, 10]
+    assert get_token_counter(openai).calls == 1